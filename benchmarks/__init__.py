@@ -0,0 +1 @@
+"""Performance benchmarks for the Linkplay integration (not run by CI)."""
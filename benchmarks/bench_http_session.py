@@ -0,0 +1,77 @@
+"""Compare HA's default aiohttp session with the speaker-tuned session.
+
+Starts a simulated LinkPlay speaker (``tests.simulator``) and drives
+the same request mix through both sessions, printing requests/s and
+latency percentiles. Run from the repository root::
+
+    python -m benchmarks.bench_http_session --requests 2000 --concurrency 4
+    python -m benchmarks.bench_http_session --close   # firmware that drops sockets
+
+The simulator answers ``getPlayerStatus`` after ``--latency`` ms; with
+``--close`` it sends ``Connection: close`` like many LinkPlay modules.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+
+from custom_components.linkplay.http_session import API_TIMEOUT, create_linkplay_session
+from tests.simulator import LinkPlaySimulator
+
+
+async def _drive(session: aiohttp.ClientSession, url: str, total: int, concurrency: int) -> tuple[float, list[float]]:
+    latencies: list[float] = []
+    queue = iter(range(total))
+
+    async def _worker() -> None:
+        for _ in queue:
+            start = time.perf_counter()
+            async with session.get(url, timeout=API_TIMEOUT) as response:
+                await response.read()
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, latencies
+
+
+def _report(label: str, elapsed: float, latencies: list[float]) -> None:
+    latencies.sort()
+    p99 = latencies[max(0, int(len(latencies) * 0.99) - 1)]
+    print(
+        f"{label:<10} {len(latencies) / elapsed:9.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:7.2f} ms  "
+        f"p99 {p99 * 1000:7.2f} ms"
+    )
+
+
+async def _main(args: argparse.Namespace) -> None:
+    simulator = LinkPlaySimulator(latency=args.latency / 1000, close_connections=args.close)
+    await simulator.start()
+    url = f"http://{simulator.host}/httpapi.asp?command=getPlayerStatus"
+    try:
+        sessions = {
+            # What HA's shared session looks like: default connector.
+            "default": aiohttp.ClientSession(),
+            "linkplay": create_linkplay_session(),
+        }
+        for label, session in sessions.items():
+            async with session:
+                await _drive(session, url, min(50, args.requests), args.concurrency)  # warm-up
+                _report(label, *await _drive(session, url, args.requests, args.concurrency))
+    finally:
+        await simulator.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated latency in ms")
+    parser.add_argument("--close", action="store_true", help="simulator sends Connection: close")
+    asyncio.run(_main(parser.parse_args()))
@@ -0,0 +1,275 @@
+"""Per-poll cost of ``async_update`` and master -> slave group sync.
+
+Builds 5, 20 and 50 entities with the test helpers (``make_device`` /
+``make_group``) and drives full update cycles against recorded HTTPAPI
+responses (``benchmarks/fixtures/linkplay_responses.json``). No network
+is touched: ``call_linkplay_httpapi`` answers from the fixtures and the
+internet metadata lookups are stubbed out.
+
+Scenarios:
+
+* ``update``     - N standalone speakers, each polled once per cycle.
+* ``group_sync`` - one master with N-1 slaves; the master poll rebuilds
+  the group from ``multiroom:getSlaveList`` and mirrors its state onto
+  every slave, then each slave runs its (short-circuited) update.
+
+For each scenario and size it reports, per poll cycle:
+
+* ``cpu_ms``     - process CPU time.
+* ``peak_kib``   - tracemalloc peak above the pre-poll baseline.
+* ``coroutines`` - coroutine frames started (``sys.monitoring``);
+  deterministic, so any increase is a real change in the call graph.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_update_loop                 # print the table
+    python -m benchmarks.bench_update_loop --check         # compare with baseline.json
+    python -m benchmarks.bench_update_loop --save          # refresh baseline.json
+
+``--check`` exits non-zero when a metric regresses past ``--tolerance``
+(CPU / memory) or the coroutine count grows at all. Refresh the baseline
+in the same commit as an intentional change so the diff shows up in
+review.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from tests._helpers import make_device, make_group
+
+_HERE = Path(__file__).parent
+_FIXTURES = _HERE / "fixtures" / "linkplay_responses.json"
+_BASELINE = _HERE / "baseline.json"
+
+SIZES = (5, 20, 50)
+# CPU and memory are compared with --tolerance; coroutine counts exactly.
+_EXACT_METRICS = ("coroutines",)
+
+# One full poll cycle; builders also hang the entities off ``.entities``.
+Poll = Callable[[], Awaitable[None]]
+
+
+def _load_fixtures() -> dict:
+    with _FIXTURES.open(encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _attach_responder(dev, fixtures: dict, slave_names: list[str] | None = None) -> None:
+    """Answer the device's HTTPAPI calls from the recorded fixtures.
+
+    ``getPlayerStatus`` cycles through the recorded sequence (playhead
+    advancing, then a track change) so metadata paths see real churn.
+    """
+    status = {**fixtures["getStatus"], "DeviceName": dev._name, "uuid": f"BENCH{id(dev):X}"}
+    player_polls = fixtures["getPlayerStatus"]
+    if slave_names:
+        entry = fixtures["slave_list_entry"]
+        slave_list = {
+            "slaves": len(slave_names),
+            "wmrm_version": "4.2",
+            "slave_list": [
+                {**entry, "name": name, "ip": f"192.168.1.{100 + i}"}
+                for i, name in enumerate(slave_names)
+            ],
+        }
+    else:
+        slave_list = fixtures["multiroom:getSlaveList"]
+    poll_index = 0
+
+    async def _httpapi(cmd, jsn, protocol=None, **_kwargs):
+        nonlocal poll_index
+        if cmd == "getPlayerStatus":
+            poll_index += 1
+            return dict(player_polls[poll_index % len(player_polls)])
+        if cmd in ("getStatus", "getStatusEx"):
+            return dict(status)
+        if cmd == "multiroom:getSlaveList":
+            return slave_list
+        return "OK"
+
+    async def _no_lookup(*_args, **_kwargs):
+        return None
+
+    dev.call_linkplay_httpapi = _httpapi
+    dev.async_get_itunes_artwork = _no_lookup
+    dev.async_write_ha_state = MagicMock()
+    # The UPnP description fetch is out of scope; pretend it succeeded.
+    dev._upnp_device = MagicMock()
+
+
+def _build_update(size: int, fixtures: dict) -> Poll:
+    devices = [make_device(f"speaker_{i}") for i in range(size)]
+    for dev in devices:
+        _attach_responder(dev, fixtures)
+
+    async def _poll() -> None:
+        await asyncio.gather(*(dev.async_update() for dev in devices))
+
+    _poll.entities = devices
+    return _poll
+
+
+def _build_group_sync(size: int, fixtures: dict) -> Poll:
+    master, slaves = make_group("master", [f"slave_{i}" for i in range(size - 1)])
+    _attach_responder(master, fixtures, [slave._name for slave in slaves])
+    for slave in slaves:
+        _attach_responder(slave, fixtures)
+
+    async def _poll() -> None:
+        await master.async_update()
+        await asyncio.gather(*(slave.async_update() for slave in slaves))
+
+    _poll.entities = [master, *slaves]
+    return _poll
+
+
+SCENARIOS: dict[str, Callable[[int, dict], Poll]] = {
+    "update": _build_update,
+    "group_sync": _build_group_sync,
+}
+
+
+class _CoroutineCounter:
+    """Count coroutine frames started, via ``sys.monitoring`` PY_START."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._tool = sys.monitoring.PROFILER_ID
+
+    def _on_start(self, code, _offset):
+        if code.co_flags & inspect.CO_COROUTINE:
+            self.count += 1
+            return None
+        return sys.monitoring.DISABLE
+
+    def __enter__(self) -> _CoroutineCounter:
+        sys.monitoring.use_tool_id(self._tool, "linkplay-bench")
+        sys.monitoring.register_callback(self._tool, sys.monitoring.events.PY_START, self._on_start)
+        sys.monitoring.set_events(self._tool, sys.monitoring.events.PY_START)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        sys.monitoring.set_events(self._tool, 0)
+        sys.monitoring.register_callback(self._tool, sys.monitoring.events.PY_START, None)
+        sys.monitoring.free_tool_id(self._tool)
+        sys.monitoring.restart_events()
+
+
+async def measure(scenario: str, size: int, polls: int, fixtures: dict | None = None) -> dict:
+    """Run ``polls`` cycles of ``scenario`` at ``size`` entities.
+
+    Each metric gets its own pass so instrumentation overhead from one
+    does not leak into another.
+    """
+    fixtures = fixtures or _load_fixtures()
+    # Whole passes over the recorded sequence keep the per-poll averages
+    # independent of --polls.
+    cycle = len(fixtures["getPlayerStatus"])
+    polls = -(-polls // cycle) * cycle
+    poll = SCENARIOS[scenario](size, fixtures)
+    # First update fetches getStatus, tears down first-update state, etc.
+    for _ in range(2):
+        await poll()
+
+    start = time.process_time()
+    for _ in range(polls):
+        await poll()
+    cpu = time.process_time() - start
+
+    tracemalloc.start()
+    try:
+        peak = 0
+        for _ in range(polls):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await poll()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+
+    with _CoroutineCounter() as counter:
+        for _ in range(polls):
+            await poll()
+
+    return {
+        "cpu_ms": round(cpu / polls * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "coroutines": round(counter.count / polls, 1),
+    }
+
+
+async def run_suite(polls: int, sizes=SIZES, scenarios=None) -> dict[str, dict]:
+    fixtures = _load_fixtures()
+    results = {}
+    for scenario in scenarios or SCENARIOS:
+        for size in sizes:
+            results[f"{scenario}/{size}"] = await measure(scenario, size, polls, fixtures)
+    return results
+
+
+def compare(results: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Return one line per metric that regressed against ``baseline``."""
+    regressions = []
+    for key, metrics in results.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        for metric, value in metrics.items():
+            limit = base.get(metric)
+            if limit is None:
+                continue
+            if metric not in _EXACT_METRICS:
+                limit *= 1 + tolerance
+            if value > limit:
+                regressions.append(f"{key} {metric}: {value} > baseline {base[metric]}")
+    return regressions
+
+
+def _print_table(results: dict[str, dict], baseline: dict[str, dict]) -> None:
+    print(f"{'scenario':<16} {'cpu_ms':>9} {'peak_kib':>9} {'coroutines':>11}   baseline")
+    for key, metrics in results.items():
+        base = baseline.get(key, {})
+        ref = " / ".join(str(base.get(m, "-")) for m in metrics)
+        print(
+            f"{key:<16} {metrics['cpu_ms']:9.3f} {metrics['peak_kib']:9.1f} "
+            f"{metrics['coroutines']:11.1f}   {ref}"
+        )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--polls", type=int, default=50)
+    parser.add_argument("--tolerance", type=float, default=0.5, help="allowed CPU/memory regression (0.5 = 50%%)")
+    parser.add_argument("--check", action="store_true", help="fail on regressions against baseline.json")
+    parser.add_argument("--save", action="store_true", help="write the results to baseline.json")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    results = asyncio.run(run_suite(args.polls))
+    baseline = json.loads(_BASELINE.read_text()) if _BASELINE.exists() else {}
+    _print_table(results, baseline)
+
+    if args.save:
+        _BASELINE.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+        print(f"baseline written to {_BASELINE}")
+    if args.check:
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
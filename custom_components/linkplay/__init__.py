@@ -6,15 +6,18 @@ https://github.com/phedoreanu/home-assistant-custom-components-linkplay
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+from collections.abc import Awaitable, Callable, Iterable
 from pathlib import Path
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 
 
@@ -30,7 +33,7 @@ def _read_manifest_version() -> str:
 VERSION = _read_manifest_version()
 
 DOMAIN = 'linkplay'
-PLATFORMS = [Platform.MEDIA_PLAYER]
+PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SENSOR]
 
 SERVICE_JOIN = 'join'
 SERVICE_UNJOIN = 'unjoin'
@@ -40,6 +43,10 @@ SERVICE_SNAP = 'snapshot'
 SERVICE_REST = 'restore'
 SERVICE_PLAY = 'play_track'
 SERVICE_SET_GROUP_VOLUME = 'set_group_volume'
+SERVICE_FADE_VOLUME = 'fade_volume'
+
+# Speakers handled at once by a multi-entity service call.
+SERVICE_PARALLEL_LIMIT = 8
 
 ATTR_MASTER = 'master'
 ATTR_PRESET = 'preset_number'
@@ -50,6 +57,7 @@ ATTR_SELECT = 'input_select'
 ATTR_SOURCE = 'source'
 ATTR_TRACK = 'track'
 ATTR_VOLUME = 'volume'
+ATTR_DURATION = 'duration'
 
 SERVICE_SCHEMA = vol.Schema({
     vol.Optional(ATTR_ENTITY_ID): cv.comp_entity_ids
@@ -89,6 +97,12 @@ SET_GROUP_VOLUME_SCHEMA = vol.Schema({
     vol.Required(ATTR_VOLUME): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
 })
 
+FADE_VOLUME_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.comp_entity_ids,
+    vol.Required(ATTR_VOLUME): vol.All(vol.Coerce(float), vol.Range(min=0, max=1)),
+    vol.Optional(ATTR_DURATION, default=10): vol.All(vol.Coerce(float), vol.Range(min=0, max=3600)),
+})
+
 _LOGGER = logging.getLogger(__name__)
 
 # No top-level YAML configuration for the integration itself — YAML users
@@ -141,6 +155,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         for service in (
             SERVICE_JOIN, SERVICE_UNJOIN, SERVICE_PRESET, SERVICE_CMD,
             SERVICE_SNAP, SERVICE_REST, SERVICE_PLAY, SERVICE_SET_GROUP_VOLUME,
+            SERVICE_FADE_VOLUME,
         ):
             if hass.services.has_service(DOMAIN, service):
                 hass.services.async_remove(DOMAIN, service)
@@ -148,6 +163,44 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget what was stored about a speaker whose entry was deleted."""
+    from .device_store import async_get_device_store
+
+    store = await async_get_device_store(hass)
+    store.async_remove(entry.data[CONF_HOST])
+
+
+async def async_run_for_entities(
+    service: str,
+    entities: Iterable,
+    handler: Callable[[object], Awaitable],
+    limit: int = SERVICE_PARALLEL_LIMIT,
+) -> None:
+    """Await ``handler(entity)`` for every entity, ``limit`` at a time.
+
+    One speaker failing does not stop the others; once all are done the
+    failures are raised together as a single ``HomeAssistantError``.
+    """
+    entities = list(entities)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(entity):
+        async with semaphore:
+            await handler(entity)
+
+    results = await asyncio.gather(*(_run(entity) for entity in entities), return_exceptions=True)
+    failures = []
+    for entity, result in zip(entities, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            _LOGGER.warning("%s failed for %s: %s", service, entity.entity_id, result)
+            failures.append(f"{entity.entity_id}: {result}")
+    if failures:
+        raise HomeAssistantError(f"{DOMAIN}.{service} failed for {'; '.join(failures)}")
+
+
 async def async_setup_services(hass: HomeAssistant) -> None:
     """Set up services for Linkplay integration."""
 
@@ -158,12 +211,10 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         entity_ids = service.data.get(ATTR_ENTITY_ID)
         entities = hass.data[DOMAIN].entities
 
-        if entity_ids:
-            if entity_ids == 'all':
-                entity_ids = [e.entity_id for e in entities]
-            elif isinstance(entity_ids, str):
-                entity_ids = [entity_ids]
-            entities = [e for e in entities if e.entity_id in entity_ids]
+        # Resolve the targets once; the branches below only see them.
+        if entity_ids and entity_ids != 'all':
+            targets = {entity_ids} if isinstance(entity_ids, str) else set(entity_ids)
+            entities = [e for e in entities if e.entity_id in targets]
 
         if service.service == SERVICE_JOIN:
             master = [e for e in hass.data[DOMAIN].entities
@@ -189,45 +240,53 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         elif service.service == SERVICE_PRESET:
             preset = service.data.get(ATTR_PRESET)
-            for device in entities:
-                if device.entity_id in entity_ids:
-                    _LOGGER.debug("**PRESET** entity: %s; preset: %s", device.entity_id, preset)
-                    await device.async_preset_button(preset)
+
+            async def _preset(device):
+                _LOGGER.debug("**PRESET** entity: %s; preset: %s", device.entity_id, preset)
+                await device.async_preset_button(preset)
+
+            await async_run_for_entities(service.service, entities, _preset)
 
         elif service.service == SERVICE_CMD:
             command = service.data.get(ATTR_CMD)
             notify = service.data.get(ATTR_NOTIF)
-            for device in entities:
-                if device.entity_id in entity_ids:
-                    _LOGGER.debug("**COMMAND** entity: %s; command: %s", device.entity_id, command)
-                    await device.async_execute_command(command, notify)
+
+            async def _command(device):
+                _LOGGER.debug("**COMMAND** entity: %s; command: %s", device.entity_id, command)
+                await device.async_execute_command(command, notify)
+
+            await async_run_for_entities(service.service, entities, _command)
 
         elif service.service == SERVICE_SNAP:
             switchinput = service.data.get(ATTR_SNAP)
-            for device in entities:
-                if device.entity_id in entity_ids:
-                    _LOGGER.debug("**SNAPSHOT** entity: %s;", device.entity_id)
-                    await device.async_snapshot(switchinput)
+
+            async def _snapshot(device):
+                _LOGGER.debug("**SNAPSHOT** entity: %s;", device.entity_id)
+                await device.async_snapshot(switchinput)
+
+            await async_run_for_entities(service.service, entities, _snapshot)
 
         elif service.service == SERVICE_REST:
-            for device in entities:
-                if device.entity_id in entity_ids:
-                    _LOGGER.debug("**RESTORE** entity: %s;", device.entity_id)
-                    await device.async_restore()
+
+            async def _restore(device):
+                _LOGGER.debug("**RESTORE** entity: %s;", device.entity_id)
+                await device.async_restore()
+
+            await async_run_for_entities(service.service, entities, _restore)
 
         elif service.service == SERVICE_PLAY:
             track = service.data.get(ATTR_TRACK)
-            for device in entities:
-                if device.entity_id in entity_ids:
-                    _LOGGER.debug("**PLAY TRACK** entity: %s; track: %s", device.entity_id, track)
-                    await device.async_play_track(track)
+
+            async def _play_track(device):
+                _LOGGER.debug("**PLAY TRACK** entity: %s; track: %s", device.entity_id, track)
+                await device.async_play_track(track)
+
+            await async_run_for_entities(service.service, entities, _play_track)
 
         elif service.service == SERVICE_SET_GROUP_VOLUME:
             volume = service.data.get(ATTR_VOLUME)
 
-            master_device = next(
-                (d for d in entities if d.entity_id in entity_ids), None
-            )
+            master_device = next(iter(entities), None)
             if master_device:
                 _LOGGER.debug(
                     "**SET GROUP VOLUME** master: %s; volume: %s",
@@ -236,6 +295,19 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 )
                 await master_device.async_set_group_volume(volume)
 
+        elif service.service == SERVICE_FADE_VOLUME:
+            volume = service.data.get(ATTR_VOLUME)
+            duration = service.data.get(ATTR_DURATION)
+
+            async def _fade(device):
+                _LOGGER.debug(
+                    "**FADE VOLUME** entity: %s; volume: %s; duration: %s",
+                    device.entity_id, volume, duration,
+                )
+                await device.async_fade_volume(volume, duration)
+
+            await async_run_for_entities(service.service, entities, _fade)
+
     # Register all services
     hass.services.async_register(
         DOMAIN, SERVICE_JOIN, async_service_handle, schema=JOIN_SERVICE_SCHEMA)
@@ -253,3 +325,5 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         DOMAIN, SERVICE_PLAY, async_service_handle, schema=PLYTRK_SERVICE_SCHEMA)
     hass.services.async_register(
         DOMAIN, SERVICE_SET_GROUP_VOLUME, async_service_handle, schema=SET_GROUP_VOLUME_SCHEMA)
+    hass.services.async_register(
+        DOMAIN, SERVICE_FADE_VOLUME, async_service_handle, schema=FADE_VOLUME_SCHEMA)
@@ -6,41 +6,123 @@ Wraps the two ways the firmware accepts commands:
 * TCP UART on port 8899 (for ``MCU+XXX`` style passthrough commands)
 
 Plus the throttled ``getPlayerStatus`` poll that other update logic
-hangs off of.
+hangs off of, and :meth:`async_wait_for_status`, which polls it until
+the speaker reports a given state instead of sleeping a fixed time
+after a command. HTTPAPI requests are queued through the per-host
+:mod:`request_scheduler` so user commands overtake status polls, and
+gated by the per-host :mod:`circuit_breaker` so an unreachable speaker
+fails fast instead of costing every caller a full timeout. Latency and
+errors of every call are recorded in the per-host :mod:`metrics`.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import socket
+import time
 from datetime import timedelta
 from http import HTTPStatus
 
 import aiohttp
-import async_timeout
 from homeassistant.const import STATE_UNAVAILABLE
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.util import Throttle
 
+from .circuit_breaker import STATE_CLOSED, get_circuit_breaker
+from .http_session import API_TIMEOUT, FIRST_UPDATE_TIMEOUT, async_get_linkplay_session
+from .metrics import (
+    CHANNEL_HTTPAPI,
+    CHANNEL_UART,
+    ERROR_CLIENT,
+    ERROR_CONNECT,
+    ERROR_HTTP,
+    ERROR_OTHER,
+    ERROR_PARSE,
+    ERROR_SSL,
+    ERROR_TIMEOUT,
+    get_metrics,
+)
+from .request_scheduler import (
+    PRIORITY_USER,
+    RequestDropped,
+    get_request_scheduler,
+    request_priority,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 _API_TIMEOUT = 2
-_FIRST_UPDATE_TIMEOUT = 10
 _TCPPORT = 8899
 _UART_HEAD1 = "18 96 18 20 "
 _UART_HEAD2 = " 00 00 00 c1 02 00 00 00 00 00 00 00 00 00 00 "
 _UNA_THROTTLE = timedelta(seconds=20)
+# async_wait_for_status poll interval: starts short, doubles up to the max.
+_WAIT_INTERVAL_MIN = 0.1
+_WAIT_INTERVAL_MAX = 0.5
+
+
+def volume_settled():
+    """Status condition: the same volume was reported twice in a row.
+
+    Inputs fade in after a switch; until then the reported volume moves.
+    """
+    last = None
+
+    def _settled(status: dict) -> bool:
+        nonlocal last
+        previous, last = last, status.get("vol")
+        return last is not None and last == previous
+
+    return _settled
+
+
+# getPlayerStatus fields that change when a recalled preset takes over.
+_PRESET_FIELDS = ("mode", "uri", "Title")
+
+
+def preset_applied(before: dict | None):
+    """Status condition: a preset recalled from ``before`` has taken over.
+
+    Met as soon as the firmware has applied the preset's stored volume,
+    or once the input / stream changed and the volume stopped moving.
+    Being in ``play`` is not enough: the speaker usually already was,
+    and line-in or Bluetooth presets never report it.
+    """
+    settled = volume_settled()
+
+    def _applied(status: dict) -> bool:
+        steady = settled(status)
+        if before is None:
+            return steady
+        if status.get("vol") != before.get("vol"):
+            return True
+        return steady and any(status.get(key) != before.get(key) for key in _PRESET_FIELDS)
+
+    return _applied
 
 
 class LinkPlayAPIClientMixin:
     """HTTPAPI / TCP UART client + throttled status poll."""
 
-    async def call_linkplay_httpapi(self, cmd: str, jsn: bool | None, protocol: str | None = None):
+    async def call_linkplay_httpapi(
+        self,
+        cmd: str,
+        jsn: bool | None,
+        protocol: str | None = None,
+        *,
+        priority: int | None = None,
+        raise_dropped: bool = False,
+    ):
         """Call the device httpapi.asp endpoint and return the parsed body.
 
         Returns ``False`` on any transport error so the caller can
         differentiate a failure from a legitimate ``None`` / empty
-        response payload.
+        response payload. Returns ``None`` when a status poll was
+        dropped by the scheduler because it went stale in the queue,
+        or raises :class:`RequestDropped` if ``raise_dropped`` is set.
+
+        ``priority`` overrides the scheduling lane picked from ``cmd``
+        (see :func:`request_priority`).
         """
         if protocol is None and self._protocol is None:
             _LOGGER.warning(
@@ -51,55 +133,133 @@ class LinkPlayAPIClientMixin:
 
         proto = self._protocol if protocol is None else protocol
         url = f"{proto}://{self._host}/httpapi.asp?command={cmd}"
-        timeout = _FIRST_UPDATE_TIMEOUT if self._first_update else _API_TIMEOUT
-        verify_ssl = proto == "https"
+        timeout = FIRST_UPDATE_TIMEOUT if self._first_update else API_TIMEOUT
+        if priority is None:
+            priority = request_priority(cmd)
+
+        breaker = get_circuit_breaker(self._host)
+        if not breaker.allow_request():
+            return self._circuit_open(breaker, cmd)
+        # A pass outside ``closed`` is the half-open probe and owns it;
+        # anything else re-checks once it has a slot, in case the breaker
+        # tripped while it was queued. Only the probe releases the pass.
+        probe = breaker.state != STATE_CLOSED
 
         try:
-            session = async_get_clientsession(self.hass)
-            async with async_timeout.timeout(timeout):
-                response = await session.get(url, ssl=verify_ssl, allow_redirects=True)
+            async with get_request_scheduler(self._host).slot(priority):
+                if not probe:
+                    if not breaker.allow_request():
+                        return self._circuit_open(breaker, cmd)
+                    probe = breaker.state != STATE_CLOSED
+                return await self._async_httpapi_request(url, cmd, jsn, timeout)
+        except RequestDropped:
+            _LOGGER.debug(
+                "For: %s (%s) dropped stale queued request: %s",
+                self._name, self._host, cmd,
+            )
+            if raise_dropped:
+                raise
+            return None
+        finally:
+            if probe:
+                breaker.release_probe()
+
+    def _circuit_open(self, breaker, cmd: str) -> bool:
+        _LOGGER.debug(
+            "For: %s (%s) circuit open, skipping %s (retry in %.0fs)",
+            self._name, self._host, cmd, breaker.retry_in,
+        )
+        return False
+
+    async def _async_httpapi_request(
+        self, url: str, cmd: str, jsn: bool | None, timeout: aiohttp.ClientTimeout,
+    ):
+        """Issue one HTTPAPI GET while holding a scheduler slot.
+
+        Feeds the outcome into the host's circuit breaker: any answer
+        (even a non-200) proves the speaker is reachable, a transport
+        error or a body that can't be read counts as a failure.
+        """
+        breaker = get_circuit_breaker(self._host)
+        metrics = get_metrics(self._host)
+        started = time.monotonic()
+        try:
+            session = async_get_linkplay_session(self.hass)
+            # The total timeout covers reading the body too, so read it
+            # here; ``async with`` hands the connection back either way.
+            async with session.get(url, timeout=timeout, allow_redirects=True) as response:
+                status = response.status
+                if status != HTTPStatus.OK:
+                    breaker.record_success()
+                    metrics.record_request(
+                        CHANNEL_HTTPAPI, cmd, started, ERROR_HTTP, status=status,
+                    )
+                    _LOGGER.error(
+                        "For: %s (%s) Get failed, response code: %s",
+                        self._name, self._host, status,
+                    )
+                    return False
+                size = response.content_length
+                if jsn:
+                    data = await response.json(content_type=None)
+                else:
+                    data = await response.text()
+                    _LOGGER.debug("For: %s cmd: %s resp: %s", self._name, cmd, data)
+                    size = len(data)
         except TimeoutError:
             _LOGGER.warning(
                 "Failed communicating with LinkPlayDevice (httpapi) '%s': Timeout",
                 self._name,
             )
+            metrics.record_request(CHANNEL_HTTPAPI, cmd, started, ERROR_TIMEOUT)
+            breaker.record_failure()
             return False
         except aiohttp.ClientSSLError as error:
             _LOGGER.warning(
                 "Failed communicating with LinkPlayDevice (httpapi) '%s': SSL Error - %s. Try using 'http' protocol",
                 self._name, error,
             )
+            metrics.record_request(CHANNEL_HTTPAPI, cmd, started, ERROR_SSL)
+            breaker.record_failure()
             return False
         except aiohttp.ClientConnectorError as error:
             _LOGGER.warning(
                 "Failed communicating with LinkPlayDevice (httpapi) '%s': Connection Error - %s",
                 self._name, error,
             )
+            metrics.record_request(CHANNEL_HTTPAPI, cmd, started, ERROR_CONNECT)
+            breaker.record_failure()
             return False
         except aiohttp.ClientError as error:
             _LOGGER.warning(
                 "Failed communicating with LinkPlayDevice (httpapi) '%s': %s",
                 self._name, type(error).__name__,
             )
+            metrics.record_request(CHANNEL_HTTPAPI, cmd, started, ERROR_CLIENT)
+            breaker.record_failure()
+            return False
+        except ValueError:
+            _LOGGER.warning(
+                "Failed communicating with LinkPlayDevice (httpapi) '%s': Invalid response to %s",
+                self._name, cmd,
+            )
+            metrics.record_request(CHANNEL_HTTPAPI, cmd, started, ERROR_PARSE)
+            breaker.record_failure()
             return False
         except Exception as error:
             _LOGGER.warning(
                 "Failed communicating with LinkPlayDevice (httpapi) '%s': Unexpected error - %s",
                 self._name, error,
             )
+            metrics.record_request(CHANNEL_HTTPAPI, cmd, started, ERROR_OTHER)
+            breaker.record_failure()
             return False
 
-        if response.status != HTTPStatus.OK:
-            _LOGGER.error(
-                "For: %s (%s) Get failed, response code: %s",
-                self._name, self._host, response.status,
-            )
-            return False
-
-        if jsn:
-            return await response.json(content_type=None)
-        data = await response.text()
-        _LOGGER.debug("For: %s cmd: %s resp: %s", self._name, cmd, data)
+        breaker.record_success()
+        metrics.record_request(
+            CHANNEL_HTTPAPI, cmd, started, status=status,
+            size=size if isinstance(size, int) else -1,
+        )
         return data
 
     async def call_linkplay_tcpuart(self, cmd: str) -> str | None:
@@ -130,7 +290,11 @@ class LinkPlayAPIClientMixin:
                 )
                 return None
 
+        started = time.monotonic()
         data = await self.hass.async_add_executor_job(_send_recv)
+        get_metrics(self._host).record_request(
+            CHANNEL_UART, cmd, started, ERROR_CONNECT if data is None else None,
+        )
         if data is None:
             return None
 
@@ -148,35 +312,68 @@ class LinkPlayAPIClientMixin:
     async def async_get_status(self) -> None:
         """Throttled getPlayerStatus poll. Marks the entity unavailable on failure."""
         resp = await self.call_linkplay_httpapi("getPlayerStatus", True)
+        if resp is None:
+            # Dropped by the request scheduler: keep the last status and
+            # let the next poll cycle try again.
+            return
         if resp is False:
             _LOGGER.debug(
                 "Unable to connect to device: %s, %s", self.entity_id, self._name,
             )
-            self._state = STATE_UNAVAILABLE
+            self._transport.state = STATE_UNAVAILABLE
             self._unav_throttle = True
-            self._wait_for_mcu = 0
-            self._playhead_position = None
-            self._duration = None
-            self._position_updated_at = None
-            self._media_title = None
-            self._media_artist = None
-            self._media_album = None
-            self._media_image_url = None
-            self._media_uri = None
-            self._media_uri_final = None
-            self._media_source_uri = None
-            self._playing_mediabrowser = False
-            self._playing_stream = False
-            self._icecast_name = None
-            self._source = None
+            self._transport.playhead_position = None
+            self._transport.duration = None
+            self._transport.position_updated_at = None
+            self._meta.title = None
+            self._meta.artist = None
+            self._meta.album = None
+            self._meta.image_url = None
+            self._meta.uri = None
+            self._meta.uri_final = None
+            self._meta.source_uri = None
+            self._playing.mediabrowser = False
+            self._playing.stream = False
+            self._meta.icecast_name = None
+            self._transport.source = None
             self._upnp_device = None
+            self._upnp_actions = {}
             self._first_update = True
-            self._slave_mode = False
-            self._is_master = False
+            self._group.slave_mode = False
+            self._group.is_master = False
             self._player_statdata = None
             return
         self._player_statdata = resp.copy()
 
+    async def async_wait_for_status(
+        self, condition, timeout: float, *, command: str = "getPlayerStatus",
+    ) -> dict | None:
+        """Poll ``command`` until ``condition(status)`` or ``timeout``.
+
+        Polls right away, then at growing intervals, in the user-command
+        lane so the wait is not queued behind routine status polls.
+        Returns the last status read, whether or not it met the condition
+        (callers that care check it again), or None if none could be read.
+        """
+        deadline = time.monotonic() + timeout
+        interval = _WAIT_INTERVAL_MIN
+        last = None
+        while True:
+            status = await self.call_linkplay_httpapi(command, True, priority=PRIORITY_USER)
+            if isinstance(status, dict):
+                last = status
+                if condition(status):
+                    return status
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _LOGGER.debug(
+                    "For: %s (%s) %s condition not met within %ss",
+                    self._name, self._host, command, timeout,
+                )
+                return last
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(interval * 2, _WAIT_INTERVAL_MAX)
+
     async def async_trigger_schedule_update(self, before: bool) -> None:
         """Convenience wrapper for callers that just want a fresh HA state."""
         await self.async_schedule_update_ha_state(before)
@@ -0,0 +1,134 @@
+"""Per-host circuit breaker for unreachable LinkPlay speakers.
+
+A powered-off speaker otherwise costs every caller the full HTTPAPI
+timeout: each service call, each member of a group-volume loop and each
+join attempt waits 2-10 s for a socket that will never answer. The
+breaker remembers that a host is dead and lets callers fail fast:
+
+* ``closed``    - normal operation; consecutive transport failures are
+  counted and the breaker opens at ``_FAILURE_THRESHOLD``.
+* ``open``      - requests are refused without touching the network
+  until the backoff expires. The backoff doubles on every trip, from
+  ``_BASE_BACKOFF`` up to ``_MAX_BACKOFF``.
+* ``half_open`` - the backoff expired; exactly one probe request is let
+  through. Success closes the breaker, failure re-opens it with the
+  next (longer) backoff.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+_FAILURE_THRESHOLD = 3
+_BASE_BACKOFF = 5.0    # seconds
+_MAX_BACKOFF = 300.0   # seconds
+
+
+class LinkPlayCircuitBreaker:
+    """Closed / open / half-open breaker with exponential backoff."""
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = _FAILURE_THRESHOLD,
+        base_backoff: float = _BASE_BACKOFF,
+        max_backoff: float = _MAX_BACKOFF,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._trips = 0
+        self._retry_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """Current state; an expired ``open`` reads as ``half_open``."""
+        if self._state == STATE_OPEN and self._clock() >= self._retry_at:
+            return STATE_HALF_OPEN
+        return self._state
+
+    @property
+    def is_closed(self) -> bool:
+        """True unless the breaker tripped and no probe has succeeded since."""
+        return self._state == STATE_CLOSED
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when not open)."""
+        if self._state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self._retry_at - self._clock())
+
+    def allow_request(self) -> bool:
+        """Return True if a request may go out now.
+
+        Moving from ``open`` to ``half_open`` happens here, so the
+        caller that gets True after the backoff is the probe.
+        """
+        if self._state == STATE_CLOSED:
+            return True
+        if self._state == STATE_OPEN:
+            if self._clock() < self._retry_at:
+                return False
+            self._state = STATE_HALF_OPEN
+            self._probing = False
+        if self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def release_probe(self) -> None:
+        """Let another probe through if the last one ended without a verdict.
+
+        Covers probes that were dropped or cancelled before the host
+        could answer; harmless after ``record_success``/``record_failure``.
+        """
+        self._probing = False
+
+    def record_success(self) -> None:
+        """The host answered: close the breaker and reset the backoff."""
+        self._state = STATE_CLOSED
+        self._failures = 0
+        self._trips = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """The host did not answer: count it and open when due.
+
+        Ignored while open: requests that were already in flight when
+        the breaker tripped must not trip it again and stretch the
+        backoff.
+        """
+        if self._state == STATE_OPEN:
+            return
+        self._failures += 1
+        if self._state == STATE_HALF_OPEN or self._failures >= self.failure_threshold:
+            self._trip()
+
+    def _trip(self) -> None:
+        backoff = min(self.max_backoff, self.base_backoff * 2 ** self._trips)
+        self._trips += 1
+        self._state = STATE_OPEN
+        self._retry_at = self._clock() + backoff
+        self._probing = False
+
+
+_BREAKERS: dict[str, LinkPlayCircuitBreaker] = {}
+
+
+def get_circuit_breaker(host: str) -> LinkPlayCircuitBreaker:
+    """Return the shared breaker for ``host``, creating it on first use."""
+    breaker = _BREAKERS.get(host)
+    if breaker is None:
+        breaker = _BREAKERS[host] = LinkPlayCircuitBreaker()
+    return breaker
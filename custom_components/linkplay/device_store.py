@@ -0,0 +1,82 @@
+"""Persisted identity and capabilities of LinkPlay speakers.
+
+Every restart used to re-learn what a speaker is before it became fully
+usable: firmware / MCU version and preset count from ``getStatus``, and
+the UPnP description plus one SCPD document per service from port
+49152. This module keeps the last known answers in HA's ``Store``
+(``.storage/linkplay.devices``), one record per host:
+
+* ``uuid``, ``protocol``, ``firmware``, ``mcu_ver``, ``preset_key``
+* ``upnp`` - the description / SCPD documents keyed by URL
+
+On a warm start the entity applies its record when it is added and the
+UPnP device is rebuilt from the stored documents through the shared
+factory's document cache (see :mod:`upnp_factory`), so the first poll
+makes no description requests. Records are revalidated lazily: the first ``getStatus`` still
+runs, and a different uuid or firmware drops the stored documents so
+they are fetched again; so does a UPnP device that fails to build from
+them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_KEY = f"{DOMAIN}.devices"
+STORAGE_VERSION = 1
+# Records change at most once per speaker per restart; batch the writes.
+_SAVE_DELAY = 30
+
+_STORE_KEY = f"{DOMAIN}_device_store"
+
+
+class LinkPlayDeviceStore:
+    """Host -> record map backed by one ``Store`` file."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, dict[str, Any]]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._records: dict[str, dict[str, Any]] = {}
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        async with self._load_lock:
+            if self._loaded:
+                return
+            self._records = await self._store.async_load() or {}
+            self._loaded = True
+
+    def get(self, host: str) -> dict[str, Any] | None:
+        return self._records.get(host)
+
+    @callback
+    def async_update(self, host: str, **fields: Any) -> None:
+        """Merge ``fields`` into the record of ``host`` and schedule a save."""
+        record = self._records.setdefault(host, {})
+        if all(record.get(key) == value for key, value in fields.items()):
+            return
+        record.update(fields)
+        self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    @callback
+    def async_remove(self, host: str) -> None:
+        if self._records.pop(host, None) is not None:
+            self._store.async_delay_save(self._data_to_save, _SAVE_DELAY)
+
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        return self._records
+
+
+async def async_get_device_store(hass: HomeAssistant) -> LinkPlayDeviceStore:
+    """Return the loaded device store, creating it on first use."""
+    store = hass.data.get(_STORE_KEY)
+    if store is None:
+        store = hass.data[_STORE_KEY] = LinkPlayDeviceStore(hass)
+    await store.async_load()
+    return store
@@ -0,0 +1,118 @@
+"""Config-entry diagnostics download for LinkPlay speakers.
+
+Besides the request metrics (histograms plus the ring buffer of the
+last requests, see :mod:`metrics`) the dump captures the entity's
+view of the speaker: the last decoded ``getPlayerStatus``, the
+transport, metadata, playback-flag and snapshot records, multiroom
+topology, throttle / circuit-breaker / scheduler state, metadata
+caches and per-provider timings.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import somafm_fetcher_mixin
+from .circuit_breaker import get_circuit_breaker
+from .const import DOMAIN
+from .metrics import (
+    CHANNEL_ICECAST,
+    CHANNEL_ITUNES,
+    CHANNEL_LASTFM,
+    CHANNEL_SOMAFM,
+    CHANNEL_UPNP,
+    get_metrics,
+)
+from .request_scheduler import get_request_scheduler
+
+TO_REDACT = {"lastfm_api_key"}
+
+_PROVIDER_CHANNELS = (CHANNEL_UPNP, CHANNEL_SOMAFM, CHANNEL_ITUNES, CHANNEL_LASTFM, CHANNEL_ICECAST)
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry,
+) -> dict[str, Any]:
+    """Return the entry config, the speaker's state and its request metrics."""
+    host = entry.data[CONF_HOST]
+    metrics = get_metrics(host)
+    breaker = get_circuit_breaker(host)
+    scheduler = get_request_scheduler(host)
+    entity = _find_entity(hass, host)
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "device": None if entity is None else _entity_diagnostics(entity),
+        "transport": {
+            "circuit_breaker": {"state": breaker.state, "retry_in": round(breaker.retry_in, 1)},
+            "scheduler": {
+                "active": scheduler.active,
+                "queued": scheduler.queued,
+                "dropped": scheduler.dropped,
+            },
+        },
+        "providers": {
+            channel: {
+                "count": sum(s.latency.count for s in metrics.requests.get(channel, {}).values()),
+                "p50_ms": metrics.latency_percentile(0.5, channel),
+                "p95_ms": metrics.latency_percentile(0.95, channel),
+                "errors": metrics.error_counts(channel),
+            }
+            for channel in _PROVIDER_CHANNELS
+        },
+        "metrics": metrics.as_dict(),
+    }
+
+
+def _find_entity(hass: HomeAssistant, host: str):
+    data = hass.data.get(DOMAIN)
+    for entity in getattr(data, "entities", ()):
+        if getattr(entity, "_host", None) == host:
+            return entity
+    return None
+
+
+def _entity_id(entity) -> str | None:
+    return None if entity is None else entity.entity_id
+
+
+def _entity_diagnostics(entity) -> dict[str, Any]:
+    return {
+        "entity_id": entity.entity_id,
+        "name": entity._name,
+        "protocol": entity._protocol,
+        "firmware": entity._fw_ver,
+        "model": entity._model,
+        "quirks": entity._quirks._asdict(),
+        "mcu": entity._mcu_ver,
+        "state": entity._transport.state,
+        "player": entity._transport.as_dict(),
+        "metadata": entity._meta.as_dict(),
+        "player_status": entity._player_statdata,
+        "playing": entity._playing.as_dict(),
+        "snapshot": {"active": entity._snapshot_active, **entity._snap.as_dict()},
+        "topology": {
+            "is_master": entity._group.is_master,
+            "slave_mode": entity._group.slave_mode,
+            "master": _entity_id(entity._group.master),
+            "group": list(entity._group.members or ()),
+            "slaves": [_entity_id(slave) for slave in entity._group.slave_list or ()],
+            "wifidirect": entity._group.wifidirect,
+        },
+        "throttle": {
+            "first_update": entity._first_update,
+            "unavailable_throttle": entity._unav_throttle,
+        },
+        "caches": {
+            "itunes_last_lookup": getattr(entity, "_itunes_last_lookup", None),
+            "somafm_station": getattr(entity, "_somafm_cached_station", None),
+            "somafm_channels": len(somafm_fetcher_mixin._channel_map_cache or ()),
+            "usb_tracks": len(entity._trackq),
+            "usb_queue_hash": entity._track_index.digest,
+        },
+    }
@@ -0,0 +1,21 @@
+"""Firmware releases that change a LinkPlay speaker's behaviour.
+
+The thresholds are used by the quirk registry (see :mod:`quirks`),
+which parses a speaker's version once and turns these into flags.
+"""
+
+from __future__ import annotations
+
+# Router-mode (non Wi-Fi-direct) multiroom.
+FW_MROOM_RTR_MIN = "4.2.8020"
+# ``MCU+PAS+RAKOIT:...`` commands over the TCP UART (Arylic boards).
+FW_RAKOIT_UART_MIN = "4.2.9326"
+# Slow to let go of a stream: pause before switching or stopping.
+FW_SLOW_STREAMS = "4.6"
+
+DEFAULT_FIRMWARE = "1.0.0"
+
+
+def parse_version(version: str) -> tuple[str, ...]:
+    """Comparable form of a dotted version: each part zero-padded."""
+    return tuple(point.zfill(8) for point in version.split("."))
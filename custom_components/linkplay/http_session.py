@@ -0,0 +1,75 @@
+"""Integration-owned aiohttp session for talking to LinkPlay speakers.
+
+HA's shared ``async_get_clientsession`` is tuned for internet APIs: a
+global connection limit shared with every other integration, a DNS
+cache (useless for the raw IPs speakers are configured with) and
+certificate verification that the speakers' self-signed ``https``
+certificates never pass. The speakers themselves are small embedded
+HTTP servers that cope badly with many parallel sockets and often
+close the connection right after answering.
+
+This module builds one ``ClientSession`` per HA instance with a
+connector sized for that: a small per-host limit (matching the request
+scheduler), short keep-alive so half-closed sockets are recycled
+before the firmware drops them, no DNS caching and a no-verify SSL
+context for the ``https`` variant. Timeouts are ``ClientTimeout``
+objects built once at import time.
+
+Internet lookups (SomaFM, iTunes, Last.fm, Icecast) keep using HA's
+shared session.
+"""
+
+from __future__ import annotations
+
+import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.ssl import get_default_no_verify_context
+
+from .const import DOMAIN
+
+# Mirrors request_scheduler._MAX_CONCURRENT: never open more sockets to
+# one speaker than the scheduler will let requests through.
+_LIMIT_PER_HOST = 2
+# Overall cap across every speaker of the installation.
+_LIMIT = 64
+# LinkPlay firmware closes idle sockets after a few seconds; drop ours
+# first so a request never lands on a connection the speaker already
+# hung up on.
+_KEEPALIVE_TIMEOUT = 5.0
+
+API_TIMEOUT = aiohttp.ClientTimeout(total=2)
+FIRST_UPDATE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+_SESSION_KEY = f"{DOMAIN}_session"
+
+
+def create_linkplay_session() -> aiohttp.ClientSession:
+    """Build a ``ClientSession`` with the LAN-speaker connector settings."""
+    connector = aiohttp.TCPConnector(
+        limit=_LIMIT,
+        limit_per_host=_LIMIT_PER_HOST,
+        keepalive_timeout=_KEEPALIVE_TIMEOUT,
+        use_dns_cache=False,
+        ssl=get_default_no_verify_context(),
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=API_TIMEOUT)
+
+
+@callback
+def async_get_linkplay_session(hass: HomeAssistant) -> aiohttp.ClientSession:
+    """Return the shared speaker session, creating it on first use.
+
+    The session is closed when Home Assistant shuts down.
+    """
+    session = hass.data.get(_SESSION_KEY)
+    if session is not None and not session.closed:
+        return session
+
+    session = hass.data[_SESSION_KEY] = create_linkplay_session()
+
+    async def _async_close(_event: Event) -> None:
+        await session.close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return session
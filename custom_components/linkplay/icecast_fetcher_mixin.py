@@ -10,12 +10,14 @@ from __future__ import annotations
 
 import logging
 import struct
+import time
 import urllib.request
 from datetime import timedelta
 
 from homeassistant.util import Throttle
 
 from .metadata import parse_icy_name, parse_icy_stream_title
+from .metrics import CHANNEL_ICECAST, ERROR_OTHER, get_metrics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,40 +65,44 @@ class LinkPlayIcecastFetcherMixin:
         if self._icecast_meta == "Off":
             return True
 
+        metrics = get_metrics(self._host)
+        started = time.monotonic()
         try:
             icy_name, icy_metaint, chunks = await self.hass.async_add_executor_job(
-                _fetch_icecast_headers_and_chunks, self._media_uri_final,
+                _fetch_icecast_headers_and_chunks, self._meta.uri_final,
             )
         except Exception:
+            metrics.record_request(CHANNEL_ICECAST, "metadata", started, ERROR_OTHER)
             _LOGGER.debug(
-                "For: %s Metadata error: %s", self._name, self._media_uri_final,
+                "For: %s Metadata error: %s", self._name, self._meta.uri_final,
             )
-            self._media_title = None
-            self._media_artist = None
-            self._icecast_name = None
-            self._media_image_url = None
+            self._meta.title = None
+            self._meta.artist = None
+            self._meta.icecast_name = None
+            self._meta.image_url = None
             return True
+        metrics.record_request(CHANNEL_ICECAST, "metadata", started)
 
-        self._icecast_name = parse_icy_name(icy_name)
+        self._meta.icecast_name = parse_icy_name(icy_name)
 
         if self._icecast_meta == "StationName" or icy_metaint is None:
-            self._media_title = self._icecast_name
-            self._media_artist = None
-            self._media_image_url = None
+            self._meta.title = self._meta.icecast_name
+            self._meta.artist = None
+            self._meta.image_url = None
             return True
 
         # Title may not be in the first chunk; try several.
         for chunk in chunks:
-            artist, title = parse_icy_stream_title(chunk, self._icecast_name)
+            artist, title = parse_icy_stream_title(chunk, self._meta.icecast_name)
             if artist is None and title is None:
                 # No StreamTitle in this chunk; fall back to station name
                 # and keep scanning subsequent chunks.
-                self._media_title = self._icecast_name
-                self._media_artist = None
-                self._media_image_url = None
+                self._meta.title = self._meta.icecast_name
+                self._meta.artist = None
+                self._meta.image_url = None
                 continue
-            self._media_artist = artist
-            self._media_title = title
+            self._meta.artist = artist
+            self._meta.title = title
             return True
 
         return True
@@ -8,7 +8,7 @@ key, no rate-limit headers, JSON response.
 
     https://itunes.apple.com/search?term=<artist>+<title>&entity=song&limit=1
 
-The mixin populates ``self._media_image_url`` and remembers the last
+The mixin populates ``self._meta.image_url`` and remembers the last
 ``(artist, title)`` it looked up so subsequent polls inside the same
 track skip the network call entirely.
 """
@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import logging
 import re
+import time
 import urllib.parse
 from datetime import timedelta
 from http import HTTPStatus
@@ -26,6 +27,15 @@ import async_timeout
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.util import Throttle
 
+from .metrics import (
+    CHANNEL_ITUNES,
+    ERROR_CLIENT,
+    ERROR_HTTP,
+    ERROR_PARSE,
+    ERROR_TIMEOUT,
+    get_metrics,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 _ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
@@ -46,19 +56,21 @@ class LinkPlayItunesArtworkMixin:
 
     @Throttle(_ITUNES_THROTTLE)
     async def async_get_itunes_artwork(self) -> bool:
-        """Replace ``self._media_image_url`` with iTunes art if available.
+        """Replace ``self._meta.image_url`` with iTunes art if available.
 
         Returns True when a cover URL was set, False otherwise.
         """
-        artist = self._media_artist
-        title = self._media_title
+        artist = self._meta.artist
+        title = self._meta.title
         if not artist or not title:
             return False
 
         # Skip the network round-trip when we already looked up the
         # same (artist, title). The track-cache survives between polls
         # so an entire song-long stream only hits iTunes once.
+        metrics = get_metrics(self._host)
         last = getattr(self, "_itunes_last_lookup", None)
+        metrics.record_cache(CHANNEL_ITUNES, last == (artist, title))
         if last == (artist, title):
             return False
 
@@ -66,10 +78,15 @@ class LinkPlayItunesArtworkMixin:
         url = f"{_ITUNES_SEARCH_URL}?term={term}&entity=song&limit=1"
 
         session = async_get_clientsession(self.hass)
+        started = time.monotonic()
         try:
             async with async_timeout.timeout(5):
                 response = await session.get(url)
         except (TimeoutError, aiohttp.ClientError) as error:
+            metrics.record_request(
+                CHANNEL_ITUNES, "search", started,
+                ERROR_TIMEOUT if isinstance(error, TimeoutError) else ERROR_CLIENT,
+            )
             _LOGGER.debug(
                 "[%s @ %s] iTunes fetch failed: %s",
                 self._name, self._host, type(error).__name__,
@@ -77,6 +94,7 @@ class LinkPlayItunesArtworkMixin:
             return False
 
         if response.status != HTTPStatus.OK:
+            metrics.record_request(CHANNEL_ITUNES, "search", started, ERROR_HTTP)
             _LOGGER.debug(
                 "[%s @ %s] iTunes search -> HTTP %s",
                 self._name, self._host, response.status,
@@ -86,11 +104,13 @@ class LinkPlayItunesArtworkMixin:
         try:
             data = await response.json(content_type=None)
         except (aiohttp.ContentTypeError, ValueError) as error:
+            metrics.record_request(CHANNEL_ITUNES, "search", started, ERROR_PARSE)
             _LOGGER.debug(
                 "[%s @ %s] iTunes JSON parse failed: %s",
                 self._name, self._host, error,
             )
             return False
+        metrics.record_request(CHANNEL_ITUNES, "search", started)
 
         results = data.get("results") or []
         if not results:
@@ -102,10 +122,10 @@ class LinkPlayItunesArtworkMixin:
             self._itunes_last_lookup = (artist, title)
             return False
 
-        self._media_image_url = _upscale_artwork(thumb)
+        self._meta.image_url = _upscale_artwork(thumb)
         self._itunes_last_lookup = (artist, title)
         _LOGGER.debug(
             "[%s @ %s] iTunes art -> %s",
-            self._name, self._host, self._media_image_url,
+            self._name, self._host, self._meta.image_url,
         )
         return True
@@ -0,0 +1,200 @@
+"""Last.fm cover-art client shared by every speaker.
+
+Last.fm limits request rates per API application and answers an
+over-eager client with a placeholder "star" cover (or error 29) rather
+than an HTTP error. Every entity used to build its own query by string
+concatenation, so a group of speakers playing the same stream asked
+for the same track once each, a title containing ``&`` broke the
+query, and nothing waited for the server.
+
+:class:`LastFmClient` is one process-wide instance
+(:func:`get_lastfm_client`):
+
+* a token bucket paces requests across all entities; a lookup that
+  would wait longer than ``_MAX_WAIT`` for a token is skipped (the
+  cover is retried on the next track change)
+* query parameters are encoded by aiohttp, with a request timeout
+* results are cached by normalized artist / title, including "no
+  cover"; concurrent lookups of one track share a single request
+* the placeholder cover or error 29 backs off all lookups, doubling
+  from ``_BACKOFF_MIN`` to ``_BACKOFF_MAX``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from http import HTTPStatus
+
+import aiohttp
+
+from .metrics import (
+    CHANNEL_LASTFM,
+    ERROR_CLIENT,
+    ERROR_HTTP,
+    ERROR_TIMEOUT,
+    get_metrics,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_API_URL = "http://ws.audioscrobbler.com/2.0/"
+_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# Last.fm asks for at most 5 requests per second per application,
+# averaged over five minutes; stay well below it.
+_RATE = 1.0  # tokens per second
+_BURST = 5
+_MAX_WAIT = 2.0
+
+_CACHE_SIZE = 256
+
+_BACKOFF_MIN = 30.0
+_BACKOFF_MAX = 900.0
+
+# The CDN URL substring last.fm returns for the placeholder "sheriff
+# star" cover that signals a rate-limit or unknown album.
+RATELIMIT_MARKER = "2a96cbd8b46e442fc41c2b86b821562f"
+_ERROR_RATE_LIMITED = 29
+
+
+def track_key(artist: str, title: str) -> tuple[str, str]:
+    """Cache key: case-folded, whitespace-collapsed artist and title."""
+    return " ".join(artist.casefold().split()), " ".join(title.casefold().split())
+
+
+class TokenBucket:
+    """Requests allowed at ``rate`` per second with bursts of ``capacity``."""
+
+    __slots__ = ("rate", "capacity", "_tokens", "_stamp")
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._stamp = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token if one is free; otherwise return the seconds until one is."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+        self._stamp = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+class LastFmClient:
+    """Paced, cached ``track.getInfo`` cover lookups."""
+
+    def __init__(self, rate: float = _RATE, burst: int = _BURST) -> None:
+        self._bucket = TokenBucket(rate, burst)
+        self._cache: OrderedDict[tuple[str, str], str | None] = OrderedDict()
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self._backoff = 0.0
+        self._blocked_until = 0.0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    async def async_track_cover(
+        self, session: aiohttp.ClientSession, api_key: str,
+        artist: str, title: str, host: str,
+    ) -> str | None:
+        """Cover art URL for the track, or None (unknown, failed or paced out)."""
+        key = track_key(artist, title)
+        metrics = get_metrics(host)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            metrics.record_cache(CHANNEL_LASTFM, True)
+            return self._cache[key]
+        metrics.record_cache(CHANNEL_LASTFM, False)
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self._async_lookup(session, api_key, artist, title, key, host)
+            )
+            self._inflight[key] = pending
+            pending.add_done_callback(lambda _done: self._inflight.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _async_lookup(
+        self, session: aiohttp.ClientSession, api_key: str,
+        artist: str, title: str, key: tuple[str, str], host: str,
+    ) -> str | None:
+        if time.monotonic() < self._blocked_until:
+            return None
+        while (delay := self._bucket.take()) > 0:
+            if delay > _MAX_WAIT:
+                _LOGGER.debug("Last.fm lookups saturated; skipping %s - %s", artist, title)
+                return None
+            await asyncio.sleep(delay)
+
+        params = {
+            "method": "track.getInfo",
+            "artist": artist,
+            "track": title,
+            "api_key": api_key,
+            "format": "json",
+        }
+        metrics = get_metrics(host)
+        started = time.monotonic()
+        try:
+            async with session.get(_API_URL, params=params, timeout=_TIMEOUT) as response:
+                if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                    metrics.record_request(CHANNEL_LASTFM, "track.getInfo", started, ERROR_HTTP)
+                    self._back_off()
+                    return None
+                if response.status != HTTPStatus.OK:
+                    metrics.record_request(CHANNEL_LASTFM, "track.getInfo", started, ERROR_HTTP)
+                    _LOGGER.error("Last.fm GET failed, response code: %s", response.status)
+                    return None
+                data = await response.json(content_type=None)
+        except (TimeoutError, aiohttp.ClientError) as error:
+            metrics.record_request(
+                CHANNEL_LASTFM, "track.getInfo", started,
+                ERROR_TIMEOUT if isinstance(error, TimeoutError) else ERROR_CLIENT,
+            )
+            _LOGGER.error("Failed communicating with Last.fm: %s", type(error))
+            return None
+        metrics.record_request(CHANNEL_LASTFM, "track.getInfo", started)
+
+        if isinstance(data, dict) and data.get("error") == _ERROR_RATE_LIMITED:
+            self._back_off()
+            return None
+        try:
+            cover = data["track"]["album"]["image"][3]["#text"] or None
+        except (TypeError, ValueError, KeyError, IndexError):
+            cover = None
+        if cover is not None and RATELIMIT_MARKER in cover:
+            self._back_off()
+            return None
+
+        self._backoff = 0.0
+        self._cache[key] = cover
+        if len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return cover
+
+    def _back_off(self) -> None:
+        first = not self._backoff
+        self._backoff = min(self._backoff * 2 or _BACKOFF_MIN, _BACKOFF_MAX)
+        self._blocked_until = time.monotonic() + self._backoff
+        (_LOGGER.warning if first else _LOGGER.debug)(
+            "Last.fm rate limit hit; pausing cover lookups for %ss", self._backoff,
+        )
+
+
+_CLIENT: LastFmClient | None = None
+
+
+def get_lastfm_client() -> LastFmClient:
+    """Return the client shared by every speaker, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = LastFmClient()
+    return _CLIENT
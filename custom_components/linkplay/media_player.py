@@ -11,20 +11,18 @@ import voluptuous as vol
 
 from datetime import timedelta
 import logging
-from json import loads, dumps
 import binascii
 import string
+import time
 import aiohttp
 
 from http import HTTPStatus
 
-from async_upnp_client.client_factory import UpnpFactory
-from async_upnp_client.aiohttp import AiohttpRequester
 
 
 from homeassistant.util.dt import utcnow
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from homeassistant.components.media_player import (
     PLATFORM_SCHEMA,
@@ -39,6 +37,7 @@ from homeassistant.components import media_source
 from homeassistant.components.media_player.browse_media import (
     async_process_play_media_url,
 )
+from homeassistant.components.media_player.errors import BrowseError
 
 from homeassistant.components.media_player.const import (
     MediaType,
@@ -57,22 +56,35 @@ from homeassistant.const import (
 
 from . import ATTR_MASTER
 from .metadata import (
+    DidlDecoder,
     decode_hex_utf8,
     parse_player_status_field,
 )
-from .api_client_mixin import LinkPlayAPIClientMixin
+from .api_client_mixin import LinkPlayAPIClientMixin, preset_applied
+from .circuit_breaker import get_circuit_breaker
+from .device_store import async_get_device_store
+from .http_session import API_TIMEOUT as PROBE_TIMEOUT, async_get_linkplay_session
 from .commands_mixin import LinkPlayCommandsMixin
 from .icecast_fetcher_mixin import LinkPlayIcecastFetcherMixin
 from .itunes_artwork_mixin import LinkPlayItunesArtworkMixin
 from .lastfm_mixin import LinkPlayLastFmMixin
 from .media_controls_mixin import LinkPlayMediaControlsMixin
+from .metrics import get_metrics
 from .multiroom_mixin import LinkPlayMultiroomMixin
 from .setters_mixin import LinkPlaySettersMixin
 from .snapshot_mixin import LinkPlaySnapshotMixin
+from .firmware import DEFAULT_FIRMWARE
+from .quirks import resolve_quirks
+from .request_scheduler import PRIORITY_USER, get_request_scheduler
+from .source_catalog import SourceCatalog
+from .state import GroupState, MediaMetadata, PlaybackFlags, SnapshotState, TransportState
 from .somafm_fetcher_mixin import LinkPlaySomaFmFetcherMixin, somafm_channel_slug
 from .stream_resolver_mixin import LinkPlayStreamResolverMixin
+from .track_index import TrackIndex
+from .upnp_factory import get_upnp_factory
 from .upnp_mixin import LinkPlayUPnPMixin
 from .volume_controls_mixin import LinkPlayVolumeControlsMixin
+from .volume_engine import VolumeEngine
 from .const import (
     DOMAIN,
     CONF_ICECAST_METADATA,
@@ -115,16 +127,9 @@ CONF_COMMONSOURCES = 'common_sources'
 CONF_UUID = 'uuid'
 
 DEBUGSTR_ATTR = False
-LASTFM_API_BASE = 'http://ws.audioscrobbler.com/2.0/?method='
 MAX_VOL = 100
-FW_MROOM_RTR_MIN = '4.2.8020'
-FW_RAKOIT_UART_MIN = '4.2.9326'
-FW_SLOW_STREAMS = '4.6'
 ROOTDIR_USB = '/media/sda1/'
-UUID_ARYLIC = 'FF31F09E'
 TCPPORT = 8899
-UPNP_TIMEOUT = 2
-API_TIMEOUT = 2
 SCAN_INTERVAL = timedelta(seconds=3)
 ICE_THROTTLE = timedelta(seconds=45)
 LFM_THROTTLE = timedelta(seconds=4)
@@ -133,11 +138,14 @@ MROOM_UJWDIR = timedelta(seconds=20)
 MROOM_UJWROU = timedelta(seconds=3)
 SPOTIFY_PAUSED_TIMEOUT = timedelta(seconds=300)
 AUTOIDLE_STATE_TIMEOUT = timedelta(seconds=1)
+PRESET_READY_TIMEOUT = 2  # seconds for a recalled preset to take over
 #PARALLEL_UPDATES = 0
 
 CUT_EXTENSIONS = ['mp3', 'mp2', 'm2a', 'mpg', 'wav', 'aac', 'flac', 'flc', 'm4a', 'ape', 'wma', 'ac3', 'ogg']
 
 SOUND_MODES = {'0': 'Normal', '1': 'Classic', '2': 'Pop', '3': 'Jazz', '4': 'Vocal'}
+SOUND_MODE_KEYS = {label: key for key, label in SOUND_MODES.items()}
+SOUND_MODE_LIST = sorted(SOUND_MODES.values())
 
 SOURCES = {'bluetooth': 'Bluetooth',
            'line-in': 'Line-in',
@@ -180,9 +188,9 @@ SOURCES_MAP = {'-1': 'Idle',
                '60': 'Talk',
                '99': 'Idle'}
 
-SOURCES_LIVEIN = ['-1', '0', '40', '41', '43', '44', '45', '46', '47', '48', '49', '50', '51', '99']
-SOURCES_STREAM = ['1', '2', '3', '10', '30']
-SOURCES_LOCALF = ['11', '16', '20', '21', '52', '60']
+SOURCES_LIVEIN = frozenset(('-1', '0', '40', '41', '43', '44', '45', '46', '47', '48', '49', '50', '51', '99'))
+SOURCES_STREAM = frozenset(('1', '2', '3', '10', '30'))
+SOURCES_LOCALF = frozenset(('11', '16', '20', '21', '52', '60'))
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -207,6 +215,86 @@ class LinkPlayData:
         """Initialize the data."""
         self.entities = []
 
+async def _async_probe_device(hass, host, protocols):
+    """Race the status probe over ``protocols``; first good answer wins.
+
+    Returns ``(protocol, payload)``, or ``(None, None)`` when no
+    protocol answered. ``https`` speakers are probed with
+    ``getStatusEx`` like before.
+    """
+    websession = async_get_linkplay_session(hass)
+
+    async def _probe(protocol):
+        command = "getStatusEx" if protocol == "https" else "getStatus"
+        # ``async with`` releases the connection of a probe that lost the
+        # race and is cancelled mid-read.
+        async with websession.get(
+            f"{protocol}://{host}/httpapi.asp?command={command}", timeout=PROBE_TIMEOUT,
+        ) as response:
+            if response.status != HTTPStatus.OK:
+                raise aiohttp.ClientResponseError(
+                    response.request_info, (), status=response.status,
+                )
+            return protocol, await response.json(content_type=None)
+
+    tasks = [asyncio.ensure_future(_probe(protocol)) for protocol in protocols]
+    errors = []
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                return await next_done
+            except (TimeoutError, aiohttp.ClientError, ValueError) as error:
+                errors.append(error)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+    _LOGGER.warning(
+        "[%s] startup probe failed (%s): %s",
+        host, "/".join(protocols),
+        ", ".join(
+            f"HTTP {error.status}" if isinstance(error, aiohttp.ClientResponseError)
+            else type(error).__name__
+            for error in errors
+        ),
+    )
+    return None, None
+
+
+async def _async_startup_probe(hass, linkplay, protocols, *, adopt_name):
+    """Probe the speaker and fold the answer into ``linkplay``.
+
+    Runs before the entity is added when its unique id still has to
+    come from the speaker, otherwise as a background task after the
+    entity was created from cached identity. A failed probe marks the
+    entity unavailable until the first successful poll.
+    """
+    host = linkplay._host
+    protocol, data = await _async_probe_device(hass, host, protocols)
+
+    if data is None:
+        if linkplay._first_update:
+            linkplay._transport.state = STATE_UNAVAILABLE
+    else:
+        linkplay._protocol = protocol
+        if not linkplay._uuid and data.get('uuid'):
+            linkplay._uuid = data['uuid']
+            linkplay._refresh_quirks()
+        if adopt_name and data.get('DeviceName'):
+            linkplay._name = data['DeviceName']
+        _LOGGER.info(
+            "[%s @ %s] discovered: fw=%s hw=%s uuid=%s",
+            linkplay._name, host,
+            data.get('firmware', 'unknown'),
+            data.get('hardware', 'unknown'),
+            linkplay._uuid or 'unknown',
+        )
+        _LOGGER.debug("[%s] full getStatus payload: %s", linkplay._name, data)
+
+    if linkplay.hass is not None and linkplay.entity_id is not None:
+        linkplay.async_write_ha_state()
+
+
 async def async_setup_platform(hass, config, async_add_entities, _discovery_info=None):
     """Set up the LinkPlayDevice platform.
 
@@ -231,55 +319,10 @@ async def async_setup_platform(hass, config, async_add_entities, _discovery_info
     lastfm_api_key = config.get(CONF_LASTFM_API_KEY)
     uuid = config.get(CONF_UUID)
 
-    default_protocol = False
-    if protocol is None:
-        protocol = "http"
-        default_protocol = True
-
-    state = STATE_IDLE
-
-    websession = async_get_clientsession(hass)
-    response = None
-
-    try:
-        initurl = "{}://{}/httpapi.asp?command=getStatus"
-        response = await websession.get(initurl.format(protocol, host), timeout=aiohttp.ClientTimeout(total=API_TIMEOUT))
-
-    except (TimeoutError, aiohttp.ClientError) as error:
-        if default_protocol:
-            try:
-                protocol = "https"
-                initurl = "{}://{}/httpapi.asp?command=getStatusEx"
-                response = await websession.get(initurl.format(protocol, host), ssl=False, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT))
-
-            except (TimeoutError, aiohttp.ClientError) as error:
-                _LOGGER.warning(
-                    "Failed communicating with LinkPlayDevice (start) '%s': uuid: %s %s", host, uuid, type(error)
-                )
-                state = STATE_UNAVAILABLE
-        else:
-            _LOGGER.warning(
-                "Failed communicating with LinkPlayDevice (start) '%s': uuid: %s %s", host, uuid, type(error)
-            )
-            state = STATE_UNAVAILABLE
-
-    if response and response.status == HTTPStatus.OK:
-        data = await response.json(content_type=None)
-        _LOGGER.debug("HOST: %s DATA response: %s", host, data)
-
-        if 'uuid' in data:
-            uuid = data['uuid']
-
-        if 'DeviceName' in data and name is None:
-            name = data['DeviceName']
-
-    else:
-        _LOGGER.warning(
-            "Get Status UUID failed, response code: %s Full message: %s",
-            response.status if response is not None else "Unknown",
-            response,
-        )
-        state = STATE_UNAVAILABLE
+    # Without an explicit protocol, race http and https. If neither
+    # answers the entity starts with no protocol and async_update keeps
+    # detecting it on later polls.
+    protocols = (protocol,) if protocol else ("http", "https")
 
     linkplay = LinkPlayDevice(name,
                             host,
@@ -292,15 +335,28 @@ async def async_setup_platform(hass, config, async_add_entities, _discovery_info
                             volume_step,
                             lastfm_api_key,
                             uuid,
-                            state,
+                            STATE_IDLE,
                             volume_offset=volume_offset)
 
-    _LOGGER.info("[%s @ %s] adding media_player entity (YAML)", name, host)
-    async_add_entities([linkplay])
+    probe = _async_startup_probe(hass, linkplay, protocols, adopt_name=name is None)
+    if uuid:
+        _LOGGER.info("[%s @ %s] adding media_player entity (YAML)", name, host)
+        async_add_entities([linkplay])
+        hass.async_create_background_task(probe, f"linkplay startup probe {host}")
+    else:
+        # The unique id has to come from the speaker itself.
+        await probe
+        _LOGGER.info("[%s @ %s] adding media_player entity (YAML)", linkplay._name, host)
+        async_add_entities([linkplay])
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    """Set up Linkplay media player from a config entry."""
+    """Set up Linkplay media player from a config entry.
+
+    The entity is created straight away from the identity stored in the
+    entry; the status probe runs in the background so offline speakers
+    do not hold up startup.
+    """
     from . import LinkPlayData as InitLinkPlayData
 
     if DOMAIN not in hass.data:
@@ -337,47 +393,6 @@ async def async_setup_entry(hass, entry, async_add_entities):
     lastfm_api_key = entry.data.get(CONF_LASTFM_API_KEY)
     uuid = entry.unique_id or ""
 
-    state = STATE_IDLE
-
-    websession = async_get_clientsession(hass)
-    response = None
-
-    try:
-        initurl = f"{protocol}://{host}/httpapi.asp?command=getStatus"
-        response = await websession.get(initurl, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT))
-
-    except (TimeoutError, aiohttp.ClientError) as error:
-        _LOGGER.warning(
-            "[%s @ %s] startup probe failed: %s",
-            name, host, type(error).__name__,
-        )
-        state = STATE_UNAVAILABLE
-
-    if response and response.status == HTTPStatus.OK:
-        data = await response.json(content_type=None)
-
-        if 'uuid' in data and not uuid:
-            uuid = data['uuid']
-
-        if 'DeviceName' in data and data['DeviceName']:
-            name = data['DeviceName']
-
-        _LOGGER.info(
-            "[%s @ %s] discovered: fw=%s hw=%s uuid=%s",
-            name, host,
-            data.get('firmware', 'unknown'),
-            data.get('hardware', 'unknown'),
-            uuid or 'unknown',
-        )
-        _LOGGER.debug("[%s] full getStatus payload: %s", name, data)
-    else:
-        _LOGGER.warning(
-            "[%s @ %s] getStatus failed, response code: %s",
-            name, host,
-            response.status if response is not None else "Unknown",
-        )
-        state = STATE_UNAVAILABLE
-
     linkplay = LinkPlayDevice(
         name,
         host,
@@ -390,12 +405,21 @@ async def async_setup_entry(hass, entry, async_add_entities):
         volume_step,
         lastfm_api_key,
         uuid,
-        state,
+        STATE_IDLE,
         volume_offset=volume_offset,
     )
 
-    _LOGGER.info("[%s @ %s] adding media_player entity", name, host)
-    async_add_entities([linkplay])
+    probe = _async_startup_probe(hass, linkplay, (protocol,), adopt_name=True)
+    if uuid:
+        _LOGGER.info("[%s @ %s] adding media_player entity", name, host)
+        async_add_entities([linkplay])
+        entry.async_create_background_task(hass, probe, f"linkplay startup probe {host}")
+    else:
+        # Entries created before unique ids were stored: the unique id
+        # has to come from the speaker itself.
+        await probe
+        _LOGGER.info("[%s @ %s] adding media_player entity", linkplay._name, host)
+        async_add_entities([linkplay])
 
 
 class LinkPlayDevice(
@@ -436,95 +460,52 @@ class LinkPlayDevice(
         added; the constructor no longer takes it as a parameter.
         """
         self._uuid = uuid
-        self._fw_ver = '1.0.0'
+        # getStatus ``project``; with uuid and firmware selects _quirks.
+        self._model = None
+        self._fw_version = DEFAULT_FIRMWARE
+        self._quirks = None
         self._mcu_ver = ''
-        requester = AiohttpRequester(UPNP_TIMEOUT)
-        self._factory = UpnpFactory(requester)
+        # Shared by all speakers; description / SCPD documents are served
+        # from the device store on warm starts, see upnp_factory.
+        self._factory = get_upnp_factory()
+        self._upnp_documents = self._factory.requester
+        self._device_store = None
         self._upnp_device = None
-        self._service = None
+        self._upnp_actions = {}
+        self._upnp_lock = asyncio.Lock()
+        self._upnp_retry_at = 0.0
+        self._upnp_retry_delay = 0
+        self._upnp_retry_unsub = None
         self._features = None
         self._preset_key = 4
         self._name = name
         self._host = host
+        self._refresh_quirks()
         self._protocol = protocol
         self._icon = ICON_DEFAULT
-        self._state = state
-        self._volume = 0
         self._volume_step = volume_step
         # Per-device volume offset (signed percentage points, -100..+100)
         # applied on top of the master target by linkplay.set_group_volume.
         # Mirrors mini-media-player's ``volume_offset`` config option.
         self._volume_offset = volume_offset
         self._led_off = led_off
-        self._fadevol = False
-        self._source = None
-        self._prev_source = None
-        if sources is not None and sources != {}:
-            self._source_list = loads(dumps(sources).strip('[]'))
-        else:
-            self._source_list = SOURCES.copy()
-        if common_sources is not None and common_sources != {}:
-            commonsources = loads(dumps(common_sources).strip('[]'))
-            localsources = self._source_list
-            self._source_list = {**localsources, **commonsources}
-        self._sound_mode = None
-        self._muted = False
-        self._playhead_position = 0
-        self._duration = 0
-        self._position_updated_at = None
-        self._spotify_paused_at = None
-        self._idletime_updated_at = None
-        self._shuffle = False
-        self._repeat = RepeatMode.OFF
-        self._media_album = None
-        self._media_artist = None
-        self._media_prev_artist = None
-        self._media_title = None
-        self._media_prev_title = None
-        self._media_image_url = None
-        self._media_uri = None
-        self._media_uri_final = None
-        self._media_source_uri = None
-        self._nometa = False
+        self._sources = SourceCatalog.from_options(sources, common_sources, SOURCES)
         self._player_statdata = {}
         self._lastfm_api_key = lastfm_api_key
         self._first_update = True
-        self._slave_mode = False
-        self._slave_ip = None
         self._trackq = []
+        # Name index over _trackq plus the queue's content hash.
+        self._track_index = TrackIndex()
+        # Last CurrentURIMetaData document and its parsed fields.
+        self._didl_decoder = DidlDecoder()
+        self._volume_engine = VolumeEngine(
+            lambda volume, action: self._set_volume_on_device(volume, action=action)
+        )
         self._trackc = None
-        self._master = None
-        self._is_master = False
         self._wifi_channel = None
         self._ssid = None
-        self._playing_localfile = True
-        self._playing_stream = False
-        self._playing_liveinput = False
-        self._playing_spotify = False
-        self._playing_webplaylist = False
-        self._playing_tts = False
-        self._playing_mediabrowser = False
-        self._slave_list = None
-        self._multiroom_wifidirect = multiroom_wifidirect
-        self._multiroom_group = []
-        self._multiroom_prevsrc = None
-        self._multiroom_unjoinat = None
-        # Timestamp of the last successful ``async_join`` that
-        # populated ``_multiroom_group``. The master-side poll uses
-        # this to keep the just-built group through a brief grace
-        # window when ``multiroom:getSlaveList`` still reports zero
-        # slaves (WiFi-direct propagates slowly on AudioPro firmware).
-        self._multiroom_joinat = None
-        # Consecutive ``multiroom:getSlaveList`` polls that reported no
-        # slaves (or failed). A master only tears down its locally-built
-        # group once this passes ``_ZERO_POLL_TEARDOWN``; AudioPro
-        # firmware briefly reports ``slaves=0`` during preset / source
-        # switches while the group is still physically intact.
-        self._slave_zero_polls = 0
-        self._wait_for_mcu = 0
-        self._new_song = True
+        self._playing = PlaybackFlags()
         self._unav_throttle = False
-        self._icecast_name = None
         self._icecast_meta = icecast_metadata
         self._ice_skip_throt = False
         # Last SomaFM station name we fetched track info for; used to
@@ -534,29 +515,66 @@ class LinkPlayDevice(
         # we logged; used to suppress repeating per-poll debug lines.
         self._last_poll_snapshot: tuple | None = None
         self._snapshot_active = False
-        self._snap_source = None
-        self._snap_uri = None
-        self._snap_state = STATE_UNKNOWN
-        self._snap_volume = 0
-        self._snap_spotify = False
-        self._snap_spotify_volumeonly = False
-        self._snap_nometa = False
-        self._snap_playing_mediabrowser = False
-        self._snap_media_source_uri = None
-        self._snap_seek = False
-        self._snap_playhead_position = 0
+        # What linkplay.snapshot captured, see snapshot_mixin.
+        self._snap = SnapshotState()
+        # Player state the update loop reads and writes, see state.py.
+        self._transport = TransportState(state)
+        self._meta = MediaMetadata()
+        self._group = GroupState(multiroom_wifidirect)
 
     async def async_added_to_hass(self):
-        """Record entity."""
+        """Record entity and apply what the last run learned about the speaker."""
         if self not in self.hass.data[DOMAIN].entities:
             self.hass.data[DOMAIN].entities.append(self)
+        self._device_store = await async_get_device_store(self.hass)
+        self._apply_device_record(self._device_store.get(self._host))
+
+    def _apply_device_record(self, record):
+        """Restore identity, capabilities and UPnP documents from ``record``.
+
+        A record left by another speaker that used to own this address
+        (different uuid) is ignored; the first poll overwrites it.
+        """
+        if not record or (self._uuid and record.get('uuid') not in (None, self._uuid)):
+            return
+        if self._protocol is None:
+            self._protocol = record.get('protocol')
+        self._fw_ver = record.get('firmware', self._fw_ver)
+        self._mcu_ver = record.get('mcu_ver', self._mcu_ver)
+        self._preset_key = record.get('preset_key', self._preset_key)
+        self._upnp_documents.add(record.get('upnp') or {})
+
+    def _save_device_record(self, previous_fw):
+        """Persist what the first poll learned; revalidates stored documents."""
+        if previous_fw != self._fw_ver:
+            # New firmware may come with different UPnP services.
+            self._forget_upnp_documents()
+        if self._device_store is None:
+            return
+        self._device_store.async_update(
+            self._host,
+            uuid=self._uuid,
+            protocol=self._protocol,
+            firmware=self._fw_ver,
+            mcu_ver=self._mcu_ver,
+            preset_key=self._preset_key,
+        )
 
     async def async_will_remove_from_hass(self):
         """Drop entity reference on unload."""
+        self._cancel_upnp_retry()
         with contextlib.suppress(ValueError):
             self.hass.data[DOMAIN].entities.remove(self)
 
     async def async_update(self):
+        """Update state, recording the poll-cycle duration."""
+        started = time.monotonic()
+        try:
+            return await self._async_update_state()
+        finally:
+            get_metrics(self._host).record_poll(started)
+
+    async def _async_update_state(self):
         """Update state."""
 
         # If we couldn't determine our protocol on startup, then attempt to do it now as our speaker might be available
@@ -575,46 +593,43 @@ class LinkPlayDevice(
         # the registered entities before assuming we're no longer in a group.
         # Only clear slave_mode as a last resort: status['type']!=0 below
         # will correct it on the next poll if the device disagrees.
-        if self._slave_mode and self._master is None and self._multiroom_group:
-            master_eid = self._multiroom_group[0]
+        if self._group.slave_mode and self._group.master is None and self._group.members:
+            master_eid = self._group.members[0]
             for entity in self.hass.data[DOMAIN].entities:
                 if entity.entity_id == master_eid and entity is not self:
-                    self._master = entity
+                    self._group.master = entity
                     break
 
-        if self._slave_mode and self._master is None and not self._multiroom_group:
+        if self._group.slave_mode and self._group.master is None and not self._group.members:
             # No way to recover: not a slave anymore.
-            self._slave_mode = False
+            self._group.slave_mode = False
 
-        if self._slave_mode: # or self._snapshot_active:
+        if self._group.slave_mode: # or self._snapshot_active:
             return True
 
-        if self._multiroom_unjoinat is not None:
-            waittim = MROOM_UJWDIR if self._multiroom_wifidirect else MROOM_UJWROU
-
-            if utcnow() <= (self._multiroom_unjoinat + waittim):
-                self._source = None
-                self._media_title = None
-                self._media_artist = None
-                self._media_uri = None
-                self._media_uri_final = None
-                self._media_image_url = None
-                self._state = STATE_IDLE
+        if self._group.unjoinat is not None:
+            waittim = MROOM_UJWDIR if self._group.wifidirect else MROOM_UJWROU
+
+            if utcnow() <= (self._group.unjoinat + waittim):
+                self._transport.source = None
+                self._meta.title = None
+                self._meta.artist = None
+                self._meta.uri = None
+                self._meta.uri_final = None
+                self._meta.image_url = None
+                self._transport.state = STATE_IDLE
                 return True
             else:
-                self._multiroom_unjoinat = None
-                self._playhead_position = 0
-                self._duration = 0
-                self._position_updated_at = utcnow()
-                self._idletime_updated_at = self._position_updated_at
+                self._group.unjoinat = None
+                self._transport.playhead_position = 0
+                self._transport.duration = 0
+                self._transport.position_updated_at = utcnow()
+                self._transport.idletime_updated_at = self._transport.position_updated_at
 #                await self.async_restore_previous_source()
-                await self.async_select_source(self._multiroom_prevsrc)
-                self._multiroom_prevsrc = None
+                await self.async_select_source(self._group.prevsrc)
+                self._group.prevsrc = None
                 return True
 
-        # if self._wait_for_mcu > 0:  # have waited for the hardware unit to finish processing command, otherwise some reported status values will be incorrect
-            # await asyncio.sleep(self._wait_for_mcu)
-
         if self._unav_throttle:
             await self.async_get_status()
         else:
@@ -626,78 +641,64 @@ class LinkPlayDevice(
 
         if isinstance(self._player_statdata, dict):
             self._unav_throttle = False
-            if self._first_update or (self._state == STATE_UNAVAILABLE or self._multiroom_wifidirect):
+            if self._first_update or (self._transport.state == STATE_UNAVAILABLE or self._group.wifidirect):
                 if self._protocol == "https":
                     device_status = await self.call_linkplay_httpapi("getStatusEx", True)
                 else:
                     device_status = await self.call_linkplay_httpapi("getStatus", True)
                 if device_status is not None and isinstance(device_status, dict):
-                    if self._state == STATE_UNAVAILABLE:
-                        self._state = STATE_IDLE
+                    if self._transport.state == STATE_UNAVAILABLE:
+                        self._transport.state = STATE_IDLE
                     self._wifi_channel = device_status['WifiChannel']
                     self._ssid = binascii.hexlify(device_status['ssid'].encode('utf-8'))
                     self._ssid = self._ssid.decode()
 
+                    previous_fw = self._fw_ver
                     with contextlib.suppress(KeyError):
                         self._uuid = device_status['uuid']
                     with contextlib.suppress(KeyError):
                         self._name = device_status['DeviceName']
-                    self._fw_ver = device_status.get('firmware', '1.0.0')
+                    self._model = device_status.get('project')
+                    # Re-resolves _quirks for the uuid and model above too.
+                    self._fw_ver = device_status.get('firmware', DEFAULT_FIRMWARE)
                     self._mcu_ver = device_status.get('mcu_ver', '')
                     try:
                         self._preset_key = int(device_status['preset_key'])
                     except KeyError:
                         self._preset_key = 4
+                    if self._first_update:
+                        self._save_device_record(previous_fw)
 
                     if (
                         self._led_off
-                        and self._uuid
-                        and self._uuid.startswith(UUID_ARYLIC)
-                        and self._fwvercheck(self._fw_ver) >= self._fwvercheck(FW_RAKOIT_UART_MIN)
+                        and self._quirks.rakoit_led
                     ):
                         value = await self.call_linkplay_tcpuart('MCU+PAS+RAKOIT:LED:0&')
                         _LOGGER.debug("LED turn off: %s, %s, response: %s", self.entity_id, self._name, value)
 
                     if (
-                        not self._multiroom_wifidirect
+                        not self._group.wifidirect
                         and self._fw_ver
-                        and self._fwvercheck(self._fw_ver) < self._fwvercheck(FW_MROOM_RTR_MIN)
+                        and not self._quirks.router_multiroom
                     ):
-                        self._multiroom_wifidirect = True
-
-                    # UPnP / first-update init runs for *every* device,
-                    # not just the old-firmware force-wifidirect path.
-                    # Previously these blocks were nested under the
-                    # condition above and silently no-op'd on modern
-                    # firmware, so _upnp_device stayed None forever and
-                    # async_update_via_upnp short-circuited (taking
-                    # Spotify / TuneIn metadata with it).
-                    if self._upnp_device is None:
-                        url = f"http://{self._host}:49152/description.xml"
-                        try:
-                            self._upnp_device = await self._factory.async_create_device(url)
-                        except Exception as error:
-                            _LOGGER.warning(
-                                "Failed communicating with LinkPlayDevice (UPnP) '%s': %s",
-                                self._name, type(error),
-                            )
+                        self._group.wifidirect = True
 
                     if self._first_update:
-                        self._duration = 0
-                        self._playhead_position = 0
-                        self._idletime_updated_at = utcnow()
-                        if "udisk" in self._source_list:
+                        self._transport.duration = 0
+                        self._transport.playhead_position = 0
+                        self._transport.idletime_updated_at = utcnow()
+                        if "udisk" in self._sources:
                             await self.async_tracklist_via_upnp("USB")
                         self._first_update = False
 
-            self._position_updated_at = utcnow()
+            self._transport.position_updated_at = utcnow()
 
             if self._player_statdata['type'] == '0':
-                self._slave_mode = False
+                self._group.slave_mode = False
 
-            if self._multiroom_group == [] and not self._slave_mode:
-                self._is_master = False
-                self._master = None
+            if self._group.members == [] and not self._group.slave_mode:
+                self._group.is_master = False
+                self._group.master = None
 
             # TODO: https://github.com/phedoreanu/home-assistant-custom-components-linkplay/compare/master...akloeckner:home-assistant-custom-components-linkplay:dev
             # Only clear group state on standalone devices. Slaves keep the
@@ -707,23 +708,23 @@ class LinkPlayDevice(
             # False on a transient poll; without this guard that poll would
             # wipe the just-built group out from under the in-flight join.
             if (
-                not self._is_master
-                and not self._slave_mode
+                not self._group.is_master
+                and not self._group.slave_mode
                 and not self._within_join_grace()
             ):
-                self._master = None
-                self._multiroom_group = []
-            self._volume = self._player_statdata['vol']
-            self._muted = bool(int(self._player_statdata['mute']))
-            self._sound_mode = SOUND_MODES.get(self._player_statdata['eq'])
+                self._group.master = None
+                self._group.members = []
+            self._transport.volume = self._player_statdata['vol']
+            self._transport.muted = bool(int(self._player_statdata['mute']))
+            self._transport.sound_mode = SOUND_MODES.get(self._player_statdata['eq'])
 
-            self._shuffle = {
+            self._transport.shuffle = {
                 '2': True,
                 '3': True,
                 '5': True,
             }.get(self._player_statdata['loop'], False)
 
-            self._repeat = {
+            self._transport.repeat = {
                 '0': RepeatMode.ALL,
                 '1': RepeatMode.ONE,
                 '2': RepeatMode.ALL,
@@ -731,19 +732,19 @@ class LinkPlayDevice(
             }.get(self._player_statdata['loop'], RepeatMode.OFF)
 
             if self._player_statdata['mode'] in ['-1', '0', '99'] or self._player_statdata['status'] == 'stop':
-                if utcnow() >= (self._idletime_updated_at + AUTOIDLE_STATE_TIMEOUT):
-                    self._state = STATE_IDLE
+                if utcnow() >= (self._transport.idletime_updated_at + AUTOIDLE_STATE_TIMEOUT):
+                    self._transport.state = STATE_IDLE
             elif self._player_statdata['status'] in ['play', 'load']:
-                self._state = STATE_PLAYING
+                self._transport.state = STATE_PLAYING
             elif self._player_statdata['status'] == 'pause':
-                self._state = STATE_PAUSED
+                self._transport.state = STATE_PAUSED
 
-            if self._state in [STATE_PLAYING, STATE_PAUSED]:
-                self._duration = int(int(self._player_statdata['totlen']) / 1000)
-                self._playhead_position = int(int(self._player_statdata['curpos']) / 1000)
+            if self._transport.state in [STATE_PLAYING, STATE_PAUSED]:
+                self._transport.duration = int(int(self._player_statdata['totlen']) / 1000)
+                self._transport.playhead_position = int(int(self._player_statdata['curpos']) / 1000)
             else:
-                self._duration = 0
-                self._playhead_position = 0
+                self._transport.duration = 0
+                self._transport.playhead_position = 0
 
             # Per-poll debug is rate-limited to actual state changes so the
             # 3s scan interval doesn't fill the log with identical lines.
@@ -765,131 +766,131 @@ class LinkPlayDevice(
                     *poll_snapshot[3:],
                 )
                 self._last_poll_snapshot = poll_snapshot
-            self._playing_spotify = bool(self._player_statdata['mode'] == '31')
-            self._playing_liveinput = self._player_statdata['mode'] in SOURCES_LIVEIN
-            self._playing_stream = self._player_statdata['mode'] in SOURCES_STREAM
-            self._playing_localfile = self._player_statdata['mode'] in SOURCES_LOCALF
+            self._playing.spotify = bool(self._player_statdata['mode'] == '31')
+            self._playing.liveinput = self._player_statdata['mode'] in SOURCES_LIVEIN
+            self._playing.stream = self._player_statdata['mode'] in SOURCES_STREAM
+            self._playing.localfile = self._player_statdata['mode'] in SOURCES_LOCALF
 
             if bool(self._player_statdata['mode'] != '10'):
-                self._playing_mediabrowser = False
+                self._playing.mediabrowser = False
 
-            if not (self._playing_liveinput or self._playing_stream or self._playing_spotify):
-                self._playing_localfile = True
+            if not (self._playing.liveinput or self._playing.stream or self._playing.spotify):
+                self._playing.localfile = True
 
             try:
-                if self._playing_stream and self._player_statdata['uri'] != "":
+                if self._playing.stream and self._player_statdata['uri'] != "":
                     _LOGGER.debug("06 Update URI final detect %s, %s", self.entity_id, self._name)
                     try:
-                        self._media_uri_final = str(bytearray.fromhex(self._player_statdata['uri']).decode('utf-8'))
+                        self._meta.uri_final = str(bytearray.fromhex(self._player_statdata['uri']).decode('utf-8'))
                     except ValueError:
-                        self._media_uri_final = self._player_statdata['uri']
-                    if not self._media_uri:
-                        self._media_uri = self._media_uri_final
+                        self._meta.uri_final = self._player_statdata['uri']
+                    if not self._meta.uri:
+                        self._meta.uri = self._meta.uri_final
             except KeyError:
                 pass
 
-            if self._media_uri:
+            if self._meta.uri:
                 # Detect web music service by their CDN subdomains in the URL
                 # Tidal, Deezer
-                self._playing_webplaylist = \
-                    bool(self._media_uri.find('audio.tidal.') != -1) or \
-                    bool(self._media_uri.find('.dzcdn.') != -1) or \
-                    bool(self._media_uri.find('.deezer.') != -1)
+                self._playing.webplaylist = \
+                    bool(self._meta.uri.find('audio.tidal.') != -1) or \
+                    bool(self._meta.uri.find('.dzcdn.') != -1) or \
+                    bool(self._meta.uri.find('.deezer.') != -1)
 
-            if not self._playing_webplaylist:
+            if not self._playing.webplaylist:
                 source_t = SOURCES_MAP.get(self._player_statdata['mode'], 'Network')
                 source_n = None
                 if source_t == 'Network':
-                    if self._media_uri:
-                        source_n = self._source_list.get(self._media_uri, 'Network')
+                    if self._meta.uri:
+                        source_n = self._sources.name(self._meta.uri, 'Network')
                 else:
-                    source_n = self._source_list.get(source_t, None)
+                    source_n = self._sources.name(source_t)
 
                 if source_n is not None:
-                    self._source = source_n
+                    self._transport.source = source_n
                 else:
-                    self._source = source_t
+                    self._transport.source = source_t
             else:
-                self._source = 'Web playlist'
+                self._transport.source = 'Web playlist'
 
-            if self._source != 'Network' and not (self._playing_stream or self._playing_localfile or self._playing_spotify):
-                if self._source == 'Idle':
-                    self._state = STATE_IDLE
-                    self._media_title = None
+            if self._transport.source != 'Network' and not (self._playing.stream or self._playing.localfile or self._playing.spotify):
+                if self._transport.source == 'Idle':
+                    self._transport.state = STATE_IDLE
+                    self._meta.title = None
                 else:
-                    self._state = STATE_PLAYING
-                    self._media_title = self._source
+                    self._transport.state = STATE_PLAYING
+                    self._meta.title = self._transport.source
 
-                self._media_artist = None
-                self._media_album = None
-                self._media_image_url = None
-                self._icecast_name = None
+                self._meta.artist = None
+                self._meta.album = None
+                self._meta.image_url = None
+                self._meta.icecast_name = None
 
             if self._player_statdata['mode'] in ['1', '2', '3']:
-                self._state = STATE_PLAYING
-                self._media_title = self._source
+                self._transport.state = STATE_PLAYING
+                self._meta.title = self._transport.source
 
-            if self._playing_spotify and self._state == STATE_IDLE:
-                self._source = None
+            if self._playing.spotify and self._transport.state == STATE_IDLE:
+                self._transport.source = None
 
             if (
-                self._spotify_paused_at is not None
-                and utcnow() >= (self._spotify_paused_at + SPOTIFY_PAUSED_TIMEOUT)
+                self._transport.spotify_paused_at is not None
+                and utcnow() >= (self._transport.spotify_paused_at + SPOTIFY_PAUSED_TIMEOUT)
             ):
                 # Prevent sticking in Pause mode for a long time (Spotify doesn't have a stop button on the app)
                 await self.async_media_stop()
                 return True
 
             if self._player_statdata['mode'] in ['11', '16'] and len(self._trackq) <= 0:
-                if int(self._player_statdata['curpos']) > 6000 and self._state == STATE_PLAYING:
+                if int(self._player_statdata['curpos']) > 6000 and self._transport.state == STATE_PLAYING:
                     await self.async_tracklist_via_upnp("USB")
 
-            if self._playing_spotify:
-                if self._state != STATE_IDLE:
+            if self._playing.spotify:
+                if self._transport.state != STATE_IDLE:
                     await self.async_update_via_upnp()
-                if self._state == STATE_PAUSED:
-                    if self._spotify_paused_at is None:
-                        self._spotify_paused_at = utcnow()
+                if self._transport.state == STATE_PAUSED:
+                    if self._transport.spotify_paused_at is None:
+                        self._transport.spotify_paused_at = utcnow()
                 else:
-                    self._spotify_paused_at = None
+                    self._transport.spotify_paused_at = None
             # else:
-            elif self._playing_webplaylist:
-                if self._state != STATE_IDLE:
+            elif self._playing.webplaylist:
+                if self._transport.state != STATE_IDLE:
                     await self.async_update_via_upnp()
 
             else:
-                self._spotify_paused_at = None
-                if self._state not in [STATE_PLAYING, STATE_PAUSED]:
-                    self._media_title = None
-                    self._media_artist = None
-                    self._media_album = None
-                    self._media_image_url = None
-                    self._icecast_name = None
-                    self._playing_tts = False
+                self._transport.spotify_paused_at = None
+                if self._transport.state not in [STATE_PLAYING, STATE_PAUSED]:
+                    self._meta.title = None
+                    self._meta.artist = None
+                    self._meta.album = None
+                    self._meta.image_url = None
+                    self._meta.icecast_name = None
+                    self._playing.tts = False
                     self._somafm_cached_station = None
 
-                if self._playing_localfile and self._state in [STATE_PLAYING, STATE_PAUSED] and not self._playing_tts:
+                if self._playing.localfile and self._transport.state in [STATE_PLAYING, STATE_PAUSED] and not self._playing.tts:
                     await self.async_get_playerstatus_metadata(self._player_statdata)
 
-                    if self._media_title is not None and self._media_artist is None:
-                        querywords = self._media_title.split('.')
+                    if self._meta.title is not None and self._meta.artist is None:
+                        querywords = self._meta.title.split('.')
                         resultwords  = [word for word in querywords if word.lower() not in CUT_EXTENSIONS]
                         title = ' '.join(resultwords)
                         title = title.replace('_', ' ')
                         if title.find(' - ') != -1:
                             titles = title.split(' - ')
-                            self._media_artist = string.capwords(titles[0].strip().strip('-'))
-                            self._media_title = string.capwords(titles[1].strip().strip('-'))
+                            self._meta.artist = string.capwords(titles[0].strip().strip('-'))
+                            self._meta.title = string.capwords(titles[1].strip().strip('-'))
                         else:
-                            self._media_title = string.capwords(title.strip().strip('-'))
+                            self._meta.title = string.capwords(title.strip().strip('-'))
                     else:
-                        self._media_title = self._source
+                        self._meta.title = self._transport.source
 
-                elif self._state == STATE_PLAYING and self._media_uri and int(self._player_statdata['totlen']) > 0 and not self._snapshot_active and not self._playing_tts and not self._playing_mediabrowser:
-                    if not self._nometa:
+                elif self._transport.state == STATE_PLAYING and self._meta.uri and int(self._player_statdata['totlen']) > 0 and not self._snapshot_active and not self._playing.tts and not self._playing.mediabrowser:
+                    if not self._meta.nometa:
                         await self.async_get_playerstatus_metadata(self._player_statdata)
 
-                elif self._state == STATE_PLAYING and self._playing_stream and int(self._player_statdata['totlen']) <= 0 and not self._snapshot_active and not self._playing_tts:
+                elif self._transport.state == STATE_PLAYING and self._playing.stream and int(self._player_statdata['totlen']) <= 0 and not self._snapshot_active and not self._playing.tts:
                     # Live stream. Detect SomaFM-via-TuneIn first
                     # because the device only exposes the station name
                     # in playerstatus and the icecast / UPnP DIDL
@@ -904,16 +905,16 @@ class LinkPlayDevice(
                     #   1. raw playerstatus Title (most authoritative,
                     #      populated after a station change),
                     #   2. previously-detected cached station name
-                    #      (sticky: survives _media_title being
+                    #      (sticky: survives _meta.title being
                     #      overwritten with the track title by a
                     #      successful SomaFM JSON fetch),
-                    #   3. current _media_title (bootstraps detection
+                    #   3. current _meta.title (bootstraps detection
                     #      from UPnP DIDL on the first poll after
                     #      pressing play, when raw Title is still empty).
                     somafm_title = (
                         decoded_title
                         or self._somafm_cached_station
-                        or self._media_title
+                        or self._meta.title
                         or ''
                     )
                     is_somafm = somafm_channel_slug(somafm_title) is not None
@@ -931,10 +932,10 @@ class LinkPlayDevice(
                             # previous station so the card doesn't show
                             # "Drone Zone" with "Kodomo / Spira
                             # Mirabilis" while Beat Blender is loading.
-                            self._media_title = string.capwords(somafm_title)
-                            self._media_artist = None
-                            self._media_album = None
-                            self._media_image_url = None
+                            self._meta.title = string.capwords(somafm_title)
+                            self._meta.artist = None
+                            self._meta.album = None
+                            self._meta.image_url = None
                             self._somafm_cached_station = somafm_title
                             # Bypass @Throttle so the new station's
                             # track shows up on the next render.
@@ -946,14 +947,14 @@ class LinkPlayDevice(
                             # Throttled: previous artist + title still
                             # in place. No log here - per-poll trace
                             # is suppressed via the poll-snapshot dedupe.
-                            got_meta = self._media_artist is not None
+                            got_meta = self._meta.artist is not None
                         else:
                             got_meta = bool(result)
                             _LOGGER.debug(
                                 "[%s @ %s] SomaFM JSON -> title=%r artist=%r ok=%s "
                                 "(station_changed=%s)",
                                 self._name, self._host,
-                                self._media_title, self._media_artist, got_meta,
+                                self._meta.title, self._meta.artist, got_meta,
                                 station_changed,
                             )
                     else:
@@ -961,9 +962,9 @@ class LinkPlayDevice(
                         # Run silently; result is captured by the next
                         # per-poll snapshot. Detailed trace fires only
                         # once per metadata change.
-                        prev = (self._media_title, self._media_artist)
+                        prev = (self._meta.title, self._meta.artist)
                         got_meta = await self.async_get_playerstatus_metadata(self._player_statdata)
-                        if not got_meta and self._upnp_device is not None:
+                        if not got_meta:
                             try:
                                 await self.async_update_via_upnp()
                             except Exception as error:
@@ -971,32 +972,32 @@ class LinkPlayDevice(
                                     "[%s @ %s] UPnP DIDL exception: %s",
                                     self._name, self._host, error,
                                 )
-                            got_meta = self._media_title is not None and self._media_artist is not None
-                        if not got_meta and self._media_uri_final:
+                            got_meta = self._meta.title is not None and self._meta.artist is not None
+                        if not got_meta and self._meta.uri_final:
                             if self._ice_skip_throt:
                                 await self.async_update_from_icecast(no_throttle=True)
                                 self._ice_skip_throt = False
                             else:
                                 await self.async_update_from_icecast()
-                        new = (self._media_title, self._media_artist)
+                        new = (self._meta.title, self._meta.artist)
                         if new != prev:
                             _LOGGER.debug(
                                 "[%s @ %s] live-stream metadata changed: %r -> %r",
                                 self._name, self._host, prev, new,
                             )
 
-                elif self._state == STATE_PLAYING and self._playing_mediabrowser and self._media_source_uri is not None:
-                    if not self._nometa:
+                elif self._transport.state == STATE_PLAYING and self._playing.mediabrowser and self._meta.source_uri is not None:
+                    if not self._meta.nometa:
                         await self.async_get_local_mediasource_metadata_from_path()
 
-                self._new_song = await self.async_is_playing_new_track()
-                if self._lastfm_api_key is not None and self._new_song:
+                self._meta.new_song = await self.async_is_playing_new_track()
+                if self._lastfm_api_key is not None and self._meta.new_song:
                     await self.async_get_lastfm_coverart()
                 # iTunes Search artwork: fire on every track change, not
                 # only the SomaFM-fetcher path - non-SomaFM streams with
                 # firmware-supplied title/artist also benefit from a
                 # real album cover instead of the station logo.
-                if self._new_song:
+                if self._meta.new_song:
                     itunes = getattr(self, "async_get_itunes_artwork", None)
                     if itunes is not None:
                         try:
@@ -1007,8 +1008,8 @@ class LinkPlayDevice(
                                 self._name, self._host, error,
                             )
 
-            self._media_prev_artist = self._media_artist
-            self._media_prev_title = self._media_title
+            self._meta.prev_artist = self._meta.artist
+            self._meta.prev_title = self._meta.title
 
         else:
             _LOGGER.error("Erroneous JSON during update and process self._player_statdata: %s, %s", self.entity_id, self._name)
@@ -1019,7 +1020,7 @@ class LinkPlayDevice(
     @property
     def name(self):
         """Return the name of the device, decorated with the master's name when this is a slave."""
-        if self._slave_mode:
+        if self._group.slave_mode:
             for device in self.hass.data[DOMAIN].entities:
                 if device.is_master:
                     return f"{self._name} [{device.name}]"
@@ -1029,25 +1030,25 @@ class LinkPlayDevice(
     def icon(self):
         """Return the icon of the device."""
 
-        if self._playing_tts:
+        if self._playing.tts:
             return ICON_TTS
 
-        if self._state in [STATE_PAUSED, STATE_UNAVAILABLE, STATE_IDLE, STATE_UNKNOWN]:
+        if self._transport.state in [STATE_PAUSED, STATE_UNAVAILABLE, STATE_IDLE, STATE_UNKNOWN]:
             return ICON_DEFAULT
 
-        if self._muted:
+        if self._transport.muted:
             return ICON_MUTED
 
-        if self._slave_mode or self._is_master:
+        if self._group.slave_mode or self._group.is_master:
             return ICON_MULTIROOM
 
-        if self._source == "Bluetooth":
+        if self._transport.source == "Bluetooth":
             return ICON_BLUETOOTH
 
-        if self._source == "DLNA" or self._source == "Airplay" or self._source == "Spotify":
+        if self._transport.source == "DLNA" or self._transport.source == "Airplay" or self._transport.source == "Spotify":
             return ICON_PUSHSTREAM
 
-        if self._state == STATE_PLAYING:
+        if self._transport.state == STATE_PLAYING:
             return ICON_PLAYING
 
         return ICON_DEFAULT
@@ -1055,56 +1056,57 @@ class LinkPlayDevice(
     @property
     def state(self):
         """Return the state of the device."""
-        return self._state
+        return self._transport.state
+
+    @property
+    def available(self):
+        """Return False from a breaker trip until a probe gets an answer."""
+        return get_circuit_breaker(self._host).is_closed
 
     @property
     def volume_level(self):
         """Volume level of the media player (0..1)."""
-        return int(self._volume) / MAX_VOL
+        return int(self._transport.volume) / MAX_VOL
 
     @property
     def is_volume_muted(self):
         """Return boolean if volume is currently muted."""
-        return self._muted
+        return self._transport.muted
 
     @property
     def source(self):
         """Return the current input source."""
-        if self._source not in ['Idle', 'Network']:
-            return self._source
+        if self._transport.source not in ['Idle', 'Network']:
+            return self._transport.source
         else:
             return None
 
     @property
     def source_list(self):
         """Return the list of available input sources. Wi-Fi is the implicit source and is omitted."""
-        source_list = self._source_list.copy()
-        if 'wifi' in source_list:
-            del source_list['wifi']
-
-        if len(self._source_list) > 0:
-            return list(source_list.values())
+        if self._sources:
+            return list(self._sources.names)
         else:
             return None
 
     @property
     def sound_mode(self):
         """Return the current sound mode."""
-        return self._sound_mode
+        return self._transport.sound_mode
 
     @property
     def sound_mode_list(self):
         """Return the available sound modes."""
-        return sorted(list(SOUND_MODES.values()))
+        return list(SOUND_MODE_LIST)
 
     @property
     def supported_features(self) -> MediaPlayerEntityFeature:
         """Flag media player features that are supported."""
-        if self._slave_mode and self._features:
+        if self._group.slave_mode and self._features:
             return self._features
 
-        if self._playing_localfile or self._playing_spotify or self._playing_webplaylist:
-            if self._state in [STATE_PLAYING, STATE_PAUSED]:
+        if self._playing.localfile or self._playing.spotify or self._playing.webplaylist:
+            if self._transport.state in [STATE_PLAYING, STATE_PAUSED]:
                 self._features = (
                     MediaPlayerEntityFeature.SELECT_SOURCE
                     | MediaPlayerEntityFeature.SELECT_SOUND_MODE
@@ -1142,7 +1144,7 @@ class LinkPlayDevice(
                     | MediaPlayerEntityFeature.REPEAT_SET
                 )
 
-        elif self._playing_stream or self._playing_mediabrowser:
+        elif self._playing.stream or self._playing.mediabrowser:
             self._features = (
                 MediaPlayerEntityFeature.SELECT_SOURCE
                 | MediaPlayerEntityFeature.SELECT_SOUND_MODE
@@ -1158,7 +1160,7 @@ class LinkPlayDevice(
                 | MediaPlayerEntityFeature.SEEK
                 )
 
-        elif self._playing_liveinput:
+        elif self._playing.liveinput:
             self._features = (
                 MediaPlayerEntityFeature.SELECT_SOURCE
                 | MediaPlayerEntityFeature.SELECT_SOUND_MODE
@@ -1176,56 +1178,56 @@ class LinkPlayDevice(
     @property
     def media_position(self):
         """Time in seconds of current playback head position."""
-        if (self._playing_localfile or self._playing_spotify or self._slave_mode or self._playing_mediabrowser) and self._state != STATE_UNAVAILABLE:
-            return self._playhead_position
+        if (self._playing.localfile or self._playing.spotify or self._group.slave_mode or self._playing.mediabrowser) and self._transport.state != STATE_UNAVAILABLE:
+            return self._transport.playhead_position
         else:
             return None
 
     @property
     def media_duration(self):
         """Time in seconds of current song duration."""
-        if (self._playing_localfile or self._playing_spotify or self._slave_mode or self._playing_mediabrowser) and self._state != STATE_UNAVAILABLE:
-            return self._duration
+        if (self._playing.localfile or self._playing.spotify or self._group.slave_mode or self._playing.mediabrowser) and self._transport.state != STATE_UNAVAILABLE:
+            return self._transport.duration
         else:
             return None
 
     @property
     def media_position_updated_at(self):
         """When the seek position was last updated."""
-        if not self._playing_liveinput and self._state == STATE_PLAYING:
-            return self._position_updated_at
+        if not self._playing.liveinput and self._transport.state == STATE_PLAYING:
+            return self._transport.position_updated_at
         else:
             return None
 
     @property
     def shuffle(self):
         """Return True if shuffle mode is enabled."""
-        return self._shuffle
+        return self._transport.shuffle
 
     @property
     def repeat(self):
         """Return repeat mode."""
-        return self._repeat
+        return self._transport.repeat
 
     @property
     def media_title(self):
         """Return title of the current track."""
-        return self._media_title
+        return self._meta.title
 
     @property
     def media_artist(self):
         """Return name of the current track artist."""
-        return self._media_artist
+        return self._meta.artist
 
     @property
     def media_album_name(self):
         """Return name of the current track album."""
-        return self._media_album
+        return self._meta.album
 
     @property
     def media_image_url(self):
         """Return name the image for the current track."""
-        return self._media_image_url
+        return self._meta.image_url
 
     @property
     def media_content_type(self):
@@ -1245,7 +1247,7 @@ class LinkPlayDevice(
     @property
     def slave_ip(self):
         """Ip used in multiroom configuration."""
-        return self._slave_ip
+        return self._group.slave_ip
 
     @property
     def device_class(self) -> MediaPlayerDeviceClass:
@@ -1255,14 +1257,14 @@ class LinkPlayDevice(
     def extra_state_attributes(self):
         """List members in group and set master and slave state."""
         attributes = {}
-        if self._multiroom_group:
-            attributes[ATTR_LINKPLAY_GROUP] = self._multiroom_group
-
-        attributes[ATTR_MASTER] = self._is_master
-        if self._slave_mode:
-            attributes[ATTR_SLAVE] = self._slave_mode
-        if self._media_uri_final:
-            attributes[ATTR_STURI] = self._media_uri_final
+        if self._group.members:
+            attributes[ATTR_LINKPLAY_GROUP] = self._group.members
+
+        attributes[ATTR_MASTER] = self._group.is_master
+        if self._group.slave_mode:
+            attributes[ATTR_SLAVE] = self._group.slave_mode
+        if self._meta.uri_final:
+            attributes[ATTR_STURI] = self._meta.uri_final
         if len(self._trackq) > 0:
             attributes[ATTR_TRCNT] = len(self._trackq) - 1
         if self._trackc:
@@ -1270,36 +1272,36 @@ class LinkPlayDevice(
         if self._uuid != '':
             attributes[ATTR_UUID] = self._uuid
 
-        attributes[ATTR_TTS] = self._playing_tts
+        attributes[ATTR_TTS] = self._playing.tts
         attributes[ATTR_SNAPSHOT] = self._snapshot_active
-        attributes[ATTR_SNAPSPOT] = self._snap_spotify
+        attributes[ATTR_SNAPSPOT] = self._snap.spotify
 
         if DEBUGSTR_ATTR:
             atrdbg = ""
-            if self._playing_localfile:
+            if self._playing.localfile:
                 atrdbg = atrdbg + " _playing_localfile"
 
-            if self._playing_spotify:
+            if self._playing.spotify:
                 atrdbg = atrdbg + " _playing_spotify"
 
-            if self._playing_webplaylist:
+            if self._playing.webplaylist:
                 atrdbg = atrdbg + " _playing_webplaylist"
 
-            if self._playing_stream:
+            if self._playing.stream:
                 atrdbg = atrdbg + " _playing_stream"
 
-            if self._playing_liveinput:
+            if self._playing.liveinput:
                 atrdbg = atrdbg + " _playing_liveinput"
 
-            if self._playing_tts:
+            if self._playing.tts:
                 atrdbg = atrdbg + " _playing_tts"
 
-            if self._playing_mediabrowser:
+            if self._playing.mediabrowser:
                 atrdbg = atrdbg + " _playing_mediabrowser"
 
             attributes[ATTR_DEBUG] = atrdbg
 
-        if self._state != STATE_UNAVAILABLE:
+        if self._transport.state != STATE_UNAVAILABLE:
             attributes[ATTR_FWVER] = self._fw_ver + "." + self._mcu_ver
 
         return attributes
@@ -1322,18 +1324,47 @@ class LinkPlayDevice(
         """Return the unique id, or None when no UUID has been discovered yet."""
         return f"linkplay_media_{self._uuid}" if self._uuid else None
 
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Return the device entry the metric sensors attach to as well."""
+        if not self._uuid:
+            return None
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._uuid)},
+            name=self._name,
+            model=self._model,
+            sw_version=self._fw_version,
+        )
+
     @property
     def fw_ver(self):
         """Return the firmware version number of the device."""
         return self._fw_ver
 
+    @property
+    def _fw_ver(self) -> str:
+        return self._fw_version
+
+    @_fw_ver.setter
+    def _fw_ver(self, version: str) -> None:
+        self._fw_version = version
+        self._refresh_quirks()
+
+    def _refresh_quirks(self) -> None:
+        """Re-resolve the quirk settings after firmware / uuid / model changed."""
+        quirks = resolve_quirks(self._fw_version, self._uuid, self._model)
+        if quirks == self._quirks:
+            return
+        self._quirks = quirks
+        get_request_scheduler(self._host).max_concurrent = quirks.max_concurrent
+
     async def async_play_media(self, media_type, media_id, **kwargs):
         """Play media from a URL or localfile."""
         return await self._async_play_media_impl(media_type, media_id, **kwargs)
 
     async def _async_play_media_impl(self, media_type, media_id, **kwargs):
         _LOGGER.debug("Trying to play media. Device: %s, Media_type: %s, Media_id: %s", self.entity_id, media_type, media_id)
-        if not self._slave_mode:
+        if not self._group.slave_mode:
 
             if not (media_type in [MediaType.MUSIC, MediaType.URL, MediaType.TRACK] or media_source.is_media_source_id(media_id)):
                 _LOGGER.warning("For: %s Invalid media type %s. Only %s and %s is supported", self._name, media_type, MediaType.MUSIC, MediaType.URL)
@@ -1341,20 +1372,20 @@ class LinkPlayDevice(
                 return False
 
             if not self._snapshot_active:
-                self._playing_mediabrowser = False
-                self._nometa = False
+                self._playing.mediabrowser = False
+                self._meta.nometa = False
 
             if media_source.is_media_source_id(media_id):
                 play_item = await media_source.async_resolve_media(self.hass, media_id, self.entity_id)
                 if media_id.find('radio_browser') != -1:  # radios are an exception, be treated by server redirect checker and icecast metadata parser
-                    self._playing_mediabrowser = False
+                    self._playing.mediabrowser = False
                 else:
-                    self._playing_mediabrowser = True
+                    self._playing.mediabrowser = True
 
                 if media_id.find('media_source/local') != -1:
-                    self._media_source_uri = media_id
+                    self._meta.source_uri = media_id
                 else:
-                    self._media_source_uri = None
+                    self._meta.source_uri = None
 
                 media_id = play_item.url
                 if play_item.mime_type not in ['audio/basic',
@@ -1380,7 +1411,7 @@ class LinkPlayDevice(
                                                'audio/x-flac',
                                                'audio/x-ms-wma']:
                     _LOGGER.warning("For: %s Invalid media type, %s is not supported", self._name, play_item.mime_type)
-                    self._playing_mediabrowser = False
+                    self._playing.mediabrowser = False
                     return False
 
                 media_id = async_process_play_media_url(self.hass, media_id)
@@ -1401,13 +1432,13 @@ class LinkPlayDevice(
 
             media_id_final = media_id
             if media_type == MediaType.URL:
-                if not self._playing_mediabrowser:
+                if not self._playing.mediabrowser:
                     media_id_final = await self.async_detect_stream_url_redirection(media_id)
 
-                if self._fwvercheck(self._fw_ver) >= self._fwvercheck(FW_SLOW_STREAMS) and self._state == STATE_PLAYING:
+                if self._quirks.slow_streams and self._transport.state == STATE_PLAYING:
                     await self.call_linkplay_httpapi("setPlayerCmd:pause", None)
 
-                if self._playing_spotify:  # disconnect from Spotify before playing new http source
+                if self._playing.spotify:  # disconnect from Spotify before playing new http source
                     await self.call_linkplay_httpapi("setPlayerCmd:switchmode:wifi", None)
 
                 value = await self.call_linkplay_httpapi(f"setPlayerCmd:play:{media_id_final}", None)
@@ -1421,37 +1452,36 @@ class LinkPlayDevice(
                     _LOGGER.warning("Failed to play media type music. Device: %s, Got response: %s, Media_Id: %s", self.entity_id, value, media_id)
                     return False
 
-            self._state = STATE_PLAYING
+            self._transport.state = STATE_PLAYING
             if media_id.find('tts_proxy') != -1:
-                self._playing_tts = True
-                self._playing_mediabrowser = False
-                self._playing_stream = False
+                self._playing.tts = True
+                self._playing.mediabrowser = False
+                self._playing.stream = False
             else:
-                self._playing_tts = False
-            self._media_title = None
-            self._media_artist = None
-            self._media_album = None
-            self._icecast_name = None
+                self._playing.tts = False
+            self._meta.title = None
+            self._meta.artist = None
+            self._meta.album = None
+            self._meta.icecast_name = None
             self._somafm_cached_station = None
-            self._playhead_position = 0
-            self._duration = 0
+            self._transport.playhead_position = 0
+            self._transport.duration = 0
             self._trackc = None
-            self._position_updated_at = utcnow()
-            self._idletime_updated_at = self._position_updated_at
-            self._media_image_url = None
+            self._transport.position_updated_at = utcnow()
+            self._transport.idletime_updated_at = self._transport.position_updated_at
+            self._meta.image_url = None
             self._ice_skip_throt = True
             self._unav_throttle = False
             if media_type == MediaType.URL:
-                self._media_uri = media_id
-                self._media_uri_final = media_id_final
+                self._meta.uri = media_id
+                self._meta.uri_final = media_id_final
             elif media_type == MediaType.MUSIC:
-                self._media_uri = None
-                self._media_uri_final = None
-                self._wait_for_mcu = 0.4
+                self._meta.uri = None
+                self._meta.uri_final = None
             return True
 
         if not self._snapshot_active:
-            await self._master.async_play_media(media_type, media_id)
+            await self._group.master.async_play_media(media_type, media_id)
         return True
 
     async def async_select_source(self, source):
@@ -1459,145 +1489,133 @@ class LinkPlayDevice(
         await self._async_select_source_impl(source)
 
     async def _async_select_source_impl(self, source):
-        if not self._slave_mode:
-            self._nometa = False
-            temp_source = next((k for k in self._source_list if self._source_list[k] == source), None)
+        if not self._group.slave_mode:
+            self._meta.nometa = False
+            temp_source = self._sources.key(source)
             if temp_source is None:
                 return
 
-            if self._playing_spotify:  # disconnect from Spotify before selecting new source
-                if self._fwvercheck(self._fw_ver) >= self._fwvercheck(FW_SLOW_STREAMS):
+            if self._playing.spotify:  # disconnect from Spotify before selecting new source
+                if self._quirks.slow_streams:
                     await self.call_linkplay_httpapi("setPlayerCmd:pause", None)
                 await self.call_linkplay_httpapi("setPlayerCmd:switchmode:wifi", None)
 
             if temp_source == "udisk":
                 await self.async_tracklist_via_upnp("USB")
 
-            prev_source = None
-            if len(self._source_list) > 0:
-                prev_source = next((k for k in self._source_list if self._source_list[k] == self._source), None)
-
-            if prev_source and prev_source.startswith('http') and temp_source in ['line-in', 'line-in2', 'optical', 'bluetooth', 'co-axial', 'HDMI', 'cd', 'udisk', 'RCA']:
-                self._wait_for_mcu = 1
-
             self._unav_throttle = False
-            if temp_source.startswith('http'):
+            if self._sources.is_stream(temp_source):
                 temp_source_final = await self.async_detect_stream_url_redirection(temp_source)
 
-                if self._fwvercheck(self._fw_ver) >= self._fwvercheck(FW_SLOW_STREAMS) and self._state == STATE_PLAYING:
+                if self._quirks.slow_streams and self._transport.state == STATE_PLAYING:
                     await self.call_linkplay_httpapi("setPlayerCmd:pause", None)  #recent firmwares don't stop the previous stream while loading the new one, can take several seconds
 
                 value = await self.call_linkplay_httpapi(f"setPlayerCmd:play:{temp_source_final}", None)
                 if value == "OK":
-                    self._state = STATE_PLAYING
-                    if prev_source and prev_source.find('http') == -1:
-                        self._wait_for_mcu = 2  # switching from live to stream input -> time to report correct volume value at update
-                    else:
-                        self._wait_for_mcu = 0.5
-                    self._playing_tts = False
-                    self._source = source
-                    self._media_uri = temp_source
-                    self._media_uri_final = temp_source_final
-                    self._playhead_position = 0
-                    self._duration = 0
+                    self._transport.state = STATE_PLAYING
+                    self._playing.tts = False
+                    self._transport.source = source
+                    self._meta.uri = temp_source
+                    self._meta.uri_final = temp_source_final
+                    self._transport.playhead_position = 0
+                    self._transport.duration = 0
                     self._trackc = None
-                    self._position_updated_at = utcnow()
-                    self._idletime_updated_at = self._position_updated_at
-                    self._media_title = None
-                    self._media_artist = None
-                    self._media_album = None
-                    self._icecast_name = None
-                    self._media_image_url = None
+                    self._transport.position_updated_at = utcnow()
+                    self._transport.idletime_updated_at = self._transport.position_updated_at
+                    self._meta.title = None
+                    self._meta.artist = None
+                    self._meta.album = None
+                    self._meta.icecast_name = None
+                    self._meta.image_url = None
                     self._ice_skip_throt = True
-                    if self._slave_list is not None:
-                        for slave in self._slave_list:
-                            await slave.async_set_source(source)
+                    await self._async_broadcast_to_slaves(
+                        lambda slave: slave.async_set_source(source)
+                    )
                 else:
                     _LOGGER.warning("Failed to select http source and play. Device: %s, Got response: %s", self.entity_id, value)
             else:
                 value = await self.call_linkplay_httpapi(f"setPlayerCmd:switchmode:{temp_source}", None)
                 if value == "OK":
-                    self._state = STATE_PLAYING
+                    self._transport.state = STATE_PLAYING
                     # if temp_source and temp_source in ['udisk', 'TFcard']:
                     # else:
-                    self._source = source
-                    self._media_uri = None
-                    self._media_uri_final = None
-                    self._playhead_position = 0
-                    self._duration = 0
+                    self._transport.source = source
+                    self._meta.uri = None
+                    self._meta.uri_final = None
+                    self._transport.playhead_position = 0
+                    self._transport.duration = 0
                     self._trackc = None
-                    self._position_updated_at = utcnow()
-                    self._idletime_updated_at = self._position_updated_at
-                    if self._slave_list is not None:
-                        for slave in self._slave_list:
-                            await slave.async_set_source(source)
+                    self._transport.position_updated_at = utcnow()
+                    self._transport.idletime_updated_at = self._transport.position_updated_at
+                    await self._async_broadcast_to_slaves(
+                        lambda slave: slave.async_set_source(source)
+                    )
                 else:
                     _LOGGER.warning("Failed to select source. Device: %s, Got response: %s", self.entity_id, value)
         else:
-            await self._master.async_select_source(source)
+            await self._group.master.async_select_source(source)
 
     async def async_select_sound_mode(self, sound_mode):
         """Set Sound Mode for device."""
-        if not self._slave_mode:
-            mode = list(SOUND_MODES.keys())[list(
-                SOUND_MODES.values()).index(sound_mode)]
+        if not self._group.slave_mode:
+            mode = SOUND_MODE_KEYS[sound_mode]
             value = await self.call_linkplay_httpapi(f"setPlayerCmd:equalizer:{mode}", None)
             if value == "OK":
-                self._sound_mode = sound_mode
-                if self._slave_list is not None:
-                    for slave in self._slave_list:
-                        await slave.async_set_sound_mode(sound_mode)
+                self._transport.sound_mode = sound_mode
+                await self._async_broadcast_to_slaves(
+                    lambda slave: slave.async_set_sound_mode(sound_mode)
+                )
             else:
                 _LOGGER.warning("Failed to set sound mode. Device: %s, Got response: %s", self.entity_id, value)
         else:
-            await self._master.async_select_sound_mode(sound_mode)
+            await self._group.master.async_select_sound_mode(sound_mode)
 
     async def async_set_shuffle(self, shuffle):
         """Change the shuffle mode."""
-        if not self._slave_mode:
+        if not self._group.slave_mode:
             mode = '0'
             if shuffle:
-                self._shuffle = shuffle
+                self._transport.shuffle = shuffle
                 mode = '2'
-            elif self._repeat == RepeatMode.ALL:
+            elif self._transport.repeat == RepeatMode.ALL:
                 mode = '3'
-            elif self._repeat == RepeatMode.ONE:
+            elif self._transport.repeat == RepeatMode.ONE:
                 mode = '1'
             value = await self.call_linkplay_httpapi(f"setPlayerCmd:loopmode:{mode}", None)
             if value != "OK":
                 _LOGGER.warning("Failed to change shuffle mode. Device: %s, Got response: %s", self.entity_id, value)
         else:
-            await self._master.async_set_shuffle(shuffle)
+            await self._group.master.async_set_shuffle(shuffle)
 
     async def async_set_repeat(self, repeat):
         """Change the repeat mode."""
-        if not self._slave_mode:
-            self._repeat = repeat
+        if not self._group.slave_mode:
+            self._transport.repeat = repeat
             mode = '0'
             if repeat == RepeatMode.ALL:
-                mode = '2' if self._shuffle else '3'
+                mode = '2' if self._transport.shuffle else '3'
             elif repeat == RepeatMode.ONE:
                 mode = '1'
             value = await self.call_linkplay_httpapi(f"setPlayerCmd:loopmode:{mode}", None)
             if value != "OK":
                 _LOGGER.warning("Failed to change repeat mode. Device: %s, Got response: %s", self.entity_id, value)
         else:
-            await self._master.async_set_repeat(repeat)
+            await self._group.master.async_set_repeat(repeat)
 
     async def async_get_local_mediasource_metadata_from_path(self):
-        if self._media_source_uri is not None:
+        if self._meta.source_uri is not None:
             rootdir = "media-source://media_source/local/"
-            self._trackc = self._media_source_uri.replace(rootdir, '')
+            self._trackc = self._meta.source_uri.replace(rootdir, '')
             titleuri = self._trackc.split('/')
             if len(titleuri) > 1:
                 titles = titleuri[-2:]
-                self._media_artist = string.capwords(titles[0].strip().strip('-').replace('_', ' '))
-                self._media_title = string.capwords(titles[1].strip().strip('-').replace('_', ' '))
+                self._meta.artist = string.capwords(titles[0].strip().strip('-').replace('_', ' '))
+                self._meta.title = string.capwords(titles[1].strip().strip('-').replace('_', ' '))
             else:
-                self._media_title = string.capwords(titleuri[0].strip().strip('-').replace('_', ' '))
-            querywords = self._media_title.split('.')
+                self._meta.title = string.capwords(titleuri[0].strip().strip('-').replace('_', ' '))
+            querywords = self._meta.title.split('.')
             resultwords  = [word for word in querywords if word.lower() not in CUT_EXTENSIONS]
-            self._media_title = ' '.join(resultwords)
+            self._meta.title = ' '.join(resultwords)
             return True
         else:
             return False
@@ -1611,54 +1629,50 @@ class LinkPlayDevice(
 
         title = parse_player_status_field(plr_stat.get('Title', ''))
         if title is not None:
-            self._media_title = title
+            self._meta.title = title
             if self._trackc is None:
-                self._trackc = self._media_title
+                self._trackc = self._meta.title
         elif plr_stat.get('Title') == '':
             pass  # leave previous value
         else:
-            self._media_title = None
+            self._meta.title = None
 
         artist = parse_player_status_field(plr_stat.get('Artist', ''))
         if artist is not None:
-            self._media_artist = artist
+            self._meta.artist = artist
         elif plr_stat.get('Artist') == '':
             pass
         else:
-            self._media_artist = None
+            self._meta.artist = None
 
         album = parse_player_status_field(plr_stat.get('Album', ''))
         if album is not None:
-            self._media_album = album
+            self._meta.album = album
         elif plr_stat.get('Album') == '':
             pass
         else:
-            self._media_album = None
+            self._meta.album = None
 
-        return self._media_title is not None and self._media_artist is not None
-
-    @staticmethod
-    def _fwvercheck(v):
-        return tuple(point.zfill(8) for point in v.split("."))
+        return self._meta.title is not None and self._meta.artist is not None
 
     async def async_is_playing_new_track(self):
         """Check if track is changed since last update."""
-        if self._playing_mediabrowser and self._media_source_uri is not None:
+        if self._playing.mediabrowser and self._meta.source_uri is not None:
             # don't trigger new track flag for local mediabrowser files
             return False
 
-        if self._icecast_name is not None:
+        if self._meta.icecast_name is not None:
             import unicodedata
-            artmed = unicodedata.normalize('NFKD', str(self._media_artist) + str(self._media_title)).lower()
+            artmed = unicodedata.normalize('NFKD', str(self._meta.artist) + str(self._meta.title)).lower()
             artmedd = "".join([c for c in artmed if not unicodedata.combining(c)])
-            if artmedd.find(self._icecast_name.lower()) != -1 or artmedd.find(self._source.lower()) != -1:
+            if artmedd.find(self._meta.icecast_name.lower()) != -1 or artmedd.find(self._transport.source.lower()) != -1:
                 # don't trigger new track flag for icecast streams where track name contains station name or source name; save some energy by not quering last.fm with this
-                self._media_image_url = None
+                self._meta.image_url = None
                 return False
 
         return (
-            self._media_artist != self._media_prev_artist
-            or self._media_title != self._media_prev_title
+            self._meta.artist != self._meta.prev_artist
+            or self._meta.title != self._meta.prev_title
         )
 
     async def async_preset_button(self, preset):
@@ -1667,20 +1681,20 @@ class LinkPlayDevice(
             return
         # A slave forwards the preset to its master. Only forward to a
         # device that is itself NOT a slave (and not this very device):
-        # a failed join can leave a player with _slave_mode=True and
-        # _master pointing at itself (or another slave), and an
+        # a failed join can leave a player with _group.slave_mode=True and
+        # _group.master pointing at itself (or another slave), and an
         # unguarded forward then recurses until
         # "RecursionError: maximum recursion depth exceeded". Forwarding
         # solely to a genuine (non-slave) master bounds this to one hop;
         # if the master link is broken we fall through and handle the
         # preset locally instead of crashing.
         if (
-            self._slave_mode
-            and self._master is not None
-            and self._master is not self
-            and not self._master._slave_mode
+            self._group.slave_mode
+            and self._group.master is not None
+            and self._group.master is not self
+            and not self._group.master._group.slave_mode
         ):
-            await self._master.async_preset_button(preset)
+            await self._group.master.async_preset_button(preset)
             return
         if not (0 < int(preset) <= self._preset_key):
             _LOGGER.warning(
@@ -1694,30 +1708,36 @@ class LinkPlayDevice(
         # The preset recall makes AudioPro firmware briefly report
         # ``slaves=0`` on multiroom:getSlaveList even though the
         # WiFi-direct group is still physically intact. Re-arm the join
-        # grace so the master-side poll keeps ``_multiroom_group``
+        # grace so the master-side poll keeps ``_group.members``
         # through the preset and the user's follow-up set_group_volume.
-        if self._is_master and len(self._multiroom_group) > 1:
-            self._multiroom_joinat = utcnow()
-            self._slave_zero_polls = 0
+        if self._group.is_master and len(self._group.members) > 1:
+            self._group.joinat = utcnow()
+            self._group.zero_polls = 0
 
         # Snapshot the master's intended volume before MCUKeyShortClick.
         # AudioPro firmware restores the per-source saved volume on a
         # preset switch, overriding whatever the user just set via
         # set_group_volume / volume_set. Re-apply our locally tracked
-        # _volume after the switch so the firmware HW + HA cache match
+        # _transport.volume after the switch so the firmware HW + HA cache match
         # what the user asked for.
         #
-        # Exception: on Bluetooth, _volume holds the (typically loud)
+        # Exception: on Bluetooth, _transport.volume holds the (typically loud)
         # Bluetooth-session level, not any intended preset level.
         # Re-asserting it would blast that level across the whole group
         # for the ~second before the user's set_group_volume lands, so
         # skip the restore and let the firmware's per-preset volume stand.
-        from_bluetooth = self._source == "Bluetooth"
+        from_bluetooth = self._transport.source == "Bluetooth"
         intended_vol = (
-            int(self._volume)
-            if self._volume is not None and not from_bluetooth
+            int(self._transport.volume)
+            if self._transport.volume is not None and not from_bluetooth
+            and self._quirks.reassert_preset_volume
             else None
         )
+        before = None
+        if intended_vol is not None:
+            before = await self.call_linkplay_httpapi(
+                "getPlayerStatus", True, priority=PRIORITY_USER,
+            )
         value = await self.call_linkplay_httpapi(f"MCUKeyShortClick:{preset!s}", None)
         if value != "OK":
             _LOGGER.warning(
@@ -1726,25 +1746,38 @@ class LinkPlayDevice(
             )
             return
         if intended_vol is not None:
-            await asyncio.sleep(0.3)
-            await self._set_volume_on_device(intended_vol, action="preset_restore_vol")
-            # Group members: re-apply each slave's offset-adjusted target
-            # so the firmware's per-source volume restore on the master
-            # doesn't desync the group either.
-            if self._is_master and self._multiroom_group:
-                by_eid = {
-                    d.entity_id: d
-                    for d in self.hass.data[DOMAIN].entities
-                }
-                for eid in self._multiroom_group:
-                    device = by_eid.get(eid)
-                    if device is None or device is self:
-                        continue
-                    offset = getattr(device, "_volume_offset", 0) or 0
-                    target_pct = max(0, min(100, intended_vol + offset))
-                    await device._set_volume_on_device(
-                        target_pct, action="preset_restore_slave_vol",
-                    )
+            # The firmware applies the preset's own volume as the preset
+            # takes over; override it only after that.
+            await self.async_wait_for_status(
+                preset_applied(before if isinstance(before, dict) else None),
+                PRESET_READY_TIMEOUT,
+            )
+            # Group members: re-apply each slave's offset-adjusted target,
+            # together with the master's, so the firmware's per-source
+            # volume restore on the master doesn't desync the group either.
+            slaves = (
+                self._group_slave_entities()
+                if self._group.is_master and self._group.members
+                else []
+            )
+
+            async def _restore_slave_volume(device):
+                offset = getattr(device, "_volume_offset", 0) or 0
+                target_pct = max(0, min(100, intended_vol + offset))
+                await device._set_volume_on_device(
+                    target_pct, action="preset_restore_slave_vol",
+                )
+
+            await asyncio.gather(
+                self._set_volume_on_device(intended_vol, action="preset_restore_vol"),
+                self._async_broadcast_to_slaves(_restore_slave_volume, slaves),
+            )
+
+    def _usb_track_index(self):
+        """Index over ``_trackq``, rebuilt if the queue was replaced."""
+        if self._track_index.tracks is not self._trackq:
+            self._track_index = TrackIndex(self._trackq)
+        return self._track_index
 
     async def async_play_track(self, track):
         """Play media track by name found in the tracks list."""
@@ -1754,13 +1787,9 @@ class LinkPlayDevice(
         track.hass = self.hass   # render template
         trackn = track.async_render()
 
-        if not self._slave_mode:
-            try:
-                index = next(idx for idx, s in enumerate(self._trackq) if trackn in s)
-            except StopIteration:
-                return False
-
-            if index <= 0:
+        if not self._group.slave_mode:
+            index = self._usb_track_index().find(trackn)
+            if index is None or index <= 0:
                 return False
 
             value = await self.call_linkplay_httpapi(f"setPlayerCmd:playLocalList:{index}", None)
@@ -1768,26 +1797,28 @@ class LinkPlayDevice(
                 _LOGGER.warning("Failed to play media track by name. Device: %s, Got response: %s", self.entity_id, value)
                 return False
             else:
-                self._state = STATE_PLAYING
-                self._playing_tts = False
-                self._media_title = None
-                self._media_artist = None
-                self._media_album = None
+                self._transport.state = STATE_PLAYING
+                self._playing.tts = False
+                self._meta.title = None
+                self._meta.artist = None
+                self._meta.album = None
                 self._trackc = None
-                self._icecast_name = None
-                self._playhead_position = 0
-                self._duration = 0
-                self._position_updated_at = utcnow()
-                self._media_image_url = None
-                self._media_uri = None
-                self._media_uri_final = None
+                self._meta.icecast_name = None
+                self._transport.playhead_position = 0
+                self._transport.duration = 0
+                self._transport.position_updated_at = utcnow()
+                self._meta.image_url = None
+                self._meta.uri = None
+                self._meta.uri_final = None
                 self._ice_skip_throt = False
                 self._unav_throttle = False
                 return True
-        await self._master.async_play_track(track)
+        await self._group.master.async_play_track(track)
         return True
 
     _USB_DISK_ROOT_ID = "linkplay_udisk"
+    # Entries (folders + tracks) per USB browse response.
+    _USB_DISK_PAGE_SIZE = 200
 
     async def async_browse_media(self, media_content_type=None, media_content_id=None):
         """Implement the websocket media browsing helper.
@@ -1796,12 +1827,18 @@ class LinkPlayDevice(
 
         * Home Assistant media sources (HA media_source integration).
         * If this LinkPlay device has a USB disk attached and reported a
-          track queue, an additional ``USB Disk`` folder listing each
-          track. Tracks are referenced by 1-based index in the queue so
-          ``play_media`` with ``MediaType.MUSIC`` plays the correct file.
+          track queue, an additional ``USB Disk`` folder mirroring the
+          disk's folders. A folder is listed when it is expanded, at
+          most ``_USB_DISK_PAGE_SIZE`` entries at a time followed by a
+          "More" entry for the next page. Tracks are referenced by
+          1-based index in the queue so ``play_media`` with
+          ``MediaType.MUSIC`` plays the correct file.
         """
-        if media_content_id == self._USB_DISK_ROOT_ID:
-            return self._build_udisk_browse()
+        if media_content_id is not None and (
+            media_content_id == self._USB_DISK_ROOT_ID
+            or media_content_id.startswith(f"{self._USB_DISK_ROOT_ID}/")
+        ):
+            return self._build_udisk_browse(media_content_id)
 
         ha_sources = await media_source.async_browse_media(
             self.hass,
@@ -1815,7 +1852,7 @@ class LinkPlayDevice(
         # At the root level, append the device's USB disk as a child so it
         # sits next to HA's media sources.
         udisk_root = BrowseMedia(
-            title=self._source_list.get("udisk", "USB Disk"),
+            title=self._sources.name("udisk", "USB Disk"),
             media_class=MediaClass.DIRECTORY,
             media_content_id=self._USB_DISK_ROOT_ID,
             media_content_type="listing",
@@ -1829,27 +1866,75 @@ class LinkPlayDevice(
         return ha_sources
 
     def _has_udisk_tracks(self) -> bool:
-        return bool(self._trackq) and "udisk" in self._source_list
+        return bool(self._trackq) and "udisk" in self._sources
 
-    def _build_udisk_browse(self) -> "BrowseMedia":
-        """Return the BrowseMedia subtree listing tracks on the USB disk."""
-        tracks = [
+    def _udisk_content_id(self, folder: str = "", page: int = 0) -> str:
+        if not folder and not page:
+            return self._USB_DISK_ROOT_ID
+        return f"{self._USB_DISK_ROOT_ID}/{page}/{folder}"
+
+    def _build_udisk_browse(self, media_content_id: str | None = None) -> "BrowseMedia":
+        """Return one page of a USB disk folder.
+
+        Content ids are ``linkplay_udisk`` for the first page of the disk
+        root and ``linkplay_udisk/<page>/<folder path>`` otherwise.
+        """
+        folder, page = "", 0
+        if media_content_id and media_content_id != self._USB_DISK_ROOT_ID:
+            try:
+                _root, page_str, folder = media_content_id.split("/", 2)
+                page = int(page_str)
+            except ValueError as error:
+                raise BrowseError(f"Invalid USB media id: {media_content_id}") from error
+
+        index = self._usb_track_index()
+        entries = index.folder(folder)
+        if entries is None or page < 0:
+            raise BrowseError(f"USB folder not found: {folder}")
+        subfolders, positions = entries
+
+        size = self._USB_DISK_PAGE_SIZE
+        start = page * size
+        children = [
+            BrowseMedia(
+                title=path.rpartition("/")[2],
+                media_class=MediaClass.DIRECTORY,
+                media_content_id=self._udisk_content_id(path),
+                media_content_type="listing",
+                can_play=False,
+                can_expand=True,
+            )
+            for path in subfolders[start:start + size]
+        ]
+        track_start = max(0, start - len(subfolders))
+        children.extend(
             BrowseMedia(
-                title=track,
+                title=index.tracks[position].rpartition("/")[2],
                 media_class=MediaClass.MUSIC,
-                media_content_id=str(index),
+                media_content_id=str(position + 1),
                 media_content_type=MediaType.MUSIC,
                 can_play=True,
                 can_expand=False,
             )
-            for index, track in enumerate(self._trackq, start=1)
-        ]
+            for position in positions[track_start:track_start + size - len(children)]
+        )
+        if start + size < len(subfolders) + len(positions):
+            children.append(BrowseMedia(
+                title="More…",
+                media_class=MediaClass.DIRECTORY,
+                media_content_id=self._udisk_content_id(folder, page + 1),
+                media_content_type="listing",
+                can_play=False,
+                can_expand=True,
+            ))
+
+        title = folder.rpartition("/")[2] or self._sources.name("udisk", "USB Disk")
         return BrowseMedia(
-            title=self._source_list.get("udisk", "USB Disk"),
+            title=title if not page else f"{title} ({page + 1})",
             media_class=MediaClass.DIRECTORY,
-            media_content_id=self._USB_DISK_ROOT_ID,
+            media_content_id=self._udisk_content_id(folder, page),
             media_content_type="listing",
             can_play=False,
             can_expand=True,
-            children=tracks,
+            children=children,
         )
@@ -7,11 +7,16 @@ methods in :mod:`media_player` delegate to these.
 
 from __future__ import annotations
 
+import io
 import re
 import string
 from collections.abc import Iterable
+from typing import NamedTuple
+from xml.etree.ElementTree import ParseError
 
 import chardet
+import validators
+from defusedxml import ElementTree as DET
 
 
 # ---- LinkPlay getPlayerStatus hex fields ----
@@ -166,10 +171,90 @@ def parse_pls_first_url(text: str) -> str | None:
     return match.group(1) if match else None
 
 
+# ---- UPnP DIDL-Lite track metadata ----
+
+_DIDL_ITEM = "{urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/}item"
+_DC_NS = "{http://purl.org/dc/elements/1.1/}"
+_UPNP_NS = "{urn:schemas-upnp-org:metadata-1-0/upnp/}"
+# Element tag -> DidlMetadata field, for the children of an <item>.
+_DIDL_FIELDS = {
+    f"{_DC_NS}title": "title",
+    f"{_UPNP_NS}artist": "artist",
+    f"{_UPNP_NS}album": "album",
+    f"{_UPNP_NS}albumArtURI": "image_url",
+}
+
+
+class DidlMetadata(NamedTuple):
+    title: str | None = None
+    artist: str | None = None
+    album: str | None = None
+    image_url: str | None = None
+
+
+def parse_didl_metadata(raw: str) -> DidlMetadata:
+    """Extract the track fields of a DIDL-Lite document in one pass.
+
+    The first value of each field across the ``<item>`` elements wins.
+    An album art value that is not a URL is dropped. Raises
+    ``ParseError`` on malformed XML.
+    """
+    fields: dict[str, str | None] = {}
+    depth = -1
+    in_item = False
+    for event, element in DET.iterparse(io.StringIO(raw), events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                in_item = element.tag == _DIDL_ITEM
+            continue
+        if depth == 2 and in_item:
+            name = _DIDL_FIELDS.get(element.tag)
+            if name is not None and name not in fields:
+                fields[name] = element.text
+        element.clear()
+        depth -= 1
+
+    image_url = fields.get("image_url")
+    if image_url and not validators.url(image_url):
+        fields["image_url"] = None
+    return DidlMetadata(**fields)
+
+
+class DidlDecoder:
+    """Last-result cache in front of :func:`parse_didl_metadata`.
+
+    ``CurrentURIMetaData`` is usually identical from one poll to the
+    next, so a document equal to the previous one is not parsed again.
+    """
+
+    __slots__ = ("_raw", "_result", "error")
+
+    def __init__(self) -> None:
+        self._raw: str | None = None
+        self._result: DidlMetadata | None = None
+        self.error: ParseError | None = None
+
+    def decode(self, raw: str) -> DidlMetadata | None:
+        """Metadata of ``raw``; None if it is not valid XML (see ``error``)."""
+        if raw != self._raw:
+            self._raw = raw
+            try:
+                self._result = parse_didl_metadata(raw)
+                self.error = None
+            except ParseError as error:
+                self._result = None
+                self.error = error
+        return self._result
+
+
 # ---- Exposed helpers iterator (for type-checkers) ----
 
 __all__: Iterable[str] = (
+    "DidlDecoder",
+    "DidlMetadata",
     "decode_hex_utf8",
+    "parse_didl_metadata",
     "parse_icy_name",
     "parse_icy_stream_title",
     "parse_m3u_first_url",
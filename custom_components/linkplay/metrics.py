@@ -0,0 +1,280 @@
+"""Lightweight per-host metrics for LinkPlay speakers.
+
+Every outbound call - HTTPAPI, TCP UART, UPnP actions and the internet
+metadata fetchers (SomaFM, iTunes, Last.fm, Icecast) - reports its
+latency and outcome here, together with cache hits/misses and the
+duration of each ``async_update`` poll cycle. The numbers feed the
+diagnostic sensors and the config-entry diagnostics download, so a
+lagging speaker can be diagnosed without debug logging.
+
+Latencies go into fixed-bucket histograms: recording is a bisect and
+two integer increments, and memory stays constant however long HA runs.
+Commands are keyed without their arguments (``setPlayerCmd:vol`` rather
+than ``setPlayerCmd:vol:30``) so the key space stays bounded.
+
+The last ``_TRACE_SIZE`` calls are also kept verbatim in a
+:class:`RequestTrace` ring buffer for the diagnostics download.
+"""
+
+from __future__ import annotations
+
+import time
+from array import array
+from bisect import bisect_left
+
+CHANNEL_HTTPAPI = "httpapi"
+CHANNEL_UART = "uart"
+CHANNEL_UPNP = "upnp"
+CHANNEL_SOMAFM = "somafm"
+CHANNEL_ITUNES = "itunes"
+CHANNEL_LASTFM = "lastfm"
+CHANNEL_ICECAST = "icecast"
+
+ERROR_TIMEOUT = "timeout"
+ERROR_CONNECT = "connect"
+ERROR_SSL = "ssl"
+ERROR_CLIENT = "client"
+ERROR_HTTP = "http"
+ERROR_PARSE = "parse"
+ERROR_OTHER = "other"
+
+# Upper bucket bounds in milliseconds; one extra overflow bucket.
+_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# Beyond this many distinct commands per channel, new ones share a key.
+_MAX_COMMANDS_PER_CHANNEL = 64
+_OVERFLOW_COMMAND = "other"
+# Requests kept per host in the diagnostics trace.
+_TRACE_SIZE = 64
+
+
+def command_key(command: str) -> str:
+    """Strip arguments from ``command``: keep at most two ``:`` segments."""
+    return ":".join(command.split(":", 2)[:2])
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect_left(_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    @property
+    def mean_ms(self) -> float | None:
+        return self.total_ms / self.count if self.count else None
+
+    def percentile(self, fraction: float) -> float | None:
+        """Upper bound of the bucket holding the ``fraction`` quantile."""
+        if not self.count:
+            return None
+        rank = fraction * self.count
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= rank:
+                if index < len(_BUCKETS_MS):
+                    return float(min(_BUCKETS_MS[index], self.max_ms))
+                break
+        return self.max_ms
+
+    def as_dict(self) -> dict:
+        buckets = {f"le_{bound}": n for bound, n in zip(_BUCKETS_MS, self.counts)}
+        buckets["inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": _round(self.mean_ms),
+            "p50_ms": _round(self.percentile(0.5)),
+            "p95_ms": _round(self.percentile(0.95)),
+            "max_ms": _round(self.max_ms),
+            "buckets": buckets,
+        }
+
+
+class RequestStats:
+    """Latency histogram plus error counts for one (channel, command)."""
+
+    __slots__ = ("latency", "errors")
+
+    def __init__(self) -> None:
+        self.latency = LatencyHistogram()
+        self.errors: dict[str, int] = {}
+
+    def as_dict(self) -> dict:
+        return {**self.latency.as_dict(), "errors": dict(self.errors)}
+
+
+class RequestTrace:
+    """Fixed-capacity ring buffer of the most recent requests.
+
+    Every column is preallocated: numbers live in typed ``array``s and
+    the string columns only hold references to strings the caller
+    already owns, so appending never grows or allocates containers and
+    the trace can stay on permanently.
+    """
+
+    __slots__ = (
+        "capacity", "_next", "_size",
+        "_at", "_latency", "_status", "_bytes",
+        "_channel", "_command", "_error",
+    )
+
+    def __init__(self, capacity: int = _TRACE_SIZE) -> None:
+        self.capacity = capacity
+        self._next = 0
+        self._size = 0
+        self._at = array("d", bytes(8 * capacity))
+        self._latency = array("d", bytes(8 * capacity))
+        self._status = array("i", bytes(4 * capacity))
+        self._bytes = array("q", bytes(8 * capacity))
+        self._channel: list[str | None] = [None] * capacity
+        self._command: list[str | None] = [None] * capacity
+        self._error: list[str | None] = [None] * capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(
+        self, channel: str, command: str, latency_ms: float,
+        status: int, size: int, error: str | None,
+    ) -> None:
+        index = self._next
+        self._at[index] = time.time()
+        self._latency[index] = latency_ms
+        self._status[index] = status
+        self._bytes[index] = size
+        self._channel[index] = channel
+        self._command[index] = command
+        self._error[index] = error
+        self._next = (index + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def entries(self) -> list[dict]:
+        """Oldest-first copy of the buffered requests."""
+        start = (self._next - self._size) % self.capacity
+        result = []
+        for offset in range(self._size):
+            index = (start + offset) % self.capacity
+            result.append({
+                "at": self._at[index],
+                "channel": self._channel[index],
+                "command": self._command[index],
+                "latency_ms": round(self._latency[index], 1),
+                "status": self._status[index] or None,
+                "bytes": self._bytes[index] if self._bytes[index] >= 0 else None,
+                "error": self._error[index],
+            })
+        return result
+
+
+class LinkPlayMetrics:
+    """All metrics recorded for one speaker host."""
+
+    def __init__(self) -> None:
+        self.requests: dict[str, dict[str, RequestStats]] = {}
+        self.caches: dict[str, list[int]] = {}
+        self.polls = LatencyHistogram()
+        self.last_poll_ms: float | None = None
+        self.trace = RequestTrace()
+
+    def record_request(
+        self, channel: str, command: str, started: float, error: str | None = None,
+        *, status: int = 0, size: int = -1,
+    ) -> float:
+        """Record one call that began at ``started`` (``time.monotonic``).
+
+        ``error`` is one of the ``ERROR_*`` kinds, or None on success.
+        ``status`` (HTTP status) and ``size`` (response bytes) only go
+        into the trace; leave them at 0 / -1 when unknown. Returns the
+        elapsed time in milliseconds.
+        """
+        elapsed_ms = (time.monotonic() - started) * 1000
+        self.trace.append(channel, command, elapsed_ms, status, size, error)
+        commands = self.requests.setdefault(channel, {})
+        key = command_key(command)
+        stats = commands.get(key)
+        if stats is None:
+            if len(commands) >= _MAX_COMMANDS_PER_CHANNEL:
+                key = _OVERFLOW_COMMAND
+            stats = commands.setdefault(key, RequestStats())
+        stats.latency.observe(elapsed_ms)
+        if error is not None:
+            stats.errors[error] = stats.errors.get(error, 0) + 1
+        return elapsed_ms
+
+    def record_cache(self, name: str, hit: bool) -> None:
+        counts = self.caches.setdefault(name, [0, 0])
+        counts[0 if hit else 1] += 1
+
+    def record_poll(self, started: float) -> None:
+        self.last_poll_ms = (time.monotonic() - started) * 1000
+        self.polls.observe(self.last_poll_ms)
+
+    # ---- summaries for the diagnostic sensors ----
+
+    def _channel_stats(self, channel: str):
+        return self.requests.get(channel, {}).values()
+
+    def error_counts(self, channel: str = CHANNEL_HTTPAPI) -> dict[str, int]:
+        totals: dict[str, int] = {}
+        for stats in self._channel_stats(channel):
+            for kind, count in stats.errors.items():
+                totals[kind] = totals.get(kind, 0) + count
+        return totals
+
+    def latency_percentile(self, fraction: float, channel: str = CHANNEL_HTTPAPI) -> float | None:
+        """Quantile over every command of ``channel``."""
+        merged = LatencyHistogram()
+        for stats in self._channel_stats(channel):
+            hist = stats.latency
+            merged.counts = [a + b for a, b in zip(merged.counts, hist.counts)]
+            merged.count += hist.count
+            merged.max_ms = max(merged.max_ms, hist.max_ms)
+        return merged.percentile(fraction)
+
+    def cache_hit_rate(self) -> float | None:
+        """Hit percentage across all caches, None before the first lookup."""
+        hits = sum(counts[0] for counts in self.caches.values())
+        total = hits + sum(counts[1] for counts in self.caches.values())
+        return round(100 * hits / total, 1) if total else None
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": {
+                channel: {key: stats.as_dict() for key, stats in commands.items()}
+                for channel, commands in self.requests.items()
+            },
+            "caches": {
+                name: {"hits": hits, "misses": misses}
+                for name, (hits, misses) in self.caches.items()
+            },
+            "polls": self.polls.as_dict(),
+            "last_poll_ms": _round(self.last_poll_ms),
+            "recent_requests": self.trace.entries(),
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
+
+
+_METRICS: dict[str, LinkPlayMetrics] = {}
+
+
+def get_metrics(host: str) -> LinkPlayMetrics:
+    """Return the shared metrics for ``host``, creating them on first use."""
+    metrics = _METRICS.get(host)
+    if metrics is None:
+        metrics = _METRICS[host] = LinkPlayMetrics()
+    return metrics
@@ -7,106 +7,143 @@ LinkPlayDevice, which provides:
 * ``self.hass`` and ``self.hass.data[DOMAIN].entities``
 * ``self.call_linkplay_httpapi``
 * ``self.async_write_ha_state``
-* the ``_multiroom_group`` / ``_master`` / ``_is_master`` / ``_slave_mode``
-  / ``_multiroom_wifidirect`` / ``_slave_ip`` / ``_multiroom_unjoinat``
-  / ``_multiroom_prevsrc`` / ``_position_updated_at`` / ``_wait_for_mcu``
-  / ``_state`` / ``_slave_list`` / ``_features`` state attributes
+* the ``_group`` record (:class:`~.state.GroupState`), plus
+  ``_transport.state`` / ``_transport.position_updated_at`` and
+  ``_features``
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
 
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.util.dt import utcnow
 
 from .const import DOMAIN
+from .request_scheduler import RequestDropped
 
 _LOGGER = logging.getLogger(__name__)
 
-# Window during which we trust the locally-built ``_multiroom_group``
-# over a poll response that says ``slaves=0``. On AudioPro A28 firmware
-# (and others) the ``multiroom:getSlaveList`` response lags the
-# ``ConnectMasterAp`` success by several seconds; without this grace
-# the master's group is cleared between ``async_join`` and the very
-# next user-script action (e.g. ``linkplay.set_group_volume``), and
-# the service iterates an empty list.
-_JOIN_GRACE = timedelta(seconds=10)
-
-
 
 class LinkPlayMultiroomMixin:
     """Multiroom half of LinkPlayDevice."""
 
     # How long ``async_join`` waits for the firmware to populate each
     # new slave's WiFi-direct IP (visible via ``multiroom:getSlaveList``)
-    # before returning. Class attributes so tests can override them on
-    # the instance without monkeypatching the module.
-    _slave_ip_poll_interval = 0.5  # seconds between getSlaveList polls
-    _slave_ip_poll_max = 10        # attempts -> up to ~5 s total
-
-    # Consecutive ``multiroom:getSlaveList`` polls reporting no slaves
-    # (or failing) required before a master tears down its locally-built
-    # group. AudioPro firmware briefly reports ``slaves=0`` during preset
-    # and source switches even though the WiFi-direct group is still
-    # physically intact; a single such poll must not orphan the slaves.
-    _ZERO_POLL_TEARDOWN = 2
+    # before returning. Class attribute so tests can override it on the
+    # instance without monkeypatching the module.
+    _slave_ip_timeout = 5.0  # seconds
+
+    # Upper bound for one slave's share of a master-to-slave broadcast
+    # (see ``_async_broadcast_to_slaves``). A slave that doesn't finish
+    # within this window is reported as a straggler instead of holding
+    # up the rest of the group.
+    _slave_broadcast_timeout = 3.0  # seconds per slave
 
     # ---- properties ----
 
     @property
     def slave(self):
         """Return true if it is a slave."""
-        return self._slave_mode
+        return self._group.slave_mode
 
     @property
     def master(self):
         """Master entity used in multiroom configuration."""
-        return self._master
+        return self._group.master
 
     @property
     def is_master(self):
         """Return true if it is a master."""
-        return self._is_master
+        return self._group.is_master
 
     @property
     def group_members(self):
         """Entity-ids in the current multiroom group (HA standard)."""
-        return list(self._multiroom_group) if self._multiroom_group else []
+        return list(self._group.members) if self._group.members else []
 
     # ---- setters used by the master to push state onto slaves ----
 
     async def async_set_multiroom_group(self, multiroom_group):
-        self._multiroom_group = multiroom_group
+        self._group.members = multiroom_group
 
     async def async_set_master(self, master):
-        self._master = master
+        self._group.master = master
 
     async def async_set_is_master(self, is_master):
-        self._is_master = is_master
+        self._group.is_master = is_master
 
     async def async_set_multiroom_unjoinat(self, tme):
-        self._multiroom_unjoinat = tme
+        self._group.unjoinat = tme
 
     async def async_set_slave_mode(self, slave_mode):
-        self._slave_mode = slave_mode
+        self._group.slave_mode = slave_mode
 
     async def async_set_slave_ip(self, slave_ip):
-        self._slave_ip = slave_ip
+        self._group.slave_ip = slave_ip
 
     async def async_set_previous_source(self, srcbool):
         """Remember the source before entering multiroom, for restore."""
         if srcbool:
-            self._multiroom_prevsrc = self._source
+            self._group.prevsrc = self._transport.source
         else:
-            self._multiroom_prevsrc = None
+            self._group.prevsrc = None
 
     async def async_restore_previous_source(self):
         """Restore the source remembered before joining a group."""
-        self.select_source(self._multiroom_prevsrc)
-        self._multiroom_prevsrc = None
+        self.select_source(self._group.prevsrc)
+        self._group.prevsrc = None
+
+    # ---- master-to-slave broadcast ----
+
+    def _group_slave_entities(self) -> list:
+        """Registered entities in ``_group.members`` other than this master."""
+        members = set(self._group.members)
+        members.discard(self.entity_id)
+        return [
+            device for device in self.hass.data[DOMAIN].entities
+            if device.entity_id in members
+        ]
+
+    async def _async_broadcast_to_slaves(self, update, slaves=None) -> list:
+        """Run ``update(slave)`` for every slave concurrently.
+
+        ``slaves`` defaults to ``self._group.slave_list``. Each slave gets its
+        own ``_slave_broadcast_timeout`` budget, so one slow or offline
+        member can't stall the mirror for the rest of the group.
+
+        Returns the slaves whose update timed out or raised (the
+        stragglers); an empty list means every member was updated.
+        """
+        targets = list(self._group.slave_list or []) if slaves is None else list(slaves)
+        if not targets:
+            return []
+
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(update(slave), self._slave_broadcast_timeout)
+                for slave in targets
+            ),
+            return_exceptions=True,
+        )
+
+        stragglers = []
+        for slave, result in zip(targets, results):
+            if isinstance(result, BaseException):
+                stragglers.append(slave)
+                _LOGGER.debug(
+                    "Multiroom broadcast: %s -> %s failed: %s",
+                    self.entity_id, getattr(slave, "entity_id", slave),
+                    type(result).__name__,
+                )
+        if stragglers:
+            _LOGGER.warning(
+                "Multiroom broadcast from %s: %d of %d slave(s) did not respond in time: %s",
+                self.entity_id, len(stragglers), len(targets),
+                [getattr(s, "entity_id", s) for s in stragglers],
+            )
+        return stragglers
 
     # ---- master-side polling ----
 
@@ -114,27 +151,29 @@ class LinkPlayMultiroomMixin:
         """True while ``async_join`` is still propagating to firmware.
 
         WiFi-direct slaves take several seconds to appear in
-        ``multiroom:getSlaveList`` after ``ConnectMasterAp`` returns OK.
-        During that window we keep the locally-built ``_multiroom_group``
-        even if the firmware claims zero slaves, so user scripts that
-        run ``linkplay.join`` immediately followed by
+        ``multiroom:getSlaveList`` after ``ConnectMasterAp`` returns OK
+        (AudioPro A28 and others). During that window, ``join_grace``
+        of the speaker's quirks, we keep the locally-built
+        ``_group.members`` even if the firmware claims zero slaves, so
+        user scripts that run ``linkplay.join`` immediately followed by
         ``linkplay.set_group_volume`` see a populated group.
         """
         return (
-            self._multiroom_joinat is not None
-            and (utcnow() - self._multiroom_joinat) < _JOIN_GRACE
+            self._group.joinat is not None
+            and (utcnow() - self._group.joinat).total_seconds() < self._quirks.join_grace
         )
 
     def _note_groupless_poll(self) -> bool:
         """Count a poll that reported no slaves; True at the teardown threshold.
 
-        Debounces the firmware's transient ``slaves=0`` reports: the
-        master only clears its locally-built group once this has been
-        seen ``_ZERO_POLL_TEARDOWN`` times in a row. Reset to zero
-        whenever a poll confirms slaves (or a fresh join builds a group).
+        Debounces the firmware's transient ``slaves=0`` reports (AudioPro
+        during preset and source switches): the master only clears its
+        locally-built group once this has been seen ``zero_poll_teardown``
+        (a quirk setting) times in a row. Reset to zero whenever a poll
+        confirms slaves (or a fresh join builds a group).
         """
-        self._slave_zero_polls = getattr(self, "_slave_zero_polls", 0) + 1
-        return self._slave_zero_polls >= self._ZERO_POLL_TEARDOWN
+        self._group.zero_polls += 1
+        return self._group.zero_polls >= self._quirks.zero_poll_teardown
 
     async def _async_poll_multiroom_master_status(self):
         """Fetch the master multiroom slave list and propagate state to slaves.
@@ -143,19 +182,26 @@ class LinkPlayMultiroomMixin:
         async_set_multiroom_group. Skipping the query for slaves prevents
         clobbering the master-pushed list every poll cycle.
         """
-        if self._slave_mode:
+        if self._group.slave_mode:
             return True
 
-        slave_list = await self.call_linkplay_httpapi("multiroom:getSlaveList", True)
+        try:
+            slave_list = await self.call_linkplay_httpapi(
+                "multiroom:getSlaveList", True, raise_dropped=True,
+            )
+        except RequestDropped:
+            # Shed by the scheduler under load: the speaker said nothing
+            # about its group, so this poll must not count toward teardown.
+            return True
         if slave_list is None:
             # A failed/empty poll may just be a flap; only tear down after
             # the grace window AND repeated misses (see _note_groupless_poll),
             # so a single transient doesn't orphan the group between a
             # preset recall and a follow-up set_group_volume.
             if not self._within_join_grace() and self._note_groupless_poll():
-                self._is_master = False
-                self._slave_list = None
-                self._multiroom_group = []
+                self._group.is_master = False
+                self._group.slave_list = None
+                self._group.members = []
             return True
 
         if isinstance(slave_list, dict):
@@ -163,49 +209,50 @@ class LinkPlayMultiroomMixin:
                 # Firmware confirms group; rebuild from the authoritative
                 # slave list (and clear the grace timestamp, since the
                 # group is now reflected in firmware).
-                self._slave_zero_polls = 0
-                self._multiroom_joinat = None
-                self._slave_list = []
-                self._multiroom_group = []
-                self._is_master = True
-                self._multiroom_group.append(self.entity_id)
+                self._group.zero_polls = 0
+                self._group.joinat = None
+                self._group.members = [self.entity_id]
+                self._group.is_master = True
+                reported = {}
                 for slave in slave_list['slave_list']:
                     for device in self.hass.data[DOMAIN].entities:
                         if device._name == slave['name']:
-                            self._multiroom_group.append(device.entity_id)
-                            await device.async_set_master(self)
-                            await device.async_set_is_master(False)
-                            await device.async_set_slave_mode(True)
-                            await device.async_set_media_title(self._media_title)
-                            await device.async_set_media_artist(self._media_artist)
-                            await device.async_set_volume(slave['volume'])
-                            await device.async_set_state(self.state)
-                            await device.async_set_slave_ip(slave['ip'])
-                            await device.async_set_media_image_url(self._media_image_url)
-                            await device.async_set_playhead_position(self.media_position)
-                            await device.async_set_duration(self.media_duration)
-                            await device.async_set_position_updated_at(self.media_position_updated_at)
-                            await device.async_set_source(self._source)
-                            await device.async_set_sound_mode(self._sound_mode)
-                            await device.async_set_features(self._features)
-
-                    # Push the freshly-built group list once to every
-                    # entity already in the group. (The original code
-                    # nested this inside `for slave in slaves`, so it
-                    # ran N times with identical work.)
-                    for device in self.hass.data[DOMAIN].entities:
-                        if device.entity_id in self._multiroom_group:
-                            await device.async_set_multiroom_group(self._multiroom_group)
+                            self._group.members.append(device.entity_id)
+                            reported[device] = slave
+                self._group.slave_list = list(reported)
+
+                async def _mirror(device):
+                    entry = reported[device]
+                    await device.async_set_master(self)
+                    await device.async_set_is_master(False)
+                    await device.async_set_slave_mode(True)
+                    await device.async_set_media_title(self._meta.title)
+                    await device.async_set_media_artist(self._meta.artist)
+                    await device.async_set_volume(entry['volume'])
+                    await device.async_set_state(self.state)
+                    await device.async_set_slave_ip(entry['ip'])
+                    await device.async_set_media_image_url(self._meta.image_url)
+                    await device.async_set_playhead_position(self.media_position)
+                    await device.async_set_duration(self.media_duration)
+                    await device.async_set_position_updated_at(self.media_position_updated_at)
+                    await device.async_set_source(self._transport.source)
+                    await device.async_set_sound_mode(self._transport.sound_mode)
+                    await device.async_set_features(self._features)
+                    # Push the freshly-built group list with the rest of
+                    # the mirrored state, once per member.
+                    await device.async_set_multiroom_group(self._group.members)
+
+                await self._async_broadcast_to_slaves(_mirror)
 
             elif not self._within_join_grace() and self._note_groupless_poll():
                 # Firmware has reported no slaves for several polls in a
                 # row, outside the post-join grace window, so the player
                 # really is standalone again. Clear the group.
-                self._slave_list = []
-                self._multiroom_group = []
-                self._is_master = False
+                self._group.slave_list = []
+                self._group.members = []
+                self._group.is_master = False
             # else: still in grace or debouncing a transient zero-slaves
-            # report, so leave _multiroom_group / _is_master alone and
+            # report, so leave _group.members / _group.is_master alone and
             # keep the locally-built post-join state.
 
         else:
@@ -229,37 +276,36 @@ class LinkPlayMultiroomMixin:
     async def async_join(self, slaves):
         """Add selected slaves to the multiroom group."""
         _LOGGER.debug("Multiroom JOIN request: Master: %s, Slaves: %s", self.entity_id, slaves)
-        if self._state == STATE_UNAVAILABLE:
+        if self._transport.state == STATE_UNAVAILABLE:
             return
 
-        if self.entity_id not in self._multiroom_group:
-            self._multiroom_group.append(self.entity_id)
-            self._is_master = True
-            self._wait_for_mcu = 2
+        if self.entity_id not in self._group.members:
+            self._group.members.append(self.entity_id)
+            self._group.is_master = True
             # Arm the join-grace window and clear any stale zero-poll
             # counter BEFORE the per-slave ConnectMasterAp calls, which
             # block ~3s on an offline slave. A master poll that interleaves
             # on that blocking await would otherwise see slaves==0 with no
-            # grace and a saturated _slave_zero_polls (carried over from a
+            # grace and a saturated _group.zero_polls (carried over from a
             # preceding standalone period) and tear the just-built group
             # down mid-join. NOTE: only covers the fresh standalone->join
             # path; an add-slave-to-existing-group join skips this block and
             # relies on the end-of-join arm below.
-            self._multiroom_joinat = utcnow()
-            self._slave_zero_polls = 0
+            self._group.joinat = utcnow()
+            self._group.zero_polls = 0
 
         for slave in slaves:
-            if slave._is_master:
+            if slave._group.is_master:
                 _LOGGER.debug("Multiroom: slave has master flag set. Unjoining it from where it is. Master: %s, Slave: %s", self.entity_id, slave.entity_id)
                 await slave.async_unjoin_all()
 
-            if slave.entity_id not in self._multiroom_group:
-                if slave._slave_mode:
+            if slave.entity_id not in self._group.members:
+                if slave._group.slave_mode:
                     _LOGGER.debug("Multiroom: slave already has slave flag set. Unjoining it from where it is. Master: %s, Slave: %s", self.entity_id, slave.entity_id)
                     await slave.async_unjoin_me()
 
                 await slave.async_set_previous_source(True)
-                if self._multiroom_wifidirect:
+                if self._group.wifidirect:
                     _LOGGER.debug("Multiroom: Join in WiFi direct mode. Master: %s, Slave: %s", self.entity_id, slave.entity_id)
                     cmd = f"ConnectMasterAp:ssid={self._ssid}:ch={self._wifi_channel}:auth=OPEN:" + "encry=NONE:pwd=:chext=0"
                 else:
@@ -272,46 +318,50 @@ class LinkPlayMultiroomMixin:
                     await slave.async_set_master(self)
                     await slave.async_set_is_master(False)
                     await slave.async_set_slave_mode(True)
-                    await slave.async_set_media_title(self._media_title)
-                    await slave.async_set_media_artist(self._media_artist)
+                    await slave.async_set_media_title(self._meta.title)
+                    await slave.async_set_media_artist(self._meta.artist)
                     await slave.async_set_state(self.state)
-                    # Leave _slave_ip as-is until the firmware reveals
+                    # Leave _group.slave_ip as-is until the firmware reveals
                     # the WiFi-direct address via multiroom:getSlaveList.
                     # The previous code wrote self._host here, which made
                     # multiroom:SlaveVolume:<master-ip>:<N> commands
                     # silently no-op (wrong target). The retry-poll loop
                     # at the end of async_join populates the real IP
                     # before returning.
-                    await slave.async_set_media_image_url(self._media_image_url)
+                    await slave.async_set_media_image_url(self._meta.image_url)
                     await slave.async_set_playhead_position(self.media_position)
                     await slave.async_set_duration(self.media_duration)
-                    await slave.async_set_source(self._source)
-                    await slave.async_set_sound_mode(self._sound_mode)
+                    await slave.async_set_source(self._transport.source)
+                    await slave.async_set_sound_mode(self._transport.sound_mode)
                     await slave.async_set_features(self._features)
-                    self._multiroom_group.append(slave.entity_id)
+                    self._group.members.append(slave.entity_id)
                 else:
                     await slave.async_set_previous_source(False)
                     _LOGGER.warning("Failed to join multiroom. command result: %s Master: %s, Slave: %s", value, self.entity_id, slave.entity_id)
 
-        for slave in slaves:
-            if slave.entity_id in self._multiroom_group:
-                await slave.async_set_multiroom_group(self._multiroom_group)
-                slave.async_write_ha_state()
+        async def _push_group(slave):
+            await slave.async_set_multiroom_group(self._group.members)
+            slave.async_write_ha_state()
+
+        await self._async_broadcast_to_slaves(
+            _push_group,
+            [s for s in slaves if s.entity_id in self._group.members],
+        )
 
         # Mark the moment the group was built locally. The master-side
         # poll uses this to ignore a transient ``slaves=0`` response
         # from ``multiroom:getSlaveList`` for the next few seconds,
         # which would otherwise wipe the group we just constructed.
-        if len(self._multiroom_group) > 1:
-            self._multiroom_joinat = utcnow()
-            self._slave_zero_polls = 0
+        if len(self._group.members) > 1:
+            self._group.joinat = utcnow()
+            self._group.zero_polls = 0
         else:
             # Every slave failed to join (e.g. all offline). Don't leave a
             # phantom master sitting in the grace window armed at join start;
             # clear it so the next groupless poll returns us to standalone.
-            self._multiroom_joinat = None
+            self._group.joinat = None
 
-        self._position_updated_at = utcnow()
+        self._transport.position_updated_at = utcnow()
         self.async_write_ha_state()
 
         # Block until the firmware has reflected the new slaves in its
@@ -326,119 +376,121 @@ class LinkPlayMultiroomMixin:
     async def _await_slave_ips(self, slaves) -> None:
         """Poll the master for each new slave's WiFi-direct IP + volume.
 
-        Returns once every joined slave has a non-master ``_slave_ip``
-        or after ``_slave_ip_poll_max`` attempts. Safe to call with an
-        empty join (returns immediately).
+        Returns once every joined slave has a non-master IP in
+        ``multiroom:getSlaveList`` or after ``_slave_ip_timeout``
+        seconds. Safe to call with an empty join (returns immediately).
 
         Also copies each slave's reported ``volume`` (0-100) into its
-        local ``_volume`` so callers like ``async_set_group_volume``
+        local ``_transport.volume`` so callers like ``async_set_group_volume``
         have an accurate base for the delta-preserving group shift.
         Without this, slaves keep the pre-join cached value and the
         delta shift lands them at the wrong target.
         """
         new_slaves = [
-            s for s in slaves if s.entity_id in self._multiroom_group
+            s for s in slaves if s.entity_id in self._group.members
         ]
         if not new_slaves:
             return
 
-        for _ in range(self._slave_ip_poll_max):
-            await asyncio.sleep(self._slave_ip_poll_interval)
-            slave_list = await self.call_linkplay_httpapi(
-                "multiroom:getSlaveList", True,
-            )
-            if not isinstance(slave_list, dict):
-                continue
+        def _entries(slave_list: dict) -> dict:
             if int(slave_list.get('slaves', 0)) <= 0:
-                continue
-            by_name = {
+                return {}
+            return {
                 entry.get('name'): entry
                 for entry in slave_list.get('slave_list', [])
                 if entry.get('name')
             }
-            for slave in new_slaves:
-                entry = by_name.get(slave._name)
-                if not entry:
-                    continue
-                if entry.get('ip'):
-                    await slave.async_set_slave_ip(entry['ip'])
-                if entry.get('volume') is not None:
-                    await slave.async_set_volume(entry['volume'])
-            if all(
-                getattr(s, '_slave_ip', None)
-                and s._slave_ip != self._host
-                for s in new_slaves
-            ):
-                return
-        _LOGGER.debug(
-            "async_join: timed out waiting for slave IPs from firmware "
-            "(master=%s, slaves=%s)",
-            self.entity_id,
-            [s.entity_id for s in new_slaves],
+
+        def _has_ip(slave, entries: dict) -> bool:
+            ip = entries.get(slave._name, {}).get('ip') or slave._group.slave_ip
+            return bool(ip) and ip != self._host
+
+        def _all_reported(slave_list: dict) -> bool:
+            entries = _entries(slave_list)
+            return all(_has_ip(s, entries) for s in new_slaves)
+
+        slave_list = await self.async_wait_for_status(
+            _all_reported, self._slave_ip_timeout, command="multiroom:getSlaveList",
         )
+        entries = _entries(slave_list) if slave_list is not None else {}
+        for slave in new_slaves:
+            entry = entries.get(slave._name)
+            if not entry:
+                continue
+            if entry.get('ip'):
+                await slave.async_set_slave_ip(entry['ip'])
+            if entry.get('volume') is not None:
+                await slave.async_set_volume(entry['volume'])
+        if not all(_has_ip(s, entries) for s in new_slaves):
+            _LOGGER.debug(
+                "async_join: timed out waiting for slave IPs from firmware "
+                "(master=%s, slaves=%s)",
+                self.entity_id,
+                [s.entity_id for s in new_slaves],
+            )
 
     async def async_unjoin_all(self):
         """Master disconnects everybody in the group."""
-        if self._state == STATE_UNAVAILABLE:
+        if self._transport.state == STATE_UNAVAILABLE:
             return
 
         cmd = "multiroom:Ungroup"
         value = await self.call_linkplay_httpapi(cmd, None)
         if value == "OK":
-            self._is_master = False
-            self._multiroom_joinat = None
-            for slave_id in self._multiroom_group:
-                for device in self.hass.data[DOMAIN].entities:
-                    if device.entity_id == slave_id and device.entity_id != self.entity_id:
-                        await device.async_set_slave_mode(False)
-                        await device.async_set_is_master(False)
-                        await device.async_set_slave_ip(None)
-                        await device.async_set_master(None)
-                        await device.async_set_multiroom_unjoinat(utcnow())
-                        await device.async_set_multiroom_group([])
-                        device.async_write_ha_state()
-            self._multiroom_group = []
-            self._position_updated_at = utcnow()
+            self._group.is_master = False
+            self._group.joinat = None
+
+            async def _release(device):
+                await device.async_set_slave_mode(False)
+                await device.async_set_is_master(False)
+                await device.async_set_slave_ip(None)
+                await device.async_set_master(None)
+                await device.async_set_multiroom_unjoinat(utcnow())
+                await device.async_set_multiroom_group([])
+                device.async_write_ha_state()
+
+            await self._async_broadcast_to_slaves(_release, self._group_slave_entities())
+            self._group.members = []
+            self._transport.position_updated_at = utcnow()
             self.async_write_ha_state()
         else:
             _LOGGER.warning("Failed to unjoin_all multiroom. Device: %s, Got response: %s", self.entity_id, value)
 
     async def async_unjoin_player(self):
         """Remove this player from any group (standard HA service)."""
-        if self._is_master:
+        if self._group.is_master:
             await self.async_unjoin_all()
-        if self._slave_mode:
+        if self._group.slave_mode:
             await self.async_unjoin_me()
 
     async def async_unjoin_me(self):
         """Slave leaves the multiroom group."""
         value = None
-        if self._multiroom_wifidirect:
+        if self._group.wifidirect:
             # Kick this slave from the master's Wi-Fi-direct group.
             # Walk the registered entities and ask whichever one is
             # the current master to evict our IP.
             for device in self.hass.data[DOMAIN].entities:
                 if device.is_master:
-                    cmd = f"multiroom:SlaveKickout:{self._slave_ip}"
-                    value = await self._master.call_linkplay_httpapi(cmd, None)
-                    self._master._position_updated_at = utcnow()
+                    cmd = f"multiroom:SlaveKickout:{self._group.slave_ip}"
+                    value = await self._group.master.call_linkplay_httpapi(cmd, None)
+                    self._group.master._transport.position_updated_at = utcnow()
                     break
         else:
             cmd = "multiroom:Ungroup"
             value = await self.call_linkplay_httpapi(cmd, None)
 
         if value == "OK":
-            if self._master is not None:
-                await self._master.async_remove_from_group(self)
-                self._master._wait_for_mcu = 1
-                self._master.async_write_ha_state()
-            self._multiroom_unjoinat = utcnow()
-            self._multiroom_joinat = None
-            self._master = None
-            self._is_master = False
-            self._slave_mode = False
-            self._slave_ip = None
-            self._multiroom_group = []
+            if self._group.master is not None:
+                await self._group.master.async_remove_from_group(self)
+                self._group.master.async_write_ha_state()
+            self._group.unjoinat = utcnow()
+            self._group.joinat = None
+            self._group.master = None
+            self._group.is_master = False
+            self._group.slave_mode = False
+            self._group.slave_ip = None
+            self._group.members = []
             self.async_write_ha_state()
         else:
             _LOGGER.warning("Failed to unjoin_me from multiroom. Device: %s, Got response: %s", self.entity_id, value)
@@ -478,7 +530,7 @@ class LinkPlayMultiroomMixin:
 
         _LOGGER.debug(
             "Group volume: master=%s -> %.2f (offsets per slave), group=%s",
-            self.entity_id, master_target, self._multiroom_group,
+            self.entity_id, master_target, self._group.members,
         )
 
         by_eid = {d.entity_id: d for d in self.hass.data[DOMAIN].entities}
@@ -493,17 +545,17 @@ class LinkPlayMultiroomMixin:
         if self.entity_id in by_eid:
             group_entities.append(by_eid[self.entity_id])
             seen.add(self.entity_id)
-        for eid in self._multiroom_group:
+        for eid in self._group.members:
             if eid in by_eid and eid not in seen:
                 group_entities.append(by_eid[eid])
                 seen.add(eid)
 
         _LOGGER.debug(
             "async_set_group_volume: %s resolved %d member(s): %s "
-            "(cached _multiroom_group=%s, is_master=%s, slave_mode=%s)",
+            "(cached _group.members=%s, is_master=%s, slave_mode=%s)",
             self.entity_id, len(group_entities),
-            [d.entity_id for d in group_entities], self._multiroom_group,
-            self._is_master, self._slave_mode,
+            [d.entity_id for d in group_entities], self._group.members,
+            self._group.is_master, self._group.slave_mode,
         )
         if len(group_entities) <= 1:
             _LOGGER.debug(
@@ -529,18 +581,18 @@ class LinkPlayMultiroomMixin:
 
     async def async_remove_from_group(self, device):
         """Master removes a single member from its group."""
-        if device.entity_id in self._multiroom_group:
-            self._multiroom_group.remove(device.entity_id)
-
-        if len(self._multiroom_group) <= 1:
-            self._multiroom_group = []
-            self._is_master = False
-            self._slave_list = None
-
-        for member in self._multiroom_group:
-            for player in self.hass.data[DOMAIN].entities:
-                if player.entity_id == member and player.entity_id != self.entity_id:
-                    await player.async_set_multiroom_group(self._multiroom_group)
-                    player.async_write_ha_state()
+        if device.entity_id in self._group.members:
+            self._group.members.remove(device.entity_id)
+
+        if len(self._group.members) <= 1:
+            self._group.members = []
+            self._group.is_master = False
+            self._group.slave_list = None
+
+        async def _push_group(player):
+            await player.async_set_multiroom_group(self._group.members)
+            player.async_write_ha_state()
+
+        await self._async_broadcast_to_slaves(_push_group, self._group_slave_entities())
 
         self.async_write_ha_state()
@@ -0,0 +1,113 @@
+"""Per-speaker behaviour settings from a declarative quirk registry.
+
+LinkPlay modules share one HTTP API but differ in how they behave
+around it: some firmware lets go of a stream slowly, some only support
+Wi-Fi-direct multiroom, Arylic boards take LED commands over the TCP
+UART, AudioPro firmware reports ``slaves=0`` for a while after a join
+or a preset switch and restores a per-preset volume. Each of those used
+to be an inline version / uuid check at the call site.
+
+:data:`QUIRKS` lists them as data. A :class:`Quirk` matches on any mix
+of uuid prefix, model (the ``project`` field of ``getStatus``) and a
+firmware range, and overrides fields of :class:`DeviceQuirks`. The
+defaults are safe for every speaker; an entry only changes them for
+the hardware it names. :func:`resolve_quirks` applies every matching quirk
+in order (later entries win) into one immutable result; the entity
+re-resolves it whenever its firmware, uuid or model changes, and hot
+paths read plain attributes of it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from .firmware import (
+    FW_MROOM_RTR_MIN,
+    FW_RAKOIT_UART_MIN,
+    FW_SLOW_STREAMS,
+    parse_version,
+)
+
+UUID_ARYLIC = "FF31F09E"
+
+
+class DeviceQuirks(NamedTuple):
+    """Resolved behaviour settings for one speaker."""
+
+    # Names of the quirks that matched, for diagnostics.
+    names: tuple[str, ...] = ()
+    # Pause before switching away from or stopping a stream.
+    slow_streams: bool = False
+    # Router-mode multiroom; without it groups are forced to Wi-Fi direct.
+    router_multiroom: bool = False
+    # ``MCU+PAS+RAKOIT:LED`` over the TCP UART turns the LED off.
+    rakoit_led: bool = False
+    # Seconds after a join / preset recall during which a master keeps
+    # its group even though ``getSlaveList`` reports no slaves.
+    join_grace: float = 10.0
+    # Consecutive slave-less polls before a master drops its group.
+    zero_poll_teardown: int = 2
+    # Put the volume back after a preset recall (the firmware applies
+    # the preset's stored volume).
+    reassert_preset_volume: bool = True
+    # Concurrent HTTPAPI requests the module tolerates.
+    max_concurrent: int = 2
+
+
+class Quirk(NamedTuple):
+    """One registry entry: a device match plus the settings it overrides."""
+
+    name: str
+    settings: Mapping[str, Any]
+    uuid_prefix: str | None = None
+    # Prefix of the ``getStatus`` ``project`` string.
+    model: str | None = None
+    # Firmware range, ``fw_min`` inclusive, ``fw_max`` exclusive.
+    fw_min: str | None = None
+    fw_max: str | None = None
+
+    def matches(self, firmware: tuple[str, ...], uuid: str, model: str) -> bool:
+        return (
+            (self.uuid_prefix is None or uuid.startswith(self.uuid_prefix))
+            and (self.model is None or model.startswith(self.model))
+            and (self.fw_min is None or firmware >= parse_version(self.fw_min))
+            and (self.fw_max is None or firmware < parse_version(self.fw_max))
+        )
+
+
+QUIRKS: tuple[Quirk, ...] = (
+    Quirk("router_multiroom", {"router_multiroom": True}, fw_min=FW_MROOM_RTR_MIN),
+    Quirk("slow_streams", {"slow_streams": True}, fw_min=FW_SLOW_STREAMS),
+    Quirk("rakoit_led", {"rakoit_led": True}, uuid_prefix=UUID_ARYLIC, fw_min=FW_RAKOIT_UART_MIN),
+)
+
+
+def resolve_quirks(
+    firmware: str, uuid: str | None = None, model: str | None = None,
+    registry: tuple[Quirk, ...] | None = None,
+) -> DeviceQuirks:
+    """Settings for a speaker from every matching entry of ``registry``.
+
+    ``registry`` defaults to :data:`QUIRKS`; that lookup is cached.
+    """
+    if registry is None:
+        return _resolve_default(firmware, uuid or "", model or "")
+    return _resolve(firmware, uuid or "", model or "", registry)
+
+
+@lru_cache(maxsize=64)
+def _resolve_default(firmware: str, uuid: str, model: str) -> DeviceQuirks:
+    return _resolve(firmware, uuid, model, QUIRKS)
+
+
+def _resolve(firmware: str, uuid: str, model: str, registry: tuple[Quirk, ...]) -> DeviceQuirks:
+    parsed = parse_version(firmware)
+    settings: dict[str, Any] = {}
+    names = []
+    for quirk in registry:
+        if quirk.matches(parsed, uuid, model):
+            settings.update(quirk.settings)
+            names.append(quirk.name)
+    return DeviceQuirks(names=tuple(names), **settings)
@@ -0,0 +1,153 @@
+"""Per-host request scheduling for LinkPlay HTTPAPI traffic.
+
+Many LinkPlay modules stall or drop connections once more than one or
+two requests are in flight, and every entity talks to its speaker from
+several places at once (the 3 s poll, the master's ``getSlaveList``,
+user service calls, slave volume proxies). Without ordering, a user's
+``setPlayerCmd:pause`` can sit behind a slow ``getPlayerStatus`` on a
+struggling speaker.
+
+One :class:`LinkPlayRequestScheduler` exists per host. It caps the
+number of concurrent requests and hands free slots out by priority:
+
+* ``PRIORITY_USER`` - commands the user is waiting on. Never dropped.
+* ``PRIORITY_POLL`` - status polls. Carry a deadline; if they are still
+  queued when it passes they are dropped (:class:`RequestDropped`)
+  because the next poll cycle will ask again anyway.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+
+PRIORITY_USER = 0
+PRIORITY_POLL = 1
+
+# Concurrent requests allowed per speaker. Two keeps one slot free for
+# a user command while a poll is in flight without overrunning the
+# HTTP server on the module.
+_MAX_CONCURRENT = 2
+
+# How long a poll may wait for a slot before it is considered stale.
+# Matches the media_player SCAN_INTERVAL: by then the next poll is due.
+_POLL_DEADLINE = 3.0
+
+# Read-only status queries issued by the update loop.
+_POLL_COMMANDS = frozenset({
+    "getPlayerStatus",
+    "getStatus",
+    "getStatusEx",
+    "multiroom:getSlaveList",
+})
+
+
+class RequestDropped(Exception):
+    """A queued request's deadline passed before a slot became free."""
+
+
+def request_priority(cmd: str) -> int:
+    """Return the scheduling lane for an HTTPAPI command."""
+    return PRIORITY_POLL if cmd in _POLL_COMMANDS else PRIORITY_USER
+
+
+class LinkPlayRequestScheduler:
+    """Priority-ordered concurrency limiter for one speaker."""
+
+    def __init__(self, max_concurrent: int = _MAX_CONCURRENT) -> None:
+        self._max_concurrent = max_concurrent
+        self.dropped = 0
+        self._active = 0
+        self._waiters: list[list] = []
+        self._seq = itertools.count()
+
+    @property
+    def max_concurrent(self) -> int:
+        """Concurrent requests allowed; raising it admits queued requests."""
+        return self._max_concurrent
+
+    @max_concurrent.setter
+    def max_concurrent(self, value: int) -> None:
+        self._max_concurrent = value
+        while self._active < value and self._wake_next():
+            self._active += 1
+
+    @property
+    def active(self) -> int:
+        """Requests currently holding a slot."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """Requests waiting for a slot."""
+        return len(self._waiters)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_USER, deadline: float | None = None):
+        """Hold one request slot for the duration of the ``async with`` block.
+
+        ``deadline`` is an absolute ``loop.time()`` value; polls that are
+        still queued when it passes raise :class:`RequestDropped`. When
+        omitted, polls get ``_POLL_DEADLINE`` and user commands wait as
+        long as needed.
+        """
+        if deadline is None and priority >= PRIORITY_POLL:
+            deadline = asyncio.get_running_loop().time() + _POLL_DEADLINE
+        await self._acquire(priority, deadline)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int, deadline: float | None) -> None:
+        if self._active < self._max_concurrent and not self._waiters:
+            self._active += 1
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        entry = [priority, next(self._seq), fut]
+        heapq.heappush(self._waiters, entry)
+        try:
+            async with asyncio.timeout_at(deadline):
+                await fut
+        except BaseException as err:
+            if fut.done() and not fut.cancelled():
+                # The slot was handed over just as we gave up on it;
+                # pass it on to the next waiter instead of leaking it.
+                self._release()
+            else:
+                fut.cancel()
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+            if isinstance(err, TimeoutError):
+                self.dropped += 1
+                raise RequestDropped from None
+            raise
+
+    def _release(self) -> None:
+        # Hand the slot straight to the highest-priority waiter, so
+        # ``_active`` stays the same, unless the limit was lowered.
+        if self._active > self._max_concurrent or not self._wake_next():
+            self._active -= 1
+
+    def _wake_next(self) -> bool:
+        while self._waiters:
+            fut = heapq.heappop(self._waiters)[2]
+            if not fut.done():
+                fut.set_result(None)
+                return True
+        return False
+
+
+_SCHEDULERS: dict[str, LinkPlayRequestScheduler] = {}
+
+
+def get_request_scheduler(host: str) -> LinkPlayRequestScheduler:
+    """Return the shared scheduler for ``host``, creating it on first use."""
+    scheduler = _SCHEDULERS.get(host)
+    if scheduler is None:
+        scheduler = _SCHEDULERS[host] = LinkPlayRequestScheduler()
+    return scheduler
@@ -0,0 +1,118 @@
+"""Diagnostic sensors exposing per-speaker request metrics.
+
+One set per config entry, read from :mod:`metrics` on a slow poll:
+last poll-cycle duration, HTTPAPI p95 latency, HTTPAPI error count
+(broken down by kind in the attributes) and the metadata cache hit
+rate. All are diagnostic entities and disabled by default.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
+
+from .const import DOMAIN
+from .metrics import LinkPlayMetrics, get_metrics
+
+SCAN_INTERVAL = timedelta(seconds=30)
+
+
+@dataclass(frozen=True, kw_only=True)
+class LinkPlayMetricSensorDescription(SensorEntityDescription):
+    """Sensor description reading one value from a host's metrics."""
+
+    value_fn: Callable[[LinkPlayMetrics], StateType]
+    attributes_fn: Callable[[LinkPlayMetrics], dict] | None = None
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
+
+
+SENSORS: tuple[LinkPlayMetricSensorDescription, ...] = (
+    LinkPlayMetricSensorDescription(
+        key="poll_duration",
+        name="Poll duration",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: _round(metrics.last_poll_ms),
+        attributes_fn=lambda metrics: {
+            "p95_ms": _round(metrics.polls.percentile(0.95)),
+            "polls": metrics.polls.count,
+        },
+    ),
+    LinkPlayMetricSensorDescription(
+        key="request_latency_p95",
+        name="Request latency p95",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: _round(metrics.latency_percentile(0.95)),
+    ),
+    LinkPlayMetricSensorDescription(
+        key="request_errors",
+        name="Request errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda metrics: sum(metrics.error_counts().values()),
+        attributes_fn=lambda metrics: metrics.error_counts(),
+    ),
+    LinkPlayMetricSensorDescription(
+        key="cache_hit_rate",
+        name="Cache hit rate",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda metrics: metrics.cache_hit_rate(),
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the metric sensors for one speaker."""
+    async_add_entities(
+        LinkPlayMetricSensor(entry, description) for description in SENSORS
+    )
+
+
+class LinkPlayMetricSensor(SensorEntity):
+    """One metric of one speaker host."""
+
+    entity_description: LinkPlayMetricSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, entry: ConfigEntry, description: LinkPlayMetricSensorDescription) -> None:
+        self.entity_description = description
+        self._host = entry.data[CONF_HOST]
+        self._attr_name = f"{entry.title} {description.name}"
+        self._attr_unique_id = f"{entry.unique_id or self._host}_{description.key}"
+        if entry.unique_id:
+            # Same identifiers as the media_player, so both share a device.
+            self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, entry.unique_id)})
+
+    @property
+    def native_value(self) -> StateType:
+        return self.entity_description.value_fn(get_metrics(self._host))
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        attributes_fn = self.entity_description.attributes_fn
+        if attributes_fn is None:
+            return None
+        return attributes_fn(get_metrics(self._host))
@@ -16,46 +16,43 @@ class LinkPlaySettersMixin:
     """
 
     async def async_set_media_title(self, title):
-        self._media_title = title
+        self._meta.title = title
 
     async def async_set_media_artist(self, artist):
-        self._media_artist = artist
+        self._meta.artist = artist
 
     async def async_set_volume(self, volume):
-        self._volume = volume
+        self._transport.volume = volume
 
     async def async_set_muted(self, mute):
-        self._muted = mute
+        self._transport.muted = mute
 
     async def async_set_state(self, state):
-        self._state = state
+        self._transport.state = state
 
     async def async_set_playhead_position(self, position):
-        self._playhead_position = position
+        self._transport.playhead_position = position
 
     async def async_set_duration(self, duration):
-        self._duration = duration
+        self._transport.duration = duration
 
     async def async_set_position_updated_at(self, time):
-        self._position_updated_at = time
+        self._transport.position_updated_at = time
 
     async def async_set_source(self, source):
-        self._source = source
+        self._transport.source = source
 
     async def async_set_sound_mode(self, mode):
-        self._sound_mode = mode
+        self._transport.sound_mode = mode
 
     async def async_set_media_image_url(self, url):
-        self._media_image_url = url
+        self._meta.image_url = url
 
     async def async_set_media_uri(self, uri):
-        self._media_uri = uri
+        self._meta.uri = uri
 
     async def async_set_features(self, features):
         self._features = features
 
-    async def async_set_wait_for_mcu(self, wait_for_mcu):
-        self._wait_for_mcu = wait_for_mcu
-
     async def async_set_unav_throttle(self, unav_throttle):
         self._unav_throttle = unav_throttle
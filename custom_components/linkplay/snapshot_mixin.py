@@ -4,6 +4,13 @@ Captures and restores enough player state so a TTS announcement
 (handled internally by the media_player base since HA 2022.6) or a
 manual ``linkplay.snapshot``/``linkplay.restore`` call leaves the user
 back where they were: same source, same volume, same playhead.
+
+A master snapshots and restores for its whole group: the slaves follow
+the master's stream, so only their volumes are captured, and they are
+restored concurrently with the master's own restore. Instead of fixed
+sleeps, the mixin polls ``getPlayerStatus`` (see
+``async_wait_for_status``) until the speaker has settled, bounded by a
+deadline.
 """
 
 from __future__ import annotations
@@ -20,12 +27,16 @@ from homeassistant.const import (
     STATE_UNKNOWN,
 )
 
+from .api_client_mixin import volume_settled
+
 _LOGGER = logging.getLogger(__name__)
 
-# Firmware version after which the firmware is slow to switch streams
-# and we need an extra pause before snapshot. Kept here to avoid
-# coupling the mixin to media_player module-level constants.
-_FW_SLOW_STREAMS = "4.6"
+# Deadlines for the speaker to leave its physical input after
+# switchmode:wifi, for its volume to stop moving once the input fades
+# in, and for a restored source to start playing before seeking.
+_SWITCH_TIMEOUT = 1
+_VOLUME_SETTLE_TIMEOUT = 3
+_RESTORE_PLAY_TIMEOUT = 3
 
 
 class LinkPlaySnapshotMixin:
@@ -39,136 +50,176 @@ class LinkPlaySnapshotMixin:
         When False, current playback continues — useful for snapshotting
         without interrupting Spotify, etc.
         """
-        if self._state == STATE_UNAVAILABLE:
+        if self._transport.state == STATE_UNAVAILABLE:
             return
-        if self._slave_mode:
+        if self._group.slave_mode:
             return
 
+        slaves = self._snapshot_slaves()
+        if slaves:
+            await self._async_broadcast_to_slaves(
+                lambda slave: slave.async_set_snapshot_volume(), slaves,
+            )
+
         self._snapshot_active = True
-        self._snap_source = self._source
-        self._snap_state = self._state
-        self._snap_nometa = self._nometa
-        self._snap_playing_mediabrowser = self._playing_mediabrowser
-        self._snap_media_source_uri = self._media_source_uri
-        self._snap_playhead_position = self._playhead_position
-
-        if self._playing_localfile or self._playing_spotify or self._playing_webplaylist:
-            if self._state in (STATE_PLAYING, STATE_PAUSED):
-                self._snap_seek = True
-        elif self._playing_stream or self._playing_mediabrowser:
-            if self._state in (STATE_PLAYING, STATE_PAUSED) and self._playing_mediabrowser:
-                self._snap_seek = True
+        self._snap.source = self._transport.source
+        self._snap.state = self._transport.state
+        self._snap.nometa = self._meta.nometa
+        self._snap.playing_mediabrowser = self._playing.mediabrowser
+        self._snap.media_source_uri = self._meta.source_uri
+        self._snap.playhead_position = self._transport.playhead_position
+
+        if self._playing.localfile or self._playing.spotify or self._playing.webplaylist:
+            if self._transport.state in (STATE_PLAYING, STATE_PAUSED):
+                self._snap.seek = True
+        elif self._playing.stream or self._playing.mediabrowser:
+            if self._transport.state in (STATE_PLAYING, STATE_PAUSED) and self._playing.mediabrowser:
+                self._snap.seek = True
 
         _LOGGER.debug(
             "Player %s snapshot source: %s, volume: %s, uri: %s, seek: %s, pos: %s",
-            self.name, self._source, self._snap_volume, self._media_uri_final,
-            self._snap_seek, self._playhead_position,
+            self.name, self._transport.source, self._snap.volume, self._meta.uri_final,
+            self._snap.seek, self._transport.playhead_position,
         )
 
-        if self._source == "Network":
-            self._snap_uri = self._media_uri_final
+        if self._transport.source == "Network":
+            self._snap.uri = self._meta.uri_final
 
-        if self._playing_spotify:
+        if self._playing.spotify:
             if not switchinput:
                 await self.async_preset_snap_via_upnp(str(self._preset_key))
                 await self.call_linkplay_httpapi("setPlayerCmd:stop", None)
             else:
-                self._snap_spotify_volumeonly = True
-            self._snap_spotify = True
-            self._snap_volume = int(self._volume)
+                self._snap.spotify_volumeonly = True
+            self._snap.spotify = True
+            self._snap.volume = int(self._transport.volume)
             return
 
-        if self._state == STATE_IDLE:
-            self._snap_volume = int(self._volume)
+        if self._transport.state == STATE_IDLE:
+            self._snap.volume = int(self._transport.volume)
             return
 
-        if switchinput and not self._playing_stream:
+        if switchinput and not self._playing.stream:
+            mode = (self._player_statdata or {}).get("mode")
             value = await self.call_linkplay_httpapi("setPlayerCmd:switchmode:wifi", None)
-            await asyncio.sleep(0.2)
+            if value == "OK":
+                await self.async_wait_for_status(
+                    lambda status: status.get("mode") != mode, _SWITCH_TIMEOUT,
+                )
             await self.call_linkplay_httpapi("setPlayerCmd:stop", None)
             if value != "OK":
-                self._snap_volume = 0
+                self._snap.volume = 0
                 return
-            # Physical-source switch fades audio in; wait so the
-            # reported volume is accurate.
-            await asyncio.sleep(2)
-            await self.async_get_status()
-            if self._player_statdata is None:
-                self._snap_volume = 0
+            # Physical-source switch fades audio in; wait until the
+            # reported volume stops moving so it is accurate.
+            status = await self.async_wait_for_status(volume_settled(), _VOLUME_SETTLE_TIMEOUT)
+            if status is None:
+                self._snap.volume = 0
                 return
             try:
-                self._snap_volume = int(self._player_statdata["vol"])
-            except ValueError:
+                self._snap.volume = int(status["vol"])
+            except (KeyError, ValueError):
                 _LOGGER.warning(
                     "Erroneous JSON during snapshot volume reading: %s, %s",
                     self.entity_id, self._name,
                 )
-                self._snap_volume = 0
+                self._snap.volume = 0
             return
 
-        self._snap_volume = int(self._volume)
-        if self._fwvercheck(self._fw_ver) >= self._fwvercheck(_FW_SLOW_STREAMS):
+        self._snap.volume = int(self._transport.volume)
+        if self._quirks.slow_streams:
             await self.call_linkplay_httpapi("setPlayerCmd:pause", None)
         await self.call_linkplay_httpapi("setPlayerCmd:stop", None)
 
+    async def async_set_snapshot_volume(self) -> None:
+        """Slave side of a group snapshot: remember the current volume."""
+        volume = self._transport.volume
+        self._snap.volume = 0 if volume is None else int(volume)
+
+    async def async_restore_snapshot_volume(self) -> None:
+        """Slave side of a group restore: go back to the remembered volume."""
+        volume, self._snap.volume = self._snap.volume, 0
+        await self._set_volume_on_device(volume, action="restore volume")
+
+    def _snapshot_slaves(self) -> list:
+        return list(self._group.slave_list or []) if self._group.is_master else []
+
     async def async_restore(self) -> None:
-        """Restore the source, volume and playhead position captured by async_snapshot."""
-        if self._state == STATE_UNAVAILABLE:
+        """Restore the source, volume and playhead position captured by async_snapshot.
+
+        The slaves' volumes are restored alongside the master's restore.
+        """
+        if self._transport.state == STATE_UNAVAILABLE:
+            return
+        if self._group.slave_mode:
             return
-        if self._slave_mode:
+
+        slaves = [slave for slave in self._snapshot_slaves() if slave._snap.volume]
+        if not slaves:
+            await self._async_restore_device()
             return
+        await asyncio.gather(
+            self._async_restore_device(),
+            self._async_broadcast_to_slaves(
+                lambda slave: slave.async_restore_snapshot_volume(), slaves,
+            ),
+        )
 
+    async def _async_restore_device(self) -> None:
         _LOGGER.debug(
             "Player %s current source: %s, restoring volume: %s, source: %s "
             "uri: %s, seek: %s, pos: %s",
-            self.name, self._source, self._snap_volume, self._snap_source,
-            self._snap_uri, self._snap_seek, self._snap_playhead_position,
+            self.name, self._transport.source, self._snap.volume, self._snap.source,
+            self._snap.uri, self._snap.seek, self._snap.playhead_position,
         )
 
-        if self._snap_state != STATE_UNKNOWN:
-            self._state = self._snap_state
+        if self._snap.state != STATE_UNKNOWN:
+            self._transport.state = self._snap.state
 
-        if self._snap_volume != 0:
-            await self.call_linkplay_httpapi(f"setPlayerCmd:vol:{self._snap_volume}", None)
-            self._snap_volume = 0
+        if self._snap.volume != 0:
+            await self.call_linkplay_httpapi(f"setPlayerCmd:vol:{self._snap.volume}", None)
+            self._snap.volume = 0
 
-        self._playing_tts = False
-        self._playhead_position = self._snap_playhead_position
+        self._playing.tts = False
+        self._transport.playhead_position = self._snap.playhead_position
 
-        if self._snap_spotify:
-            self._snap_spotify = False
-            if not self._snap_spotify_volumeonly:
+        if self._snap.spotify:
+            self._snap.spotify = False
+            if not self._snap.spotify_volumeonly:
                 await self.call_linkplay_httpapi(
                     f"MCUKeyShortClick:{self._preset_key}", None
                 )
             self._snapshot_active = False
-            self._snap_spotify_volumeonly = False
+            self._snap.spotify_volumeonly = False
 
-        elif self._snap_source != "Network":
+        elif self._snap.source != "Network":
             self._snapshot_active = False
-            await self.async_select_source(self._snap_source)
-            self._snap_source = None
-
-        elif self._snap_uri is not None:
-            self._playing_mediabrowser = self._snap_playing_mediabrowser
-            self._media_source_uri = self._snap_media_source_uri
-            self._media_uri = self._snap_uri
-            self._nometa = self._snap_nometa
-            if self._snap_state in (STATE_PLAYING, STATE_PAUSED):
-                await self.async_play_media(MediaType.URL, self._media_uri)
+            await self.async_select_source(self._snap.source)
+            self._snap.source = None
+
+        elif self._snap.uri is not None:
+            self._playing.mediabrowser = self._snap.playing_mediabrowser
+            self._meta.source_uri = self._snap.media_source_uri
+            self._meta.uri = self._snap.uri
+            self._meta.nometa = self._snap.nometa
+            if self._snap.state in (STATE_PLAYING, STATE_PAUSED):
+                await self.async_play_media(MediaType.URL, self._meta.uri)
             self._snapshot_active = False
-            self._snap_uri = None
+            self._snap.uri = None
 
-        if self._snap_state in (STATE_PLAYING, STATE_PAUSED):
-            await asyncio.sleep(0.5)
-            if self._snap_seek and self._snap_playhead_position > 0:
+        if self._snap.state in (STATE_PLAYING, STATE_PAUSED):
+            if self._snap.seek and self._snap.playhead_position > 0:
+                # A seek is only honoured once the source is playing.
+                await self.async_wait_for_status(
+                    lambda status: status.get("status") == "play", _RESTORE_PLAY_TIMEOUT,
+                )
                 _LOGGER.debug("Seeking after restore")
                 await self.call_linkplay_httpapi(
-                    f"setPlayerCmd:seek:{self._snap_playhead_position}", None
+                    f"setPlayerCmd:seek:{self._snap.playhead_position}", None
                 )
-                if self._snap_state == STATE_PAUSED:
+                if self._snap.state == STATE_PAUSED:
                     await self.async_media_pause()
 
-        self._snap_state = STATE_UNKNOWN
-        self._snap_seek = False
-        self._snap_playhead_position = 0
+        self._snap.state = STATE_UNKNOWN
+        self._snap.seek = False
+        self._snap.playhead_position = 0
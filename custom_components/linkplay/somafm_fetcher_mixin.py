@@ -19,6 +19,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import time
 from datetime import timedelta
 from http import HTTPStatus
 
@@ -27,6 +28,15 @@ import async_timeout
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.util import Throttle
 
+from .metrics import (
+    CHANNEL_SOMAFM,
+    ERROR_CLIENT,
+    ERROR_HTTP,
+    ERROR_PARSE,
+    ERROR_TIMEOUT,
+    get_metrics,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 # Throttle the SomaFM now-playing fetch. Set tight enough that
@@ -148,19 +158,21 @@ class LinkPlaySomaFmFetcherMixin:
         Returns True when artist + title were populated, False otherwise.
         """
         # Prefer the sticky cached station name: after the first
-        # successful fetch ``_media_title`` is the track title, not the
+        # successful fetch ``_meta.title`` is the track title, not the
         # "SomaFM: <station>" prefix, so deriving from it would freeze
         # the entity on the first track of every session.
         title = _slug_from_title(
             getattr(self, "_somafm_cached_station", None)
-        ) or _slug_from_title(self._media_title)
+        ) or _slug_from_title(self._meta.title)
         if title is None:
             return False
 
         session = async_get_clientsession(self.hass)
+        metrics = get_metrics(self._host)
 
         # Resolve via the official channel list first; fall back to the
         # alphanum-only slug for stations missing from the map.
+        metrics.record_cache(f"{CHANNEL_SOMAFM}_channels", _channel_map_cache is not None)
         channel_map = await _get_channel_map(session)
         channel = channel_map.get(title)
         slug = (channel or {}).get("id") or re.sub(r"[^a-z0-9]", "", title)
@@ -176,10 +188,15 @@ class LinkPlaySomaFmFetcherMixin:
         channel_image = (channel or {}).get("image")
 
         url = _SOMAFM_NOW_PLAYING_URL.format(channel=slug)
+        started = time.monotonic()
         try:
             async with async_timeout.timeout(5):
                 response = await session.get(url)
         except (TimeoutError, aiohttp.ClientError) as error:
+            metrics.record_request(
+                CHANNEL_SOMAFM, "songs", started,
+                ERROR_TIMEOUT if isinstance(error, TimeoutError) else ERROR_CLIENT,
+            )
             _LOGGER.debug(
                 "[%s @ %s] SomaFM fetch failed: %s",
                 self._name, self._host, type(error).__name__,
@@ -187,6 +204,7 @@ class LinkPlaySomaFmFetcherMixin:
             return False
 
         if response.status != HTTPStatus.OK:
+            metrics.record_request(CHANNEL_SOMAFM, "songs", started, ERROR_HTTP)
             _LOGGER.debug(
                 "[%s @ %s] SomaFM %s -> HTTP %s",
                 self._name, self._host, url, response.status,
@@ -196,11 +214,13 @@ class LinkPlaySomaFmFetcherMixin:
         try:
             data = await response.json(content_type=None)
         except (aiohttp.ContentTypeError, ValueError) as error:
+            metrics.record_request(CHANNEL_SOMAFM, "songs", started, ERROR_PARSE)
             _LOGGER.debug(
                 "[%s @ %s] SomaFM JSON parse failed: %s",
                 self._name, self._host, error,
             )
             return False
+        metrics.record_request(CHANNEL_SOMAFM, "songs", started)
 
         songs = data.get("songs") or []
         if not songs:
@@ -222,24 +242,24 @@ class LinkPlaySomaFmFetcherMixin:
         )
         display_artist = f"{artist} ({station})" if station else artist
 
-        prev = (self._media_title, self._media_artist)
+        prev = (self._meta.title, self._meta.artist)
         track_changed = (title, display_artist) != prev
-        self._media_title = title
+        self._meta.title = title
         # Keep the RAW artist in place while the artwork chain runs: the
-        # iTunes Search term is built from ``_media_artist``, so a
+        # iTunes Search term is built from ``_meta.artist``, so a
         # "(Station)" suffix here poisons the query ("efesoul (Fluid)
         # <title>" -> no match -> no cover). The display suffix is
         # re-applied after art resolution, below.
-        self._media_artist = artist
+        self._meta.artist = artist
         if album:
-            self._media_album = album
+            self._meta.album = album
 
         # On every fresh track inside the same station, drop the prior
         # cover before resolving a new one - otherwise either the
         # previous track's iTunes art or the station logo lingers when
         # the new resolution chain returns nothing.
         if track_changed:
-            self._media_image_url = None
+            self._meta.image_url = None
 
         # Artwork priority:
         #   1. iTunes Search by (artist, title) - the real album cover
@@ -251,7 +271,7 @@ class LinkPlaySomaFmFetcherMixin:
         # iTunes is throttled to 4 s and caches per (artist, title);
         # after the first successful lookup subsequent calls inside
         # the same track return False/None. We only fall through to
-        # the next source when ``_media_image_url`` is still empty,
+        # the next source when ``_meta.image_url`` is still empty,
         # so a sticky iTunes URL from a previous poll isn't clobbered
         # by the station logo on the next poll inside the same track.
         itunes_ok = False
@@ -264,14 +284,14 @@ class LinkPlaySomaFmFetcherMixin:
                     "[%s @ %s] iTunes art lookup raised: %s",
                     self._name, self._host, error,
                 )
-        if not itunes_ok and not self._media_image_url and albumart:
-            self._media_image_url = albumart
-        if not self._media_image_url and channel_image:
-            self._media_image_url = channel_image
+        if not itunes_ok and not self._meta.image_url and albumart:
+            self._meta.image_url = albumart
+        if not self._meta.image_url and channel_image:
+            self._meta.image_url = channel_image
 
         # Art resolved against the raw artist; now apply the station label
         # for the card, e.g. "efesoul (Fluid)".
-        self._media_artist = display_artist
+        self._meta.artist = display_artist
         if (title, display_artist) != prev:
             _LOGGER.debug(
                 "[%s @ %s] SomaFM %s -> %r / %r (art=%s)",
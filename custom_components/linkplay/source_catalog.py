@@ -0,0 +1,76 @@
+"""Configured input sources of a speaker.
+
+The ``sources`` / ``common_sources`` options map a source key - a
+firmware input (``line-in``, ``udisk``, ...) or a stream URL - to the
+name shown in Home Assistant. :class:`SourceCatalog` is built from them
+once per entity (an options change reloads the entry and rebuilds it)
+and answers the lookups the entity makes on every poll or service call
+from precomputed tables:
+
+* key -> name for the current source (:meth:`SourceCatalog.name`)
+* name -> key for ``select_source`` (:meth:`SourceCatalog.key`)
+* the names offered in ``source_list``, without the implicit Wi-Fi input
+* which keys are stream URLs, which are local disks
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+
+# Source key of the network input; always implied, never listed.
+_WIFI = "wifi"
+_DISK_KEYS = frozenset(("udisk", "TFcard"))
+
+
+def _merge(options: Iterable[Mapping[str, str]] | Mapping[str, str] | None) -> dict[str, str]:
+    """Flatten an option value: one mapping or a list of mappings."""
+    if not options:
+        return {}
+    if isinstance(options, Mapping):
+        return dict(options)
+    merged: dict[str, str] = {}
+    for entry in options:
+        merged.update(entry)
+    return merged
+
+
+class SourceCatalog:
+    """Forward and reverse source maps plus per-key classification."""
+
+    __slots__ = ("sources", "names", "_keys", "_streams")
+
+    def __init__(self, sources: Mapping[str, str]) -> None:
+        self.sources = dict(sources)
+        keys: dict[str, str] = {}
+        for key, name in self.sources.items():
+            # Two keys with one name: the first one configured wins.
+            keys.setdefault(name, key)
+        self._keys = keys
+        self._streams = frozenset(key for key in self.sources if key.startswith("http"))
+        self.names = [name for key, name in self.sources.items() if key != _WIFI]
+
+    @classmethod
+    def from_options(cls, sources, common_sources, default: Mapping[str, str]) -> SourceCatalog:
+        """Per-speaker ``sources`` (or ``default``) extended by ``common_sources``."""
+        return cls({**(_merge(sources) or default), **_merge(common_sources)})
+
+    def __bool__(self) -> bool:
+        return bool(self.sources)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.sources
+
+    def name(self, key: str, default: str | None = None) -> str | None:
+        return self.sources.get(key, default)
+
+    def key(self, name: str) -> str | None:
+        """Source key shown as ``name``, or None."""
+        return self._keys.get(name)
+
+    def is_stream(self, key: str) -> bool:
+        """``key`` is a stream URL rather than a firmware input."""
+        return key in self._streams
+
+    @staticmethod
+    def is_disk(key: str) -> bool:
+        return key in _DISK_KEYS
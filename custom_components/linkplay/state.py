@@ -0,0 +1,154 @@
+"""Slotted sub-records of the entity's player state.
+
+The player state the update loop reads and writes on every poll lives
+in small ``__slots__`` records rather than the entity's ``__dict__``;
+configuration, UPnP plumbing and caches stay flat on the entity:
+
+* :class:`TransportState` - state, volume, position and input
+  (``self._transport``).
+* :class:`MediaMetadata` - what is playing: title, artist, cover, URIs
+  (``self._meta``).
+* :class:`GroupState` - multiroom role and membership (``self._group``).
+* :class:`PlaybackFlags` - what kind of media is playing, recomputed
+  from ``mode`` on every poll (``self._playing``).
+* :class:`SnapshotState` - what ``linkplay.snapshot`` captured for
+  ``linkplay.restore`` (``self._snap``).
+
+Each record has ``as_dict()`` for diagnostics and state diffing.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.media_player import RepeatMode
+from homeassistant.const import STATE_UNKNOWN
+
+
+class _Record:
+    __slots__ = ()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class TransportState(_Record):
+    """Player state, volume, position and selected input."""
+
+    __slots__ = (
+        "state", "volume", "muted", "playhead_position", "duration",
+        "position_updated_at", "idletime_updated_at", "spotify_paused_at",
+        "shuffle", "repeat", "source", "prev_source", "sound_mode",
+    )
+
+    def __init__(self, state: str | None = None) -> None:
+        self.state = state
+        self.volume: int | None = 0
+        self.muted = False
+        self.playhead_position = 0
+        self.duration = 0
+        self.position_updated_at = None
+        self.idletime_updated_at = None
+        self.spotify_paused_at = None
+        self.shuffle = False
+        self.repeat = RepeatMode.OFF
+        self.source: str | None = None
+        self.prev_source: str | None = None
+        self.sound_mode: str | None = None
+
+
+class MediaMetadata(_Record):
+    """Metadata of the current track and where it is played from."""
+
+    __slots__ = (
+        "title", "artist", "album", "image_url", "prev_title", "prev_artist",
+        "uri", "uri_final", "source_uri", "nometa", "icecast_name", "new_song",
+    )
+
+    def __init__(self) -> None:
+        self.title: str | None = None
+        self.artist: str | None = None
+        self.album: str | None = None
+        self.image_url: str | None = None
+        self.prev_title: str | None = None
+        self.prev_artist: str | None = None
+        self.uri: str | None = None
+        self.uri_final: str | None = None
+        self.source_uri: str | None = None
+        self.nometa = False
+        self.icecast_name: str | None = None
+        self.new_song = True
+
+
+class GroupState(_Record):
+    """Multiroom role of the speaker and the group it belongs to."""
+
+    __slots__ = (
+        "is_master", "slave_mode", "master", "slave_ip", "slave_list",
+        "members", "wifidirect", "prevsrc", "joinat", "unjoinat", "zero_polls",
+    )
+
+    def __init__(self, wifidirect: bool = False) -> None:
+        self.is_master = False
+        self.slave_mode = False
+        self.master = None
+        self.slave_ip: str | None = None
+        self.slave_list: list | None = None
+        # Entity ids, master first.
+        self.members: list[str] = []
+        self.wifidirect = wifidirect
+        # Source to go back to after leaving a group.
+        self.prevsrc: str | None = None
+        # Last successful ``async_join`` that populated ``members``. The
+        # master-side poll keeps the just-built group through a grace
+        # window while ``multiroom:getSlaveList`` still reports zero
+        # slaves (Wi-Fi direct propagates slowly on AudioPro firmware).
+        self.joinat = None
+        self.unjoinat = None
+        # Consecutive ``multiroom:getSlaveList`` polls that reported no
+        # slaves. A master only tears down its locally-built group once
+        # this passes ``zero_poll_teardown`` (quirks); AudioPro firmware
+        # briefly reports ``slaves=0`` during preset / source switches
+        # while the group is still physically intact.
+        self.zero_polls = 0
+
+
+class PlaybackFlags(_Record):
+    """Kind of media the speaker is playing."""
+
+    __slots__ = (
+        "localfile", "stream", "liveinput", "spotify",
+        "webplaylist", "tts", "mediabrowser",
+    )
+
+    def __init__(self) -> None:
+        self.localfile = True
+        self.stream = False
+        self.liveinput = False
+        self.spotify = False
+        self.webplaylist = False
+        self.tts = False
+        self.mediabrowser = False
+
+
+class SnapshotState(_Record):
+    """Player state captured by ``async_snapshot``."""
+
+    __slots__ = (
+        "source", "uri", "state", "volume", "spotify", "spotify_volumeonly",
+        "nometa", "playing_mediabrowser", "media_source_uri", "seek",
+        "playhead_position",
+    )
+
+    def __init__(self) -> None:
+        self.source: str | None = None
+        self.uri: str | None = None
+        self.state = STATE_UNKNOWN
+        self.volume = 0
+        self.spotify = False
+        self.spotify_volumeonly = False
+        self.nometa = False
+        self.playing_mediabrowser = False
+        self.media_source_uri: str | None = None
+        self.seek = False
+        self.playhead_position = 0
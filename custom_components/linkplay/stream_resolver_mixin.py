@@ -2,7 +2,7 @@
 
 Follows redirects on stream URIs and unwraps M3U / PLS playlist
 wrappers to the first concrete URL. Side-effects on the entity are
-limited to ``self._nometa`` when a playlist body has no playable URL.
+limited to ``self._meta.nometa`` when a playlist body has no playable URL.
 """
 
 from __future__ import annotations
@@ -74,7 +74,7 @@ class LinkPlayStreamResolverMixin:
             "For: %s M3U playlist: %s No valid http URL in the playlist",
             self._name, playlist,
         )
-        self._nometa = True
+        self._meta.nometa = True
         return playlist
 
     async def async_parse_pls_url(self, playlist: str) -> str:
@@ -89,7 +89,7 @@ class LinkPlayStreamResolverMixin:
             "For: %s PLS playlist: %s No valid File entry in the playlist",
             self._name, playlist,
         )
-        self._nometa = True
+        self._meta.nometa = True
         return playlist
 
     async def _fetch_playlist_body(self, playlist: str, kind: str) -> str | None:
@@ -0,0 +1,168 @@
+"""Index over the USB disk track queue.
+
+``PlayQueue.BrowseQueue("USBDiskQueue")`` returns the whole queue as a
+single XML document; on a large USB drive that is 10k+ entries and
+several megabytes. :func:`parse_usb_queue` reads it with ``iterparse``
+and drops every element once it has been looked at, so the parsed tree
+is never held in memory at once, and callers hash the raw document
+(:func:`queue_digest`) to skip parsing when the queue did not change.
+
+:class:`TrackIndex` wraps the resulting path list for ``play_track``
+lookups by name. Keys are normalized titles: the file name without
+folder or extension, accents stripped, case-folded, punctuation
+collapsed to single spaces. Lookups try, in order, an exact key, a key
+prefix (bisect over the sorted keys), a substring of the raw path (the
+historical behaviour) and finally a fuzzy match. The keys are built on
+the first lookup, not on parse.
+
+For media browsing the index also groups the paths by folder
+(:meth:`TrackIndex.folder`), again built once per queue on first use.
+"""
+
+from __future__ import annotations
+
+import difflib
+import hashlib
+import io
+import re
+import unicodedata
+from bisect import bisect_left
+
+from defusedxml import ElementTree as DET
+
+# Depth of the <URL> elements: PlayList / Tracks / TrackN / URL.
+_URL_DEPTH = 3
+_FUZZY_CUTOFF = 0.75
+_PUNCTUATION = re.compile(r"[\W_]+")
+
+
+def queue_digest(queue_xml: str) -> str:
+    """Content hash of a raw ``BrowseQueue`` document."""
+    return hashlib.sha1(queue_xml.encode(), usedforsecurity=False).hexdigest()
+
+
+def parse_usb_queue(queue_xml: str, rootdir: str) -> list[str]:
+    """Return the queue's track paths below ``rootdir``, relative to it."""
+    tracks: list[str] = []
+    depth = -1
+    for event, element in DET.iterparse(io.StringIO(queue_xml), events=("start", "end")):
+        if event == "start":
+            depth += 1
+            continue
+        if depth == _URL_DEPTH and element.tag == "URL":
+            text = element.text
+            if text and rootdir in text:
+                tracks.append(text.replace(rootdir, ""))
+        # Keep memory flat on huge queues: nothing below needs the subtree.
+        element.clear()
+        depth -= 1
+    return tracks
+
+
+def normalize_title(path: str) -> str:
+    """Lookup key for a track path or a user-supplied track name."""
+    name = path.rsplit("/", 1)[-1]
+    stem, dot, extension = name.rpartition(".")
+    if dot and stem and len(extension) <= 4:
+        name = stem
+    name = unicodedata.normalize("NFKD", name)
+    name = "".join(char for char in name if not unicodedata.combining(char))
+    return _PUNCTUATION.sub(" ", name.casefold()).strip()
+
+
+class TrackIndex:
+    """Name lookups over one USB queue."""
+
+    __slots__ = ("tracks", "digest", "_positions", "_sorted_keys", "_folders")
+
+    def __init__(self, tracks: list[str] | None = None, digest: str | None = None) -> None:
+        self.tracks = tracks if tracks is not None else []
+        self.digest = digest
+        self._positions: dict[str, int] | None = None
+        self._sorted_keys: list[str] = []
+        self._folders: dict[str, tuple[list[str], list[int]]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def _build(self) -> dict[str, int]:
+        positions: dict[str, int] = {}
+        for position, path in enumerate(self.tracks):
+            positions.setdefault(normalize_title(path), position)
+        self._positions = positions
+        self._sorted_keys = sorted(positions)
+        return positions
+
+    def _build_folders(self) -> dict[str, tuple[list[str], list[int]]]:
+        folders: dict[str, tuple[list[str], list[int]]] = {"": ([], [])}
+        for position, path in enumerate(self.tracks):
+            parent = path.rpartition("/")[0]
+            node = folders.get(parent)
+            if node is None:
+                node = folders[parent] = ([], [])
+                # Register the new folder with its parent, creating
+                # missing ancestors up to the (always present) root.
+                child = parent
+                while child:
+                    up = child.rpartition("/")[0]
+                    up_node = folders.get(up)
+                    created = up_node is None
+                    if created:
+                        up_node = folders[up] = ([], [])
+                    up_node[0].append(child)
+                    if not created:
+                        break
+                    child = up
+            node[1].append(position)
+        for subfolders, _positions in folders.values():
+            subfolders.sort(key=str.casefold)
+        self._folders = folders
+        return folders
+
+    def folder(self, path: str = "") -> tuple[list[str], list[int]] | None:
+        """Sub-folder paths and track positions directly in ``path``.
+
+        ``""`` is the disk root; None for a folder not in the queue.
+        """
+        folders = self._folders if self._folders is not None else self._build_folders()
+        return folders.get(path)
+
+    def prefix(self, query: str, limit: int = 10) -> list[int]:
+        """Positions of tracks whose key starts with ``query``'s key."""
+        positions = self._positions if self._positions is not None else self._build()
+        key = normalize_title(query)
+        keys = self._sorted_keys
+        matches = []
+        start = bisect_left(keys, key)
+        for candidate in keys[start:start + limit]:
+            if not candidate.startswith(key):
+                break
+            matches.append(positions[candidate])
+        return matches
+
+    def fuzzy(self, query: str, limit: int = 5) -> list[int]:
+        """Positions of the tracks whose key is closest to ``query``'s key."""
+        positions = self._positions if self._positions is not None else self._build()
+        close = difflib.get_close_matches(
+            normalize_title(query), self._sorted_keys, n=limit, cutoff=_FUZZY_CUTOFF,
+        )
+        return [positions[key] for key in close]
+
+    def find(self, query: str) -> int | None:
+        """Position of the best match for ``query``, or None."""
+        positions = self._positions if self._positions is not None else self._build()
+        if not query:
+            return None
+        key = normalize_title(query)
+        if key:
+            position = positions.get(key)
+            if position is not None:
+                return position
+            matches = self.prefix(query, limit=1)
+            if matches:
+                return matches[0]
+        position = next((pos for pos, path in enumerate(self.tracks) if query in path), None)
+        if position is not None or not key:
+            return position
+        matches = self.fuzzy(query, limit=1)
+        return matches[0] if matches else None
@@ -0,0 +1,143 @@
+"""Shared UPnP factory for every LinkPlay speaker.
+
+``UpnpFactory.async_create_device`` downloads ``description.xml`` plus
+one SCPD document per service and parses all of them, and every entity
+used to build its own factory / requester pair to do so. LinkPlay
+modules of the same model publish byte-identical SCPDs, so a fleet of
+20 speakers parsed the same handful of service descriptions 20 times.
+
+All entities now share one :class:`LinkPlayUpnpFactory`:
+
+* its requester is a :class:`UpnpDocumentCache`, which answers document
+  GETs from the copies kept in the device store (see
+  :mod:`device_store`) and remembers what it fetched;
+* SCPD documents are parsed once per distinct content: the parsed tree
+  is kept keyed by a hash of the document body and handed to every
+  device publishing the same body. The factory only reads these trees.
+
+``UpnpService`` / ``UpnpAction`` objects keep a back-reference to their
+device, so those are still built per speaker.
+
+Sharing the parse means overriding private ``UpnpFactory`` internals
+(``_async_get_service_spec`` and the hooks it calls), written against
+async-upnp-client 0.46 - 0.49. If a library release renames or
+reshapes them the factory falls back to the library's own per-device
+parsing instead of failing UPnP setup.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import xml.etree.ElementTree as ET
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from async_upnp_client.aiohttp import AiohttpRequester
+from async_upnp_client.client import UpnpRequester
+from async_upnp_client.client_factory import UpnpFactory
+from async_upnp_client.const import HttpRequest, HttpResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+UPNP_TIMEOUT = 2
+# Distinct SCPD documents kept parsed. A LinkPlay module has about six
+# services, so this covers a mixed fleet of several models.
+_MAX_SCPD_DOCUMENTS = 64
+
+
+def _hostname(url: str) -> str | None:
+    return urlsplit(url).hostname
+
+
+class UpnpDocumentCache(UpnpRequester):
+    """UPnP requester answering document GETs from memory.
+
+    Wraps the real requester: description / SCPD fetches whose URL is in
+    ``documents`` never touch the network, everything else (SOAP action
+    POSTs, unknown documents) is passed through. Documents fetched from
+    a speaker are added to ``documents`` so the entity can persist them.
+    """
+
+    def __init__(self, requester: UpnpRequester) -> None:
+        self._requester = requester
+        self.documents: dict[str, str] = {}
+
+    def add(self, documents: dict[str, str]) -> None:
+        self.documents.update(documents)
+
+    def for_host(self, host: str) -> dict[str, str]:
+        """The documents served by ``host``, keyed by URL."""
+        return {url: body for url, body in self.documents.items() if _hostname(url) == host}
+
+    def forget(self, host: str) -> None:
+        """Drop the documents of ``host`` so the next build fetches them again."""
+        for url in list(self.for_host(host)):
+            del self.documents[url]
+
+    async def async_http_request(self, http_request: HttpRequest) -> HttpResponse:
+        if http_request.method == "GET":
+            body = self.documents.get(http_request.url)
+            if body is not None:
+                return HttpResponse(HTTPStatus.OK, {}, body)
+
+        response = await self._requester.async_http_request(http_request)
+        if http_request.method == "GET" and response.status_code == HTTPStatus.OK and response.body:
+            self.documents[http_request.url] = response.body
+        return response
+
+
+# Private UpnpFactory members the shared SCPD parse relies on. Without
+# ``_async_get_service_spec`` itself the override is simply never called.
+_SPEC_INTERNALS = (
+    "_on_pre_receive_service_spec",
+    "_on_post_receive_service_spec",
+    "_read_spec_from_reponse",
+)
+
+
+class LinkPlayUpnpFactory(UpnpFactory):
+    """``UpnpFactory`` parsing each distinct SCPD document once."""
+
+    requester: UpnpDocumentCache
+
+    def __init__(self, requester: UpnpDocumentCache) -> None:
+        super().__init__(requester)
+        self._scpd_trees: dict[str, ET.Element] = {}
+        self._share_scpds = all(hasattr(self, name) for name in _SPEC_INTERNALS)
+
+    async def _async_get_service_spec(self, url: str) -> ET.Element:
+        if self._share_scpds:
+            try:
+                return await self._async_get_shared_service_spec(url)
+            except (AttributeError, TypeError) as error:
+                self._share_scpds = False
+                _LOGGER.debug("UpnpFactory internals changed, not sharing SCPDs: %s", error)
+        return await super()._async_get_service_spec(url)
+
+    async def _async_get_shared_service_spec(self, url: str) -> ET.Element:
+        # Same request / hook sequence as the base class; only the parse
+        # step is shared between identical documents.
+        request = self._on_pre_receive_service_spec(HttpRequest("GET", url, {}, None))
+        response = self._on_post_receive_service_spec(await self.requester.async_http_request(request))
+        if response.status_code != HTTPStatus.OK or not response.body:
+            return self._read_spec_from_reponse(response)
+
+        digest = hashlib.sha1(response.body.encode(), usedforsecurity=False).hexdigest()
+        tree = self._scpd_trees.get(digest)
+        if tree is None:
+            tree = self._read_spec_from_reponse(response)
+            if len(self._scpd_trees) < _MAX_SCPD_DOCUMENTS:
+                self._scpd_trees[digest] = tree
+        return tree
+
+
+_FACTORY: LinkPlayUpnpFactory | None = None
+
+
+def get_upnp_factory() -> LinkPlayUpnpFactory:
+    """Return the factory shared by every speaker, creating it on first use."""
+    global _FACTORY
+    if _FACTORY is None:
+        _FACTORY = LinkPlayUpnpFactory(UpnpDocumentCache(AiohttpRequester(UPNP_TIMEOUT)))
+    return _FACTORY
@@ -6,6 +6,13 @@ Calls the three async_upnp_client services the firmware exposes:
   (Spotify-friendly path).
 * ``PlayQueue:1`` for the USB / local-disk track list.
 * ``PlayQueue:1`` for persisting a Spotify preset slot.
+
+The UPnP device is bound lazily, the first time one of these is needed
+(most speakers never play Spotify or USB media), through the shared
+factory (see :mod:`upnp_factory`). Binding is serialised by a lock;
+after a failure callers get ``None`` straight away while a background
+retry runs with a doubling delay. Action handles are cached per
+(service, action) for the lifetime of the bound device.
 """
 
 from __future__ import annotations
@@ -14,10 +21,13 @@ import logging
 import time
 import xml.etree.ElementTree as ET
 
-import validators
 from defusedxml import ElementTree as DET
 
 from homeassistant.components import persistent_notification
+from homeassistant.helpers.event import async_call_later
+
+from .metrics import CHANNEL_UPNP, ERROR_OTHER, get_metrics
+from .track_index import TrackIndex, parse_usb_queue, queue_digest
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -26,31 +36,104 @@ _ROOTDIR_USB = "/media/sda1/"
 _AV_TRANSPORT = "urn:schemas-upnp-org:service:AVTransport:1"
 _PLAY_QUEUE = "urn:schemas-wiimu-com:service:PlayQueue:1"
 
-_DIDL_ITEM_NS = "{urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/}item/"
-_DC_NS = "{http://purl.org/dc/elements/1.1/}"
-_UPNP_NS = "{urn:schemas-upnp-org:metadata-1-0/upnp/}"
-
-
-def _didl_text(xml_tree: ET.Element, suffix: str) -> str | None:
-    node = xml_tree.find(_DIDL_ITEM_NS + suffix)
-    return node.text if node is not None else None
+# Background retry delay after a failed bind, doubling up to the max.
+_UPNP_RETRY_MIN = 30
+_UPNP_RETRY_MAX = 600
 
 
 class LinkPlayUPnPMixin:
     """UPnP metadata fetch + queue + Spotify-preset helpers."""
 
+    async def _async_upnp_device(self):
+        """Return the UPnP device, binding it on first need.
+
+        Returns ``None`` while a failed bind is backing off.
+        """
+        if self._upnp_device is not None:
+            return self._upnp_device
+        if time.monotonic() < self._upnp_retry_at:
+            return None
+        async with self._upnp_lock:
+            # Another caller may have bound (or failed) while we waited.
+            if self._upnp_device is None and time.monotonic() >= self._upnp_retry_at:
+                await self._async_bind_upnp()
+        return self._upnp_device
+
+    async def _async_bind_upnp(self) -> None:
+        url = f"http://{self._host}:49152/description.xml"
+        try:
+            device = await self._factory.async_create_device(url)
+        except Exception as error:
+            first_failure = not self._upnp_retry_delay
+            delay = min(self._upnp_retry_delay * 2 or _UPNP_RETRY_MIN, _UPNP_RETRY_MAX)
+            self._upnp_retry_delay = delay
+            self._upnp_retry_at = time.monotonic() + delay
+            (_LOGGER.warning if first_failure else _LOGGER.debug)(
+                "Failed communicating with LinkPlayDevice (UPnP) '%s': %s, retrying in %ss",
+                self._name, type(error), delay,
+            )
+            # Stored documents may be what broke; refetch next time.
+            self._forget_upnp_documents()
+            if self.hass is not None:
+                self._upnp_retry_unsub = async_call_later(self.hass, delay, self._async_retry_upnp)
+            return
+
+        self._upnp_device = device
+        self._upnp_actions = {}
+        self._upnp_retry_delay = 0
+        self._upnp_retry_at = 0.0
+        if self._device_store is not None:
+            self._device_store.async_update(
+                self._host, upnp=self._upnp_documents.for_host(self._host),
+            )
+
+    async def _async_retry_upnp(self, _now) -> None:
+        self._upnp_retry_unsub = None
+        # call_later may fire a hair before the recorded deadline.
+        self._upnp_retry_at = 0.0
+        await self._async_upnp_device()
+
+    def _forget_upnp_documents(self) -> None:
+        """Drop stored UPnP documents so the next bind fetches them again."""
+        self._upnp_documents.forget(self._host)
+        if self._device_store is not None:
+            self._device_store.async_update(self._host, upnp={})
+
+    def _cancel_upnp_retry(self) -> None:
+        if self._upnp_retry_unsub is not None:
+            self._upnp_retry_unsub()
+            self._upnp_retry_unsub = None
+
+    async def _async_upnp_call(self, service_type: str, action: str, **kwargs) -> dict:
+        """Run ``action`` of ``service_type`` and record its latency.
+
+        Only call with a bound device (see :meth:`_async_upnp_device`).
+        """
+        handle = self._upnp_actions.get((service_type, action))
+        if handle is None:
+            handle = self._upnp_device.service(service_type).action(action)
+            self._upnp_actions[(service_type, action)] = handle
+
+        metrics = get_metrics(self._host)
+        started = time.monotonic()
+        try:
+            result = await handle.async_call(**kwargs)
+        except Exception:
+            metrics.record_request(CHANNEL_UPNP, action, started, ERROR_OTHER)
+            raise
+        metrics.record_request(CHANNEL_UPNP, action, started)
+        return result
+
     async def async_update_via_upnp(self) -> None:
         """Refresh media metadata from the AVTransport service."""
-        if self._upnp_device is None:
+        if await self._async_upnp_device() is None:
             return
 
-        self._service = self._upnp_device.service(_AV_TRANSPORT)
-
         media_metadata = None
         try:
-            media_info = await self._service.action("GetMediaInfo").async_call(InstanceID=0)
+            media_info = await self._async_upnp_call(_AV_TRANSPORT, "GetMediaInfo", InstanceID=0)
             self._trackc = media_info.get("CurrentURI")
-            self._media_uri_final = media_info.get("TrackSource")
+            self._meta.uri_final = media_info.get("TrackSource")
             media_metadata = media_info.get("CurrentURIMetaData")
         except Exception:
             _LOGGER.warning("GetMediaInfo/CurrentURIMetaData UPNP error: %s", self.entity_id)
@@ -58,15 +141,16 @@ class LinkPlayUPnPMixin:
         if media_metadata is None:
             return
 
-        try:
-            xml_tree = DET.fromstring(media_metadata)
-        except ET.ParseError as error:
+        # Parsed only when the document differs from the last poll's.
+        metadata = self._didl_decoder.decode(media_metadata)
+        if metadata is None:
             # LinkPlay DIDL-Lite payloads occasionally contain
             # unescaped ampersands or non-Latin chars that the stdlib
             # XML parser rejects. Bail rather than killing the whole
             # poll cycle so the caller can fall through to other
             # metadata sources. Only log the first occurrence of each
             # unique error per entity to avoid filling the log.
+            error = self._didl_decoder.error
             error_key = (self.entity_id, str(error))
             if error_key != getattr(self, "_last_didl_parse_error", None):
                 _LOGGER.debug(
@@ -76,27 +160,15 @@ class LinkPlayUPnPMixin:
                 self._last_didl_parse_error = error_key
             return
 
-        self._media_title = None
-        self._media_album = None
-        self._media_artist = None
-        self._media_image_url = None
-
-        # Most media exposes title/artist/album via DIDL-Lite + UPnP namespaces.
-        self._media_title = _didl_text(xml_tree, f"{_DC_NS}title")
-        self._media_artist = _didl_text(xml_tree, f"{_UPNP_NS}artist")
-        self._media_album = _didl_text(xml_tree, f"{_UPNP_NS}album")
-        image_url = _didl_text(xml_tree, f"{_UPNP_NS}albumArtURI")
-
-        if image_url and validators.url(image_url):
-            self._media_image_url = image_url
-        else:
-            self._media_image_url = None
+        (
+            self._meta.title,
+            self._meta.artist,
+            self._meta.album,
+            self._meta.image_url,
+        ) = metadata
 
     async def async_tracklist_via_upnp(self, media: str) -> None:
         """Populate ``self._trackq`` with URLs from the local-storage queue."""
-        if self._upnp_device is None:
-            return
-
         if media != "USB":
             _LOGGER.debug(
                 "Tracklist retrieval %s for %s is not supported; only USB is wired up.",
@@ -105,14 +177,15 @@ class LinkPlayUPnPMixin:
             self._trackq = []
             return
 
+        if await self._async_upnp_device() is None:
+            return
+
         queuename = "USBDiskQueue"
         rootdir = _ROOTDIR_USB
 
-        self._service = self._upnp_device.service(_PLAY_QUEUE)
-
         media_metadata = None
         try:
-            media_info = await self._service.action("BrowseQueue").async_call(QueueName=queuename)
+            media_info = await self._async_upnp_call(_PLAY_QUEUE, "BrowseQueue", QueueName=queuename)
             media_metadata = media_info.get("QueueContext")
         except Exception:
             _LOGGER.debug("PlayQueue/QueueContext UPNP error, media not present?: %s", self.entity_id)
@@ -120,29 +193,25 @@ class LinkPlayUPnPMixin:
         if media_metadata is None:
             return
 
-        xml_tree = DET.fromstring(media_metadata)
-
-        trackq: list[str] = []
-        for playlist in xml_tree:
-            for tracks in playlist:
-                for track in tracks:
-                    if track.tag == "URL" and track.text and rootdir in track.text:
-                        trackq.append(track.text.replace(rootdir, ""))
+        # Unchanged queue (same content hash): keep the current index.
+        digest = queue_digest(media_metadata)
+        if digest == self._track_index.digest:
+            return
 
+        trackq = parse_usb_queue(media_metadata, rootdir)
         if trackq:
+            self._track_index = TrackIndex(trackq, digest)
             self._trackq = trackq
 
     async def async_preset_snap_via_upnp(self, presetnum: str) -> None:
         """Save the current Spotify playlist into the device preset slot ``presetnum``."""
-        if self._upnp_device is None or not self._playing_spotify:
+        if not self._playing.spotify or await self._async_upnp_device() is None:
             return
 
-        self._service = self._upnp_device.service(_PLAY_QUEUE)
-
         result = None
         try:
-            media_info = await self._service.action("SetSpotifyPreset").async_call(
-                KeyIndex=int(presetnum)
+            media_info = await self._async_upnp_call(
+                _PLAY_QUEUE, "SetSpotifyPreset", KeyIndex=int(presetnum)
             )
             _LOGGER.debug(
                 "PlayQueue/SetSpotifyPreset for: %s, UPNP media_info:%s",
@@ -158,7 +227,7 @@ class LinkPlayUPnPMixin:
 
         try:
             preset_map_raw = (
-                await self._service.action("GetKeyMapping").async_call()
+                await self._async_upnp_call(_PLAY_QUEUE, "GetKeyMapping")
             ).get("QueueContext")
         except Exception:
             _LOGGER.debug("GetKeyMapping UPNP error: %s", self.entity_id)
@@ -193,7 +262,7 @@ class LinkPlayUPnPMixin:
         preset_map = ET.tostring(xml_tree, encoding="unicode")
 
         try:
-            await self._service.action("SetKeyMapping").async_call(QueueContext=preset_map)
+            await self._async_upnp_call(_PLAY_QUEUE, "SetKeyMapping", QueueContext=preset_map)
         except Exception:
             _LOGGER.debug("SetKeyMapping UPNP error: %s, %s", self.entity_id, preset_map)
 
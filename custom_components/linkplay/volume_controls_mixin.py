@@ -9,17 +9,23 @@ Three commands the firmware exposes:
 * ``setPlayerCmd:mute`` / ``setPlayerCmd:slave_mute`` for muting.
 
 Wraps them so the entity exposes ``async_volume_up`` /
-``async_volume_down`` / ``async_set_volume_level`` / ``async_mute_volume``.
+``async_volume_down`` / ``async_set_volume_level`` / ``async_mute_volume``
+and ``async_fade_volume``. Volume commands go through the entity's
+:class:`~.volume_engine.VolumeEngine`, so rapid steps coalesce into
+the newest target instead of queueing one request each.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
 
+from .api_client_mixin import volume_settled
+
 _LOGGER = logging.getLogger(__name__)
 
 _MAX_VOL = 100
+# Upper bound on the wait for a snapshot's input fade-in to finish.
+_SNAPSHOT_SETTLE_TIMEOUT = 2
 
 
 class LinkPlayVolumeControlsMixin:
@@ -47,12 +53,12 @@ class LinkPlayVolumeControlsMixin:
         _LOGGER.debug(
             "_set_volume_on_device: %s action=%s target=%s slave_mode=%s "
             "wifidirect=%s is_master=%s snapshot_active=%s slave_ip=%s master=%s",
-            self.entity_id, action, volume_s, self._slave_mode,
-            self._multiroom_wifidirect, self._is_master,
-            self._snapshot_active, self._slave_ip,
-            self._master.entity_id if self._master else None,
+            self.entity_id, action, volume_s, self._group.slave_mode,
+            self._group.wifidirect, self._group.is_master,
+            self._snapshot_active, self._group.slave_ip,
+            self._group.master.entity_id if self._group.master else None,
         )
-        if not (self._slave_mode and self._multiroom_wifidirect):
+        if not (self._group.slave_mode and self._group.wifidirect):
             cmd = f"setPlayerCmd:vol:{volume_s}"
             _LOGGER.debug(
                 "_set_volume_on_device: %s sending DIRECT %s", self.entity_id, cmd,
@@ -66,40 +72,46 @@ class LinkPlayVolumeControlsMixin:
                     self.entity_id, action, volume_s,
                 )
                 return
-            cmd = f"multiroom:SlaveVolume:{self._slave_ip}:{volume_s}"
+            cmd = f"multiroom:SlaveVolume:{self._group.slave_ip}:{volume_s}"
             _LOGGER.debug(
                 "_set_volume_on_device: %s sending PROXY via master %s: %s",
                 self.entity_id,
-                self._master.entity_id if self._master else None,
+                self._group.master.entity_id if self._group.master else None,
                 cmd,
             )
-            value = await self._master.call_linkplay_httpapi(cmd, None)
+            value = await self._group.master.call_linkplay_httpapi(cmd, None)
 
         _LOGGER.debug(
             "_set_volume_on_device: %s response=%s (target=%s)",
             self.entity_id, value, volume_s,
         )
         if value == "OK":
-            self._volume = volume
+            self._transport.volume = volume
         else:
             _LOGGER.warning(
                 "Failed to %s. Device: %s, Got response: %s",
                 action, self.entity_id, value,
             )
 
+    def _volume_target_base(self) -> int:
+        """Volume a relative step starts from: the queued target, if any."""
+        pending = self._volume_engine.pending
+        return int(self._transport.volume) if pending is None else pending
+
     async def async_volume_up(self) -> None:
         """Increase volume one step."""
-        if int(self._volume) == 100 and not self._muted:
+        if self._volume_target_base() == 100 and not self._transport.muted:
             return
-        volume = min(_MAX_VOL, int(self._volume) + int(self._volume_step))
-        await self._set_volume_on_device(volume, action="volume_up")
+        volume = min(_MAX_VOL, self._volume_target_base() + int(self._volume_step))
+        await self._volume_engine.async_set(volume, "volume_up")
 
     async def async_volume_down(self) -> None:
         """Decrease volume one step."""
-        if int(self._volume) == 0:
+        base = self._volume_target_base()
+        if base == 0:
             return
-        volume = max(0, int(self._volume) - int(self._volume_step))
-        await self._set_volume_on_device(volume, action="volume_down")
+        volume = max(0, base - int(self._volume_step))
+        await self._volume_engine.async_set(volume, "volume_down")
 
     async def async_set_volume_level(self, volume) -> None:
         """Set volume from a 0.0-1.0 HA scale to the device's 0-100 scale."""
@@ -109,37 +121,68 @@ class LinkPlayVolumeControlsMixin:
             self.entity_id, volume, target,
         )
         # During a snapshot restore the device fades in audio when the
-        # input switches, so an immediate vol command is ignored. Give
-        # it a second to settle.
+        # input switches, so an immediate vol command is ignored. Wait
+        # for the reported volume to settle.
         if (
-            not (self._slave_mode and self._multiroom_wifidirect)
-            and not self._is_master
+            not (self._group.slave_mode and self._group.wifidirect)
+            and not self._group.is_master
             and self._snapshot_active
         ):
             _LOGGER.debug(
-                "async_set_volume_level: %s sleeping 1s (snapshot settle)",
+                "async_set_volume_level: %s waiting for volume to settle (snapshot)",
                 self.entity_id,
             )
-            await asyncio.sleep(1)
-        await self._set_volume_on_device(target, action="set volume")
+            await self.async_wait_for_status(volume_settled(), _SNAPSHOT_SETTLE_TIMEOUT)
+        await self._volume_engine.async_set(target, "set volume")
+
+    async def async_fade_volume(self, volume: float, duration: float) -> None:
+        """Ramp to ``volume`` (0.0-1.0) over ``duration`` seconds.
+
+        On a group master every slave fades alongside, to the target
+        shifted by its ``_volume_offset`` as in ``set_group_volume``,
+        from the master's fade loop; a volume change on a slave takes it
+        out of the fade. A speaker whose volume is not known yet jumps
+        to its target on the first step.
+        """
+        target = round(int(max(0.0, min(1.0, volume)) * _MAX_VOL))
+        followers = []
+        # Commands per step that reach this speaker: its own, plus one
+        # per Wi-Fi-direct slave proxied through it.
+        load = 1
+        if self._group.is_master:
+            for slave in self._group_slave_entities():
+                offset = getattr(slave, "_volume_offset", 0) or 0
+                slave_target = max(0, min(_MAX_VOL, target + int(offset)))
+                start = None if slave._transport.volume is None else int(slave._transport.volume)
+                followers.append((slave._volume_engine, start, slave_target))
+                if slave._group.slave_mode and slave._group.wifidirect:
+                    load += 1
+        _LOGGER.debug(
+            "async_fade_volume: %s -> %s over %ss (%d device(s))",
+            self.entity_id, target, duration, len(followers) + 1,
+        )
+        start = None if self._transport.volume is None else int(self._transport.volume)
+        await self._volume_engine.async_fade_to(
+            start, target, duration, followers=followers, load=load,
+        )
 
     async def async_mute_volume(self, mute) -> None:
         """Mute (true) or unmute (false) the media player."""
         flag = str(int(mute))
-        if not (self._slave_mode and self._multiroom_wifidirect):
+        if not (self._group.slave_mode and self._group.wifidirect):
             cmd = (
                 f"setPlayerCmd:slave_mute:{flag}"
-                if self._is_master
+                if self._group.is_master
                 else f"setPlayerCmd:mute:{flag}"
             )
             value = await self.call_linkplay_httpapi(cmd, None)
         else:
-            value = await self._master.call_linkplay_httpapi(
-                f"multiroom:SlaveVolume:{self._slave_ip}:{flag}", None,
+            value = await self._group.master.call_linkplay_httpapi(
+                f"multiroom:SlaveVolume:{self._group.slave_ip}:{flag}", None,
             )
 
         if value == "OK":
-            self._muted = bool(int(mute))
+            self._transport.muted = bool(int(mute))
         else:
             _LOGGER.warning(
                 "Failed mute/unmute volume. Device: %s, Got response: %s",
@@ -0,0 +1,157 @@
+"""Per-speaker volume command engine.
+
+Every volume change used to be one ``setPlayerCmd:vol:N`` (or, for a
+Wi-Fi-direct slave, one ``multiroom:SlaveVolume`` through the master)
+per request, so a held volume button or a dragged slider queued a
+command per step on a device that handles one request at a time.
+
+:class:`VolumeEngine` sits in front of the entity's
+``_set_volume_on_device`` (which picks the direct or proxied command):
+
+* :meth:`VolumeEngine.async_set` coalesces: a request sent while
+  another is in flight only records its target, last write wins, and
+  the newest target goes out once the device answered, no sooner than
+  ``min_interval`` after the previous command. A lone request is sent
+  straight away.
+* :meth:`VolumeEngine.async_fade_to` ramps to a target over a duration
+  in integer steps, at most one command per ``min_interval``. A new set
+  or fade cancels a running fade. A group master passes its slaves'
+  engines as ``followers``: one loop steps every speaker through its
+  own engine, and the step interval grows with the number of commands
+  per step that reach the master (Wi-Fi-direct slaves are proxied
+  through it). A set or fade on a slave drops it from the group fade.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+
+# Minimum spacing of volume commands to one speaker.
+MIN_COMMAND_INTERVAL = 0.2
+
+Send = Callable[[int, str], Awaitable[None]]
+# One speaker in a fade: its engine, where it starts (None when
+# unknown: it jumps to the target on the first step) and ends.
+Ramp = tuple["VolumeEngine", int | None, int]
+
+
+class VolumeEngine:
+    """Coalesced volume sets and timed fades for one speaker."""
+
+    def __init__(
+        self,
+        send: Send,
+        min_interval: float = MIN_COMMAND_INTERVAL,
+    ) -> None:
+        self._send = send
+        self.min_interval = min_interval
+        self._pending: tuple[int, str] | None = None
+        self._in_flight: int | None = None
+        self._sender: asyncio.Task | None = None
+        self._fade: asyncio.Task | None = None
+        self._last_sent = 0.0
+        # The engine whose group fade steps this one, and the followers
+        # of this engine's own running fade.
+        self._leader: VolumeEngine | None = None
+        self._followers: set[VolumeEngine] = set()
+
+    @property
+    def pending(self) -> int | None:
+        """Newest target not answered yet (queued or in flight), if any."""
+        return self._pending[0] if self._pending is not None else self._in_flight
+
+    async def async_set(self, volume: int, action: str) -> None:
+        """Send ``volume``, or fold it into the command already queued.
+
+        Returns once this target, or one that replaced it, was sent.
+        """
+        self.cancel_fade()
+        self._pending = (volume, action)
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(self._async_drain())
+        await asyncio.shield(self._sender)
+
+    async def _async_drain(self) -> None:
+        while self._pending is not None:
+            wait = self._last_sent + self.min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            volume, action = self._pending
+            self._pending = None
+            self._last_sent = time.monotonic()
+            self._in_flight = volume
+            try:
+                await self._send(volume, action)
+            finally:
+                self._in_flight = None
+
+    async def async_fade_to(
+        self, start: int | None, volume: int, duration: float,
+        *, followers: Sequence[Ramp] = (), load: int = 1,
+    ) -> None:
+        """Ramp from ``start`` to ``volume`` over ``duration`` seconds.
+
+        ``followers`` are stepped in the same loop until they fade or
+        set on their own; ``load`` is the number of commands per step
+        that reach this speaker.
+        """
+        self.cancel_fade()
+        for engine, _, _ in followers:
+            engine.cancel_fade()
+            engine._leader = self
+        self._followers = {engine for engine, _, _ in followers}
+        ramps = [(self, start, volume), *followers]
+        self._fade = asyncio.create_task(self._async_fade(ramps, duration, load))
+        try:
+            await self._fade
+        except asyncio.CancelledError:
+            # Superseded by a newer set / fade; only propagate our own
+            # cancellation.
+            task = asyncio.current_task()
+            if task is not None and task.cancelling():
+                raise
+
+    async def _async_fade(self, ramps: list[Ramp], duration: float, load: int) -> None:
+        span = max((abs(end - start) for _, start, end in ramps if start is not None), default=0)
+        steps = max(1, min(span, int(duration / (self.min_interval * max(1, load)))))
+        interval = duration / steps
+        began = time.monotonic()
+        previous = [start for _, start, _ in ramps]
+        for step in range(1, steps + 1):
+            sends = []
+            for index, (engine, start, end) in enumerate(ramps):
+                if engine is not self and engine not in self._followers:
+                    continue
+                target = end if start is None else start + round((end - start) * step / steps)
+                if target != previous[index]:
+                    sends.append(engine._async_step(target))
+                    previous[index] = target
+            if sends:
+                await asyncio.gather(*sends)
+            # Sleep to the step's slot on the timeline, so slow
+            # responses don't stretch the fade.
+            delay = began + interval * step - time.monotonic()
+            if step < steps and delay > 0:
+                await asyncio.sleep(delay)
+        self._release_followers()
+
+    async def _async_step(self, volume: int) -> None:
+        self._last_sent = time.monotonic()
+        await self._send(volume, "fade volume")
+
+    def cancel_fade(self) -> None:
+        """Stop this speaker's fade, its own or its part in a group fade."""
+        if self._leader is not None:
+            self._leader._followers.discard(self)
+            self._leader = None
+        if self._fade is not None and not self._fade.done():
+            self._fade.cancel()
+        self._fade = None
+        self._release_followers()
+
+    def _release_followers(self) -> None:
+        for engine in self._followers:
+            engine._leader = None
+        self._followers = set()
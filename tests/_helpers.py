@@ -8,7 +8,7 @@ caps, ``async_write_ha_state``, etc.) on the returned instance.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 from homeassistant.const import STATE_IDLE
 
@@ -29,7 +29,7 @@ def make_device(
     state: str = STATE_IDLE,
     hass=None,
 ):
-    """Build a real LinkPlayDevice with the UPnP/aiohttp factories patched out.
+    """Build a real LinkPlayDevice (no I/O happens until it is polled).
 
     Keyword args map straight onto the ``LinkPlayDevice`` constructor so a
     caller only overrides what it cares about (e.g. ``sources=...`` or
@@ -43,23 +43,20 @@ def make_device(
         hass = MagicMock()
         hass.data = {"linkplay": MagicMock(entities=[])}
 
-    with patch("custom_components.linkplay.media_player.AiohttpRequester"), patch(
-        "custom_components.linkplay.media_player.UpnpFactory"
-    ):
-        dev = LinkPlayDevice(
-            name=name,
-            host=host,
-            protocol=protocol,
-            sources=sources,
-            common_sources=common_sources,
-            icecast_metadata=icecast_metadata,
-            multiroom_wifidirect=multiroom_wifidirect,
-            led_off=led_off,
-            volume_step=volume_step,
-            lastfm_api_key=lastfm_api_key,
-            uuid=uuid,
-            state=state,
-        )
+    dev = LinkPlayDevice(
+        name=name,
+        host=host,
+        protocol=protocol,
+        sources=sources,
+        common_sources=common_sources,
+        icecast_metadata=icecast_metadata,
+        multiroom_wifidirect=multiroom_wifidirect,
+        led_off=led_off,
+        volume_step=volume_step,
+        lastfm_api_key=lastfm_api_key,
+        uuid=uuid,
+        state=state,
+    )
     dev.entity_id = f"media_player.{name}"
     dev.hass = hass
     return dev
@@ -23,3 +23,27 @@ def mock_aiohttp_session():
     with patch("custom_components.linkplay.config_flow.async_get_clientsession") as mock:
         yield mock
 
+
+
+@pytest.fixture(autouse=True)
+def _reset_host_registries():
+    """Drop per-host schedulers / circuit breakers / metrics and the shared
+    UPnP factory / Last.fm client between tests.
+
+    Most tests share the ``1.2.3.4`` host, so failures recorded by one
+    test would otherwise open the breaker for the next.
+    """
+    from custom_components.linkplay import (
+        circuit_breaker,
+        lastfm_client,
+        metrics,
+        request_scheduler,
+        upnp_factory,
+    )
+
+    yield
+    circuit_breaker._BREAKERS.clear()
+    metrics._METRICS.clear()
+    request_scheduler._SCHEDULERS.clear()
+    upnp_factory._FACTORY = None
+    lastfm_client._CLIENT = None
@@ -0,0 +1,445 @@
+"""Local LinkPlay device simulator for deterministic I/O and load tests.
+
+Serves the parts of the firmware the integration talks to, on
+localhost, so the real HTTP / UART / UPnP code paths can be exercised
+without hardware:
+
+* HTTPAPI (``/httpapi.asp?command=...``): ``getStatus`` /
+  ``getStatusEx``, ``getPlayerStatus``, ``multiroom:*``,
+  ``setPlayerCmd:*``, ``MCUKeyShortClick:N`` and ``ConnectMasterAp:*``.
+  State is kept per device, so a ``setPlayerCmd:vol:30`` shows up in
+  the next ``getPlayerStatus``.
+* TCP UART (port 8899 on real hardware): echoes ``MCU+...`` commands
+  back in the firmware's framing.
+* UPnP: ``description.xml`` plus AVTransport (``GetMediaInfo``) and
+  PlayQueue (``BrowseQueue``) SCPDs and a SOAP control endpoint.
+
+Every listener binds to an ephemeral port, so dozens of instances can
+run side by side. The integration builds URLs from ``host``, so pass
+``sim.host`` (``127.0.0.1:<port>``) as the device host.
+
+Latency, timeouts and drops are configurable per device and driven by
+a seeded RNG so runs are reproducible::
+
+    async with LinkPlaySimulator(latency=0.02, timeout_rate=0.1, seed=1) as sim:
+        device = make_device(host=sim.host)
+        ...
+
+    async with SimulatorFleet(20) as fleet:
+        hosts = [sim.host for sim in fleet]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass, field
+from xml.sax.saxutils import escape
+
+from aiohttp import web
+
+_UART_HEAD = bytes.fromhex("18 96 18 20")
+_UART_PAD = bytes.fromhex("00 00 00 c1 02 00 00 00 00 00 00 00 00 00 00")
+
+_AV_TRANSPORT = "urn:schemas-upnp-org:service:AVTransport:1"
+_PLAY_QUEUE = "urn:schemas-wiimu-com:service:PlayQueue:1"
+
+_DESCRIPTION_XML = """<?xml version="1.0"?>
+<root xmlns="urn:schemas-upnp-org:device-1-0">
+  <specVersion><major>1</major><minor>0</minor></specVersion>
+  <device>
+    <deviceType>urn:schemas-upnp-org:device:MediaRenderer:1</deviceType>
+    <friendlyName>{name}</friendlyName>
+    <manufacturer>Linkplay Technology Inc.</manufacturer>
+    <modelName>{model}</modelName>
+    <UDN>uuid:{uuid}</UDN>
+    <serviceList>
+      <service>
+        <serviceType>{av}</serviceType>
+        <serviceId>urn:upnp-org:serviceId:AVTransport</serviceId>
+        <SCPDURL>/upnp/AVTransport.xml</SCPDURL>
+        <controlURL>/upnp/control/AVTransport</controlURL>
+        <eventSubURL>/upnp/event/AVTransport</eventSubURL>
+      </service>
+      <service>
+        <serviceType>{pq}</serviceType>
+        <serviceId>urn:wiimu-com:serviceId:PlayQueue</serviceId>
+        <SCPDURL>/upnp/PlayQueue.xml</SCPDURL>
+        <controlURL>/upnp/control/PlayQueue</controlURL>
+        <eventSubURL>/upnp/event/PlayQueue</eventSubURL>
+      </service>
+    </serviceList>
+  </device>
+</root>"""
+
+
+def _scpd(actions: dict[str, tuple[list[str], list[str]]], variables: dict[str, str]) -> str:
+    """Build an SCPD document: ``actions`` maps name -> (in args, out args)."""
+    action_xml = []
+    for name, (args_in, args_out) in actions.items():
+        args = [
+            f"<argument><name>{arg}</name><direction>{direction}</direction>"
+            f"<relatedStateVariable>A_ARG_TYPE_{arg}</relatedStateVariable></argument>"
+            for direction, names in (("in", args_in), ("out", args_out))
+            for arg in names
+        ]
+        action_xml.append(
+            f"<action><name>{name}</name><argumentList>{''.join(args)}</argumentList></action>"
+        )
+    var_xml = [
+        f'<stateVariable sendEvents="no"><name>A_ARG_TYPE_{name}</name>'
+        f"<dataType>{data_type}</dataType></stateVariable>"
+        for name, data_type in variables.items()
+    ]
+    return (
+        '<?xml version="1.0"?><scpd xmlns="urn:schemas-upnp-org:service-1-0">'
+        "<specVersion><major>1</major><minor>0</minor></specVersion>"
+        f"<actionList>{''.join(action_xml)}</actionList>"
+        f"<serviceStateTable>{''.join(var_xml)}</serviceStateTable></scpd>"
+    )
+
+
+_AV_TRANSPORT_SCPD = _scpd(
+    {"GetMediaInfo": (["InstanceID"], ["CurrentURI", "CurrentURIMetaData", "TrackSource"])},
+    {"InstanceID": "ui4", "CurrentURI": "string", "CurrentURIMetaData": "string", "TrackSource": "string"},
+)
+_PLAY_QUEUE_SCPD = _scpd(
+    {"BrowseQueue": (["QueueName"], ["QueueContext"])},
+    {"QueueName": "string", "QueueContext": "string"},
+)
+
+
+def _hexstr(value: str) -> str:
+    return value.encode("utf-8").hex().upper()
+
+
+@dataclass
+class DeviceState:
+    """Mutable firmware state behind one simulated speaker."""
+
+    name: str = "Simulated Speaker"
+    uuid: str = "FF31F09E00000000000000000000SIM0"
+    firmware: str = "4.6.415145"
+    mcu_ver: str = "1"
+    hardware: str = "A31"
+    preset_key: int = 6
+    ssid: str = "SimSpeaker"
+    wifi_channel: int = 6
+    mode: str = "10"
+    status: str = "stop"
+    vol: int = 30
+    mute: int = 0
+    eq: str = "0"
+    loop: str = "0"
+    curpos: int = 0
+    totlen: int = 0
+    title: str = ""
+    artist: str = ""
+    album: str = ""
+    uri: str = ""
+    group_type: str = "0"
+    slaves: list[dict] = field(default_factory=list)
+    media_metadata: str = ""
+    usb_tracks: list[str] = field(default_factory=list)
+
+    def status_payload(self) -> dict:
+        return {
+            "uuid": self.uuid,
+            "DeviceName": self.name,
+            "firmware": self.firmware,
+            "hardware": self.hardware,
+            "mcu_ver": self.mcu_ver,
+            "preset_key": str(self.preset_key),
+            "ssid": self.ssid,
+            "WifiChannel": str(self.wifi_channel),
+        }
+
+    def player_status_payload(self) -> dict:
+        return {
+            "type": self.group_type,
+            "ch": "0",
+            "mode": self.mode,
+            "loop": self.loop,
+            "eq": self.eq,
+            "status": self.status,
+            "curpos": str(self.curpos),
+            "offset_pts": "0",
+            "totlen": str(self.totlen),
+            "Title": _hexstr(self.title),
+            "Artist": _hexstr(self.artist),
+            "Album": _hexstr(self.album),
+            "uri": _hexstr(self.uri),
+            "alarmflag": "0",
+            "plicount": str(len(self.usb_tracks)),
+            "plicurr": "0",
+            "vol": str(self.vol),
+            "mute": str(self.mute),
+        }
+
+    def slave_list_payload(self) -> dict:
+        return {"slaves": len(self.slaves), "slave_list": list(self.slaves)}
+
+
+class LinkPlaySimulator:
+    """One simulated speaker: HTTPAPI + UPnP on one port, UART on another.
+
+    ``latency`` (seconds, plus up to ``jitter``) delays every HTTP
+    answer. ``timeout_rate`` is the share of requests that never answer
+    within ``hang``; ``drop_rate`` the share whose connection is closed
+    without a response. ``close_connections`` sends ``Connection:
+    close`` like much of the real firmware.
+    """
+
+    def __init__(
+        self,
+        state: DeviceState | None = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        timeout_rate: float = 0.0,
+        drop_rate: float = 0.0,
+        hang: float = 30.0,
+        close_connections: bool = False,
+        seed: int | None = None,
+    ) -> None:
+        self.state = state or DeviceState()
+        self.latency = latency
+        self.jitter = jitter
+        self.timeout_rate = timeout_rate
+        self.drop_rate = drop_rate
+        self.hang = hang
+        self.close_connections = close_connections
+        self.requests: list[str] = []
+        self.uart_commands: list[str] = []
+        self._rng = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+        self._uart: asyncio.base_events.Server | None = None
+        self.port = 0
+        self.uart_port = 0
+
+    @property
+    def host(self) -> str:
+        """``host:port`` to hand to the integration as the device host."""
+        return f"127.0.0.1:{self.port}"
+
+    @property
+    def description_url(self) -> str:
+        return f"http://{self.host}/description.xml"
+
+    async def start(self) -> LinkPlaySimulator:
+        app = web.Application()
+        app.router.add_get("/httpapi.asp", self._handle_httpapi)
+        app.router.add_get("/description.xml", self._handle_description)
+        app.router.add_get("/upnp/AVTransport.xml", self._handle_scpd(_AV_TRANSPORT_SCPD))
+        app.router.add_get("/upnp/PlayQueue.xml", self._handle_scpd(_PLAY_QUEUE_SCPD))
+        app.router.add_post("/upnp/control/{service}", self._handle_soap)
+        self._runner = web.AppRunner(app, access_log=None, handle_signals=False)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+        self._uart = await asyncio.start_server(self._handle_uart, "127.0.0.1", 0)
+        self.uart_port = self._uart.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self) -> None:
+        if self._uart is not None:
+            self._uart.close()
+            await self._uart.wait_closed()
+            self._uart = None
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> LinkPlaySimulator:
+        return await self.start()
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    # ---- fault injection ----
+
+    async def _misbehave(self, request: web.Request) -> bool:
+        """Apply latency / timeout / drop. True when the request was dropped."""
+        delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+        roll = self._rng.random()
+        if roll < self.timeout_rate:
+            delay = self.hang
+        elif roll < self.timeout_rate + self.drop_rate:
+            if request.transport is not None:
+                request.transport.close()
+            return True
+        if delay:
+            await asyncio.sleep(delay)
+        return False
+
+    def _response(self, text: str, content_type: str = "text/html") -> web.Response:
+        headers = {"Connection": "close"} if self.close_connections else None
+        return web.Response(text=text, content_type=content_type, headers=headers)
+
+    # ---- HTTPAPI ----
+
+    async def _handle_httpapi(self, request: web.Request) -> web.StreamResponse:
+        command = request.query.get("command", "")
+        self.requests.append(command)
+        if await self._misbehave(request):
+            return web.Response(status=499)
+        return self._response(self.handle_command(command))
+
+    def handle_command(self, command: str) -> str:
+        """Apply ``command`` to the device state and return the raw body."""
+        state = self.state
+        if command in ("getStatus", "getStatusEx"):
+            return json.dumps(state.status_payload())
+        if command == "getPlayerStatus":
+            return json.dumps(state.player_status_payload())
+        if command == "multiroom:getSlaveList":
+            return json.dumps(state.slave_list_payload())
+        if command == "multiroom:Ungroup":
+            state.slaves.clear()
+            state.group_type = "0"
+            return "OK"
+        if command.startswith("multiroom:SlaveKickout:"):
+            ip = command.rsplit(":", 1)[1]
+            state.slaves[:] = [s for s in state.slaves if s.get("ip") != ip]
+            return "OK"
+        if command.startswith("multiroom:SlaveVolume:"):
+            _, _, ip, vol = command.split(":")
+            for slave in state.slaves:
+                if slave.get("ip") == ip:
+                    slave["volume"] = int(vol)
+            return "OK"
+        if command.startswith("ConnectMasterAp:"):
+            state.group_type = "1"
+            return "OK"
+        if command.startswith("MCUKeyShortClick:"):
+            state.mode = "10"
+            state.status = "play"
+            return "OK"
+        if command.startswith("setPlayerCmd:"):
+            return self._handle_player_cmd(command.removeprefix("setPlayerCmd:"))
+        return "unknown command"
+
+    def _handle_player_cmd(self, cmd: str) -> str:
+        state = self.state
+        name, _, arg = cmd.partition(":")
+        if name in ("pause", "resume", "stop"):
+            state.status = {"pause": "pause", "resume": "play", "stop": "stop"}[name]
+        elif name == "play":
+            state.status = "play"
+            if arg:
+                state.mode = "10"
+                state.uri = arg
+        elif name in ("vol", "slave_vol"):
+            state.vol = max(0, min(100, int(arg)))
+        elif name in ("mute", "slave_mute"):
+            state.mute = int(arg)
+        elif name == "switchmode":
+            state.mode = {"wifi": "10", "line-in": "40", "bluetooth": "41", "optical": "43"}.get(arg, state.mode)
+        elif name == "equalizer":
+            state.eq = arg
+        elif name == "loopmode":
+            state.loop = arg
+        elif name == "seek":
+            state.curpos = int(arg) * 1000
+        elif name == "playLocalList":
+            state.mode = "11"
+            state.status = "play"
+        elif name not in ("next", "prev"):
+            return "unknown command"
+        return "OK"
+
+    # ---- UPnP ----
+
+    async def _handle_description(self, request: web.Request) -> web.Response:
+        if await self._misbehave(request):
+            return web.Response(status=499)
+        state = self.state
+        body = _DESCRIPTION_XML.format(
+            name=escape(state.name), model=escape(state.hardware), uuid=state.uuid,
+            av=_AV_TRANSPORT, pq=_PLAY_QUEUE,
+        )
+        return self._response(body, "text/xml")
+
+    def _handle_scpd(self, body: str):
+        async def _handler(request: web.Request) -> web.Response:
+            return self._response(body, "text/xml")
+        return _handler
+
+    async def _handle_soap(self, request: web.Request) -> web.Response:
+        action = request.headers.get("SOAPACTION", "").strip('"').rsplit("#", 1)[-1]
+        await request.read()
+        if await self._misbehave(request):
+            return web.Response(status=499)
+        service = _AV_TRANSPORT if request.match_info["service"] == "AVTransport" else _PLAY_QUEUE
+        if action == "GetMediaInfo":
+            out = {
+                "CurrentURI": self.state.uri,
+                "CurrentURIMetaData": self.state.media_metadata,
+                "TrackSource": self.state.uri,
+            }
+        elif action == "BrowseQueue":
+            out = {"QueueContext": self._queue_context()}
+        else:
+            return web.Response(status=500)
+        args = "".join(f"<{k}>{escape(v)}</{k}>" for k, v in out.items())
+        body = (
+            '<?xml version="1.0"?><s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" '
+            's:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/"><s:Body>'
+            f'<u:{action}Response xmlns:u="{service}">{args}</u:{action}Response>'
+            "</s:Body></s:Envelope>"
+        )
+        return self._response(body, "text/xml")
+
+    def _queue_context(self) -> str:
+        tracks = "".join(
+            f"<Track{i}><URL>/media/sda1/{escape(t)}</URL></Track{i}>"
+            for i, t in enumerate(self.state.usb_tracks, start=1)
+        )
+        return f"<PlayList><ListName>USBDiskQueue</ListName><Tracks>{tracks}</Tracks></PlayList>"
+
+    # ---- TCP UART ----
+
+    async def _handle_uart(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            data = await reader.read(1024)
+            command = data[len(_UART_HEAD) + 1 + len(_UART_PAD):].decode("ascii", "replace")
+            self.uart_commands.append(command)
+            reply = command.encode() + b"\n"
+            writer.write(_UART_HEAD + bytes([len(reply)]) + _UART_PAD + reply)
+            await writer.drain()
+        finally:
+            writer.close()
+
+
+class SimulatorFleet:
+    """``count`` independent simulators started and stopped together."""
+
+    def __init__(self, count: int, **kwargs) -> None:
+        seed = kwargs.pop("seed", None)
+        self.devices = [
+            LinkPlaySimulator(
+                DeviceState(name=f"Speaker {i}", uuid=f"FF31F09E{i:024X}"),
+                seed=None if seed is None else seed + i,
+                **kwargs,
+            )
+            for i in range(count)
+        ]
+
+    def __iter__(self):
+        return iter(self.devices)
+
+    def __len__(self) -> int:
+        return len(self.devices)
+
+    def __getitem__(self, index: int) -> LinkPlaySimulator:
+        return self.devices[index]
+
+    async def __aenter__(self) -> SimulatorFleet:
+        await asyncio.gather(*(device.start() for device in self.devices))
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await asyncio.gather(*(device.stop() for device in self.devices))
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import contextlib
 from http import HTTPStatus
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
 
-from custom_components.linkplay.api_client_mixin import LinkPlayAPIClientMixin
+from custom_components.linkplay.api_client_mixin import LinkPlayAPIClientMixin, preset_applied
+from custom_components.linkplay.circuit_breaker import get_circuit_breaker
+from custom_components.linkplay.metrics import ERROR_CLIENT, ERROR_PARSE, ERROR_TIMEOUT, get_metrics
+from custom_components.linkplay.request_scheduler import PRIORITY_USER
+from custom_components.linkplay.state import GroupState, MediaMetadata, PlaybackFlags, TransportState
 
 
 class _FakeDevice(LinkPlayAPIClientMixin):
@@ -16,6 +21,9 @@ class _FakeDevice(LinkPlayAPIClientMixin):
     methods read so we can exercise the transport layer in isolation."""
 
     def __init__(self, *, protocol: str | None = "http") -> None:
+        self._transport = TransportState()
+        self._meta = MediaMetadata()
+        self._group = GroupState()
         self.hass = MagicMock()
         self.hass.async_add_executor_job = AsyncMock()
         self.entity_id = "media_player.fake"
@@ -24,38 +32,44 @@ class _FakeDevice(LinkPlayAPIClientMixin):
         self._protocol = protocol
         self._first_update = False
         # Fields async_get_status mutates on failure:
-        self._state = "playing"
+        self._transport.state = "playing"
         self._unav_throttle = False
-        self._wait_for_mcu = 1
-        self._playhead_position = 1
-        self._duration = 1
-        self._position_updated_at = "x"
-        self._media_title = "x"
-        self._media_artist = "x"
-        self._media_album = "x"
-        self._media_image_url = "x"
-        self._media_uri = "x"
-        self._media_uri_final = "x"
-        self._media_source_uri = "x"
-        self._playing_mediabrowser = True
-        self._playing_stream = True
-        self._icecast_name = "x"
-        self._source = "x"
+        self._transport.playhead_position = 1
+        self._transport.duration = 1
+        self._transport.position_updated_at = "x"
+        self._meta.title = "x"
+        self._meta.artist = "x"
+        self._meta.album = "x"
+        self._meta.image_url = "x"
+        self._meta.uri = "x"
+        self._meta.uri_final = "x"
+        self._meta.source_uri = "x"
+        self._playing = PlaybackFlags()
+        self._playing.mediabrowser = True
+        self._playing.stream = True
+        self._meta.icecast_name = "x"
+        self._transport.source = "x"
         self._upnp_device = "x"
-        self._slave_mode = True
-        self._is_master = True
+        self._group.slave_mode = True
+        self._group.is_master = True
         self._player_statdata = {"vol": 50}
 
 
 def _session_with(get_mock: AsyncMock):
+    """A session whose ``get()`` enters to what ``get_mock`` returns or raises."""
+
+    @contextlib.asynccontextmanager
+    async def _get(*args, **kwargs):
+        yield await get_mock(*args, **kwargs)
+
     session = MagicMock()
-    session.get = get_mock
+    session.get = _get
     return session
 
 
 def _patch_session(session):
     return patch(
-        "custom_components.linkplay.api_client_mixin.async_get_clientsession",
+        "custom_components.linkplay.api_client_mixin.async_get_linkplay_session",
         return_value=session,
     )
 
@@ -122,6 +136,24 @@ class TestCallLinkplayHttpapi:
         with _patch_session(_session_with(AsyncMock(return_value=response))):
             assert await dev.call_linkplay_httpapi("noop", None) is False
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("error", "kind"),
+        [
+            (TimeoutError(), ERROR_TIMEOUT),
+            (aiohttp.ClientPayloadError(), ERROR_CLIENT),
+            (ValueError("not json"), ERROR_PARSE),
+        ],
+    )
+    async def test_body_read_errors_count_as_failures(self, error, kind) -> None:
+        dev = _FakeDevice()
+        response = MagicMock(status=HTTPStatus.OK)
+        response.json = AsyncMock(side_effect=error)
+        with _patch_session(_session_with(AsyncMock(return_value=response))):
+            assert await dev.call_linkplay_httpapi("getPlayerStatus", True) is False
+        assert get_metrics(dev._host).error_counts() == {kind: 1}
+        assert get_circuit_breaker(dev._host)._failures == 1
+
     @pytest.mark.asyncio
     async def test_explicit_protocol_overrides_self(self) -> None:
         dev = _FakeDevice(protocol="http")
@@ -174,7 +206,7 @@ class TestAsyncGetStatus:
         ):
             await dev.async_get_status.__wrapped__(dev)
         assert dev._player_statdata == payload
-        assert dev._state == "playing"  # untouched on success
+        assert dev._transport.state == "playing"  # untouched on success
 
     @pytest.mark.asyncio
     async def test_failure_marks_unavailable_and_clears_state(self) -> None:
@@ -185,11 +217,49 @@ class TestAsyncGetStatus:
             new=AsyncMock(return_value=False),
         ):
             await dev.async_get_status.__wrapped__(dev)
-        assert dev._state == "unavailable"
+        assert dev._transport.state == "unavailable"
         assert dev._unav_throttle is True
-        assert dev._media_title is None
-        assert dev._media_artist is None
+        assert dev._meta.title is None
+        assert dev._meta.artist is None
         assert dev._upnp_device is None
-        assert dev._slave_mode is False
-        assert dev._is_master is False
+        assert dev._group.slave_mode is False
+        assert dev._group.is_master is False
         assert dev._player_statdata is None
+
+
+class TestWaitForStatus:
+    @pytest.mark.asyncio
+    async def test_returns_first_status_meeting_the_condition(self) -> None:
+        dev = _FakeDevice()
+        dev.call_linkplay_httpapi = AsyncMock(
+            side_effect=[False, {"status": "load"}, {"status": "play"}],
+        )
+        with patch("custom_components.linkplay.api_client_mixin.asyncio.sleep", new=AsyncMock()) as sleep:
+            status = await dev.async_wait_for_status(lambda s: s["status"] == "play", 5)
+        assert status == {"status": "play"}
+        assert [c.args[0] for c in sleep.await_args_list] == [0.1, 0.2]
+        assert dev.call_linkplay_httpapi.await_args.kwargs["priority"] == PRIORITY_USER
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_last_status(self) -> None:
+        dev = _FakeDevice()
+        dev.call_linkplay_httpapi = AsyncMock(return_value={"status": "load"})
+        status = await dev.async_wait_for_status(lambda s: False, 0)
+        assert status == {"status": "load"}
+        dev.call_linkplay_httpapi.assert_awaited_once()
+
+
+class TestPresetApplied:
+    def test_input_change_needs_settled_volume(self) -> None:
+        before = {"mode": "10", "uri": "a", "Title": "x", "vol": "20"}
+        applied = preset_applied(before)
+        line_in = {**before, "mode": "40", "uri": "", "Title": ""}
+        assert applied(line_in) is False
+        assert applied(line_in) is True
+        unchanged = preset_applied(before)
+        assert unchanged(before) is False
+        assert unchanged(before) is False
+
+    def test_volume_change_is_immediate(self) -> None:
+        before = {"mode": "10", "vol": "20"}
+        assert preset_applied(before)({**before, "vol": "35"}) is True
@@ -40,7 +40,7 @@ class TestPollMultiroomMasterStatus:
     @pytest.mark.asyncio
     async def test_slave_short_circuits_without_http(self) -> None:
         slave = _make_device("slave")
-        slave._slave_mode = True
+        slave._group.slave_mode = True
         slave.call_linkplay_httpapi = AsyncMock(
             side_effect=AssertionError("slaves must not query getSlaveList")
         )
@@ -52,51 +52,51 @@ class TestPollMultiroomMasterStatus:
     @pytest.mark.asyncio
     async def test_api_failure_clears_master_state(self) -> None:
         master = _make_device("master")
-        master._is_master = True
-        master._slave_list = [{"name": "x"}]
-        master._multiroom_group = ["media_player.master", "media_player.slave"]
+        master._group.is_master = True
+        master._group.slave_list = [{"name": "x"}]
+        master._group.members = ["media_player.master", "media_player.slave"]
         master.call_linkplay_httpapi = AsyncMock(return_value=None)
 
         # A single failed poll is debounced: the group survives in case
         # the firmware is merely flapping mid preset / source switch.
         await master._async_poll_multiroom_master_status()
-        assert master._is_master is True
-        assert master._multiroom_group == ["media_player.master", "media_player.slave"]
+        assert master._group.is_master is True
+        assert master._group.members == ["media_player.master", "media_player.slave"]
 
         # A second consecutive failure crosses the teardown threshold.
         await master._async_poll_multiroom_master_status()
-        assert master._is_master is False
-        assert master._slave_list is None
-        assert master._multiroom_group == []
+        assert master._group.is_master is False
+        assert master._group.slave_list is None
+        assert master._group.members == []
 
     @pytest.mark.asyncio
     async def test_zero_slaves_resets_group_and_drops_master_flag(self) -> None:
         master = _make_device("master")
-        master._is_master = True
-        master._multiroom_group = ["media_player.master"]
+        master._group.is_master = True
+        master._group.members = ["media_player.master"]
         master.call_linkplay_httpapi = AsyncMock(return_value={"slaves": 0, "slave_list": []})
 
         # First zero-slaves poll is debounced; second tears the group down.
         await master._async_poll_multiroom_master_status()
-        assert master._is_master is True
+        assert master._group.is_master is True
 
         await master._async_poll_multiroom_master_status()
-        assert master._is_master is False
-        assert master._multiroom_group == []
-        assert master._slave_list == []
+        assert master._group.is_master is False
+        assert master._group.members == []
+        assert master._group.slave_list == []
 
     @pytest.mark.asyncio
     async def test_zero_slaves_debounced_then_recovers(self) -> None:
         """A lone zero-slaves flap must not orphan an intact group."""
         master = _make_device("master")
-        master._is_master = True
-        master._multiroom_group = ["media_player.master", "media_player.slave"]
+        master._group.is_master = True
+        master._group.members = ["media_player.master", "media_player.slave"]
 
         # One transient zero-slaves report...
         master.call_linkplay_httpapi = AsyncMock(return_value={"slaves": 0, "slave_list": []})
         await master._async_poll_multiroom_master_status()
-        assert master._is_master is True
-        assert master._multiroom_group == ["media_player.master", "media_player.slave"]
+        assert master._group.is_master is True
+        assert master._group.members == ["media_player.master", "media_player.slave"]
 
         # ...followed by a poll that confirms slaves resets the counter,
         # so a later single zero is debounced again rather than tearing
@@ -105,11 +105,11 @@ class TestPollMultiroomMasterStatus:
             return_value={"slaves": 1, "slave_list": []}
         )
         await master._async_poll_multiroom_master_status()
-        assert master._slave_zero_polls == 0
+        assert master._group.zero_polls == 0
 
         master.call_linkplay_httpapi = AsyncMock(return_value={"slaves": 0, "slave_list": []})
         await master._async_poll_multiroom_master_status()
-        assert master._is_master is True
+        assert master._group.is_master is True
 
     @pytest.mark.asyncio
     async def test_master_populates_group_and_pushes_to_slaves(self) -> None:
@@ -136,17 +136,17 @@ class TestPollMultiroomMasterStatus:
 
         await master._async_poll_multiroom_master_status()
 
-        assert master._is_master is True
-        assert master._multiroom_group == [
+        assert master._group.is_master is True
+        assert master._group.members == [
             "media_player.master",
             "media_player.kitchen",
             "media_player.office",
         ]
-        assert slave_kitchen._slave_mode is True
-        assert slave_office._slave_mode is True
-        assert slave_kitchen._master is master
-        assert slave_kitchen._multiroom_group == master._multiroom_group
-        assert slave_office._multiroom_group == master._multiroom_group
+        assert slave_kitchen._group.slave_mode is True
+        assert slave_office._group.slave_mode is True
+        assert slave_kitchen._group.master is master
+        assert slave_kitchen._group.members == master._group.members
+        assert slave_office._group.members == master._group.members
 
     @pytest.mark.asyncio
     async def test_unmatched_slave_name_is_silently_skipped(self) -> None:
@@ -166,12 +166,12 @@ class TestPollMultiroomMasterStatus:
 
         await master._async_poll_multiroom_master_status()
 
-        assert master._multiroom_group == ["media_player.master"]
-        assert stranger._slave_mode is False
+        assert master._group.members == ["media_player.master"]
+        assert stranger._group.slave_mode is False
 
 
 class TestUnjoinWaitWindow:
-    """async_update returns early while _multiroom_unjoinat is within the
+    """async_update returns early while _group.unjoinat is within the
     wait window — the device firmware needs time after Ungroup before its
     status response is reliable again.
     """
@@ -181,8 +181,8 @@ class TestUnjoinWaitWindow:
         from homeassistant.util.dt import utcnow
 
         dev = _make_device("device")
-        dev._multiroom_unjoinat = utcnow()  # just now
-        dev._multiroom_wifidirect = False  # router mode -> 3s wait window
+        dev._group.unjoinat = utcnow()  # just now
+        dev._group.wifidirect = False  # router mode -> 3s wait window
         dev.call_linkplay_httpapi = AsyncMock(
             side_effect=AssertionError("update should short-circuit in wait window")
         )
@@ -190,26 +190,26 @@ class TestUnjoinWaitWindow:
         result = await dev.async_update()
 
         assert result is True
-        assert dev._source is None
-        assert dev._media_title is None
-        assert dev._media_artist is None
-        assert dev._state == "idle"
+        assert dev._transport.source is None
+        assert dev._meta.title is None
+        assert dev._meta.artist is None
+        assert dev._transport.state == "idle"
 
     @pytest.mark.asyncio
     async def test_outside_wait_window_restores_previous_source(self) -> None:
         from homeassistant.util.dt import utcnow
 
         dev = _make_device("device")
-        dev._multiroom_unjoinat = utcnow() - timedelta(minutes=5)  # long ago
-        dev._multiroom_wifidirect = False
-        dev._multiroom_prevsrc = "Line-in"
+        dev._group.unjoinat = utcnow() - timedelta(minutes=5)  # long ago
+        dev._group.wifidirect = False
+        dev._group.prevsrc = "Line-in"
         dev.async_select_source = AsyncMock()
 
         result = await dev.async_update()
 
         assert result is True
-        assert dev._multiroom_unjoinat is None
-        assert dev._multiroom_prevsrc is None
+        assert dev._group.unjoinat is None
+        assert dev._group.prevsrc is None
         dev.async_select_source.assert_awaited_once_with("Line-in")
 
 
@@ -293,11 +293,11 @@ class TestPlayerStatusBranches:
             timedelta(seconds=0),
         )
         dev._first_update = False
-        dev._idletime_updated_at = utcnow() - timedelta(minutes=1)
+        dev._transport.idletime_updated_at = utcnow() - timedelta(minutes=1)
         self._prep(dev, _idle_payload())
         await dev.async_update()
-        assert dev._state == "idle"
-        assert dev._volume == "30"
+        assert dev._transport.state == "idle"
+        assert dev._transport.volume == "30"
 
     @pytest.mark.asyncio
     async def test_playing_stream_payload(self) -> None:
@@ -305,9 +305,9 @@ class TestPlayerStatusBranches:
         dev._first_update = False
         self._prep(dev, _stream_payload())
         await dev.async_update()
-        assert dev._state == "playing"
-        assert dev._playing_stream is True
-        assert dev._media_uri_final.startswith("http://stream/")
+        assert dev._transport.state == "playing"
+        assert dev._playing.stream is True
+        assert dev._meta.uri_final.startswith("http://stream/")
 
     @pytest.mark.asyncio
     async def test_localfile_paused_payload(self) -> None:
@@ -317,9 +317,9 @@ class TestPlayerStatusBranches:
         payload["status"] = "pause"
         self._prep(dev, payload)
         await dev.async_update()
-        assert dev._state == "paused"
-        assert dev._duration == 180
-        assert dev._playhead_position == 30
+        assert dev._transport.state == "paused"
+        assert dev._transport.duration == 180
+        assert dev._transport.playhead_position == 30
 
     @pytest.mark.asyncio
     async def test_spotify_payload_marks_playing_spotify(self) -> None:
@@ -327,8 +327,8 @@ class TestPlayerStatusBranches:
         dev._first_update = False
         self._prep(dev, _spotify_payload())
         await dev.async_update()
-        assert dev._playing_spotify is True
-        assert dev._state == "playing"
+        assert dev._playing.spotify is True
+        assert dev._transport.state == "playing"
 
     @pytest.mark.asyncio
     async def test_first_update_populates_device_info(self) -> None:
@@ -0,0 +1,39 @@
+"""Smoke tests so the update-loop benchmark keeps working as the code evolves."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.bench_update_loop import SCENARIOS, _load_fixtures, compare, measure
+
+
+class TestBenchUpdateLoop:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("scenario", list(SCENARIOS))
+    async def test_measure_reports_every_metric(self, scenario: str) -> None:
+        result = await measure(scenario, 3, polls=1)
+        assert set(result) == {"cpu_ms", "peak_kib", "coroutines"}
+        assert result["coroutines"] > 0
+
+    @pytest.mark.asyncio
+    async def test_group_sync_mirrors_onto_slaves(self) -> None:
+        poll = SCENARIOS["group_sync"](3, _load_fixtures())
+        await poll()
+        await poll()
+        # The coroutine count alone would not catch a broken fixture, so
+        # check the slaves really went through the master mirror path.
+        master = poll.entities[0]
+        assert master._group.is_master is True
+        assert len(master._group.slave_list) == 2
+        assert all(slave._group.slave_mode for slave in master._group.slave_list)
+
+    def test_compare_flags_regressions(self) -> None:
+        baseline = {"update/5": {"cpu_ms": 1.0, "peak_kib": 10.0, "coroutines": 40.0}}
+        within = {"update/5": {"cpu_ms": 1.2, "peak_kib": 10.0, "coroutines": 40.0}}
+        assert compare(within, baseline, 0.25) == []
+
+        worse = {"update/5": {"cpu_ms": 1.3, "peak_kib": 10.0, "coroutines": 41.0}}
+        assert compare(worse, baseline, 0.25) == [
+            "update/5 cpu_ms: 1.3 > baseline 1.0",
+            "update/5 coroutines: 41.0 > baseline 40.0",
+        ]
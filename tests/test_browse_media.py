@@ -13,6 +13,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from custom_components.linkplay.source_catalog import SourceCatalog
 from tests._helpers import make_device
 
 if TYPE_CHECKING:
@@ -43,7 +44,7 @@ class TestBrowseMedia:
     @pytest.mark.asyncio
     async def test_root_with_udisk_appends_usb_folder(self) -> None:
         dev = _make_device()
-        dev._source_list = {"udisk": "USB stick", "line-in": "Line-in"}
+        dev._sources = SourceCatalog({"udisk": "USB stick", "line-in": "Line-in"})
         dev._trackq = ["Track 1.mp3", "Track 2.mp3", "Track 3.mp3"]
 
         with patch(
@@ -61,7 +62,7 @@ class TestBrowseMedia:
     @pytest.mark.asyncio
     async def test_root_without_udisk_returns_ha_sources_only(self) -> None:
         dev = _make_device()
-        dev._source_list = {"line-in": "Line-in"}
+        dev._sources = SourceCatalog({"line-in": "Line-in"})
         dev._trackq = []
 
         with patch(
@@ -75,7 +76,7 @@ class TestBrowseMedia:
     @pytest.mark.asyncio
     async def test_root_with_udisk_but_no_tracks_returns_ha_only(self) -> None:
         dev = _make_device()
-        dev._source_list = {"udisk": "USB stick"}
+        dev._sources = SourceCatalog({"udisk": "USB stick"})
         dev._trackq = []
 
         with patch(
@@ -89,7 +90,7 @@ class TestBrowseMedia:
     @pytest.mark.asyncio
     async def test_expanding_udisk_folder_returns_tracks(self) -> None:
         dev = _make_device()
-        dev._source_list = {"udisk": "USB stick"}
+        dev._sources = SourceCatalog({"udisk": "USB stick"})
         dev._trackq = ["Track 1.mp3", "Track 2.mp3"]
 
         result = await dev.async_browse_media(media_content_id="linkplay_udisk")
@@ -110,7 +111,7 @@ class TestBrowseMedia:
         recursion into HA's media-source tree.
         """
         dev = _make_device()
-        dev._source_list = {"udisk": "USB stick"}
+        dev._sources = SourceCatalog({"udisk": "USB stick"})
         dev._trackq = ["Track.mp3"]
 
         ha_payload = _ha_source_stub()
@@ -124,3 +125,45 @@ class TestBrowseMedia:
 
         assert result is ha_payload
         assert result.children == []
+
+    @pytest.mark.asyncio
+    async def test_udisk_folders_are_browsed_level_by_level(self) -> None:
+        dev = _make_device()
+        dev._sources = SourceCatalog({"udisk": "USB stick"})
+        dev._trackq = ["Jazz/Blue.mp3", "Intro.mp3", "Jazz/Live/Set 1.mp3"]
+
+        root = await dev.async_browse_media(media_content_id="linkplay_udisk")
+        assert [(c.title, c.media_content_id) for c in root.children] == [
+            ("Jazz", "linkplay_udisk/0/Jazz"), ("Intro.mp3", "2"),
+        ]
+
+        jazz = await dev.async_browse_media(media_content_id="linkplay_udisk/0/Jazz")
+        assert jazz.title == "Jazz"
+        assert [(c.title, c.media_content_id) for c in jazz.children] == [
+            ("Live", "linkplay_udisk/0/Jazz/Live"), ("Blue.mp3", "1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_large_udisk_folder_is_paged(self) -> None:
+        dev = _make_device()
+        dev._sources = SourceCatalog({"udisk": "USB stick"})
+        dev._USB_DISK_PAGE_SIZE = 3
+        dev._trackq = ["A/x.mp3", "B/y.mp3"] + [f"{n}.mp3" for n in range(4)]
+
+        first = await dev.async_browse_media(media_content_id="linkplay_udisk")
+        assert [c.title for c in first.children] == ["A", "B", "0.mp3", "More…"]
+        assert first.children[-1].media_content_id == "linkplay_udisk/1/"
+
+        second = await dev.async_browse_media(media_content_id="linkplay_udisk/1/")
+        assert [c.media_content_id for c in second.children] == ["4", "5", "6"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_udisk_folder_raises(self) -> None:
+        from homeassistant.components.media_player.errors import BrowseError
+
+        dev = _make_device()
+        dev._sources = SourceCatalog({"udisk": "USB stick"})
+        dev._trackq = ["Track.mp3"]
+
+        with pytest.raises(BrowseError):
+            await dev.async_browse_media(media_content_id="linkplay_udisk/0/Gone")
@@ -0,0 +1,192 @@
+"""Tests for the per-host circuit breaker and its HTTPAPI wiring."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from custom_components.linkplay.circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    LinkPlayCircuitBreaker,
+    get_circuit_breaker,
+)
+from custom_components.linkplay.request_scheduler import get_request_scheduler
+from tests._helpers import make_device
+from tests.test_api_client import _FakeDevice, _patch_session, _session_with
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: _Clock) -> LinkPlayCircuitBreaker:
+    return LinkPlayCircuitBreaker(
+        failure_threshold=2, base_backoff=5.0, max_backoff=20.0, clock=clock,
+    )
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self) -> None:
+        breaker = _breaker(_Clock())
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+        breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        assert breaker.allow_request() is False
+
+    def test_success_resets_failure_count(self) -> None:
+        breaker = _breaker(_Clock())
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == STATE_CLOSED
+
+    def test_half_open_allows_single_probe(self) -> None:
+        clock = _Clock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        clock.now += 5.0
+        assert breaker.state == STATE_HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False
+
+        breaker.record_success()
+        assert breaker.state == STATE_CLOSED
+        assert breaker.allow_request() is True
+
+    def test_failed_probe_backs_off_exponentially(self) -> None:
+        clock = _Clock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.retry_in == pytest.approx(5.0)
+
+        for expected in (10.0, 20.0, 20.0):
+            clock.now += breaker.retry_in
+            assert breaker.allow_request() is True
+            breaker.record_failure()
+            assert breaker.state == STATE_OPEN
+            assert breaker.retry_in == pytest.approx(expected)
+
+    def test_released_probe_can_be_retried(self) -> None:
+        clock = _Clock()
+        breaker = _breaker(clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 5.0
+        assert breaker.allow_request() is True
+        breaker.release_probe()
+        assert breaker.allow_request() is True
+
+    def test_late_failures_do_not_extend_backoff(self) -> None:
+        breaker = _breaker(_Clock())
+        for _ in range(6):
+            breaker.record_failure()
+        assert breaker.state == STATE_OPEN
+        assert breaker.retry_in == pytest.approx(5.0)
+        assert breaker._trips == 1
+
+    def test_one_breaker_per_host(self) -> None:
+        assert get_circuit_breaker("10.0.0.1") is get_circuit_breaker("10.0.0.1")
+        assert get_circuit_breaker("10.0.0.1") is not get_circuit_breaker("10.0.0.2")
+
+
+class TestHttpapiWiring:
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast(self) -> None:
+        dev = _FakeDevice()
+        breaker = get_circuit_breaker(dev._host)
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        get = AsyncMock()
+
+        with _patch_session(_session_with(get)):
+            assert await dev.call_linkplay_httpapi("setPlayerCmd:pause", None) is False
+
+        get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_timeouts_open_the_breaker(self) -> None:
+        dev = _FakeDevice()
+        breaker = get_circuit_breaker(dev._host)
+
+        with _patch_session(_session_with(AsyncMock(side_effect=TimeoutError))):
+            for _ in range(breaker.failure_threshold):
+                assert await dev.call_linkplay_httpapi("getPlayerStatus", True) is False
+
+        assert breaker.state == STATE_OPEN
+
+    @pytest.mark.asyncio
+    async def test_queued_request_rechecks_after_trip(self) -> None:
+        dev = _FakeDevice()
+        breaker = get_circuit_breaker(dev._host)
+        get = AsyncMock()
+        scheduler = get_request_scheduler(dev._host)
+        async with scheduler.slot(0), scheduler.slot(0):
+            queued = asyncio.ensure_future(dev.call_linkplay_httpapi("getPlayerStatus", True))
+            await asyncio.sleep(0)
+            for _ in range(breaker.failure_threshold):
+                breaker.record_failure()
+        with _patch_session(_session_with(get)):
+            assert await queued is False
+        get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_only_the_probe_releases_its_pass(self) -> None:
+        dev = _FakeDevice()
+        breaker = get_circuit_breaker(dev._host)
+        scheduler = get_request_scheduler(dev._host)
+        async with scheduler.slot(0), scheduler.slot(0):
+            queued = asyncio.ensure_future(dev.call_linkplay_httpapi("getPlayerStatus", True))
+            await asyncio.sleep(0)
+            for _ in range(breaker.failure_threshold):
+                breaker.record_failure()
+        with patch.object(breaker, "_clock", return_value=breaker._retry_at):
+            # The half-open probe is in flight when the queued request
+            # gets its slot and is turned away.
+            assert breaker.allow_request() is True
+            with _patch_session(_session_with(AsyncMock())):
+                assert await queued is False
+            assert breaker.allow_request() is False
+
+    @pytest.mark.asyncio
+    async def test_non_ok_status_counts_as_reachable(self) -> None:
+        dev = _FakeDevice()
+        breaker = get_circuit_breaker(dev._host)
+        breaker.record_failure()
+        response = MagicMock(status=HTTPStatus.INTERNAL_SERVER_ERROR)
+
+        with _patch_session(_session_with(AsyncMock(return_value=response))):
+            assert await dev.call_linkplay_httpapi("getPlayerStatus", True) is False
+
+        assert breaker.state == STATE_CLOSED
+        assert breaker._failures == 0
+
+
+class TestEntityAvailability:
+    def test_available_follows_breaker(self) -> None:
+        dev = make_device("dev", host="10.1.1.1")
+        assert dev.available is True
+
+        breaker = get_circuit_breaker("10.1.1.1")
+        for _ in range(breaker.failure_threshold):
+            breaker.record_failure()
+        assert dev.available is False
+
+        with patch.object(breaker, "_clock", return_value=breaker._retry_at):
+            # Half-open is not recovered: wait for the probe's answer.
+            assert dev.available is False
+            assert breaker.allow_request() is True
+            breaker.record_success()
+            assert dev.available is True
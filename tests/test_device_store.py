@@ -0,0 +1,94 @@
+"""Tests for the persisted speaker identity / capability store."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.linkplay.device_store import (
+    STORAGE_KEY,
+    LinkPlayDeviceStore,
+    async_get_device_store,
+)
+from tests._helpers import make_device
+
+_DESCRIPTION_URL = "http://1.2.3.4:49152/description.xml"
+
+
+class TestLinkPlayDeviceStore:
+    @pytest.mark.asyncio
+    async def test_records_round_trip_through_storage(
+        self, hass: HomeAssistant, hass_storage,
+    ) -> None:
+        hass_storage[STORAGE_KEY] = {
+            "version": 1, "key": STORAGE_KEY, "data": {"1.2.3.4": {"firmware": "4.6"}},
+        }
+        store = await async_get_device_store(hass)
+        assert await async_get_device_store(hass) is store
+        assert store.get("1.2.3.4") == {"firmware": "4.6"}
+
+        store.async_update("1.2.3.5", uuid="U1", preset_key=6)
+        store.async_remove("1.2.3.4")
+        await hass.async_stop(force=True)
+        assert hass_storage[STORAGE_KEY]["data"] == {"1.2.3.5": {"uuid": "U1", "preset_key": 6}}
+
+    @pytest.mark.asyncio
+    async def test_unchanged_fields_do_not_schedule_a_save(self, hass: HomeAssistant) -> None:
+        store = LinkPlayDeviceStore(hass)
+        await store.async_load()
+        store._store = MagicMock()
+        store.async_update("h", firmware="4.6")
+        store.async_update("h", firmware="4.6")
+        assert store._store.async_delay_save.call_count == 1
+
+
+class TestDeviceRecord:
+    def test_warm_start_restores_capabilities(self) -> None:
+        dev = make_device(uuid="U1", protocol=None)
+        dev._apply_device_record({
+            "uuid": "U1", "protocol": "https", "firmware": "4.6.415", "mcu_ver": "3",
+            "preset_key": 10, "upnp": {_DESCRIPTION_URL: "<root/>"},
+        })
+        assert (dev._protocol, dev._fw_ver, dev._mcu_ver, dev._preset_key) == ("https", "4.6.415", "3", 10)
+        assert dev._upnp_documents.for_host("1.2.3.4") == {_DESCRIPTION_URL: "<root/>"}
+
+    def test_record_of_another_speaker_is_ignored(self) -> None:
+        dev = make_device(uuid="U1")
+        dev._apply_device_record({"uuid": "OTHER", "firmware": "9.9", "upnp": {_DESCRIPTION_URL: "x"}})
+        assert dev._fw_ver == "1.0.0"
+        assert dev._upnp_documents.for_host("1.2.3.4") == {}
+
+    @pytest.mark.asyncio
+    async def test_first_poll_persists_and_firmware_change_drops_documents(self) -> None:
+        dev = make_device(uuid="U1")
+        dev._device_store = MagicMock()
+        dev._apply_device_record({"uuid": "U1", "firmware": "4.6.1", "upnp": {_DESCRIPTION_URL: "x"}})
+        dev._upnp_device = MagicMock()
+        dev._player_statdata = None
+        status = {
+            "WifiChannel": "6", "ssid": "net", "uuid": "U1", "DeviceName": "Den",
+            "firmware": "4.6.2", "preset_key": "6",
+        }
+        dev.call_linkplay_httpapi = AsyncMock(
+            side_effect=lambda cmd, *_a, **_k: status if cmd == "getStatus" else None,
+        )
+
+        async def _status(*_args, **_kwargs):
+            dev._player_statdata = {
+                "type": "0", "vol": "10", "mute": "0", "eq": "0", "loop": "4",
+                "mode": "0", "status": "stop", "totlen": "0", "curpos": "0",
+            }
+
+        dev.async_get_status = _status
+        dev.async_write_ha_state = MagicMock()
+        await dev.async_update()
+
+        assert dev._upnp_documents.for_host("1.2.3.4") == {}
+        saved = {}
+        for call in dev._device_store.async_update.call_args_list:
+            saved.update(call.kwargs)
+        assert saved["firmware"] == "4.6.2"
+        assert saved["preset_key"] == 6
+        assert saved["upnp"] == {}
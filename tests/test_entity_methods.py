@@ -5,7 +5,8 @@ select_sound_mode, get_*_metadata helpers, async_is_playing_new_track).
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from homeassistant.components.media_player import RepeatMode
@@ -16,6 +17,8 @@ from tests._helpers import make_device
 def _make_device():
     dev = make_device("dev")
     dev.call_linkplay_httpapi = AsyncMock(return_value="OK")
+    # Preset recall waits for the preset to take over.
+    dev.async_wait_for_status = AsyncMock(return_value={"status": "play"})
     return dev
 
 
@@ -24,7 +27,7 @@ class TestPresetButton:
     async def test_valid_preset_sends_mcu_short_click(self) -> None:
         dev = _make_device()
         dev._preset_key = 4
-        dev._volume = 0  # skip the v4.5.14 vol re-apply after preset
+        dev._transport.volume = 0  # skip the v4.5.14 vol re-apply after preset
         await dev.async_preset_button(2)
         cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
         assert "MCUKeyShortClick:2" in cmds
@@ -34,13 +37,11 @@ class TestPresetButton:
         """v4.5.14: AudioPro firmware restores the per-source saved
         volume on a preset switch. Re-apply the master's tracked volume
         so the firmware HW + HA cache match what the user asked for."""
-        from unittest.mock import patch
 
         dev = _make_device()
         dev._preset_key = 4
-        dev._volume = 18  # what set_group_volume just set
-        with patch("custom_components.linkplay.media_player.asyncio.sleep"):
-            await dev.async_preset_button(2)
+        dev._transport.volume = 18  # what set_group_volume just set
+        await dev.async_preset_button(2)
         cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
         # MCUKeyShortClick + vol:18 re-apply both present, in that order
         assert cmds.index("MCUKeyShortClick:2") < cmds.index(
@@ -55,20 +56,19 @@ class TestPresetButton:
         tracked volume to itself AND multiroom:SlaveVolume to each
         slave at ``master_target + offset``."""
         from custom_components.linkplay import LinkPlayData
-        from unittest.mock import patch
 
         master = _make_device()
         master.entity_id = "media_player.master"
         master._preset_key = 4
-        master._volume = 18
-        master._is_master = True
-        master._multiroom_group = ["media_player.master", "media_player.kitchen"]
+        master._transport.volume = 18
+        master._group.is_master = True
+        master._group.members = ["media_player.master", "media_player.kitchen"]
 
         kitchen = _make_device()
         kitchen.entity_id = "media_player.kitchen"
-        kitchen._slave_mode = True
-        kitchen._multiroom_wifidirect = False
-        kitchen._slave_ip = "10.10.10.93"
+        kitchen._group.slave_mode = True
+        kitchen._group.wifidirect = False
+        kitchen._group.slave_ip = "10.10.10.93"
         kitchen._volume_offset = -10
         kitchen.call_linkplay_httpapi = AsyncMock(return_value="OK")
 
@@ -77,8 +77,7 @@ class TestPresetButton:
         master.hass.data["linkplay"] = data
         kitchen.hass = master.hass
 
-        with patch("custom_components.linkplay.media_player.asyncio.sleep"):
-            await master.async_preset_button(1)
+        await master.async_preset_button(1)
 
         master_cmds = [
             c.args[0] for c in master.call_linkplay_httpapi.await_args_list
@@ -91,20 +90,55 @@ class TestPresetButton:
         # kitchen target 18 + (-10) = 8 -> vol:8 on kitchen directly
         assert "setPlayerCmd:vol:8" in kitchen_cmds
 
+    @pytest.mark.asyncio
+    async def test_preset_restores_group_volumes_concurrently(self) -> None:
+        from custom_components.linkplay import LinkPlayData
+
+        master = _make_device()
+        master.entity_id = "media_player.master"
+        master._preset_key = 4
+        master._transport.volume = 30
+        master._group.is_master = True
+        slaves = []
+        for name in ("kitchen", "bath"):
+            slave = _make_device()
+            slave.entity_id = f"media_player.{name}"
+            slave._group.slave_mode = True
+            slaves.append(slave)
+        master._group.members = [master.entity_id, *(s.entity_id for s in slaves)]
+        data = LinkPlayData()
+        data.entities = [master, *slaves]
+        master.hass.data["linkplay"] = data
+
+        all_started = asyncio.Event()
+        started = 0
+
+        async def _set_volume(self, volume, *, action):
+            nonlocal started
+            started += 1
+            if started == 3:
+                all_started.set()
+            await asyncio.wait_for(all_started.wait(), 1)
+            self._transport.volume = volume
+
+        with patch.object(type(master), "_set_volume_on_device", _set_volume):
+            await master.async_preset_button(1)
+
+        assert started == 3
+        assert [s._transport.volume for s in slaves] == [30, 30]
+
     @pytest.mark.asyncio
     async def test_preset_from_bluetooth_skips_volume_restore(self) -> None:
-        """On Bluetooth, _volume holds the loud BT-session level, not an
+        """On Bluetooth, _transport.volume holds the loud BT-session level, not an
         intended preset level. Re-asserting it would blast that level
         across the group, so the restore must be skipped: only the
         MCUKeyShortClick is sent, no vol re-apply."""
-        from unittest.mock import patch
 
         dev = _make_device()
         dev._preset_key = 4
-        dev._volume = 100  # Bluetooth movie level
-        dev._source = "Bluetooth"
-        with patch("custom_components.linkplay.media_player.asyncio.sleep"):
-            await dev.async_preset_button(2)
+        dev._transport.volume = 100  # Bluetooth movie level
+        dev._transport.source = "Bluetooth"
+        await dev.async_preset_button(2)
         cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
         assert "MCUKeyShortClick:2" in cmds
         assert not any(c.startswith("setPlayerCmd:vol:") for c in cmds)
@@ -116,39 +150,35 @@ class TestPresetButton:
         debounce so the group survives until the follow-up
         set_group_volume."""
         from homeassistant.util.dt import utcnow
-        from unittest.mock import patch
 
         master = _make_device()
         master.entity_id = "media_player.master"
         master._preset_key = 4
-        master._volume = 18
-        master._is_master = True
-        master._multiroom_group = ["media_player.master", "media_player.kitchen"]
-        master._multiroom_joinat = None
-        master._slave_zero_polls = 5
+        master._transport.volume = 18
+        master._group.is_master = True
+        master._group.members = ["media_player.master", "media_player.kitchen"]
+        master._group.joinat = None
+        master._group.zero_polls = 5
 
         before = utcnow()
-        with patch("custom_components.linkplay.media_player.asyncio.sleep"):
-            await master.async_preset_button(1)
+        await master.async_preset_button(1)
 
-        assert master._multiroom_joinat is not None
-        assert master._multiroom_joinat >= before
-        assert master._slave_zero_polls == 0
+        assert master._group.joinat is not None
+        assert master._group.joinat >= before
+        assert master._group.zero_polls == 0
 
     @pytest.mark.asyncio
     async def test_preset_corrupt_self_master_does_not_recurse(self) -> None:
-        """A failed join can leave a device with _slave_mode=True and
-        _master pointing at itself. Pressing preset must not recurse
+        """A failed join can leave a device with _group.slave_mode=True and
+        _group.master pointing at itself. Pressing preset must not recurse
         forever (RecursionError); it falls through to local handling."""
-        from unittest.mock import patch
 
         dev = _make_device()
         dev._preset_key = 4
-        dev._volume = 0
-        dev._slave_mode = True
-        dev._master = dev  # corrupt self-reference from a broken join
-        with patch("custom_components.linkplay.media_player.asyncio.sleep"):
-            await dev.async_preset_button(2)
+        dev._transport.volume = 0
+        dev._group.slave_mode = True
+        dev._group.master = dev  # corrupt self-reference from a broken join
+        await dev.async_preset_button(2)
         cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
         assert "MCUKeyShortClick:2" in cmds
 
@@ -156,19 +186,17 @@ class TestPresetButton:
     async def test_preset_slave_forwards_to_real_master(self) -> None:
         """A genuine slave (master is not itself a slave) still forwards
         the preset to the master, and does not run it locally."""
-        from unittest.mock import patch
 
         master = _make_device()
         master.entity_id = "media_player.master"
         master._preset_key = 4
-        master._volume = 0
+        master._transport.volume = 0
         slave = _make_device()
         slave.entity_id = "media_player.slave"
         slave._preset_key = 4
-        slave._slave_mode = True
-        slave._master = master
-        with patch("custom_components.linkplay.media_player.asyncio.sleep"):
-            await slave.async_preset_button(2)
+        slave._group.slave_mode = True
+        slave._group.master = master
+        await slave.async_preset_button(2)
         master_cmds = [c.args[0] for c in master.call_linkplay_httpapi.await_args_list]
         slave_cmds = [c.args[0] for c in slave.call_linkplay_httpapi.await_args_list]
         assert "MCUKeyShortClick:2" in master_cmds
@@ -178,16 +206,49 @@ class TestPresetButton:
     async def test_preset_mcu_failure_skips_volume_restore(self) -> None:
         """If MCUKeyShortClick fails, warn and return — no volume
         re-assert should follow a failed preset recall."""
-        from unittest.mock import patch
 
         dev = _make_device()
         dev._preset_key = 4
-        dev._volume = 18
+        dev._transport.volume = 18
         dev.call_linkplay_httpapi = AsyncMock(return_value="NOK")
-        with patch("custom_components.linkplay.media_player.asyncio.sleep"):
-            await dev.async_preset_button(2)
+        await dev.async_preset_button(2)
         cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
-        assert cmds == ["MCUKeyShortClick:2"]  # no vol restore after failure
+        # Status read before the click, no vol restore after failure
+        assert cmds == ["getPlayerStatus", "MCUKeyShortClick:2"]
+
+    @pytest.mark.asyncio
+    async def test_preset_waits_for_takeover_not_play(self) -> None:
+        """The speaker is usually already playing when a preset is
+        recalled; the volume is re-applied only once the preset took
+        over (its stored volume or its input showed up)."""
+        from custom_components.linkplay.media_player import LinkPlayDevice
+
+        dev = _make_device()
+        dev._preset_key = 4
+        dev._transport.volume = 18
+        playing = {"status": "play", "mode": "10", "uri": "a", "Title": "x", "vol": "18"}
+        statuses = iter([
+            playing,
+            playing,
+            playing,
+            {**playing, "vol": "40"},
+        ])
+
+        async def _api(cmd, jsn, protocol=None, **_kwargs):
+            if cmd == "getPlayerStatus":
+                return next(statuses)
+            return "OK"
+
+        dev.call_linkplay_httpapi = AsyncMock(side_effect=_api)
+        del dev.async_wait_for_status
+        with patch("custom_components.linkplay.api_client_mixin.asyncio.sleep", new=AsyncMock()):
+            await LinkPlayDevice.async_preset_button(dev, 2)
+        cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
+        assert cmds == [
+            "getPlayerStatus", "MCUKeyShortClick:2",
+            "getPlayerStatus", "getPlayerStatus", "getPlayerStatus",
+            "setPlayerCmd:vol:18",
+        ]
 
     @pytest.mark.asyncio
     async def test_preset_out_of_range_warns_no_call(self) -> None:
@@ -219,7 +280,7 @@ class TestPlayTrack:
         ok = await dev.async_play_track(track)
         assert ok is True
         assert dev.call_linkplay_httpapi.await_args.args[0] == "setPlayerCmd:playLocalList:1"
-        assert dev._state == "playing"
+        assert dev._transport.state == "playing"
 
     @pytest.mark.asyncio
     async def test_unmatched_track_returns_false(self) -> None:
@@ -246,26 +307,26 @@ class TestShuffleRepeat:
         dev = _make_device()
         await dev.async_set_shuffle(True)
         assert dev.call_linkplay_httpapi.await_args.args[0] == "setPlayerCmd:loopmode:2"
-        assert dev._shuffle is True
+        assert dev._transport.shuffle is True
 
     @pytest.mark.asyncio
     async def test_shuffle_off_with_repeat_all_sends_mode_3(self) -> None:
         dev = _make_device()
-        dev._repeat = RepeatMode.ALL
+        dev._transport.repeat = RepeatMode.ALL
         await dev.async_set_shuffle(False)
         assert dev.call_linkplay_httpapi.await_args.args[0] == "setPlayerCmd:loopmode:3"
 
     @pytest.mark.asyncio
     async def test_shuffle_off_with_repeat_one_sends_mode_1(self) -> None:
         dev = _make_device()
-        dev._repeat = RepeatMode.ONE
+        dev._transport.repeat = RepeatMode.ONE
         await dev.async_set_shuffle(False)
         assert dev.call_linkplay_httpapi.await_args.args[0] == "setPlayerCmd:loopmode:1"
 
     @pytest.mark.asyncio
     async def test_repeat_all_with_shuffle_uses_mode_2(self) -> None:
         dev = _make_device()
-        dev._shuffle = True
+        dev._transport.shuffle = True
         await dev.async_set_repeat(RepeatMode.ALL)
         assert dev.call_linkplay_httpapi.await_args.args[0] == "setPlayerCmd:loopmode:2"
 
@@ -291,36 +352,36 @@ class TestSoundMode:
         await dev.async_select_sound_mode(mode_label)
         cmd = dev.call_linkplay_httpapi.await_args.args[0]
         assert cmd.startswith("setPlayerCmd:equalizer:")
-        assert dev._sound_mode == mode_label
+        assert dev._transport.sound_mode == mode_label
 
 
 class TestMetadataHelpers:
     @pytest.mark.asyncio
     async def test_local_mediasource_parses_artist_title(self) -> None:
         dev = _make_device()
-        dev._media_source_uri = "media-source://media_source/local/Artist_Name/Song_Name.mp3"
+        dev._meta.source_uri = "media-source://media_source/local/Artist_Name/Song_Name.mp3"
         ok = await dev.async_get_local_mediasource_metadata_from_path()
         assert ok is True
-        assert dev._media_artist == "Artist Name"
-        assert "Song Name" in dev._media_title
+        assert dev._meta.artist == "Artist Name"
+        assert "Song Name" in dev._meta.title
 
     @pytest.mark.asyncio
     async def test_local_mediasource_with_no_uri_returns_false(self) -> None:
         dev = _make_device()
-        dev._media_source_uri = None
+        dev._meta.source_uri = None
         assert await dev.async_get_local_mediasource_metadata_from_path() is False
 
     @pytest.mark.asyncio
     async def test_playerstatus_metadata_clears_when_field_present_but_empty(self) -> None:
         dev = _make_device()
         # Title/Artist/Album keys present and empty -> leave existing values alone
-        dev._media_title = "old"
-        dev._media_artist = "old"
+        dev._meta.title = "old"
+        dev._meta.artist = "old"
         await dev.async_get_playerstatus_metadata(
             {"Title": "", "Artist": "", "Album": "", "uri": ""}
         )
-        assert dev._media_title == "old"
-        assert dev._media_artist == "old"
+        assert dev._meta.title == "old"
+        assert dev._meta.artist == "old"
 
     @pytest.mark.asyncio
     async def test_playerstatus_metadata_decoded_hex_populates(self) -> None:
@@ -329,39 +390,32 @@ class TestMetadataHelpers:
         await dev.async_get_playerstatus_metadata(
             {"Title": "48656c6c6f", "Artist": "576f726c64", "Album": "", "uri": ""}
         )
-        assert dev._media_title == "Hello"
-        assert dev._media_artist == "World"
+        assert dev._meta.title == "Hello"
+        assert dev._meta.artist == "World"
 
 
 class TestIsPlayingNewTrack:
     @pytest.mark.asyncio
     async def test_mediabrowser_files_never_trigger_new_track(self) -> None:
         dev = _make_device()
-        dev._playing_mediabrowser = True
-        dev._media_source_uri = "x"
+        dev._playing.mediabrowser = True
+        dev._meta.source_uri = "x"
         assert await dev.async_is_playing_new_track() is False
 
     @pytest.mark.asyncio
     async def test_artist_or_title_change_triggers_new_track(self) -> None:
         dev = _make_device()
-        dev._media_artist = "A"
-        dev._media_title = "T"
-        dev._media_prev_artist = "A"
-        dev._media_prev_title = "Old"
+        dev._meta.artist = "A"
+        dev._meta.title = "T"
+        dev._meta.prev_artist = "A"
+        dev._meta.prev_title = "Old"
         assert await dev.async_is_playing_new_track() is True
 
     @pytest.mark.asyncio
     async def test_same_metadata_returns_false(self) -> None:
         dev = _make_device()
-        dev._media_artist = "A"
-        dev._media_title = "T"
-        dev._media_prev_artist = "A"
-        dev._media_prev_title = "T"
+        dev._meta.artist = "A"
+        dev._meta.title = "T"
+        dev._meta.prev_artist = "A"
+        dev._meta.prev_title = "T"
         assert await dev.async_is_playing_new_track() is False
-
-
-class TestFwVerCheck:
-    def test_pads_components_for_lexicographic_sort(self) -> None:
-        from custom_components.linkplay.media_player import LinkPlayDevice
-        assert LinkPlayDevice._fwvercheck("4.6.1") < LinkPlayDevice._fwvercheck("4.6.10")
-        assert LinkPlayDevice._fwvercheck("4.2.8020") < LinkPlayDevice._fwvercheck("4.6.0")
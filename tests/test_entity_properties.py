@@ -15,6 +15,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
 )
 
+from custom_components.linkplay.source_catalog import SourceCatalog
 from tests._helpers import make_device
 
 
@@ -29,9 +30,9 @@ class TestConstructorDefaults:
         assert dev._name == "kitchen"
         assert dev._host == "1.2.3.4"
         assert dev._protocol == "http"
-        assert dev._volume == 0
-        assert dev._is_master is False
-        assert dev._slave_mode is False
+        assert dev._transport.volume == 0
+        assert dev._group.is_master is False
+        assert dev._group.slave_mode is False
         assert dev._uuid == "uuid-1234"
 
 
@@ -42,9 +43,9 @@ class TestNameAndIcon:
 
     def test_slave_name_appends_master(self) -> None:
         master = _make_device("kitchen")
-        master._is_master = True
+        master._group.is_master = True
         slave = _make_device("bath")
-        slave._slave_mode = True
+        slave._group.slave_mode = True
         slave.hass.data["linkplay"].entities = [master, slave]
         assert slave.name == "bath [kitchen]"
 
@@ -60,66 +61,66 @@ class TestNameAndIcon:
             ICON_TTS,
         )
 
-        dev._state = STATE_IDLE
+        dev._transport.state = STATE_IDLE
         assert dev.icon == ICON_DEFAULT
 
-        dev._state = STATE_PAUSED
+        dev._transport.state = STATE_PAUSED
         assert dev.icon == ICON_DEFAULT
 
-        dev._state = STATE_UNAVAILABLE
+        dev._transport.state = STATE_UNAVAILABLE
         assert dev.icon == ICON_DEFAULT
 
-        dev._state = STATE_PLAYING
-        dev._playing_tts = True
+        dev._transport.state = STATE_PLAYING
+        dev._playing.tts = True
         assert dev.icon == ICON_TTS
 
-        dev._playing_tts = False
-        dev._muted = True
+        dev._playing.tts = False
+        dev._transport.muted = True
         assert dev.icon == ICON_MUTED
 
-        dev._muted = False
-        dev._is_master = True
+        dev._transport.muted = False
+        dev._group.is_master = True
         assert dev.icon == ICON_MULTIROOM
 
-        dev._is_master = False
-        dev._source = "Bluetooth"
+        dev._group.is_master = False
+        dev._transport.source = "Bluetooth"
         assert dev.icon == ICON_BLUETOOTH
 
-        dev._source = "Spotify"
+        dev._transport.source = "Spotify"
         assert dev.icon == ICON_PUSHSTREAM
 
-        dev._source = "Other"
+        dev._transport.source = "Other"
         assert dev.icon == ICON_PLAYING
 
 
 class TestBasicAccessors:
     def test_volume_level_scales_to_unit(self) -> None:
         dev = _make_device()
-        dev._volume = 73
+        dev._transport.volume = 73
         assert abs(dev.volume_level - 0.73) < 1e-9
 
     def test_state_returns_attribute(self) -> None:
         dev = _make_device()
-        dev._state = STATE_PLAYING
+        dev._transport.state = STATE_PLAYING
         assert dev.state == STATE_PLAYING
 
     def test_is_volume_muted(self) -> None:
         dev = _make_device()
         assert dev.is_volume_muted is False
-        dev._muted = True
+        dev._transport.muted = True
         assert dev.is_volume_muted is True
 
     def test_source_returns_none_for_internal_values(self) -> None:
         dev = _make_device()
         for val in ("Idle", "Network"):
-            dev._source = val
+            dev._transport.source = val
             assert dev.source is None
-        dev._source = "Spotify"
+        dev._transport.source = "Spotify"
         assert dev.source == "Spotify"
 
     def test_source_list_strips_wifi(self) -> None:
         dev = _make_device()
-        dev._source_list = {"wifi": "WiFi", "bluetooth": "Bluetooth"}
+        dev._sources = SourceCatalog({"wifi": "WiFi", "bluetooth": "Bluetooth"})
         assert "WiFi" not in dev.source_list
         assert "Bluetooth" in dev.source_list
 
@@ -130,10 +131,10 @@ class TestBasicAccessors:
 
     def test_media_title_artist_album_image(self) -> None:
         dev = _make_device()
-        dev._media_title = "T"
-        dev._media_artist = "A"
-        dev._media_album = "B"
-        dev._media_image_url = "u"
+        dev._meta.title = "T"
+        dev._meta.artist = "A"
+        dev._meta.album = "B"
+        dev._meta.image_url = "u"
         assert dev.media_title == "T"
         assert dev.media_artist == "A"
         assert dev.media_album_name == "B"
@@ -157,36 +158,36 @@ class TestBasicAccessors:
 class TestPlayheadProperties:
     def test_media_position_none_when_unavailable(self) -> None:
         dev = _make_device()
-        dev._state = STATE_UNAVAILABLE
-        dev._playing_localfile = True
+        dev._transport.state = STATE_UNAVAILABLE
+        dev._playing.localfile = True
         assert dev.media_position is None
         assert dev.media_duration is None
 
     def test_media_position_returned_for_localfile(self) -> None:
         dev = _make_device()
-        dev._playing_localfile = True
-        dev._state = STATE_PLAYING
-        dev._playhead_position = 42
-        dev._duration = 200
+        dev._playing.localfile = True
+        dev._transport.state = STATE_PLAYING
+        dev._transport.playhead_position = 42
+        dev._transport.duration = 200
         assert dev.media_position == 42
         assert dev.media_duration == 200
 
     def test_media_position_updated_at_only_when_playing(self) -> None:
         dev = _make_device()
         from datetime import datetime, timezone
-        dev._position_updated_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
-        dev._state = STATE_PLAYING
+        dev._transport.position_updated_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        dev._transport.state = STATE_PLAYING
         assert dev.media_position_updated_at is not None
 
-        dev._playing_liveinput = True
+        dev._playing.liveinput = True
         assert dev.media_position_updated_at is None
 
 
 class TestSupportedFeatures:
     def test_default_state_returns_some_features(self) -> None:
         dev = _make_device()
-        dev._state = STATE_PLAYING
-        dev._playing_localfile = True
+        dev._transport.state = STATE_PLAYING
+        dev._playing.localfile = True
         feats = dev.supported_features
         assert feats & MediaPlayerEntityFeature.VOLUME_SET
         assert feats & MediaPlayerEntityFeature.VOLUME_STEP
@@ -194,7 +195,7 @@ class TestSupportedFeatures:
 
     def test_slave_returns_cached_features(self) -> None:
         dev = _make_device()
-        dev._slave_mode = True
+        dev._group.slave_mode = True
         cached = MediaPlayerEntityFeature.VOLUME_SET
         dev._features = cached
         assert dev.supported_features == cached
@@ -220,10 +221,10 @@ class TestExtraStateAttributes:
         dev = _make_device()
         dev._fw_ver = "4.6.1"
         dev._mcu_ver = "12"
-        dev._state = STATE_PLAYING
+        dev._transport.state = STATE_PLAYING
         assert dev.extra_state_attributes.get("firmware") == "4.6.1.12"
 
     def test_firmware_attr_hidden_when_unavailable(self) -> None:
         dev = _make_device()
-        dev._state = STATE_UNAVAILABLE
+        dev._transport.state = STATE_UNAVAILABLE
         assert "firmware" not in dev.extra_state_attributes
@@ -0,0 +1,57 @@
+"""Tests for the integration-owned speaker ClientSession."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+
+from custom_components.linkplay import http_session
+from custom_components.linkplay.http_session import (
+    API_TIMEOUT,
+    FIRST_UPDATE_TIMEOUT,
+    async_get_linkplay_session,
+    create_linkplay_session,
+)
+
+
+class TestCreateSession:
+    @pytest.mark.asyncio
+    async def test_connector_is_tuned_for_lan_speakers(self) -> None:
+        session = create_linkplay_session()
+        try:
+            connector = session.connector
+            assert connector.limit_per_host == http_session._LIMIT_PER_HOST
+            assert connector.limit == http_session._LIMIT
+            assert connector.use_dns_cache is False
+            assert session.timeout is API_TIMEOUT
+        finally:
+            await session.close()
+
+    def test_timeouts_are_built_once(self) -> None:
+        assert API_TIMEOUT.total == 2
+        assert FIRST_UPDATE_TIMEOUT.total == 10
+
+
+class TestSharedSession:
+    @pytest.mark.asyncio
+    async def test_session_is_reused(self, hass: HomeAssistant) -> None:
+        first = async_get_linkplay_session(hass)
+        assert async_get_linkplay_session(hass) is first
+        await first.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_session_is_replaced(self, hass: HomeAssistant) -> None:
+        first = async_get_linkplay_session(hass)
+        await first.close()
+        second = async_get_linkplay_session(hass)
+        assert second is not first
+        assert not second.closed
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_session_closes_with_home_assistant(self, hass: HomeAssistant) -> None:
+        session = async_get_linkplay_session(hass)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+        await hass.async_block_till_done()
+        assert session.closed
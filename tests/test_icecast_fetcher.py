@@ -11,19 +11,22 @@ from custom_components.linkplay.icecast_fetcher_mixin import (
     LinkPlayIcecastFetcherMixin,
     _fetch_icecast_headers_and_chunks,
 )
+from custom_components.linkplay.state import MediaMetadata
 
 
 class _FakeDevice(LinkPlayIcecastFetcherMixin):
     def __init__(self, mode: str = "StationNameSongTitle") -> None:
+        self._meta = MediaMetadata()
         self.hass = MagicMock()
         self.hass.async_add_executor_job = AsyncMock()
         self._name = "fake"
+        self._host = "1.2.3.4"
         self._icecast_meta = mode
-        self._media_uri_final = "http://stream/aac"
-        self._media_title = None
-        self._media_artist = None
-        self._media_image_url = None
-        self._icecast_name = None
+        self._meta.uri_final = "http://stream/aac"
+        self._meta.title = None
+        self._meta.artist = None
+        self._meta.image_url = None
+        self._meta.icecast_name = None
 
 
 def _unwrap(method):
@@ -42,13 +45,13 @@ class TestUpdateFromIcecast:
     @pytest.mark.asyncio
     async def test_fetch_failure_clears_metadata(self) -> None:
         dev = _FakeDevice()
-        dev._media_title = "stale"
-        dev._media_artist = "stale"
+        dev._meta.title = "stale"
+        dev._meta.artist = "stale"
         dev.hass.async_add_executor_job = AsyncMock(side_effect=RuntimeError("net"))
         await _unwrap(dev.async_update_from_icecast)(dev)
-        assert dev._media_title is None
-        assert dev._media_artist is None
-        assert dev._icecast_name is None
+        assert dev._meta.title is None
+        assert dev._meta.artist is None
+        assert dev._meta.icecast_name is None
 
     @pytest.mark.asyncio
     async def test_station_name_mode_only_sets_title(self) -> None:
@@ -57,9 +60,9 @@ class TestUpdateFromIcecast:
             return_value=("My Radio", "16000", [])
         )
         await _unwrap(dev.async_update_from_icecast)(dev)
-        assert dev._media_title == "My Radio"
-        assert dev._media_artist is None
-        assert dev._icecast_name == "My Radio"
+        assert dev._meta.title == "My Radio"
+        assert dev._meta.artist is None
+        assert dev._meta.icecast_name == "My Radio"
 
     @pytest.mark.asyncio
     async def test_missing_metaint_falls_back_to_station(self) -> None:
@@ -70,8 +73,8 @@ class TestUpdateFromIcecast:
             return_value=("My Radio", None, [])
         )
         await _unwrap(dev.async_update_from_icecast)(dev)
-        assert dev._media_title == "My Radio"
-        assert dev._media_artist is None
+        assert dev._meta.title == "My Radio"
+        assert dev._meta.artist is None
 
     @pytest.mark.asyncio
     async def test_chunk_without_streamtitle_falls_back_then_recovers(self) -> None:
@@ -84,8 +87,8 @@ class TestUpdateFromIcecast:
             return_value=("My Radio", "16000", [empty_chunk, good_chunk])
         )
         await _unwrap(dev.async_update_from_icecast)(dev)
-        assert dev._media_artist == "Carbon"
-        assert dev._media_title == "Mind"
+        assert dev._meta.artist == "Carbon"
+        assert dev._meta.title == "Mind"
 
     @pytest.mark.asyncio
     async def test_chunk_with_streamtitle_populates_artist_title(self) -> None:
@@ -95,8 +98,8 @@ class TestUpdateFromIcecast:
             return_value=("My Radio", "16000", [chunk])
         )
         await _unwrap(dev.async_update_from_icecast)(dev)
-        assert dev._media_artist == "Artist Name"
-        assert dev._media_title == "Track Name"
+        assert dev._meta.artist == "Artist Name"
+        assert dev._meta.title == "Track Name"
 
 
 class TestFetchExecutor:
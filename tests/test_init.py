@@ -83,8 +83,8 @@ class TestReloadAndUnload:
         entry = MagicMock()
         result = await async_unload_entry(hass, entry)
         assert result is True
-        # All eight services attempted for removal
-        assert hass.services.async_remove.call_count == 8
+        # All nine services attempted for removal
+        assert hass.services.async_remove.call_count == 9
 
     @pytest.mark.asyncio
     async def test_unload_with_remaining_entries_keeps_services(self) -> None:
@@ -11,13 +11,15 @@ from custom_components.linkplay.itunes_artwork_mixin import (
     LinkPlayItunesArtworkMixin,
     _upscale_artwork,
 )
+from custom_components.linkplay.state import MediaMetadata
 
 
 class _Stub(LinkPlayItunesArtworkMixin):
     def __init__(self):
-        self._media_artist = "Carbon Based Lifeforms"
-        self._media_title = "Carbon Mind"
-        self._media_image_url = "https://api.somafm.com/img/groovesalad600.jpg"
+        self._meta = MediaMetadata()
+        self._meta.artist = "Carbon Based Lifeforms"
+        self._meta.title = "Carbon Mind"
+        self._meta.image_url = "https://api.somafm.com/img/groovesalad600.jpg"
         self._icecast_meta = "StationName"
         self._name = "dev"
         self._host = "1.2.3.4"
@@ -62,7 +64,7 @@ class TestAsyncGetItunesArtwork:
         ):
             ok = await stub.async_get_itunes_artwork.__wrapped__(stub)
         assert ok is True
-        assert "600x600bb.jpg" in stub._media_image_url
+        assert "600x600bb.jpg" in stub._meta.image_url
 
     @pytest.mark.asyncio
     async def test_empty_results_returns_false_and_caches(self) -> None:
@@ -76,14 +78,14 @@ class TestAsyncGetItunesArtwork:
             ok = await stub.async_get_itunes_artwork.__wrapped__(stub)
         assert ok is False
         # Channel-level fallback URL was not replaced
-        assert stub._media_image_url.endswith("groovesalad600.jpg")
+        assert stub._meta.image_url.endswith("groovesalad600.jpg")
         # Cache populated so the next call short-circuits
         assert stub._itunes_last_lookup == ("Carbon Based Lifeforms", "Carbon Mind")
 
     @pytest.mark.asyncio
     async def test_missing_artist_short_circuits(self) -> None:
         stub = _Stub()
-        stub._media_artist = None
+        stub._meta.artist = None
         ok = await stub.async_get_itunes_artwork.__wrapped__(stub)
         assert ok is False
 
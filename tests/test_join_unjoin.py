@@ -20,10 +20,9 @@ def _make_device(name: str, host: str = "1.2.3.4"):
     dev = make_device(name, host=host, icecast_metadata="Off")
     dev.async_write_ha_state = MagicMock()
     # Tests that exercise async_join don't need to wait 5 s for the
-    # post-join slave-IP poll; cap it at one fast attempt unless the
+    # post-join slave-IP poll; cap it at one attempt unless the
     # individual test re-enables it.
-    dev._slave_ip_poll_interval = 0
-    dev._slave_ip_poll_max = 0
+    dev._slave_ip_timeout = 0
     return dev
 
 
@@ -46,12 +45,12 @@ class TestAsyncJoin:
 
         await master.async_join([slave])
 
-        assert master._is_master is True
-        assert master.entity_id in master._multiroom_group
-        assert slave.entity_id in master._multiroom_group
-        assert slave._slave_mode is True
-        assert slave._master is master
-        assert slave._multiroom_group == master._multiroom_group
+        assert master._group.is_master is True
+        assert master.entity_id in master._group.members
+        assert slave.entity_id in master._group.members
+        assert slave._group.slave_mode is True
+        assert slave._group.master is master
+        assert slave._group.members == master._group.members
 
     @pytest.mark.asyncio
     async def test_join_pushes_state_for_master_and_slaves(self) -> None:
@@ -72,19 +71,19 @@ class TestAsyncJoin:
 
         await master.async_join([slave])
 
-        assert slave.entity_id not in master._multiroom_group
-        assert slave._slave_mode is False
+        assert slave.entity_id not in master._group.members
+        assert slave._group.slave_mode is False
 
     @pytest.mark.asyncio
     async def test_join_unavailable_master_is_noop(self) -> None:
         master, (slave,) = _make_group("master", ["slave"])
-        master._state = "unavailable"
+        master._transport.state = "unavailable"
         master.call_linkplay_httpapi = AsyncMock(return_value="OK")
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
 
         await master.async_join([slave])
 
-        assert master._multiroom_group == []
+        assert master._group.members == []
         slave.call_linkplay_httpapi.assert_not_called()
 
 
@@ -106,9 +105,9 @@ class TestJoinAwaitsSlaveIps:
         await master.async_join([slave])
 
         # Regression: the previous code wrote master._host into the
-        # slave's _slave_ip, which made multiroom:SlaveVolume target
+        # slave's _group.slave_ip, which made multiroom:SlaveVolume target
         # the master and silently fail.
-        assert slave._slave_ip != master._host
+        assert slave._group.slave_ip != master._host
 
     @pytest.mark.asyncio
     async def test_join_populates_slave_ip_from_getslavelist(self) -> None:
@@ -125,22 +124,21 @@ class TestJoinAwaitsSlaveIps:
                 ],
             },
         ])
-        master._slave_ip_poll_max = 5
-        master._slave_ip_poll_interval = 0
+        master._slave_ip_timeout = 5
 
         await master.async_join([slave])
 
-        assert slave._slave_ip == "10.10.10.93"
+        assert slave._group.slave_ip == "10.10.10.93"
 
     @pytest.mark.asyncio
     async def test_join_syncs_slave_volume_for_delta_base(self) -> None:
         """v4.5.12: ``set_group_volume`` is delta-preserving; for the
-        shift to land correctly each slave's cached ``_volume`` must
+        shift to land correctly each slave's cached ``_transport.volume`` must
         reflect the post-join firmware value, not the stale pre-join
         cache. ``_await_slave_ips`` now copies ``volume`` from the
         ``multiroom:getSlaveList`` entry."""
         master, (slave,) = _make_group("master", ["slave"])
-        slave._volume = 9  # stale pre-join cache
+        slave._transport.volume = 9  # stale pre-join cache
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
         master.call_linkplay_httpapi = AsyncMock(side_effect=[
             {
@@ -150,12 +148,11 @@ class TestJoinAwaitsSlaveIps:
                 ],
             },
         ])
-        master._slave_ip_poll_max = 5
-        master._slave_ip_poll_interval = 0
+        master._slave_ip_timeout = 5
 
         await master.async_join([slave])
 
-        assert slave._volume == 34
+        assert slave._transport.volume == 34
 
     @pytest.mark.asyncio
     async def test_join_retries_until_firmware_reports_slaves(
@@ -175,12 +172,11 @@ class TestJoinAwaitsSlaveIps:
                 ],
             },
         ])
-        master._slave_ip_poll_max = 5
-        master._slave_ip_poll_interval = 0
+        master._slave_ip_timeout = 5
 
         await master.async_join([slave])
 
-        assert slave._slave_ip == "10.10.10.93"
+        assert slave._group.slave_ip == "10.10.10.93"
         assert master.call_linkplay_httpapi.await_count == 3
 
     @pytest.mark.asyncio
@@ -192,82 +188,82 @@ class TestJoinAwaitsSlaveIps:
         master.call_linkplay_httpapi = AsyncMock(
             return_value={"slaves": 0, "slave_list": []}
         )
-        master._slave_ip_poll_max = 3
-        master._slave_ip_poll_interval = 0
+        master._slave_ip_timeout = 0
 
         await master.async_join([slave])
 
-        assert master.call_linkplay_httpapi.await_count == 3
+        assert master.call_linkplay_httpapi.await_count == 1
+        assert slave._group.slave_ip is None
 
 
 class TestAsyncUnjoinAll:
     @pytest.mark.asyncio
     async def test_unjoin_all_clears_group_and_pushes_state(self) -> None:
         master, (slave,) = _make_group("master", ["slave"])
-        master._is_master = True
-        master._multiroom_group = [master.entity_id, slave.entity_id]
-        slave._slave_mode = True
-        slave._master = master
-        slave._multiroom_group = [master.entity_id, slave.entity_id]
+        master._group.is_master = True
+        master._group.members = [master.entity_id, slave.entity_id]
+        slave._group.slave_mode = True
+        slave._group.master = master
+        slave._group.members = [master.entity_id, slave.entity_id]
 
         master.call_linkplay_httpapi = AsyncMock(return_value="OK")
 
         await master.async_unjoin_all()
 
-        assert master._multiroom_group == []
-        assert master._is_master is False
-        assert slave._slave_mode is False
-        assert slave._master is None
-        assert slave._multiroom_group == []
+        assert master._group.members == []
+        assert master._group.is_master is False
+        assert slave._group.slave_mode is False
+        assert slave._group.master is None
+        assert slave._group.members == []
         master.async_write_ha_state.assert_called()
         slave.async_write_ha_state.assert_called()
 
     @pytest.mark.asyncio
     async def test_unjoin_all_skips_when_unavailable(self) -> None:
         master, (slave,) = _make_group("master", ["slave"])
-        master._state = "unavailable"
-        master._multiroom_group = [master.entity_id, slave.entity_id]
+        master._transport.state = "unavailable"
+        master._group.members = [master.entity_id, slave.entity_id]
         master.call_linkplay_httpapi = AsyncMock(return_value="OK")
 
         await master.async_unjoin_all()
 
         master.call_linkplay_httpapi.assert_not_called()
-        assert master._multiroom_group == [master.entity_id, slave.entity_id]
+        assert master._group.members == [master.entity_id, slave.entity_id]
 
     @pytest.mark.asyncio
     async def test_unjoin_all_leaves_state_when_httpapi_fails(self) -> None:
         master, (slave,) = _make_group("master", ["slave"])
-        master._is_master = True
-        master._multiroom_group = [master.entity_id, slave.entity_id]
-        slave._slave_mode = True
+        master._group.is_master = True
+        master._group.members = [master.entity_id, slave.entity_id]
+        slave._group.slave_mode = True
         master.call_linkplay_httpapi = AsyncMock(return_value="NOK")
 
         await master.async_unjoin_all()
 
-        assert master._is_master is True
-        assert master._multiroom_group == [master.entity_id, slave.entity_id]
-        assert slave._slave_mode is True
+        assert master._group.is_master is True
+        assert master._group.members == [master.entity_id, slave.entity_id]
+        assert slave._group.slave_mode is True
 
 
 class TestAsyncUnjoinMe:
     @pytest.mark.asyncio
     async def test_unjoin_me_drops_self_and_notifies_master(self) -> None:
         master, (slave,) = _make_group("master", ["slave"])
-        master._is_master = True
-        master._multiroom_group = [master.entity_id, slave.entity_id]
-        slave._slave_mode = True
-        slave._master = master
-        slave._multiroom_group = [master.entity_id, slave.entity_id]
+        master._group.is_master = True
+        master._group.members = [master.entity_id, slave.entity_id]
+        slave._group.slave_mode = True
+        slave._group.master = master
+        slave._group.members = [master.entity_id, slave.entity_id]
 
         master.call_linkplay_httpapi = AsyncMock(return_value="OK")
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
 
         await slave.async_unjoin_me()
 
-        assert slave._slave_mode is False
-        assert slave._master is None
-        assert slave._multiroom_group == []
-        assert slave.entity_id not in master._multiroom_group
+        assert slave._group.slave_mode is False
+        assert slave._group.master is None
+        assert slave._group.members == []
+        assert slave.entity_id not in master._group.members
         slave.async_write_ha_state.assert_called()
 
 
@@ -277,32 +273,32 @@ class TestAsyncRemoveFromGroup:
         self,
     ) -> None:
         master, (slave,) = _make_group("master", ["slave"])
-        master._is_master = True
-        master._multiroom_group = [master.entity_id, slave.entity_id]
+        master._group.is_master = True
+        master._group.members = [master.entity_id, slave.entity_id]
 
         await master.async_remove_from_group(slave)
 
         # When the group collapses to <=1 member, master should reset.
-        assert master._multiroom_group == []
-        assert master._is_master is False
+        assert master._group.members == []
+        assert master._group.is_master is False
         master.async_write_ha_state.assert_called()
 
     @pytest.mark.asyncio
     async def test_remove_keeps_remaining_slaves_grouped(self) -> None:
         master, (slave1, slave2) = _make_group("master", ["slave1", "slave2"])
-        master._is_master = True
-        master._multiroom_group = [
+        master._group.is_master = True
+        master._group.members = [
             master.entity_id,
             slave1.entity_id,
             slave2.entity_id,
         ]
-        slave2._slave_mode = True
-        slave2._multiroom_group = list(master._multiroom_group)
+        slave2._group.slave_mode = True
+        slave2._group.members = list(master._group.members)
 
         await master.async_remove_from_group(slave1)
 
-        assert master._multiroom_group == [master.entity_id, slave2.entity_id]
-        assert slave2._multiroom_group == [master.entity_id, slave2.entity_id]
+        assert master._group.members == [master.entity_id, slave2.entity_id]
+        assert slave2._group.members == [master.entity_id, slave2.entity_id]
         slave2.async_write_ha_state.assert_called()
 
 
@@ -316,12 +312,12 @@ class TestJoinGraceArmedAtStart:
         master, (slave,) = _make_group("master", ["slave"])
         master.call_linkplay_httpapi = AsyncMock(return_value="OK")
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
-        master._slave_zero_polls = 9  # saturated from a prior standalone period
+        master._group.zero_polls = 9  # saturated from a prior standalone period
 
         await master.async_join([slave])
 
-        assert master._multiroom_joinat is not None
-        assert master._slave_zero_polls == 0
+        assert master._group.joinat is not None
+        assert master._group.zero_polls == 0
 
     @pytest.mark.asyncio
     async def test_groupless_poll_right_after_join_does_not_tear_down(self) -> None:
@@ -331,11 +327,11 @@ class TestJoinGraceArmedAtStart:
         master, (slave,) = _make_group("master", ["slave"])
         master.call_linkplay_httpapi = AsyncMock(return_value="OK")
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
-        master._slave_zero_polls = 5  # pre-saturated, would tear down in one poll
+        master._group.zero_polls = 5  # pre-saturated, would tear down in one poll
 
         await master.async_join([slave])
-        assert master._is_master is True
-        group_after_join = list(master._multiroom_group)
+        assert master._group.is_master is True
+        group_after_join = list(master._group.members)
         assert slave.entity_id in group_after_join
 
         # Firmware lags: getSlaveList reports zero slaves on the next poll.
@@ -344,9 +340,9 @@ class TestJoinGraceArmedAtStart:
         )
         await master._async_poll_multiroom_master_status()
 
-        assert master._is_master is True
-        assert master._multiroom_group == group_after_join
-        assert master._slave_zero_polls == 0  # grace short-circuited the counter
+        assert master._group.is_master is True
+        assert master._group.members == group_after_join
+        assert master._group.zero_polls == 0  # grace short-circuited the counter
 
     @pytest.mark.asyncio
     async def test_all_slaves_fail_clears_grace(self) -> None:
@@ -358,8 +354,8 @@ class TestJoinGraceArmedAtStart:
 
         await master.async_join([slave])
 
-        assert slave.entity_id not in master._multiroom_group
-        assert master._multiroom_joinat is None
+        assert slave.entity_id not in master._group.members
+        assert master._group.joinat is None
 
 
 class TestAwaitSlaveIpsPolling:
@@ -370,8 +366,7 @@ class TestAwaitSlaveIpsPolling:
         with its WiFi-direct IP + volume."""
         master, (slave,) = _make_group("master", ["slave"])
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
-        master._slave_ip_poll_max = 5
-        master._slave_ip_poll_interval = 0
+        master._slave_ip_timeout = 5
         master.call_linkplay_httpapi = AsyncMock(side_effect=[
             "not-a-dict",                       # ignored (continue)
             {"slaves": 0, "slave_list": []},    # transient zero (continue)
@@ -385,5 +380,5 @@ class TestAwaitSlaveIpsPolling:
 
         await master.async_join([slave])
 
-        assert slave._slave_ip == "10.10.10.99"
-        assert slave._volume == 40
+        assert slave._group.slave_ip == "10.10.10.99"
+        assert slave._transport.volume == 40
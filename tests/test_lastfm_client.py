@@ -0,0 +1,159 @@
+"""Tests for the shared Last.fm client."""
+
+from __future__ import annotations
+
+import asyncio
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import pytest
+
+from custom_components.linkplay import lastfm_client
+from custom_components.linkplay.lastfm_client import (
+    RATELIMIT_MARKER,
+    LastFmClient,
+    TokenBucket,
+    get_lastfm_client,
+    track_key,
+)
+from custom_components.linkplay.metrics import CHANNEL_LASTFM, get_metrics
+
+HOST = "1.2.3.4"
+
+
+def _payload(cover: str) -> dict:
+    return {"track": {"album": {"image": [{}, {}, {}, {"#text": cover}]}}}
+
+
+def _session(payload=None, status=HTTPStatus.OK, error=None) -> MagicMock:
+    response = MagicMock(status=status)
+    response.json = AsyncMock(return_value=payload)
+    context = MagicMock()
+    context.__aenter__ = AsyncMock(return_value=response)
+    context.__aexit__ = AsyncMock(return_value=None)
+    session = MagicMock()
+    session.get = MagicMock(return_value=context, side_effect=error)
+    return session
+
+
+async def _cover(client, session, artist="Artist", title="Track"):
+    return await client.async_track_cover(session, "deadbeef", artist, title, HOST)
+
+
+class TestTrackCover:
+    @pytest.mark.asyncio
+    async def test_parameters_are_encoded_by_aiohttp(self) -> None:
+        session = _session(_payload("xl.jpg"))
+        assert await _cover(LastFmClient(), session, "Simon & Garfunkel", "Cecilia?") == "xl.jpg"
+        params = session.get.call_args.kwargs["params"]
+        assert params["artist"] == "Simon & Garfunkel"
+        assert params["track"] == "Cecilia?"
+        assert params["method"] == "track.getInfo"
+        assert session.get.call_args.kwargs["timeout"].total == 5
+        # The response is released back to the pool.
+        session.get.return_value.__aexit__.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_by_normalized_track(self) -> None:
+        client = LastFmClient()
+        session = _session(_payload("xl.jpg"))
+        assert await _cover(client, session) == "xl.jpg"
+        assert await _cover(client, session, " artist ", "TRACK") == "xl.jpg"
+        assert session.get.call_count == 1
+        assert get_metrics(HOST).caches[CHANNEL_LASTFM] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_missing_cover_is_cached(self) -> None:
+        client = LastFmClient()
+        session = _session({"not": "right"})
+        assert await _cover(client, session) is None
+        assert await _cover(client, session) is None
+        assert session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_lookups_share_one_request(self) -> None:
+        client = LastFmClient()
+        release = asyncio.Event()
+        response = MagicMock(status=HTTPStatus.OK)
+        response.json = AsyncMock(return_value=_payload("xl.jpg"))
+
+        async def _enter(*_args):
+            await release.wait()
+            return response
+
+        session = _session()
+        session.get.return_value.__aenter__ = AsyncMock(side_effect=_enter)
+        lookups = [asyncio.ensure_future(_cover(client, session)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        assert await asyncio.gather(*lookups) == ["xl.jpg"] * 3
+        assert session.get.call_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "session",
+        [
+            _session(status=HTTPStatus.FORBIDDEN),
+            _session(error=aiohttp.ClientError()),
+        ],
+    )
+    async def test_failures_are_not_cached(self, session) -> None:
+        client = LastFmClient()
+        assert await _cover(client, session) is None
+        assert await _cover(client, session) is None
+        assert session.get.call_count == 2
+
+
+class TestRateLimit:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "session",
+        [
+            _session(_payload(f"https://lastfm/{RATELIMIT_MARKER}.jpg")),
+            _session({"error": 29, "message": "Rate limit exceeded"}),
+            _session(status=HTTPStatus.TOO_MANY_REQUESTS),
+        ],
+    )
+    async def test_backs_off_all_lookups(self, session) -> None:
+        client = LastFmClient()
+        assert await _cover(client, session) is None
+        assert await _cover(client, session, title="Other") is None
+        assert session.get.call_count == 1
+        assert client._backoff == lastfm_client._BACKOFF_MIN
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_and_resets(self) -> None:
+        client = LastFmClient()
+        limited = _session({"error": 29})
+        for expected in (30.0, 60.0, 120.0):
+            client._blocked_until = 0.0
+            await _cover(client, limited)
+            assert client._backoff == expected
+        client._blocked_until = 0.0
+        await _cover(client, _session(_payload("xl.jpg")))
+        assert client._backoff == 0.0
+
+    @pytest.mark.asyncio
+    async def test_saturated_bucket_skips_lookup(self) -> None:
+        client = LastFmClient(rate=0.1, burst=1)
+        session = _session(_payload("xl.jpg"))
+        assert await _cover(client, session, title="One") == "xl.jpg"
+        assert await _cover(client, session, title="Two") is None
+        assert session.get.call_count == 1
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self) -> None:
+        bucket = TokenBucket(rate=2.0, capacity=2)
+        assert bucket.take() == 0.0
+        assert bucket.take() == 0.0
+        assert bucket.take() == pytest.approx(0.5, abs=0.01)
+
+
+def test_track_key_normalizes_case_and_spacing() -> None:
+    assert track_key("  The  Beatles", "Let It Be ") == track_key("the beatles", "LET IT BE")
+
+
+def test_client_is_shared() -> None:
+    assert get_lastfm_client() is get_lastfm_client()
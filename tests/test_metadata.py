@@ -5,7 +5,10 @@ from __future__ import annotations
 import pytest
 
 from custom_components.linkplay.metadata import (
+    DidlDecoder,
+    DidlMetadata,
     decode_hex_utf8,
+    parse_didl_metadata,
     parse_icy_name,
     parse_icy_stream_title,
     parse_m3u_first_url,
@@ -175,3 +178,34 @@ class TestPlaylistParsers:
     def test_pls_tolerates_whitespace(self) -> None:
         text = "[playlist]\n  File1  =  http://example.com/stream  \n"
         assert parse_pls_first_url(text) == "http://example.com/stream"
+
+
+_DIDL = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<DIDL-Lite xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/" '
+    'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+    'xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/">'
+    "<item><dc:title>Jóga</dc:title><upnp:artist>Björk</upnp:artist>"
+    "<res><dc:title>nested</dc:title></res>"
+    "<upnp:albumArtURI>{art}</upnp:albumArtURI></item></DIDL-Lite>"
+)
+
+
+class TestDidlMetadata:
+    def test_fields_in_one_pass(self) -> None:
+        assert parse_didl_metadata(_DIDL.format(art="https://example.com/a.jpg")) == DidlMetadata(
+            title="Jóga", artist="Björk", album=None, image_url="https://example.com/a.jpg",
+        )
+
+    def test_invalid_art_url_is_dropped(self) -> None:
+        assert parse_didl_metadata(_DIDL.format(art="not-a-url")).image_url is None
+
+    def test_decoder_reuses_last_result_and_reports_errors(self) -> None:
+        decoder = DidlDecoder()
+        raw = _DIDL.format(art="")
+        first = decoder.decode(raw)
+        assert decoder.decode("".join(raw)) is first
+        assert decoder.decode("<DIDL-Lite> bad & unescaped") is None
+        assert decoder.error is not None
+        assert decoder.decode(raw) == first
+        assert decoder.error is None
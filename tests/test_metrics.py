@@ -0,0 +1,208 @@
+"""Tests for per-host request metrics and where they surface."""
+
+from __future__ import annotations
+
+import time
+from http import HTTPStatus
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.linkplay.const import DOMAIN
+from custom_components.linkplay.diagnostics import async_get_config_entry_diagnostics
+from custom_components.linkplay.metrics import (
+    CHANNEL_HTTPAPI,
+    CHANNEL_UPNP,
+    ERROR_HTTP,
+    ERROR_TIMEOUT,
+    LatencyHistogram,
+    LinkPlayMetrics,
+    RequestTrace,
+    command_key,
+    get_metrics,
+)
+from custom_components.linkplay.sensor import SENSORS, LinkPlayMetricSensor
+from tests._helpers import make_device
+from tests.test_api_client import _FakeDevice, _patch_session, _session_with
+
+
+class TestLatencyHistogram:
+    def test_percentiles_use_bucket_bounds_capped_at_max(self) -> None:
+        hist = LatencyHistogram()
+        for ms in (3, 4, 30, 40, 700):
+            hist.observe(ms)
+        assert hist.count == 5
+        assert hist.percentile(0.5) == 50.0
+        assert hist.percentile(1.0) == 700.0
+        assert LatencyHistogram().percentile(0.5) is None
+
+    def test_overflow_bucket_reports_max(self) -> None:
+        hist = LatencyHistogram()
+        hist.observe(60_000)
+        assert hist.percentile(0.95) == 60_000
+        assert hist.as_dict()["buckets"]["inf"] == 1
+
+
+class TestLinkPlayMetrics:
+    def test_command_arguments_are_stripped(self) -> None:
+        assert command_key("setPlayerCmd:vol:30") == "setPlayerCmd:vol"
+        assert command_key("setPlayerCmd:play:http://x/y") == "setPlayerCmd:play"
+        assert command_key("getPlayerStatus") == "getPlayerStatus"
+
+    def test_errors_are_counted_per_kind(self) -> None:
+        metrics = LinkPlayMetrics()
+        started = time.monotonic()
+        metrics.record_request(CHANNEL_HTTPAPI, "getPlayerStatus", started)
+        metrics.record_request(CHANNEL_HTTPAPI, "getPlayerStatus", started, ERROR_TIMEOUT)
+        metrics.record_request(CHANNEL_HTTPAPI, "setPlayerCmd:vol:5", started, ERROR_TIMEOUT)
+        metrics.record_request(CHANNEL_UPNP, "GetMediaInfo", started, ERROR_HTTP)
+        assert metrics.error_counts() == {ERROR_TIMEOUT: 2}
+        assert metrics.requests[CHANNEL_HTTPAPI]["getPlayerStatus"].latency.count == 2
+
+    def test_command_key_space_is_bounded(self, monkeypatch) -> None:
+        monkeypatch.setattr("custom_components.linkplay.metrics._MAX_COMMANDS_PER_CHANNEL", 2)
+        metrics = LinkPlayMetrics()
+        for cmd in ("a", "b", "c", "d"):
+            metrics.record_request(CHANNEL_HTTPAPI, cmd, time.monotonic())
+        assert sorted(metrics.requests[CHANNEL_HTTPAPI]) == ["a", "b", "other"]
+        assert metrics.requests[CHANNEL_HTTPAPI]["other"].latency.count == 2
+
+    def test_cache_hit_rate(self) -> None:
+        metrics = LinkPlayMetrics()
+        assert metrics.cache_hit_rate() is None
+        metrics.record_cache("itunes", True)
+        metrics.record_cache("itunes", True)
+        metrics.record_cache("somafm_channels", False)
+        assert metrics.cache_hit_rate() == pytest.approx(66.7)
+
+
+class TestRequestTrace:
+    def test_keeps_last_entries_oldest_first(self) -> None:
+        trace = RequestTrace(capacity=3)
+        for i in range(5):
+            trace.append(CHANNEL_HTTPAPI, f"cmd{i}", float(i), 200, i * 10, None)
+        entries = trace.entries()
+        assert [e["command"] for e in entries] == ["cmd2", "cmd3", "cmd4"]
+        assert entries[0]["bytes"] == 20
+        assert entries[0]["status"] == 200
+
+    def test_unknown_status_and_size_read_as_none(self) -> None:
+        trace = RequestTrace(capacity=2)
+        trace.append(CHANNEL_UPNP, "GetMediaInfo", 1.0, 0, -1, ERROR_HTTP)
+        assert trace.entries()[0] | {"at": None} == {
+            "at": None, "channel": CHANNEL_UPNP, "command": "GetMediaInfo",
+            "latency_ms": 1.0, "status": None, "bytes": None, "error": ERROR_HTTP,
+        }
+
+    def test_storage_does_not_grow_once_full(self) -> None:
+        trace = RequestTrace(capacity=4)
+        columns = (trace._at, trace._latency, trace._status, trace._bytes, trace._command)
+        for _ in range(100):
+            trace.append(CHANNEL_HTTPAPI, "getPlayerStatus", 1.0, 200, 10, None)
+        assert len(trace) == 4
+        assert all(len(column) == 4 for column in columns)
+        current = (trace._at, trace._latency, trace._status, trace._bytes, trace._command)
+        assert all(a is b for a, b in zip(current, columns))
+
+
+class TestInstrumentation:
+    @pytest.mark.asyncio
+    async def test_httpapi_success_and_timeout_are_recorded(self) -> None:
+        dev = _FakeDevice()
+        response = MagicMock(status=HTTPStatus.OK)
+        response.json = AsyncMock(return_value={"vol": "5"})
+
+        with _patch_session(_session_with(AsyncMock(return_value=response))):
+            await dev.call_linkplay_httpapi("getPlayerStatus", True)
+        with _patch_session(_session_with(AsyncMock(side_effect=TimeoutError))):
+            await dev.call_linkplay_httpapi("getPlayerStatus", True)
+
+        stats = get_metrics(dev._host).requests[CHANNEL_HTTPAPI]["getPlayerStatus"]
+        assert stats.latency.count == 2
+        assert stats.errors == {ERROR_TIMEOUT: 1}
+        first, second = get_metrics(dev._host).trace.entries()
+        assert (first["status"], first["error"]) == (200, None)
+        assert (second["status"], second["error"]) == (None, ERROR_TIMEOUT)
+
+    @pytest.mark.asyncio
+    async def test_async_update_records_poll_duration(self) -> None:
+        dev = make_device(host="10.9.9.9")
+        dev._group.slave_mode = True
+        dev._group.master = MagicMock()
+        await dev.async_update()
+
+        metrics = get_metrics("10.9.9.9")
+        assert metrics.polls.count == 1
+        assert metrics.last_poll_ms is not None
+
+
+def _entry(**data):
+    entry = MagicMock()
+    entry.title = "Kitchen"
+    entry.unique_id = "uuid-1"
+    entry.data = {"host": "10.0.0.7", **data}
+    entry.as_dict.return_value = {"title": "Kitchen", "data": dict(entry.data)}
+    return entry
+
+
+class TestSurfaces:
+    def test_sensors_read_host_metrics(self) -> None:
+        metrics = get_metrics("10.0.0.7")
+        started = time.monotonic()
+        metrics.record_request(CHANNEL_HTTPAPI, "getStatus", started, ERROR_TIMEOUT)
+        metrics.record_poll(started)
+
+        sensors = {d.key: LinkPlayMetricSensor(_entry(), d) for d in SENSORS}
+        assert sensors["request_errors"].native_value == 1
+        assert sensors["request_errors"].extra_state_attributes == {ERROR_TIMEOUT: 1}
+        assert sensors["poll_duration"].native_value is not None
+        assert sensors["cache_hit_rate"].native_value is None
+        assert sensors["poll_duration"].unique_id == "uuid-1_poll_duration"
+        assert sensors["poll_duration"].name == "Kitchen Poll duration"
+
+    def test_sensors_share_the_media_player_device(self) -> None:
+        sensor = LinkPlayMetricSensor(_entry(), SENSORS[0])
+        player = make_device("Kitchen", host="10.0.0.7")
+        player._uuid = "uuid-1"
+        assert sensor.device_info["identifiers"] == {(DOMAIN, "uuid-1")}
+        assert player.device_info["identifiers"] == sensor.device_info["identifiers"]
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_redact_api_key(self) -> None:
+        get_metrics("10.0.0.7").record_poll(time.monotonic())
+        result = await async_get_config_entry_diagnostics(
+            MagicMock(), _entry(lastfm_api_key="secret"),
+        )
+        assert result["entry"]["data"]["lastfm_api_key"] == "**REDACTED**"
+        assert result["metrics"]["polls"]["count"] == 1
+        assert result["device"] is None
+        assert result["transport"]["circuit_breaker"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_diagnostics_include_entity_state(self) -> None:
+        master = make_device("master", host="10.0.0.7")
+        slave = make_device("slave", host="10.0.0.8")
+        master._player_statdata = {"status": "play", "vol": "20"}
+        master._group.is_master = True
+        master._group.slave_list = [slave]
+        master._group.members = [master.entity_id, slave.entity_id]
+        get_metrics("10.0.0.7").record_request(
+            CHANNEL_HTTPAPI, "getPlayerStatus", time.monotonic(), status=200, size=321,
+        )
+        hass = MagicMock()
+        hass.data = {"linkplay": MagicMock(entities=[slave, master])}
+
+        result = await async_get_config_entry_diagnostics(hass, _entry())
+
+        device = result["device"]
+        assert device["entity_id"] == "media_player.master"
+        assert device["player_status"] == {"status": "play", "vol": "20"}
+        assert device["topology"]["slaves"] == ["media_player.slave"]
+        assert device["player"]["volume"] == 0
+        assert device["metadata"]["title"] is None
+        assert device["playing"]["localfile"] is True
+        assert device["snapshot"]["active"] is False
+        assert device["snapshot"]["volume"] == 0
+        assert device["quirks"]["join_grace"] == 10.0
+        assert result["metrics"]["recent_requests"][0]["bytes"] == 321
+        assert result["providers"]["itunes"]["count"] == 0
@@ -17,8 +17,7 @@ def _make_device():
     dev.async_write_ha_state = MagicMock()
     dev.call_linkplay_httpapi = AsyncMock(return_value="OK")
     # Skip the post-join slave-IP poll wait; these tests don't exercise it.
-    dev._slave_ip_poll_interval = 0
-    dev._slave_ip_poll_max = 0
+    dev._slave_ip_timeout = 0
     return dev
 
 
@@ -29,13 +28,13 @@ class TestDebugAttr:
             "custom_components.linkplay.media_player.DEBUGSTR_ATTR", True
         )
         dev = _make_device()
-        dev._playing_localfile = True
-        dev._playing_spotify = True
-        dev._playing_webplaylist = True
-        dev._playing_stream = True
-        dev._playing_liveinput = True
-        dev._playing_tts = True
-        dev._playing_mediabrowser = True
+        dev._playing.localfile = True
+        dev._playing.spotify = True
+        dev._playing.webplaylist = True
+        dev._playing.stream = True
+        dev._playing.liveinput = True
+        dev._playing.tts = True
+        dev._playing.mediabrowser = True
         attrs = dev.extra_state_attributes
         # debug string should mention every flag we set
         from custom_components.linkplay.media_player import ATTR_DEBUG
@@ -49,7 +48,7 @@ class TestMediaSourceResolution:
     async def test_local_media_source_url_resolved(self) -> None:
         dev = _make_device()
         dev._fw_ver = "4.2"
-        dev._volume = 0
+        dev._transport.volume = 0
         dev.async_detect_stream_url_redirection = AsyncMock(side_effect=lambda u: u)
 
         # Fake play item from media_source.async_resolve_media
@@ -72,13 +71,13 @@ class TestMediaSourceResolution:
                 "media-source://media_source/local/Song.mp3",
             )
         assert ok is True
-        assert dev._media_source_uri == "media-source://media_source/local/Song.mp3"
+        assert dev._meta.source_uri == "media-source://media_source/local/Song.mp3"
 
     @pytest.mark.asyncio
     async def test_radio_browser_does_not_set_mediabrowser_flag(self) -> None:
         dev = _make_device()
         dev._fw_ver = "4.2"
-        dev._volume = 0
+        dev._transport.volume = 0
         dev.async_detect_stream_url_redirection = AsyncMock(side_effect=lambda u: u)
 
         play_item = MagicMock()
@@ -100,13 +99,13 @@ class TestMediaSourceResolution:
                 "media-source://radio_browser/some-station",
             )
         assert ok is True
-        assert dev._playing_mediabrowser is False
+        assert dev._playing.mediabrowser is False
 
     @pytest.mark.asyncio
     async def test_unsupported_mime_type_returns_false(self) -> None:
         dev = _make_device()
         dev._fw_ver = "4.2"
-        dev._volume = 0
+        dev._transport.volume = 0
 
         play_item = MagicMock()
         play_item.url = "http://x/video.mp4"
@@ -124,7 +123,7 @@ class TestMediaSourceResolution:
                 "media-source://media_source/foo.mp4",
             )
         assert ok is False
-        assert dev._playing_mediabrowser is False
+        assert dev._playing.mediabrowser is False
 
 
 class TestMultiroomJoinUnjoin:
@@ -133,7 +132,7 @@ class TestMultiroomJoinUnjoin:
         from homeassistant.const import STATE_UNAVAILABLE
 
         dev = _make_device()
-        dev._state = STATE_UNAVAILABLE
+        dev._transport.state = STATE_UNAVAILABLE
         slaves = [_make_device()]
         await dev.async_join(slaves)
         # No HTTP traffic because the master is unavailable
@@ -142,13 +141,13 @@ class TestMultiroomJoinUnjoin:
     @pytest.mark.asyncio
     async def test_join_wifi_direct_command_shape(self) -> None:
         dev = _make_device()
-        dev._multiroom_wifidirect = True
+        dev._group.wifidirect = True
         dev._ssid = "deadbeef"
         dev._wifi_channel = "6"
         slave = _make_device()
         slave.entity_id = "media_player.slave"
-        slave._is_master = False
-        slave._slave_mode = False
+        slave._group.is_master = False
+        slave._group.slave_mode = False
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
         await dev.async_join([slave])
         sent = slave.call_linkplay_httpapi.await_args.args[0]
@@ -157,12 +156,12 @@ class TestMultiroomJoinUnjoin:
     @pytest.mark.asyncio
     async def test_join_slave_already_in_slave_mode_unjoins_first(self) -> None:
         dev = _make_device()
-        dev._multiroom_wifidirect = False
+        dev._group.wifidirect = False
         dev._host = "1.2.3.4"
         slave = _make_device()
         slave.entity_id = "media_player.slave"
-        slave._is_master = False
-        slave._slave_mode = True
+        slave._group.is_master = False
+        slave._group.slave_mode = True
         slave.async_unjoin_me = AsyncMock()
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
         await dev.async_join([slave])
@@ -173,7 +172,7 @@ class TestMultiroomJoinUnjoin:
         dev = _make_device()
         slave = _make_device()
         slave.entity_id = "media_player.slave"
-        slave._is_master = True
+        slave._group.is_master = True
         slave.async_unjoin_all = AsyncMock()
         slave.call_linkplay_httpapi = AsyncMock(return_value="OK")
         await dev.async_join([slave])
@@ -182,8 +181,8 @@ class TestMultiroomJoinUnjoin:
     @pytest.mark.asyncio
     async def test_unjoin_player_master_calls_unjoin_all(self) -> None:
         dev = _make_device()
-        dev._is_master = True
-        dev._slave_mode = False
+        dev._group.is_master = True
+        dev._group.slave_mode = False
         dev.async_unjoin_all = AsyncMock()
         await dev.async_unjoin_player()
         dev.async_unjoin_all.assert_awaited_once()
@@ -191,8 +190,8 @@ class TestMultiroomJoinUnjoin:
     @pytest.mark.asyncio
     async def test_unjoin_player_slave_calls_unjoin_me(self) -> None:
         dev = _make_device()
-        dev._is_master = False
-        dev._slave_mode = True
+        dev._group.is_master = False
+        dev._group.slave_mode = True
         dev.async_unjoin_me = AsyncMock()
         await dev.async_unjoin_player()
         dev.async_unjoin_me.assert_awaited_once()
@@ -200,41 +199,41 @@ class TestMultiroomJoinUnjoin:
     @pytest.mark.asyncio
     async def test_unjoin_me_router_mode_success(self) -> None:
         dev = _make_device()
-        dev._slave_mode = True
-        dev._multiroom_wifidirect = False
+        dev._group.slave_mode = True
+        dev._group.wifidirect = False
         master = _make_device()
         master.async_remove_from_group = AsyncMock()
         master.async_write_ha_state = MagicMock()
-        dev._master = master
+        dev._group.master = master
         dev.call_linkplay_httpapi = AsyncMock(return_value="OK")
         await dev.async_unjoin_me()
         master.async_remove_from_group.assert_awaited_once()
-        assert dev._slave_mode is False
+        assert dev._group.slave_mode is False
 
     @pytest.mark.asyncio
     async def test_unjoin_me_failure_logs_and_keeps_state(self) -> None:
         dev = _make_device()
-        dev._slave_mode = True
-        dev._multiroom_wifidirect = False
-        dev._master = _make_device()
+        dev._group.slave_mode = True
+        dev._group.wifidirect = False
+        dev._group.master = _make_device()
         dev.call_linkplay_httpapi = AsyncMock(return_value="FAIL")
         await dev.async_unjoin_me()
-        assert dev._slave_mode is True
+        assert dev._group.slave_mode is True
 
     @pytest.mark.asyncio
     async def test_unjoin_me_wifidirect_uses_kickout(self) -> None:
         dev = _make_device()
-        dev._slave_mode = True
-        dev._multiroom_wifidirect = True
-        dev._slave_ip = "10.0.0.50"
+        dev._group.slave_mode = True
+        dev._group.wifidirect = True
+        dev._group.slave_ip = "10.0.0.50"
         master = _make_device()
-        master._is_master = True
+        master._group.is_master = True
         master.entity_id = "media_player.master"
         master.call_linkplay_httpapi = AsyncMock(return_value="OK")
         master.async_remove_from_group = AsyncMock()
         master.async_write_ha_state = MagicMock()
         dev.hass.data["linkplay"].entities = [master]
-        dev._master = master
+        dev._group.master = master
         await dev.async_unjoin_me()
         cmd = master.call_linkplay_httpapi.await_args.args[0]
         assert cmd == "multiroom:SlaveKickout:10.0.0.50"
@@ -257,7 +256,7 @@ class TestSomaFmEdgeCases:
     async def test_channel_map_http_error_caches_empty(self) -> None:
         import custom_components.linkplay.somafm_fetcher_mixin as mod
         dev = self._dev()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
         # channels.json returns 503 -> empty cache; songs.json returns 200 OK
         channels_resp = MagicMock()
         channels_resp.status = 503
@@ -279,7 +278,7 @@ class TestSomaFmEdgeCases:
     async def test_channel_map_fetch_exception_cached_empty(self) -> None:
         import custom_components.linkplay.somafm_fetcher_mixin as mod
         dev = self._dev()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
         # channels.json raises; songs request still succeeds via alphanumonly fallback
         songs_resp = MagicMock()
         songs_resp.status = 200
@@ -304,7 +303,7 @@ class TestSomaFmEdgeCases:
     @pytest.mark.asyncio
     async def test_song_fetch_timeout_returns_false(self) -> None:
         dev = self._dev()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
         session = MagicMock()
         session.get = AsyncMock(side_effect=TimeoutError())
         with patch(
@@ -317,7 +316,7 @@ class TestSomaFmEdgeCases:
     @pytest.mark.asyncio
     async def test_song_json_parse_error_returns_false(self) -> None:
         dev = self._dev()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
         resp = MagicMock()
         resp.status = 200
         resp.json = AsyncMock(side_effect=ValueError("bad json"))
@@ -333,7 +332,7 @@ class TestSomaFmEdgeCases:
     @pytest.mark.asyncio
     async def test_songs_missing_artist_returns_false(self) -> None:
         dev = self._dev()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
         resp = MagicMock()
         resp.status = 200
         resp.json = AsyncMock(return_value={"songs": [{"title": "x"}]})
@@ -8,6 +8,7 @@ group pushed by the master).
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -24,7 +25,7 @@ def _make_device(name: str = "device") -> LinkPlayDevice:
 
 
 class TestGroupMembersProperty:
-    """group_members must reflect _multiroom_group for HA / mini-media-player."""
+    """group_members must reflect _group.members for HA / mini-media-player."""
 
     def test_empty_group_returns_empty_list(self) -> None:
         dev = _make_device()
@@ -32,16 +33,16 @@ class TestGroupMembersProperty:
 
     def test_returns_current_group(self) -> None:
         dev = _make_device()
-        dev._multiroom_group = ["media_player.a", "media_player.b"]
+        dev._group.members = ["media_player.a", "media_player.b"]
         assert dev.group_members == ["media_player.a", "media_player.b"]
 
     def test_returned_list_is_isolated_copy(self) -> None:
         """Mutating the returned list must not corrupt internal state."""
         dev = _make_device()
-        dev._multiroom_group = ["media_player.a"]
+        dev._group.members = ["media_player.a"]
         got = dev.group_members
         got.append("media_player.b")
-        assert dev._multiroom_group == ["media_player.a"]
+        assert dev._group.members == ["media_player.a"]
 
 
 class TestJoinPlayersSignature:
@@ -93,7 +94,7 @@ class TestJoinGracePollWindow:
     """v4.5.9: ``multiroom:getSlaveList`` returns ``slaves=0`` for several
     seconds after a WiFi-direct ``ConnectMasterAp`` join on AudioPro
     firmware. The master-side poll must keep the locally-built
-    ``_multiroom_group`` during that grace window, or
+    ``_group.members`` during that grace window, or
     ``linkplay.set_group_volume`` finds an empty group when it runs
     immediately after ``linkplay.join``.
     """
@@ -107,20 +108,20 @@ class TestJoinGracePollWindow:
 
         master = _make_device("master")
         master.hass.data["linkplay"].entities = [master]
-        master._is_master = True
-        master._multiroom_group = [
+        master._group.is_master = True
+        master._group.members = [
             "media_player.master",
             "media_player.kitchen",
         ]
-        master._multiroom_joinat = utcnow() - timedelta(seconds=2)
+        master._group.joinat = utcnow() - timedelta(seconds=2)
         master.call_linkplay_httpapi = AsyncMock(
             return_value={"slaves": 0, "slave_list": []}
         )
 
         await master._async_poll_multiroom_master_status()
 
-        assert master._is_master is True
-        assert master._multiroom_group == [
+        assert master._group.is_master is True
+        assert master._group.members == [
             "media_player.master",
             "media_player.kitchen",
         ]
@@ -134,12 +135,12 @@ class TestJoinGracePollWindow:
 
         master = _make_device("master")
         master.hass.data["linkplay"].entities = [master]
-        master._is_master = True
-        master._multiroom_group = [
+        master._group.is_master = True
+        master._group.members = [
             "media_player.master",
             "media_player.kitchen",
         ]
-        master._multiroom_joinat = utcnow() - timedelta(seconds=30)
+        master._group.joinat = utcnow() - timedelta(seconds=30)
         master.call_linkplay_httpapi = AsyncMock(
             return_value={"slaves": 0, "slave_list": []}
         )
@@ -147,16 +148,16 @@ class TestJoinGracePollWindow:
         # Grace has expired, but the zero-slaves report is still debounced:
         # one poll holds the group, a second consecutive poll clears it.
         await master._async_poll_multiroom_master_status()
-        assert master._is_master is True
-        assert master._multiroom_group == [
+        assert master._group.is_master is True
+        assert master._group.members == [
             "media_player.master",
             "media_player.kitchen",
         ]
 
         await master._async_poll_multiroom_master_status()
 
-        assert master._is_master is False
-        assert master._multiroom_group == []
+        assert master._group.is_master is False
+        assert master._group.members == []
 
     @pytest.mark.asyncio
     async def test_poll_clears_grace_timestamp_when_firmware_confirms_slaves(
@@ -167,12 +168,12 @@ class TestJoinGracePollWindow:
         master = _make_device("master")
         kitchen = _make_device("kitchen")
         master.hass.data["linkplay"].entities = [master, kitchen]
-        master._is_master = True
-        master._multiroom_group = [
+        master._group.is_master = True
+        master._group.members = [
             "media_player.master",
             "media_player.kitchen",
         ]
-        master._multiroom_joinat = utcnow()
+        master._group.joinat = utcnow()
         master.call_linkplay_httpapi = AsyncMock(
             return_value={
                 "slaves": 1,
@@ -184,9 +185,9 @@ class TestJoinGracePollWindow:
 
         await master._async_poll_multiroom_master_status()
 
-        assert master._multiroom_joinat is None
-        assert master._is_master is True
-        assert "media_player.kitchen" in master._multiroom_group
+        assert master._group.joinat is None
+        assert master._group.is_master is True
+        assert "media_player.kitchen" in master._group.members
 
     @pytest.mark.asyncio
     async def test_poll_no_response_preserves_group_during_grace(
@@ -197,22 +198,43 @@ class TestJoinGracePollWindow:
 
         master = _make_device("master")
         master.hass.data["linkplay"].entities = [master]
-        master._is_master = True
-        master._multiroom_group = [
+        master._group.is_master = True
+        master._group.members = [
             "media_player.master",
             "media_player.kitchen",
         ]
-        master._multiroom_joinat = utcnow() - timedelta(seconds=2)
+        master._group.joinat = utcnow() - timedelta(seconds=2)
         master.call_linkplay_httpapi = AsyncMock(return_value=None)
 
         await master._async_poll_multiroom_master_status()
 
-        assert master._is_master is True
-        assert master._multiroom_group == [
+        assert master._group.is_master is True
+        assert master._group.members == [
             "media_player.master",
             "media_player.kitchen",
         ]
 
+    @pytest.mark.asyncio
+    async def test_dropped_polls_do_not_count_toward_teardown(self) -> None:
+        from datetime import timedelta
+        from homeassistant.util.dt import utcnow
+
+        from custom_components.linkplay.request_scheduler import RequestDropped
+
+        master = _make_device("master")
+        master.hass.data["linkplay"].entities = [master]
+        master._group.is_master = True
+        master._group.members = ["media_player.master", "media_player.kitchen"]
+        master._group.joinat = utcnow() - timedelta(seconds=30)
+        master.call_linkplay_httpapi = AsyncMock(side_effect=RequestDropped)
+
+        for _ in range(5):
+            await master._async_poll_multiroom_master_status()
+
+        assert master._group.is_master is True
+        assert master._group.members == ["media_player.master", "media_player.kitchen"]
+        assert master._group.zero_polls == 0
+
 
 class TestMultiroomGroupSetter:
     """Master pushes group to slaves via async_set_multiroom_group."""
@@ -223,7 +245,7 @@ class TestMultiroomGroupSetter:
         await dev.async_set_multiroom_group(
             ["media_player.master", "media_player.slave"]
         )
-        assert dev._multiroom_group == [
+        assert dev._group.members == [
             "media_player.master",
             "media_player.slave",
         ]
@@ -236,21 +258,21 @@ class TestMultiroomGroupSetter:
 class TestSlavePollPreservesGroup:
     """Regression for v4.0.5: slave's async_update must not wipe its group.
 
-    When _slave_mode is True and _master is set, async_update must early
-    return at the slave-mode guard, leaving _multiroom_group intact.
+    When _group.slave_mode is True and _group.master is set, async_update must early
+    return at the slave-mode guard, leaving _group.members intact.
     Without this, cards see group_members go empty every poll cycle (3 s).
     """
 
     @pytest.mark.asyncio
     async def test_slave_with_valid_master_preserves_group(self) -> None:
         master = _make_device("master")
-        master._is_master = True
+        master._group.is_master = True
         master.entity_id = "media_player.master"
 
         slave = _make_device("slave")
-        slave._slave_mode = True
-        slave._master = master
-        slave._multiroom_group = [
+        slave._group.slave_mode = True
+        slave._group.master = master
+        slave._group.members = [
             "media_player.master",
             "media_player.slave",
         ]
@@ -265,8 +287,8 @@ class TestSlavePollPreservesGroup:
         result = await slave.async_update()
 
         assert result is True
-        assert slave._slave_mode is True
-        assert slave._multiroom_group == [
+        assert slave._group.slave_mode is True
+        assert slave._group.members == [
             "media_player.master",
             "media_player.slave",
         ]
@@ -277,19 +299,19 @@ class TestSlavePollPreservesGroup:
 
     @pytest.mark.asyncio
     async def test_slave_with_lost_master_ref_recovers_from_entities(self) -> None:
-        """Slave whose python _master ref was lost should re-resolve the
+        """Slave whose python _group.master ref was lost should re-resolve the
         master from the registered entities by the entity_id stored in
-        _multiroom_group[0], rather than dropping slave_mode and wiping
+        _group.members[0], rather than dropping slave_mode and wiping
         the group on the next poll.
         """
         master = _make_device("master")
-        master._is_master = True
+        master._group.is_master = True
         master.entity_id = "media_player.master"
 
         slave = _make_device("slave")
-        slave._slave_mode = True
-        slave._master = None  # ref lost (e.g. master entity reloaded)
-        slave._multiroom_group = [
+        slave._group.slave_mode = True
+        slave._group.master = None  # ref lost (e.g. master entity reloaded)
+        slave._group.members = [
             "media_player.master",
             "media_player.slave",
         ]
@@ -297,9 +319,9 @@ class TestSlavePollPreservesGroup:
 
         await slave.async_update()
 
-        assert slave._slave_mode is True
-        assert slave._master is master
-        assert slave._multiroom_group == [
+        assert slave._group.slave_mode is True
+        assert slave._group.master is master
+        assert slave._group.members == [
             "media_player.master",
             "media_player.slave",
         ]
@@ -311,9 +333,9 @@ class TestSlavePollPreservesGroup:
         """Edge case: nothing to recover from -> slave_mode falls back to
         False, but only when there's truly no group to anchor on."""
         slave = _make_device("orphan")
-        slave._slave_mode = True
-        slave._master = None
-        slave._multiroom_group = []
+        slave._group.slave_mode = True
+        slave._group.master = None
+        slave._group.members = []
         slave.hass.data["linkplay"].entities = [slave]
 
         slave.async_get_status = AsyncMock()
@@ -322,25 +344,120 @@ class TestSlavePollPreservesGroup:
 
         await slave.async_update()
 
-        assert slave._slave_mode is False
+        assert slave._group.slave_mode is False
 
 
 class TestMultiroomPropertiesAndRestore:
     def test_slave_and_master_properties(self) -> None:
         dev = _make_device("dev")
-        dev._slave_mode = True
+        dev._group.slave_mode = True
         assert dev.slave is True
         master = _make_device("master")
-        dev._master = master
+        dev._group.master = master
         assert dev.master is master
 
     @pytest.mark.asyncio
     async def test_restore_previous_source(self) -> None:
         dev = _make_device("dev")
-        dev._multiroom_prevsrc = "Bluetooth"
+        dev._group.prevsrc = "Bluetooth"
         dev.select_source = MagicMock()
 
         await dev.async_restore_previous_source()
 
         dev.select_source.assert_called_once_with("Bluetooth")
-        assert dev._multiroom_prevsrc is None
+        assert dev._group.prevsrc is None
+
+
+class TestBroadcastToSlaves:
+    """Master-to-slave mirroring runs concurrently and reports stragglers."""
+
+    @pytest.mark.asyncio
+    async def test_updates_every_slave_concurrently(self) -> None:
+        master = _make_device("master")
+        slaves = [_make_device(f"s{i}") for i in range(6)]
+        master._group.slave_list = slaves
+        in_flight = 0
+        peak = 0
+
+        async def _update(slave):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            await slave.async_set_source("Line In")
+            in_flight -= 1
+
+        stragglers = await master._async_broadcast_to_slaves(_update)
+
+        assert stragglers == []
+        assert peak == len(slaves)
+        assert all(s._transport.source == "Line In" for s in slaves)
+
+    @pytest.mark.asyncio
+    async def test_slow_slave_is_reported_without_blocking_others(self) -> None:
+        master = _make_device("master")
+        fast, slow = _make_device("fast"), _make_device("slow")
+        master._group.slave_list = [fast, slow]
+        master._slave_broadcast_timeout = 0.01
+
+        async def _update(slave):
+            if slave is slow:
+                await asyncio.sleep(1)
+            await slave.async_set_source("Line In")
+
+        stragglers = await master._async_broadcast_to_slaves(_update)
+
+        assert stragglers == [slow]
+        assert fast._transport.source == "Line In"
+        assert slow._transport.source is None
+
+    @pytest.mark.asyncio
+    async def test_failing_slave_is_reported(self) -> None:
+        master = _make_device("master")
+        ok, broken = _make_device("ok"), _make_device("broken")
+
+        async def _update(slave):
+            if slave is broken:
+                raise RuntimeError("boom")
+            await slave.async_set_state("playing")
+
+        stragglers = await master._async_broadcast_to_slaves(_update, [ok, broken])
+
+        assert stragglers == [broken]
+        assert ok._transport.state == "playing"
+
+    @pytest.mark.asyncio
+    async def test_no_slaves_is_noop(self) -> None:
+        master = _make_device("master")
+        master._group.slave_list = None
+        update = AsyncMock()
+
+        assert await master._async_broadcast_to_slaves(update) == []
+        update.assert_not_awaited()
+
+
+class TestGroupSlaveEntities:
+    def test_follows_group_composition(self) -> None:
+        master = _make_device("master")
+        a, b = _make_device("a"), _make_device("b")
+        a.entity_id, b.entity_id = "media_player.a", "media_player.b"
+        master.hass.data["linkplay"].entities = [master, a, b]
+        master._group.members = [master.entity_id, "media_player.a"]
+        assert master._group_slave_entities() == [a]
+
+        master._group.members.append("media_player.b")
+        assert master._group_slave_entities() == [a, b]
+
+    def test_entity_replaced_in_place_is_picked_up(self) -> None:
+        master = _make_device("master")
+        a = _make_device("a")
+        a.entity_id = "media_player.a"
+        entities = [master, a]
+        master.hass.data["linkplay"].entities = entities
+        master._group.members = [master.entity_id, "media_player.a"]
+        assert master._group_slave_entities() == [a]
+
+        reloaded = _make_device("a")
+        reloaded.entity_id = "media_player.a"
+        entities[1] = reloaded
+        assert master._group_slave_entities() == [reloaded]
@@ -23,7 +23,7 @@ def _make_device():
     dev.async_parse_pls_url = AsyncMock(side_effect=lambda u: u)
     dev.async_tracklist_via_upnp = AsyncMock()
     dev._fw_ver = "4.2"
-    dev._volume = 0
+    dev._transport.volume = 0
     return dev
 
 
@@ -40,9 +40,9 @@ class TestPlayMedia:
         dev = _make_device()
         ok = await dev._async_play_media_impl(MediaType.URL, "http://stream/mp3")
         assert ok is True
-        assert dev._state == STATE_PLAYING
-        assert dev._media_uri == "http://stream/mp3"
-        assert dev._playing_tts is False
+        assert dev._transport.state == STATE_PLAYING
+        assert dev._meta.uri == "http://stream/mp3"
+        assert dev._playing.tts is False
         cmd = dev.call_linkplay_httpapi.await_args.args[0]
         assert cmd == "setPlayerCmd:play:http://stream/mp3"
 
@@ -59,9 +59,8 @@ class TestPlayMedia:
         ok = await dev._async_play_media_impl(MediaType.MUSIC, "5")
         assert ok is True
         assert dev.call_linkplay_httpapi.await_args.args[0] == "setPlayerCmd:playLocalList:5"
-        assert dev._media_uri is None
-        assert dev._media_uri_final is None
-        assert dev._wait_for_mcu == 0.4
+        assert dev._meta.uri is None
+        assert dev._meta.uri_final is None
 
     @pytest.mark.asyncio
     async def test_url_with_http_in_id_normalized_to_url_type(self) -> None:
@@ -94,17 +93,17 @@ class TestPlayMedia:
         await dev._async_play_media_impl(
             MediaType.URL, "http://localhost:8123/api/tts_proxy/abc.mp3"
         )
-        assert dev._playing_tts is True
-        assert dev._playing_stream is False
+        assert dev._playing.tts is True
+        assert dev._playing.stream is False
 
     @pytest.mark.asyncio
     async def test_slave_routes_to_master(self) -> None:
         dev = _make_device()
-        dev._slave_mode = True
-        dev._master = MagicMock()
-        dev._master.async_play_media = AsyncMock()
+        dev._group.slave_mode = True
+        dev._group.master = MagicMock()
+        dev._group.master.async_play_media = AsyncMock()
         await dev._async_play_media_impl(MediaType.URL, "http://stream/x")
-        dev._master.async_play_media.assert_awaited_once()
+        dev._group.master.async_play_media.assert_awaited_once()
 
 
 class TestSelectSource:
@@ -120,8 +119,8 @@ class TestSelectSource:
         await dev._async_select_source_impl("Web Radio")
         cmd = dev.call_linkplay_httpapi.await_args.args[0]
         assert cmd == "setPlayerCmd:play:http://radio/"
-        assert dev._source == "Web Radio"
-        assert dev._state == STATE_PLAYING
+        assert dev._transport.source == "Web Radio"
+        assert dev._transport.state == STATE_PLAYING
 
     @pytest.mark.asyncio
     async def test_physical_source_uses_switchmode(self) -> None:
@@ -129,16 +128,16 @@ class TestSelectSource:
         await dev._async_select_source_impl("Line In")
         cmd = dev.call_linkplay_httpapi.await_args.args[0]
         assert cmd == "setPlayerCmd:switchmode:line-in"
-        assert dev._source == "Line In"
+        assert dev._transport.source == "Line In"
 
     @pytest.mark.asyncio
     async def test_slave_routes_to_master(self) -> None:
         dev = _make_device()
-        dev._slave_mode = True
-        dev._master = MagicMock()
-        dev._master.async_select_source = AsyncMock()
+        dev._group.slave_mode = True
+        dev._group.master = MagicMock()
+        dev._group.master.async_select_source = AsyncMock()
         await dev._async_select_source_impl("Line In")
-        dev._master.async_select_source.assert_awaited_once_with("Line In")
+        dev._group.master.async_select_source.assert_awaited_once_with("Line In")
         dev.call_linkplay_httpapi.assert_not_awaited()
 
     @pytest.mark.asyncio
@@ -146,7 +145,7 @@ class TestSelectSource:
         dev = _make_device()
         slave = MagicMock()
         slave.async_set_source = AsyncMock()
-        dev._slave_list = [slave]
+        dev._group.slave_list = [slave]
         await dev._async_select_source_impl("Web Radio")
         slave.async_set_source.assert_awaited_once_with("Web Radio")
 
@@ -155,6 +154,6 @@ class TestSelectSource:
         dev = _make_device()
         slave = MagicMock()
         slave.async_set_source = AsyncMock()
-        dev._slave_list = [slave]
+        dev._group.slave_list = [slave]
         await dev._async_select_source_impl("Line In")
         slave.async_set_source.assert_awaited_once_with("Line In")
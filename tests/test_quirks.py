@@ -0,0 +1,102 @@
+"""Tests for the quirk registry and firmware version parsing."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from homeassistant.util.dt import utcnow
+
+from custom_components.linkplay.firmware import parse_version
+from custom_components.linkplay.media_player import _async_startup_probe
+from custom_components.linkplay.quirks import UUID_ARYLIC, Quirk, resolve_quirks
+from custom_components.linkplay.request_scheduler import get_request_scheduler
+from tests._helpers import make_device
+
+
+class TestParseVersion:
+    def test_pads_components_for_lexicographic_sort(self) -> None:
+        assert parse_version("4.6.1") < parse_version("4.6.10")
+        assert parse_version("4.2.8020") < parse_version("4.6.0")
+
+
+class TestResolveQuirks:
+    def test_firmware_ranges(self) -> None:
+        old = resolve_quirks("4.2.7000")
+        assert (old.router_multiroom, old.slow_streams) == (False, False)
+        mid = resolve_quirks("4.2.9326")
+        assert (mid.router_multiroom, mid.slow_streams) == (True, False)
+        new = resolve_quirks("4.6.415")
+        assert (new.router_multiroom, new.slow_streams) == (True, True)
+        assert new.names == ("router_multiroom", "slow_streams")
+
+    def test_rakoit_led_needs_arylic_uuid_and_firmware(self) -> None:
+        assert resolve_quirks("4.6.415", UUID_ARYLIC + "0001").rakoit_led is True
+        assert resolve_quirks("4.2.9000", UUID_ARYLIC + "0001").rakoit_led is False
+        assert resolve_quirks("4.6.415", "AABBCCDD0001").rakoit_led is False
+
+    def test_custom_registry_matches_model_and_range(self) -> None:
+        registry = (
+            Quirk("fast_groups", {"join_grace": 2.0, "zero_poll_teardown": 1}, model="UP2STREAM"),
+            Quirk("old_busy_fw", {"max_concurrent": 1}, fw_max="4.2"),
+            Quirk("later_wins", {"join_grace": 4.0}, model="UP2STREAM_AMP", fw_min="4.6"),
+        )
+        amp = resolve_quirks("4.6.415", model="UP2STREAM_AMP_V4", registry=registry)
+        assert (amp.join_grace, amp.zero_poll_teardown, amp.max_concurrent) == (4.0, 1, 2)
+        assert amp.names == ("fast_groups", "later_wins")
+        other = resolve_quirks("4.1.0", model="A28", registry=registry)
+        assert (other.join_grace, other.max_concurrent) == (10.0, 1)
+
+    def test_default_lookup_is_shared(self) -> None:
+        assert resolve_quirks("4.6.415", "U1") is resolve_quirks("4.6.415", "U1")
+
+
+class TestEntityQuirks:
+    def test_follow_firmware_version(self) -> None:
+        dev = make_device()
+        assert dev._quirks.slow_streams is False
+        dev._fw_ver = "4.6.328"
+        assert dev._quirks.slow_streams is True
+        assert dev.fw_ver == "4.6.328"
+
+    def test_scheduler_limit_follows_quirks(self, monkeypatch) -> None:
+        dev = make_device(host="10.9.9.9")
+        monkeypatch.setattr(
+            "custom_components.linkplay.media_player.resolve_quirks",
+            lambda *_args: resolve_quirks("4.6", registry=(Quirk("busy", {"max_concurrent": 1}),)),
+        )
+        dev._fw_ver = "4.6.1"
+        assert get_request_scheduler("10.9.9.9").max_concurrent == 1
+
+    def test_unchanged_quirks_leave_scheduler_alone(self) -> None:
+        dev = make_device(host="10.9.9.8")
+        scheduler = get_request_scheduler("10.9.9.8")
+        scheduler.max_concurrent = 1
+        dev._fw_ver = dev._fw_ver
+        assert scheduler.max_concurrent == 1
+
+    @pytest.mark.asyncio
+    async def test_discovered_uuid_refreshes_quirks(self, monkeypatch) -> None:
+        dev = make_device()
+        dev._uuid = ""
+        dev.async_write_ha_state = MagicMock()
+        monkeypatch.setattr(
+            "custom_components.linkplay.media_player._async_probe_device",
+            AsyncMock(return_value=("http", {"uuid": f"{UUID_ARYLIC}0001"})),
+        )
+        registry = (Quirk("arylic", {"rakoit_led": True}, uuid_prefix=UUID_ARYLIC),)
+        monkeypatch.setattr(
+            "custom_components.linkplay.media_player.resolve_quirks",
+            lambda fw, uuid, model: resolve_quirks(fw, uuid, model, registry),
+        )
+        await _async_startup_probe(MagicMock(), dev, ("http",), adopt_name=False)
+        assert dev._quirks.rakoit_led is True
+
+    def test_join_grace_comes_from_quirks(self) -> None:
+        dev = make_device()
+        dev._group.joinat = utcnow() - timedelta(seconds=5)
+        assert dev._within_join_grace() is True
+        dev._quirks = dev._quirks._replace(join_grace=3.0)
+        assert dev._within_join_grace() is False
@@ -0,0 +1,160 @@
+"""Tests for the per-host HTTPAPI request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.linkplay.request_scheduler import (
+    PRIORITY_POLL,
+    PRIORITY_USER,
+    LinkPlayRequestScheduler,
+    RequestDropped,
+    get_request_scheduler,
+    request_priority,
+)
+
+
+class TestRequestPriority:
+    @pytest.mark.parametrize(
+        "cmd",
+        ["getPlayerStatus", "getStatus", "getStatusEx", "multiroom:getSlaveList"],
+    )
+    def test_status_queries_are_polls(self, cmd: str) -> None:
+        assert request_priority(cmd) == PRIORITY_POLL
+
+    @pytest.mark.parametrize(
+        "cmd", ["setPlayerCmd:pause", "setPlayerCmd:vol:20", "MCUKeyShortClick:1"],
+    )
+    def test_commands_are_user_priority(self, cmd: str) -> None:
+        assert request_priority(cmd) == PRIORITY_USER
+
+
+class TestScheduler:
+    @pytest.mark.asyncio
+    async def test_caps_concurrency(self) -> None:
+        scheduler = LinkPlayRequestScheduler(max_concurrent=2)
+        in_flight = 0
+        peak = 0
+
+        async def _request():
+            nonlocal in_flight, peak
+            async with scheduler.slot(PRIORITY_USER):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(_request() for _ in range(6)))
+
+        assert peak == 2
+        assert scheduler.active == 0
+        assert scheduler.queued == 0
+
+    @pytest.mark.asyncio
+    async def test_user_command_overtakes_queued_polls(self) -> None:
+        scheduler = LinkPlayRequestScheduler(max_concurrent=1)
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def _hold():
+            async with scheduler.slot(PRIORITY_POLL):
+                await release.wait()
+
+        async def _request(name: str, priority: int):
+            async with scheduler.slot(priority):
+                order.append(name)
+
+        holder = asyncio.create_task(_hold())
+        await asyncio.sleep(0)
+        polls = [asyncio.create_task(_request(f"poll{i}", PRIORITY_POLL)) for i in range(2)]
+        await asyncio.sleep(0)
+        user = asyncio.create_task(_request("pause", PRIORITY_USER))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(holder, user, *polls)
+
+        assert order == ["pause", "poll0", "poll1"]
+
+    @pytest.mark.asyncio
+    async def test_stale_poll_is_dropped(self) -> None:
+        scheduler = LinkPlayRequestScheduler(max_concurrent=1)
+        release = asyncio.Event()
+
+        async def _hold():
+            async with scheduler.slot(PRIORITY_USER):
+                await release.wait()
+
+        holder = asyncio.create_task(_hold())
+        await asyncio.sleep(0)
+        loop = asyncio.get_running_loop()
+
+        with pytest.raises(RequestDropped):
+            async with scheduler.slot(PRIORITY_POLL, deadline=loop.time() + 0.01):
+                pytest.fail("stale poll must not run")
+
+        assert scheduler.dropped == 1
+        assert scheduler.queued == 0
+        release.set()
+        await holder
+        # The dropped waiter must not leak the slot.
+        async with scheduler.slot(PRIORITY_USER):
+            assert scheduler.active == 1
+        assert scheduler.active == 0
+
+    @pytest.mark.asyncio
+    async def test_raised_limit_admits_queued_requests(self) -> None:
+        scheduler = LinkPlayRequestScheduler(max_concurrent=0)
+        admitted = asyncio.Event()
+
+        async def _request():
+            async with scheduler.slot(PRIORITY_USER):
+                admitted.set()
+
+        task = asyncio.create_task(_request())
+        await asyncio.sleep(0)
+        assert scheduler.queued == 1
+
+        scheduler.max_concurrent = 1
+        await asyncio.wait_for(admitted.wait(), 1)
+        await task
+        assert (scheduler.active, scheduler.queued) == (0, 0)
+
+    def test_one_scheduler_per_host(self) -> None:
+        assert get_request_scheduler("10.9.8.7") is get_request_scheduler("10.9.8.7")
+        assert get_request_scheduler("10.9.8.7") is not get_request_scheduler("10.9.8.6")
+
+
+class TestHttpapiIntegration:
+    @pytest.mark.asyncio
+    async def test_dropped_poll_keeps_previous_status(self) -> None:
+        from tests.test_api_client import _FakeDevice
+
+        dev = _FakeDevice()
+        dev.call_linkplay_httpapi = AsyncMock(return_value=None)
+
+        await dev.async_get_status(no_throttle=True)
+
+        assert dev._transport.state == "playing"
+        assert dev._player_statdata == {"vol": 50}
+
+    @pytest.mark.asyncio
+    async def test_httpapi_returns_none_when_dropped(self) -> None:
+        from tests.test_api_client import _FakeDevice
+
+        dev = _FakeDevice()
+        dev._async_httpapi_request = AsyncMock()
+        # A scheduler with no free slots: the poll can only go stale.
+        scheduler = LinkPlayRequestScheduler(max_concurrent=0)
+        with patch(
+            "custom_components.linkplay.request_scheduler._POLL_DEADLINE", 0.0,
+        ), patch(
+            "custom_components.linkplay.api_client_mixin.get_request_scheduler",
+            return_value=scheduler,
+        ):
+            assert await dev.call_linkplay_httpapi("getPlayerStatus", True) is None
+
+        dev._async_httpapi_request.assert_not_awaited()
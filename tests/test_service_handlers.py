@@ -6,11 +6,13 @@ Covers join/unjoin/preset/command/snapshot/restore/play_track dispatch.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 from homeassistant.const import ATTR_ENTITY_ID
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 
 from custom_components.linkplay import (
     ATTR_CMD,
@@ -28,6 +30,7 @@ from custom_components.linkplay import (
     SERVICE_REST,
     SERVICE_SNAP,
     SERVICE_UNJOIN,
+    async_run_for_entities,
     async_setup_services,
 )
 
@@ -189,3 +192,84 @@ class TestPresetCmdSnapshotRestorePlay:
             blocking=True,
         )
         ent.async_play_track.assert_awaited_once()
+
+
+class TestConcurrentDispatch:
+    @pytest.mark.asyncio
+    async def test_snapshot_runs_speakers_concurrently(self, hass: HomeAssistant) -> None:
+        entities = [_MockEntity(f"media_player.s{i}") for i in range(3)]
+        started = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def _slow_snapshot(_switchinput):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            if running == len(entities):
+                started.set()
+            await started.wait()
+            running -= 1
+
+        for ent in entities:
+            ent.async_snapshot = AsyncMock(side_effect=_slow_snapshot)
+        _register(hass, *entities)
+        await async_setup_services(hass)
+
+        await hass.services.async_call(
+            DOMAIN, SERVICE_SNAP,
+            {ATTR_ENTITY_ID: [e.entity_id for e in entities]},
+            blocking=True,
+        )
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_limit_bounds_parallel_speakers(self) -> None:
+        running = 0
+        peak = 0
+
+        async def _handler(_entity):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0)
+            running -= 1
+
+        entities = [_MockEntity(f"media_player.s{i}") for i in range(5)]
+        await async_run_for_entities(SERVICE_REST, entities, _handler, limit=2)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_aggregated_after_all_ran(self, hass: HomeAssistant) -> None:
+        bad_a = _MockEntity("media_player.a")
+        good = _MockEntity("media_player.b")
+        bad_c = _MockEntity("media_player.c")
+        bad_a.async_restore = AsyncMock(side_effect=RuntimeError("offline"))
+        bad_c.async_restore = AsyncMock(side_effect=RuntimeError("timeout"))
+        _register(hass, bad_a, good, bad_c)
+        await async_setup_services(hass)
+
+        with pytest.raises(HomeAssistantError) as err:
+            await hass.services.async_call(
+                DOMAIN, SERVICE_REST,
+                {ATTR_ENTITY_ID: ["media_player.a", "media_player.b", "media_player.c"]},
+                blocking=True,
+            )
+        good.async_restore.assert_awaited_once()
+        assert "media_player.a: offline" in str(err.value)
+        assert "media_player.c: timeout" in str(err.value)
+
+    @pytest.mark.asyncio
+    async def test_only_targeted_entities_are_called(self, hass: HomeAssistant) -> None:
+        targeted = _MockEntity("media_player.a")
+        other = _MockEntity("media_player.b")
+        _register(hass, targeted, other)
+        await async_setup_services(hass)
+
+        await hass.services.async_call(
+            DOMAIN, SERVICE_PRESET,
+            {ATTR_ENTITY_ID: "media_player.a", ATTR_PRESET: 1},
+            blocking=True,
+        )
+        targeted.async_preset_button.assert_awaited_once_with(1)
+        other.async_preset_button.assert_not_awaited()
@@ -22,6 +22,7 @@ from custom_components.linkplay import (
     async_setup_services,
 )
 from custom_components.linkplay.media_player import LinkPlayDevice
+from custom_components.linkplay.state import GroupState
 
 
 class MockLinkplayDevice:
@@ -29,11 +30,12 @@ class MockLinkplayDevice:
     handler and async_set_group_volume actually touch."""
 
     def __init__(self, entity_id: str, hass: HomeAssistant) -> None:
+        self._group = GroupState()
         self.entity_id = entity_id
         self.hass = hass
-        self._is_master = False
-        self._slave_mode = False
-        self._multiroom_group: list[str] = []
+        self._group.is_master = False
+        self._group.slave_mode = False
+        self._group.members: list[str] = []
         self.volume_level: float | None = None
         self._volume_offset = 0  # default: slave tracks master target
         # Make async_set_volume_level update volume_level too so tests
@@ -45,7 +47,7 @@ class MockLinkplayDevice:
 
     @property
     def is_master(self) -> bool:
-        return self._is_master
+        return self._group.is_master
 
 
 def _bind_real_set_group_volume(master: MockLinkplayDevice) -> None:
@@ -61,14 +63,14 @@ def _make_group(hass: HomeAssistant, master_eid: str, slave_eids: list[str]):
     from custom_components.linkplay import LinkPlayData
 
     master = MockLinkplayDevice(master_eid, hass)
-    master._is_master = True
-    master._multiroom_group = [master_eid, *slave_eids]
+    master._group.is_master = True
+    master._group.members = [master_eid, *slave_eids]
     _bind_real_set_group_volume(master)
 
     slaves = []
     for eid in slave_eids:
         slave = MockLinkplayDevice(eid, hass)
-        slave._slave_mode = True
+        slave._group.slave_mode = True
         _bind_real_set_group_volume(slave)
         slaves.append(slave)
 
@@ -120,7 +122,7 @@ class TestSetGroupVolumeService:
         # Override slave's group so the real method has something to iterate;
         # the real handler resolves the entity by id and calls its
         # async_set_group_volume.
-        kitchen._multiroom_group = [
+        kitchen._group.members = [
             "media_player.living_room",
             "media_player.kitchen",
         ]
@@ -228,7 +230,7 @@ class TestSetGroupVolumeService:
         self, hass: HomeAssistant
     ) -> None:
         """v4.5.9 defensive guard: the master is always reached by
-        ``async_set_group_volume`` even if ``_multiroom_group`` is empty
+        ``async_set_group_volume`` even if ``_group.members`` is empty
         (e.g. the master-side poll briefly cleared the list during a
         WiFi-direct join propagation race that outlived the join-grace
         window).
@@ -236,7 +238,7 @@ class TestSetGroupVolumeService:
         master, _ = _make_group(
             hass, "media_player.living_room", []
         )
-        master._multiroom_group = []  # poll-cleared
+        master._group.members = []  # poll-cleared
         master.volume_level = 0.40
         await async_setup_services(hass)
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
@@ -30,17 +32,35 @@ def _mock_response_ok():
     return response
 
 
+def _get_context(result):
+    """What ``session.get()`` returns: enters to ``result``, or raises it."""
+    context = MagicMock()
+    if isinstance(result, BaseException):
+        context.__aenter__ = AsyncMock(side_effect=result)
+    else:
+        context.__aenter__ = AsyncMock(return_value=result)
+    context.__aexit__ = AsyncMock(return_value=None)
+    return context
+
+
 def _patched_session(response):
-    """Return a context-manager patcher that makes async_get_clientsession()
+    """Return a context-manager patcher that makes async_get_linkplay_session()
     yield a session whose .get() returns `response`."""
     session = MagicMock()
-    session.get = AsyncMock(return_value=response)
+    session.get = MagicMock(return_value=_get_context(response))
     return patch(
-        "custom_components.linkplay.media_player.async_get_clientsession",
+        "custom_components.linkplay.media_player.async_get_linkplay_session",
         return_value=session,
     )
 
 
+async def _run_background_probes(owner) -> None:
+    """Await the probe coroutines handed to ``async_create_background_task``."""
+    for call in owner.async_create_background_task.call_args_list:
+        coro = next(arg for arg in call.args if asyncio.iscoroutine(arg))
+        await coro
+
+
 class TestAsyncSetupPlatform:
     @pytest.mark.asyncio
     async def test_happy_path_http(self, _mock_response_ok) -> None:
@@ -61,9 +81,7 @@ class TestAsyncSetupPlatform:
             "uuid": None,
         }
         patcher = _patched_session(_mock_response_ok)
-        with patcher, patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        with patcher:
             await async_setup_platform(hass, config, add_entities)
 
         add_entities.assert_called_once()
@@ -96,15 +114,13 @@ class TestAsyncSetupPlatform:
         ok_resp.json = AsyncMock(return_value=_payload(name="Kitchen"))
         session = MagicMock()
         # first call raises, second returns ok_resp
-        session.get = AsyncMock(
-            side_effect=[aiohttp.ClientError("boom"), ok_resp]
-        )
+        session.get = MagicMock(side_effect=[
+            _get_context(aiohttp.ClientError("boom")), _get_context(ok_resp),
+        ])
         with patch(
-            "custom_components.linkplay.media_player.async_get_clientsession",
+            "custom_components.linkplay.media_player.async_get_linkplay_session",
             return_value=session,
-        ), patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        ):
             await async_setup_platform(hass, config, add_entities)
 
         add_entities.assert_called_once()
@@ -131,18 +147,16 @@ class TestAsyncSetupPlatform:
             "uuid": None,
         }
         session = MagicMock()
-        session.get = AsyncMock(side_effect=aiohttp.ClientError("nope"))
+        session.get = MagicMock(return_value=_get_context(aiohttp.ClientError("nope")))
         with patch(
-            "custom_components.linkplay.media_player.async_get_clientsession",
+            "custom_components.linkplay.media_player.async_get_linkplay_session",
             return_value=session,
-        ), patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        ):
             await async_setup_platform(hass, config, add_entities)
 
         entity = add_entities.call_args.args[0][0]
         from homeassistant.const import STATE_UNAVAILABLE
-        assert entity._state == STATE_UNAVAILABLE
+        assert entity._transport.state == STATE_UNAVAILABLE
 
     @pytest.mark.asyncio
     async def test_explicit_protocol_failure_marks_unavailable(self) -> None:
@@ -165,18 +179,16 @@ class TestAsyncSetupPlatform:
             "uuid": None,
         }
         session = MagicMock()
-        session.get = AsyncMock(side_effect=TimeoutError())
+        session.get = MagicMock(return_value=_get_context(TimeoutError()))
         with patch(
-            "custom_components.linkplay.media_player.async_get_clientsession",
+            "custom_components.linkplay.media_player.async_get_linkplay_session",
             return_value=session,
-        ), patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        ):
             await async_setup_platform(hass, config, add_entities)
 
         entity = add_entities.call_args.args[0][0]
         from homeassistant.const import STATE_UNAVAILABLE
-        assert entity._state == STATE_UNAVAILABLE
+        assert entity._transport.state == STATE_UNAVAILABLE
 
     @pytest.mark.asyncio
     async def test_non_200_response_marks_unavailable(self) -> None:
@@ -199,18 +211,16 @@ class TestAsyncSetupPlatform:
         bad_resp = MagicMock()
         bad_resp.status = 500
         session = MagicMock()
-        session.get = AsyncMock(return_value=bad_resp)
+        session.get = MagicMock(return_value=_get_context(bad_resp))
         with patch(
-            "custom_components.linkplay.media_player.async_get_clientsession",
+            "custom_components.linkplay.media_player.async_get_linkplay_session",
             return_value=session,
-        ), patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        ):
             await async_setup_platform(hass, config, add_entities)
 
         entity = add_entities.call_args.args[0][0]
         from homeassistant.const import STATE_UNAVAILABLE
-        assert entity._state == STATE_UNAVAILABLE
+        assert entity._transport.state == STATE_UNAVAILABLE
 
 
 class TestAsyncSetupEntry:
@@ -236,15 +246,14 @@ class TestAsyncSetupEntry:
         entry.unique_id = "OLD-UUID"
         add_entities = MagicMock()
         patcher = _patched_session(_mock_response_ok)
-        with patcher, patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        with patcher:
             await async_setup_entry(hass, entry, add_entities)
+            await _run_background_probes(entry)
 
         add_entities.assert_called_once()
         entity = add_entities.call_args.args[0][0]
         assert entity._volume_step == 10
-        assert entity._multiroom_wifidirect is True
+        assert entity._group.wifidirect is True
         # entry unique_id preserved when set
         assert entity._uuid == "OLD-UUID"
         # response's DeviceName overrides entry name
@@ -265,10 +274,9 @@ class TestAsyncSetupEntry:
         entry.unique_id = None
         add_entities = MagicMock()
         patcher = _patched_session(_mock_response_ok)
-        with patcher, patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        with patcher:
             await async_setup_entry(hass, entry, add_entities)
+            await _run_background_probes(entry)
 
         entity = add_entities.call_args.args[0][0]
         assert entity._uuid == "AABBCCDDEEFF"
@@ -283,18 +291,17 @@ class TestAsyncSetupEntry:
         entry.unique_id = "ID-1"
         add_entities = MagicMock()
         session = MagicMock()
-        session.get = AsyncMock(side_effect=aiohttp.ClientError())
+        session.get = MagicMock(return_value=_get_context(aiohttp.ClientError()))
         with patch(
-            "custom_components.linkplay.media_player.async_get_clientsession",
+            "custom_components.linkplay.media_player.async_get_linkplay_session",
             return_value=session,
-        ), patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        ):
             await async_setup_entry(hass, entry, add_entities)
+            await _run_background_probes(entry)
 
         entity = add_entities.call_args.args[0][0]
         from homeassistant.const import STATE_UNAVAILABLE
-        assert entity._state == STATE_UNAVAILABLE
+        assert entity._transport.state == STATE_UNAVAILABLE
 
     @pytest.mark.asyncio
     async def test_entry_non_200_marks_unavailable(self) -> None:
@@ -308,15 +315,123 @@ class TestAsyncSetupEntry:
         bad = MagicMock()
         bad.status = 404
         session = MagicMock()
-        session.get = AsyncMock(return_value=bad)
+        session.get = MagicMock(return_value=_get_context(bad))
         with patch(
-            "custom_components.linkplay.media_player.async_get_clientsession",
+            "custom_components.linkplay.media_player.async_get_linkplay_session",
             return_value=session,
-        ), patch(
-            "custom_components.linkplay.media_player.AiohttpRequester"
-        ), patch("custom_components.linkplay.media_player.UpnpFactory"):
+        ):
             await async_setup_entry(hass, entry, add_entities)
+            await _run_background_probes(entry)
 
         entity = add_entities.call_args.args[0][0]
         from homeassistant.const import STATE_UNAVAILABLE
-        assert entity._state == STATE_UNAVAILABLE
+        assert entity._transport.state == STATE_UNAVAILABLE
+
+    @pytest.mark.asyncio
+    async def test_entity_is_added_before_the_probe_runs(self) -> None:
+        """With a stored unique id an offline speaker must not block setup."""
+        hass = MagicMock()
+        hass.data = {}
+        entry = MagicMock()
+        entry.data = {"host": "1.2.3.4", "protocol": "http", "name": "Den"}
+        entry.options = {}
+        entry.unique_id = "ID-1"
+        add_entities = MagicMock()
+        session = MagicMock()
+        session.get = MagicMock(return_value=_get_context(aiohttp.ClientError()))
+        with patch(
+            "custom_components.linkplay.media_player.async_get_linkplay_session",
+            return_value=session,
+        ):
+            await async_setup_entry(hass, entry, add_entities)
+            entity = add_entities.call_args.args[0][0]
+            assert session.get.call_count == 0
+            assert (entity._uuid, entity._name) == ("ID-1", "Den")
+            await _run_background_probes(entry)
+
+        assert session.get.call_count == 1
+
+
+class TestStartupProbe:
+    @pytest.mark.asyncio
+    async def test_protocols_are_raced_concurrently(self) -> None:
+        """A hanging http probe does not delay the https answer and has
+        its response released once it lost the race."""
+        hass = MagicMock()
+        hass.data = {}
+        add_entities = MagicMock()
+        config = {
+            "host": "1.2.3.4",
+            "protocol": None,
+            "name": None,
+            "sources": None,
+            "common_sources": None,
+            "icecast_metadata": None,
+            "multiroom_wifidirect": False,
+            "led_off": False,
+            "volume_step": 5,
+            "lastfm_api_key": None,
+            "uuid": None,
+        }
+        ok_resp = MagicMock()
+        ok_resp.status = 200
+        ok_resp.json = AsyncMock(return_value=_payload(name="Attic"))
+        hang = asyncio.Event()
+
+        async def _hang(**_kwargs):
+            await hang.wait()
+
+        stuck_resp = MagicMock()
+        stuck_resp.status = 200
+        stuck_resp.json = AsyncMock(side_effect=_hang)
+        released = []
+
+        @contextlib.asynccontextmanager
+        async def _get(url, **_kwargs):
+            try:
+                yield stuck_resp if url.startswith("http://") else ok_resp
+            finally:
+                released.append(url.split(":")[0])
+
+        session = MagicMock()
+        session.get = _get
+        with patch(
+            "custom_components.linkplay.media_player.async_get_linkplay_session",
+            return_value=session,
+        ):
+            await asyncio.wait_for(
+                async_setup_platform(hass, config, add_entities), timeout=1,
+            )
+
+        entity = add_entities.call_args.args[0][0]
+        assert entity._protocol == "https"
+        assert entity._name == "Attic"
+        await asyncio.sleep(0)
+        assert sorted(released) == ["http", "https"]
+
+    @pytest.mark.asyncio
+    async def test_yaml_with_uuid_probes_in_background(self, _mock_response_ok) -> None:
+        hass = MagicMock()
+        hass.data = {}
+        add_entities = MagicMock()
+        config = {
+            "host": "1.2.3.4",
+            "protocol": None,
+            "name": "Hall",
+            "sources": None,
+            "common_sources": None,
+            "icecast_metadata": None,
+            "multiroom_wifidirect": False,
+            "led_off": False,
+            "volume_step": 5,
+            "lastfm_api_key": None,
+            "uuid": "CONFIGURED",
+        }
+        with _patched_session(_mock_response_ok):
+            await async_setup_platform(hass, config, add_entities)
+            entity = add_entities.call_args.args[0][0]
+            assert entity._protocol is None
+            await _run_background_probes(hass)
+
+        assert entity._protocol == "http"
+        assert (entity._uuid, entity._name) == ("CONFIGURED", "Hall")
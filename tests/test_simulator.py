@@ -0,0 +1,145 @@
+"""Drive the real HTTPAPI / UART / UPnP client code against the simulator."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from async_upnp_client.aiohttp import AiohttpRequester
+from async_upnp_client.client_factory import UpnpFactory
+
+from custom_components.linkplay.circuit_breaker import get_circuit_breaker
+from custom_components.linkplay.http_session import _SESSION_KEY
+from tests._helpers import make_device
+from tests.simulator import DeviceState, LinkPlaySimulator, SimulatorFleet
+
+# The HA test plugin blocks sockets; the simulator only listens on 127.0.0.1.
+pytestmark = pytest.mark.usefixtures("socket_enabled")
+
+
+async def _close_session(dev) -> None:
+    session = dev.hass.data.get(_SESSION_KEY)
+    if session is not None:
+        await session.close()
+
+
+class TestHttpapi:
+    @pytest.mark.asyncio
+    async def test_commands_update_reported_status(self) -> None:
+        async with LinkPlaySimulator() as sim:
+            dev = make_device(host=sim.host)
+            try:
+                assert await dev.call_linkplay_httpapi("setPlayerCmd:vol:42", None) == "OK"
+                status = await dev.call_linkplay_httpapi("getPlayerStatus", True)
+            finally:
+                await _close_session(dev)
+
+        assert status["vol"] == "42"
+        assert sim.requests == ["setPlayerCmd:vol:42", "getPlayerStatus"]
+
+    @pytest.mark.asyncio
+    async def test_slave_list_and_kickout(self) -> None:
+        state = DeviceState(slaves=[{"name": "Kitchen", "ip": "10.0.0.2", "volume": 20}])
+        async with LinkPlaySimulator(state) as sim:
+            dev = make_device(host=sim.host)
+            try:
+                listed = await dev.call_linkplay_httpapi("multiroom:getSlaveList", True)
+                await dev.call_linkplay_httpapi("multiroom:SlaveKickout:10.0.0.2", None)
+                after = await dev.call_linkplay_httpapi("multiroom:getSlaveList", True)
+            finally:
+                await _close_session(dev)
+
+        assert listed["slaves"] == 1
+        assert after == {"slaves": 0, "slave_list": []}
+
+    @pytest.mark.asyncio
+    async def test_hanging_device_times_out_and_counts_failure(self) -> None:
+        async with LinkPlaySimulator(timeout_rate=1.0, hang=1.0) as sim:
+            dev = make_device(host=sim.host)
+            dev._first_update = False
+            try:
+                with patch(
+                    "custom_components.linkplay.api_client_mixin.API_TIMEOUT",
+                    aiohttp.ClientTimeout(total=0.05),
+                ):
+                    assert await dev.call_linkplay_httpapi("getPlayerStatus", True) is False
+            finally:
+                await _close_session(dev)
+
+        assert get_circuit_breaker(sim.host)._failures == 1
+
+    @pytest.mark.asyncio
+    async def test_dropped_connection_is_a_failure(self) -> None:
+        async with LinkPlaySimulator(drop_rate=1.0) as sim:
+            dev = make_device(host=sim.host)
+            try:
+                assert await dev.call_linkplay_httpapi("getStatusEx", True) is False
+            finally:
+                await _close_session(dev)
+
+    @pytest.mark.asyncio
+    async def test_seeded_faults_are_reproducible(self) -> None:
+        async def _outcomes() -> list[bool]:
+            async with LinkPlaySimulator(drop_rate=0.5, seed=7) as sim:
+                async with aiohttp.ClientSession() as session:
+                    results = []
+                    for _ in range(10):
+                        try:
+                            async with session.get(f"http://{sim.host}/httpapi.asp?command=getStatus") as resp:
+                                await resp.read()
+                            results.append(True)
+                        except aiohttp.ClientError:
+                            results.append(False)
+                    return results
+
+        first = await _outcomes()
+        assert first == await _outcomes()
+        assert True in first and False in first
+
+
+class TestUart:
+    @pytest.mark.asyncio
+    async def test_tcpuart_round_trip(self) -> None:
+        async with LinkPlaySimulator() as sim:
+            dev = make_device(host="127.0.0.1")
+            loop = asyncio.get_running_loop()
+            dev.hass.async_add_executor_job = lambda func, *args: loop.run_in_executor(None, func, *args)
+            with patch("custom_components.linkplay.api_client_mixin._TCPPORT", sim.uart_port):
+                reply = await dev.call_linkplay_tcpuart("MCU+PAS+RAKOIT:LED:0&")
+
+        assert reply == "MCU+PAS+RAKOIT:LED:0&"
+        assert sim.uart_commands == ["MCU+PAS+RAKOIT:LED:0&"]
+
+
+class TestUpnp:
+    @pytest.mark.asyncio
+    async def test_description_and_get_media_info(self) -> None:
+        state = DeviceState(name="Living Room", uri="http://radio.example/stream")
+        async with LinkPlaySimulator(state) as sim:
+            factory = UpnpFactory(AiohttpRequester(5))
+            device = await factory.async_create_device(sim.description_url)
+            media_info = await device.service(
+                "urn:schemas-upnp-org:service:AVTransport:1"
+            ).action("GetMediaInfo").async_call(InstanceID=0)
+
+        assert device.friendly_name == "Living Room"
+        assert media_info["CurrentURI"] == "http://radio.example/stream"
+
+
+class TestFleet:
+    @pytest.mark.asyncio
+    async def test_instances_are_independent(self) -> None:
+        async with SimulatorFleet(5) as fleet:
+            devices = [make_device(f"dev{i}", host=sim.host) for i, sim in enumerate(fleet)]
+            try:
+                statuses = await asyncio.gather(
+                    *(dev.call_linkplay_httpapi("getStatus", True) for dev in devices)
+                )
+            finally:
+                for dev in devices:
+                    await _close_session(dev)
+
+        assert len({sim.port for sim in fleet}) == 5
+        assert [s["DeviceName"] for s in statuses] == [f"Speaker {i}" for i in range(5)]
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 from homeassistant.components.media_player import RepeatMode
 
+from custom_components.linkplay.source_catalog import SourceCatalog
 from tests._helpers import make_device
 
 
@@ -21,11 +22,11 @@ def _make_device():
 def _mk_slave(target):
     """Set `target` up as a slave with a master-side mock for delegation
     tests."""
-    target._slave_mode = True
-    target._master = MagicMock()
-    target._master.async_select_sound_mode = AsyncMock()
-    target._master.async_set_shuffle = AsyncMock()
-    target._master.async_set_repeat = AsyncMock()
+    target._group.slave_mode = True
+    target._group.master = MagicMock()
+    target._group.master.async_select_sound_mode = AsyncMock()
+    target._group.master.async_set_shuffle = AsyncMock()
+    target._group.master.async_set_repeat = AsyncMock()
 
 
 class TestSlaveDelegation:
@@ -34,30 +35,30 @@ class TestSlaveDelegation:
         dev = _make_device()
         _mk_slave(dev)
         await dev.async_select_sound_mode("Jazz")
-        dev._master.async_select_sound_mode.assert_awaited_once_with("Jazz")
+        dev._group.master.async_select_sound_mode.assert_awaited_once_with("Jazz")
 
     @pytest.mark.asyncio
     async def test_set_shuffle_delegates(self) -> None:
         dev = _make_device()
         _mk_slave(dev)
         await dev.async_set_shuffle(True)
-        dev._master.async_set_shuffle.assert_awaited_once_with(True)
+        dev._group.master.async_set_shuffle.assert_awaited_once_with(True)
 
     @pytest.mark.asyncio
     async def test_set_repeat_delegates(self) -> None:
         dev = _make_device()
         _mk_slave(dev)
         await dev.async_set_repeat(RepeatMode.ONE)
-        dev._master.async_set_repeat.assert_awaited_once_with(RepeatMode.ONE)
+        dev._group.master.async_set_repeat.assert_awaited_once_with(RepeatMode.ONE)
 
 
 class TestSelectSourceFailures:
     @pytest.mark.asyncio
     async def test_http_source_failed_command_warns(self) -> None:
         dev = _make_device()
-        dev._source_list = {"http://radio/": "Web Radio"}
+        dev._sources = SourceCatalog({"http://radio/": "Web Radio"})
         dev._fw_ver = "4.2"
-        dev._volume = 0
+        dev._transport.volume = 0
         dev.async_detect_stream_url_redirection = AsyncMock(side_effect=lambda u: u)
         dev.call_linkplay_httpapi = AsyncMock(return_value="FAIL")
         await dev._async_select_source_impl("Web Radio")
@@ -66,9 +67,9 @@ class TestSelectSourceFailures:
     @pytest.mark.asyncio
     async def test_physical_source_failed_command_warns(self) -> None:
         dev = _make_device()
-        dev._source_list = {"line-in": "Line In"}
+        dev._sources = SourceCatalog({"line-in": "Line In"})
         dev._fw_ver = "4.2"
-        dev._volume = 0
+        dev._transport.volume = 0
         dev.call_linkplay_httpapi = AsyncMock(return_value="FAIL")
         await dev._async_select_source_impl("Line In")
 
@@ -95,30 +96,30 @@ class TestSelectSoundModeFailure:
         dev.call_linkplay_httpapi = AsyncMock(return_value="FAIL")
         mode = next(iter(SOUND_MODES.values()))
         await dev.async_select_sound_mode(mode)
-        assert dev._sound_mode != mode
+        assert dev._transport.sound_mode != mode
 
 
 class TestIsPlayingNewTrack:
     @pytest.mark.asyncio
     async def test_icecast_name_matches_title_returns_false(self) -> None:
         dev = _make_device()
-        dev._icecast_name = "WBGO"
-        dev._source = "WBGO Jazz"
-        dev._media_title = "WBGO live stream"
-        dev._media_artist = "Some Artist"
+        dev._meta.icecast_name = "WBGO"
+        dev._transport.source = "WBGO Jazz"
+        dev._meta.title = "WBGO live stream"
+        dev._meta.artist = "Some Artist"
         result = await dev.async_is_playing_new_track()
         assert result is False
-        assert dev._media_image_url is None
+        assert dev._meta.image_url is None
 
 
 class TestPlayerStatusMetadataBranches:
     @pytest.mark.asyncio
     async def test_missing_title_clears_existing(self) -> None:
         dev = _make_device()
-        dev._media_title = "old"
-        # Title key absent -> _media_title set to None
+        dev._meta.title = "old"
+        # Title key absent -> _meta.title set to None
         await dev.async_get_playerstatus_metadata({"uri": ""})
-        assert dev._media_title is None
+        assert dev._meta.title is None
 
     @pytest.mark.asyncio
     async def test_uri_decoded_into_trackc(self) -> None:
@@ -2,81 +2,67 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from custom_components.linkplay.quirks import resolve_quirks
 from custom_components.linkplay.snapshot_mixin import LinkPlaySnapshotMixin
+from custom_components.linkplay.state import (
+    GroupState,
+    MediaMetadata,
+    PlaybackFlags,
+    SnapshotState,
+    TransportState,
+)
+from tests._helpers import make_device
 
 
 class _FakeDevice(LinkPlaySnapshotMixin):
     def __init__(self) -> None:
+        self._transport = TransportState()
+        self._meta = MediaMetadata()
+        self._group = GroupState()
         # state
         self.entity_id = "media_player.fake"
         self.name = "fake"
         self._name = "fake"
-        self._state = "playing"
-        self._slave_mode = False
-        self._source = "Webradio"
-        self._nometa = False
-        self._playing_localfile = False
-        self._playing_spotify = False
-        self._playing_webplaylist = False
-        self._playing_stream = False
-        self._playing_mediabrowser = False
-        self._playing_tts = False
-        self._media_source_uri = None
-        self._media_uri = None
-        self._media_uri_final = "http://example/stream"
-        self._playhead_position = 30
-        self._volume = 50
-        self._fw_ver = "4.2"
+        self._transport.state = "playing"
+        self._group.slave_mode = False
+        self._group.is_master = False
+        self._group.slave_list = None
+        self._transport.source = "Webradio"
+        self._meta.nometa = False
+        self._playing = PlaybackFlags()
+        self._playing.localfile = False
+        self._meta.source_uri = None
+        self._meta.uri = None
+        self._meta.uri_final = "http://example/stream"
+        self._transport.playhead_position = 30
+        self._transport.volume = 50
+        self._quirks = resolve_quirks("4.2")
         self._preset_key = 4
         self._player_statdata = {"vol": "60"}
 
         # snapshot fields populated by the mixin (init to defaults)
         self._snapshot_active = False
-        self._snap_source = None
-        self._snap_state = "unknown"
-        self._snap_nometa = False
-        self._snap_playing_mediabrowser = False
-        self._snap_media_source_uri = None
-        self._snap_playhead_position = 0
-        self._snap_seek = False
-        self._snap_uri = None
-        self._snap_volume = 0
-        self._snap_spotify = False
-        self._snap_spotify_volumeonly = False
+        self._snap = SnapshotState()
 
         # collaborators
         self.call_linkplay_httpapi = AsyncMock(return_value="OK")
-        self.async_get_status = AsyncMock()
+        self.async_wait_for_status = AsyncMock(return_value={"vol": "60"})
         self.async_preset_snap_via_upnp = AsyncMock()
         self.async_select_source = AsyncMock()
         self.async_play_media = AsyncMock()
         self.async_media_pause = AsyncMock()
 
-    # snapshot_mixin compares fw versions via this helper from LinkPlayDevice.
-    @staticmethod
-    def _fwvercheck(v):
-        return tuple(point.zfill(8) for point in v.split("."))
-
-
-@pytest.fixture(autouse=True)
-def _fast_sleep(monkeypatch):
-    """Skip the real sleeps in snapshot/restore so tests don't wait seconds."""
-    async def _noop(*_args, **_kwargs):
-        return None
-    monkeypatch.setattr(
-        "custom_components.linkplay.snapshot_mixin.asyncio.sleep", _noop
-    )
-
 
 class TestSnapshot:
     @pytest.mark.asyncio
     async def test_unavailable_short_circuits(self) -> None:
         dev = _FakeDevice()
-        dev._state = "unavailable"
+        dev._transport.state = "unavailable"
         await dev.async_snapshot(switchinput=True)
         assert dev._snapshot_active is False
         dev.call_linkplay_httpapi.assert_not_awaited()
@@ -84,33 +70,33 @@ class TestSnapshot:
     @pytest.mark.asyncio
     async def test_slave_does_not_snapshot(self) -> None:
         dev = _FakeDevice()
-        dev._slave_mode = True
+        dev._group.slave_mode = True
         await dev.async_snapshot(switchinput=True)
         assert dev._snapshot_active is False
 
     @pytest.mark.asyncio
     async def test_idle_just_captures_volume(self) -> None:
         dev = _FakeDevice()
-        dev._state = "idle"
+        dev._transport.state = "idle"
         await dev.async_snapshot(switchinput=False)
-        assert dev._snap_volume == 50
+        assert dev._snap.volume == 50
         assert dev._snapshot_active is True
         dev.call_linkplay_httpapi.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_spotify_with_switchinput_saves_only_volume(self) -> None:
         dev = _FakeDevice()
-        dev._playing_spotify = True
+        dev._playing.spotify = True
         await dev.async_snapshot(switchinput=True)
-        assert dev._snap_spotify is True
-        assert dev._snap_spotify_volumeonly is True
-        assert dev._snap_volume == 50
+        assert dev._snap.spotify is True
+        assert dev._snap.spotify_volumeonly is True
+        assert dev._snap.volume == 50
         dev.async_preset_snap_via_upnp.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_spotify_without_switchinput_persists_preset(self) -> None:
         dev = _FakeDevice()
-        dev._playing_spotify = True
+        dev._playing.spotify = True
         await dev.async_snapshot(switchinput=False)
         dev.async_preset_snap_via_upnp.assert_awaited_once_with("4")
         # setPlayerCmd:stop sent after preset capture
@@ -119,93 +105,97 @@ class TestSnapshot:
 
     @pytest.mark.asyncio
     async def test_switchinput_on_non_stream_source_polls_volume(self) -> None:
-        """Physical-source playback switches to wifi, waits, then re-reads
-        the volume from getPlayerStatus."""
+        """Physical-source playback switches to wifi, waits for the mode to
+        change, stops, then waits for the volume to settle."""
         dev = _FakeDevice()
-        dev._source = "line-in"
-        dev._playing_stream = False
+        dev._transport.source = "line-in"
+        dev._playing.stream = False
+        dev._player_statdata = {"vol": "60", "mode": "40"}
         await dev.async_snapshot(switchinput=True)
         sent = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
-        assert sent[0] == "setPlayerCmd:switchmode:wifi"
-        assert sent[1] == "setPlayerCmd:stop"
-        dev.async_get_status.assert_awaited_once()
-        assert dev._snap_volume == 60  # from player_statdata fixture
+        assert sent == ["setPlayerCmd:switchmode:wifi", "setPlayerCmd:stop"]
+        switched, settled = (c.args[0] for c in dev.async_wait_for_status.await_args_list)
+        assert switched({"mode": "10"}) and not switched({"mode": "40"})
+        assert not settled({"vol": "30"})
+        assert not settled({"vol": "45"})
+        assert settled({"vol": "45"})
+        assert dev._snap.volume == 60  # from the settled status
 
     @pytest.mark.asyncio
     async def test_switchinput_failed_switch_sets_snap_volume_zero(self) -> None:
         dev = _FakeDevice()
-        dev._source = "line-in"
-        dev._playing_stream = False
+        dev._transport.source = "line-in"
+        dev._playing.stream = False
         dev.call_linkplay_httpapi = AsyncMock(return_value="FAIL")
         await dev.async_snapshot(switchinput=True)
-        assert dev._snap_volume == 0
-        dev.async_get_status.assert_not_awaited()
+        assert dev._snap.volume == 0
+        dev.async_wait_for_status.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_streaming_path_stops_only(self) -> None:
         dev = _FakeDevice()
-        dev._playing_stream = True
+        dev._playing.stream = True
         await dev.async_snapshot(switchinput=False)
         sent = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
         assert sent == ["setPlayerCmd:stop"]
-        assert dev._snap_volume == 50
+        assert dev._snap.volume == 50
 
     @pytest.mark.asyncio
     async def test_network_source_records_uri_for_restore(self) -> None:
         dev = _FakeDevice()
-        dev._source = "Network"
-        dev._playing_stream = True
+        dev._transport.source = "Network"
+        dev._playing.stream = True
         await dev.async_snapshot(switchinput=False)
-        assert dev._snap_uri == "http://example/stream"
+        assert dev._snap.uri == "http://example/stream"
 
 
 class TestRestore:
     @pytest.mark.asyncio
     async def test_unavailable_short_circuits(self) -> None:
         dev = _FakeDevice()
-        dev._state = "unavailable"
+        dev._transport.state = "unavailable"
         await dev.async_restore()
         dev.call_linkplay_httpapi.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_slave_does_not_restore(self) -> None:
         dev = _FakeDevice()
-        dev._slave_mode = True
+        dev._group.slave_mode = True
         await dev.async_restore()
         dev.call_linkplay_httpapi.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_volume_restored_and_cleared(self) -> None:
         dev = _FakeDevice()
-        dev._snap_volume = 35
-        dev._snap_source = "Webradio"
-        dev._snap_state = "idle"
+        dev._snap.volume = 35
+        dev._snap.source = "Webradio"
+        dev._snap.state = "idle"
         await dev.async_restore()
         first = dev.call_linkplay_httpapi.await_args_list[0].args[0]
         assert first == "setPlayerCmd:vol:35"
         # snap_volume reset after use
-        assert dev._snap_volume == 0
+        assert dev._snap.volume == 0
 
     @pytest.mark.asyncio
     async def test_spotify_full_restore_pushes_preset_key(self) -> None:
         dev = _FakeDevice()
-        dev._snap_spotify = True
-        dev._snap_spotify_volumeonly = False
-        dev._snap_source = "Spotify"
-        dev._snap_state = "idle"
+        dev._snap.spotify = True
+        dev._snap.spotify_volumeonly = False
+        dev._snap.source = "Spotify"
+        dev._snap.state = "idle"
         await dev.async_restore()
         cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
         assert "MCUKeyShortClick:4" in cmds
         assert dev._snapshot_active is False
-        assert dev._snap_spotify is False
+        assert dev._snap.spotify is False
 
     @pytest.mark.asyncio
     async def test_spotify_volume_only_skips_preset(self) -> None:
         dev = _FakeDevice()
-        dev._snap_spotify = True
-        dev._snap_spotify_volumeonly = True
-        dev._snap_source = "Spotify"
-        dev._snap_state = "idle"
+        dev._snap.spotify = True
+        dev._snap.spotify_volumeonly = True
+        dev._snap.source = "Spotify"
+        dev._snap.state = "idle"
         await dev.async_restore()
         cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
         assert not any("MCUKeyShortClick" in c for c in cmds)
@@ -213,33 +203,97 @@ class TestRestore:
     @pytest.mark.asyncio
     async def test_non_network_source_calls_select_source(self) -> None:
         dev = _FakeDevice()
-        dev._snap_source = "line-in"
-        dev._snap_state = "idle"
+        dev._snap.source = "line-in"
+        dev._snap.state = "idle"
         await dev.async_restore()
         dev.async_select_source.assert_awaited_once_with("line-in")
-        assert dev._snap_source is None
+        assert dev._snap.source is None
         assert dev._snapshot_active is False
 
     @pytest.mark.asyncio
     async def test_network_with_uri_replays_via_play_media(self) -> None:
         dev = _FakeDevice()
-        dev._snap_source = "Network"
-        dev._snap_uri = "http://example/stream.mp3"
-        dev._snap_state = "playing"
+        dev._snap.source = "Network"
+        dev._snap.uri = "http://example/stream.mp3"
+        dev._snap.state = "playing"
         await dev.async_restore()
         dev.async_play_media.assert_awaited_once()
-        assert dev._snap_uri is None
+        assert dev._snap.uri is None
 
     @pytest.mark.asyncio
     async def test_seek_after_restore_when_position_known(self) -> None:
         dev = _FakeDevice()
-        dev._snap_source = "Network"
-        dev._snap_uri = "http://example/stream.mp3"
-        dev._snap_state = "paused"
-        dev._snap_seek = True
-        dev._snap_playhead_position = 42
+        dev._snap.source = "Network"
+        dev._snap.uri = "http://example/stream.mp3"
+        dev._snap.state = "paused"
+        dev._snap.seek = True
+        dev._snap.playhead_position = 42
         await dev.async_restore()
         cmds = [c.args[0] for c in dev.call_linkplay_httpapi.await_args_list]
         assert "setPlayerCmd:seek:42" in cmds
+        # The seek waited for the restored source to play.
+        dev.async_wait_for_status.assert_awaited_once()
         # Paused restores also call media_pause to finish in the right state
         dev.async_media_pause.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_wait_without_seek(self) -> None:
+        dev = _FakeDevice()
+        dev._snap.source = "Network"
+        dev._snap.uri = "http://example/stream.mp3"
+        dev._snap.state = "playing"
+        await dev.async_restore()
+        dev.async_wait_for_status.assert_not_awaited()
+
+
+class TestGroupSnapshot:
+    @pytest.mark.asyncio
+    async def test_master_captures_and_restores_slave_volumes_concurrently(self) -> None:
+        master = make_device("master", host="10.0.0.1")
+        slaves = [make_device(f"s{i}", host=f"10.0.0.{i + 2}") for i in range(2)]
+        master._transport.state = "idle"
+        master._transport.volume = 40
+        master._group.is_master = True
+        master._group.slave_list = slaves
+        for volume, slave in zip((20, 30), slaves):
+            slave._transport.volume = volume
+            slave._group.slave_mode = True
+
+        await master.async_snapshot(switchinput=True)
+        assert [s._snap.volume for s in slaves] == [20, 30]
+
+        restored = asyncio.Event()
+        running = 0
+
+        async def _set_volume(self, volume, action):
+            nonlocal running
+            running += 1
+            if running == 2:
+                restored.set()
+            await restored.wait()
+            self._transport.volume = volume
+
+        master.call_linkplay_httpapi = AsyncMock(return_value="OK")
+        with patch.object(type(master), "_set_volume_on_device", _set_volume):
+            for slave in slaves:
+                slave._transport.volume = 80
+            await master.async_restore()
+
+        assert [s._transport.volume for s in slaves] == [20, 30]
+        assert [s._snap.volume for s in slaves] == [0, 0]
+        master.call_linkplay_httpapi.assert_any_await("setPlayerCmd:vol:40", None)
+
+
+class TestSnapshotState:
+    def test_records_are_slotted(self) -> None:
+        state = SnapshotState()
+        with pytest.raises(AttributeError):
+            state.volum = 10  # typo must not silently add a field
+        assert not hasattr(PlaybackFlags(), "__dict__")
+
+    def test_as_dict_lists_every_field(self) -> None:
+        state = SnapshotState()
+        state.volume = 35
+        data = state.as_dict()
+        assert data["volume"] == 35
+        assert set(data) == set(SnapshotState.__slots__)
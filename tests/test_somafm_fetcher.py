@@ -73,17 +73,17 @@ class TestUpdateFromSomafm:
     @pytest.mark.asyncio
     async def test_no_station_title_returns_false(self) -> None:
         dev = _make_device()
-        dev._media_title = "BBC Radio 1"
+        dev._meta.title = "BBC Radio 1"
 
         ok = await dev.async_update_from_somafm()
 
         assert ok is False
-        assert dev._media_title == "BBC Radio 1"
+        assert dev._meta.title == "BBC Radio 1"
 
     @pytest.mark.asyncio
     async def test_somafm_response_populates_track(self) -> None:
         dev = _make_device()
-        dev._media_title = "SomaFM: Groove Salad"
+        dev._meta.title = "SomaFM: Groove Salad"
 
         json_payload = {
             "songs": [
@@ -110,9 +110,9 @@ class TestUpdateFromSomafm:
             ok = await dev.async_update_from_somafm()
 
         assert ok is True
-        assert dev._media_title == "Carbon Mind"
-        assert dev._media_artist == "Carbon Based Lifeforms"
-        assert dev._media_album == "World Of Sleepers"
+        assert dev._meta.title == "Carbon Mind"
+        assert dev._meta.artist == "Carbon Based Lifeforms"
+        assert dev._meta.album == "World Of Sleepers"
 
     @pytest.mark.asyncio
     async def test_artist_gets_station_suffix(self) -> None:
@@ -120,7 +120,7 @@ class TestUpdateFromSomafm:
         channel name in parens, e.g. 'Carbon Based Lifeforms (Groove
         Salad)'. The title stays the raw track name."""
         dev = _make_device()
-        dev._media_title = "SomaFM: Groove Salad"
+        dev._meta.title = "SomaFM: Groove Salad"
         dev._somafm_cached_station = "SomaFM: Groove Salad"
 
         response = MagicMock()
@@ -142,13 +142,13 @@ class TestUpdateFromSomafm:
             ok = await dev.async_update_from_somafm.__wrapped__(dev)
 
         assert ok is True
-        assert dev._media_title == "Carbon Mind"
-        assert dev._media_artist == "Carbon Based Lifeforms (Groove Salad)"
+        assert dev._meta.title == "Carbon Mind"
+        assert dev._meta.artist == "Carbon Based Lifeforms (Groove Salad)"
 
     @pytest.mark.asyncio
     async def test_empty_songs_list_returns_false(self) -> None:
         dev = _make_device()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
 
         response = MagicMock()
         response.status = 200
@@ -173,7 +173,7 @@ class TestUpdateFromSomafm:
         mod._channel_map_cache = None  # reset cache between tests
 
         dev = _make_device()
-        dev._media_title = "SomaFM: Space Station Soma"
+        dev._meta.title = "SomaFM: Space Station Soma"
 
         channels_response = MagicMock()
         channels_response.status = 200
@@ -205,25 +205,25 @@ class TestUpdateFromSomafm:
             ok = await dev.async_update_from_somafm()
 
         assert ok is True
-        assert dev._media_artist == "Ambient Artist"
-        assert dev._media_title == "Ambient Track"
+        assert dev._meta.artist == "Ambient Artist"
+        assert dev._meta.title == "Ambient Track"
         # Second .get call should have hit the real spacestation slug.
         called_urls = [call.args[0] for call in session.get.await_args_list]
         assert called_urls[1] == "https://somafm.com/songs/spacestation.json"
         # Channel image surfaced even though songs[0].albumart wasn't set.
-        assert dev._media_image_url == "https://api.somafm.com/img/spacestation600.jpg"
+        assert dev._meta.image_url == "https://api.somafm.com/img/spacestation600.jpg"
 
     @pytest.mark.asyncio
     async def test_cached_station_drives_refetch_after_first_track(self) -> None:
-        """After the first successful fetch, ``_media_title`` is the
+        """After the first successful fetch, ``_meta.title`` is the
         track name (not "SomaFM: <station>"), so the slug must be
         derived from ``_somafm_cached_station`` instead - otherwise the
         entity freezes on the first track of the session."""
         dev = _make_device()
-        # State after the first fetch: _media_title is a track, sticky
+        # State after the first fetch: _meta.title is a track, sticky
         # cached station retains the prefixed form.
-        dev._media_title = "Carbon Mind"
-        dev._media_artist = "Carbon Based Lifeforms"
+        dev._meta.title = "Carbon Mind"
+        dev._meta.artist = "Carbon Based Lifeforms"
         dev._somafm_cached_station = "SomaFM: Groove Salad"
 
         response = MagicMock()
@@ -245,11 +245,11 @@ class TestUpdateFromSomafm:
             ok = await dev.async_update_from_somafm.__wrapped__(dev)
 
         assert ok is True
-        assert dev._media_title == "New Track"
+        assert dev._meta.title == "New Track"
         # Artist carries the SomaFM station name in parens.
-        assert dev._media_artist == "New Artist (Groove Salad)"
+        assert dev._meta.artist == "New Artist (Groove Salad)"
         # The slug came from the cached station, not the track-flavoured
-        # _media_title.
+        # _meta.title.
         called_url = session.get.await_args.args[0]
         assert called_url == "https://somafm.com/songs/groovesalad.json"
 
@@ -258,7 +258,7 @@ class TestUpdateFromSomafm:
         """iTunes is the primary artwork source; SomaFM's per-track
         ``albumart`` is the fallback when iTunes returns nothing."""
         dev = _make_device()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
         dev._somafm_cached_station = "SomaFM: Drone Zone"
 
         resp = MagicMock()
@@ -276,7 +276,7 @@ class TestUpdateFromSomafm:
         session.get = AsyncMock(return_value=resp)
 
         def _itunes_success():
-            dev._media_image_url = "https://is1.mzstatic.com/cover/600x600bb.jpg"
+            dev._meta.image_url = "https://is1.mzstatic.com/cover/600x600bb.jpg"
             return True
 
         dev.async_get_itunes_artwork = AsyncMock(side_effect=_itunes_success)
@@ -289,17 +289,17 @@ class TestUpdateFromSomafm:
         assert ok is True
         dev.async_get_itunes_artwork.assert_awaited_once()
         # iTunes art wins over the SomaFM-provided albumart
-        assert "mzstatic" in dev._media_image_url
+        assert "mzstatic" in dev._meta.image_url
 
     @pytest.mark.asyncio
     async def test_itunes_lookup_sees_raw_artist_not_station_suffix(self) -> None:
         """Regression: the station "(<channel>)" suffix must NOT leak into
-        the iTunes Search. iTunes builds its term from ``_media_artist``,
+        the iTunes Search. iTunes builds its term from ``_meta.artist``,
         so the suffix has to be applied only AFTER artwork resolution -
         otherwise the term is "Kodomo (Drone Zone) <title>" and every
         cover lookup misses, leaving the card on the station logo."""
         dev = _make_device()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
         dev._somafm_cached_station = "SomaFM: Drone Zone"
 
         resp = MagicMock()
@@ -318,8 +318,8 @@ class TestUpdateFromSomafm:
 
         def _capture_artist():
             # Snapshot what iTunes would search on at call time.
-            seen["artist"] = dev._media_artist
-            seen["title"] = dev._media_title
+            seen["artist"] = dev._meta.artist
+            seen["title"] = dev._meta.title
             return True
 
         dev.async_get_itunes_artwork = AsyncMock(side_effect=_capture_artist)
@@ -335,7 +335,7 @@ class TestUpdateFromSomafm:
         assert seen["artist"] == "Kodomo"
         assert seen["title"] == "Spira Mirabilis"
         # But the card still ends up with the station label applied.
-        assert dev._media_artist == "Kodomo (Drone Zone)"
+        assert dev._meta.artist == "Kodomo (Drone Zone)"
 
     @pytest.mark.asyncio
     async def test_itunes_art_persists_through_throttled_calls(self) -> None:
@@ -344,14 +344,14 @@ class TestUpdateFromSomafm:
         logo cannot win just because iTunes' throttle returned False."""
         dev = _make_device()
         # Simulate state at the start of the second poll inside the
-        # same track: _media_title/_media_artist already match the
+        # same track: _meta.title/_meta.artist already match the
         # SomaFM-resolved track from the previous poll - including the
         # "(<station>)" suffix the previous poll appended to the artist.
-        dev._media_title = "Spira Mirabilis"
-        dev._media_artist = "Kodomo (Drone Zone)"
+        dev._meta.title = "Spira Mirabilis"
+        dev._meta.artist = "Kodomo (Drone Zone)"
         dev._somafm_cached_station = "SomaFM: Drone Zone"
         # Pretend iTunes already populated the cover on the previous poll
-        dev._media_image_url = "https://is1.mzstatic.com/cover/600x600bb.jpg"
+        dev._meta.image_url = "https://is1.mzstatic.com/cover/600x600bb.jpg"
 
         resp = MagicMock()
         resp.status = 200
@@ -376,17 +376,17 @@ class TestUpdateFromSomafm:
 
         assert ok is True
         # iTunes art still in place, not clobbered by the station logo
-        assert "mzstatic" in dev._media_image_url
+        assert "mzstatic" in dev._meta.image_url
 
     @pytest.mark.asyncio
     async def test_track_change_drops_stale_art_before_resolving(self) -> None:
         """When the track changes inside the same station, the previous
         track's image is dropped before the resolution chain runs."""
         dev = _make_device()
-        dev._media_title = "Old Track"  # prior poll's title
-        dev._media_artist = "Old Artist"
+        dev._meta.title = "Old Track"  # prior poll's title
+        dev._meta.artist = "Old Artist"
         dev._somafm_cached_station = "SomaFM: Drone Zone"
-        dev._media_image_url = "https://is1.mzstatic.com/old/600x600bb.jpg"
+        dev._meta.image_url = "https://is1.mzstatic.com/old/600x600bb.jpg"
 
         resp = MagicMock()
         resp.status = 200
@@ -402,7 +402,7 @@ class TestUpdateFromSomafm:
 
         # iTunes lookup for the new track succeeds with fresh URL
         def _itunes_set_new():
-            dev._media_image_url = "https://is1.mzstatic.com/new/600x600bb.jpg"
+            dev._meta.image_url = "https://is1.mzstatic.com/new/600x600bb.jpg"
             return True
 
         dev.async_get_itunes_artwork = AsyncMock(side_effect=_itunes_set_new)
@@ -413,14 +413,14 @@ class TestUpdateFromSomafm:
         ):
             ok = await dev.async_update_from_somafm.__wrapped__(dev)
         assert ok is True
-        assert "new/600x600bb.jpg" in dev._media_image_url
+        assert "new/600x600bb.jpg" in dev._meta.image_url
 
     @pytest.mark.asyncio
     async def test_somafm_albumart_used_when_itunes_fails(self) -> None:
         """When iTunes returns nothing, SomaFM's per-track ``albumart``
         is the next-best art source before the station logo."""
         dev = _make_device()
-        dev._media_title = "SomaFM: Drone Zone"
+        dev._meta.title = "SomaFM: Drone Zone"
         dev._somafm_cached_station = "SomaFM: Drone Zone"
 
         resp = MagicMock()
@@ -445,12 +445,12 @@ class TestUpdateFromSomafm:
         ):
             ok = await dev.async_update_from_somafm.__wrapped__(dev)
         assert ok is True
-        assert dev._media_image_url == "https://api.somafm.com/img/somafm-track.jpg"
+        assert dev._meta.image_url == "https://api.somafm.com/img/somafm-track.jpg"
 
     @pytest.mark.asyncio
     async def test_http_error_returns_false_silently(self) -> None:
         dev = _make_device()
-        dev._media_title = "SomaFM: Lush"
+        dev._meta.title = "SomaFM: Lush"
 
         response = MagicMock()
         response.status = 503
@@ -464,5 +464,5 @@ class TestUpdateFromSomafm:
             ok = await dev.async_update_from_somafm()
 
         assert ok is False
-        assert dev._media_title == "SomaFM: Lush"
-        assert dev._media_artist is None
+        assert dev._meta.title == "SomaFM: Lush"
+        assert dev._meta.artist is None
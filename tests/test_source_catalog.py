@@ -0,0 +1,54 @@
+"""Tests for the precomputed source lookup tables."""
+
+from __future__ import annotations
+
+from custom_components.linkplay.media_player import SOURCES
+from custom_components.linkplay.source_catalog import SourceCatalog
+
+
+class TestFromOptions:
+    def test_defaults_when_no_sources_configured(self) -> None:
+        catalog = SourceCatalog.from_options(None, None, SOURCES)
+        assert catalog.sources == SOURCES
+        assert catalog.sources is not SOURCES
+
+    def test_option_list_of_mappings_is_merged(self) -> None:
+        catalog = SourceCatalog.from_options(
+            [{"line-in": "Turntable"}, {"http://radio/": "Radio"}],
+            [{"http://news/": "News"}],
+            SOURCES,
+        )
+        assert catalog.sources == {
+            "line-in": "Turntable", "http://radio/": "Radio", "http://news/": "News",
+        }
+
+    def test_common_sources_extend_defaults(self) -> None:
+        catalog = SourceCatalog.from_options({}, {"http://news/": "News"}, SOURCES)
+        assert catalog.key("News") == "http://news/"
+        assert catalog.key("Bluetooth") == "bluetooth"
+
+
+class TestLookups:
+    def test_forward_and_reverse(self) -> None:
+        catalog = SourceCatalog({"line-in": "Line In", "http://radio/": "Radio"})
+        assert catalog.name("line-in") == "Line In"
+        assert catalog.name("optical") is None
+        assert catalog.name("http://other/", "Network") == "Network"
+        assert catalog.key("Radio") == "http://radio/"
+        assert catalog.key("Nope") is None
+
+    def test_duplicate_name_resolves_to_first_key(self) -> None:
+        catalog = SourceCatalog({"http://a/": "Radio", "http://b/": "Radio"})
+        assert catalog.key("Radio") == "http://a/"
+
+    def test_names_omit_wifi(self) -> None:
+        catalog = SourceCatalog({"wifi": "WiFi", "bluetooth": "Bluetooth"})
+        assert catalog.names == ["Bluetooth"]
+        assert "wifi" in catalog
+
+    def test_classification(self) -> None:
+        catalog = SourceCatalog({"http://radio/": "Radio", "udisk": "USB", "line-in": "Line In"})
+        assert catalog.is_stream("http://radio/")
+        assert not catalog.is_stream("line-in")
+        assert catalog.is_disk("udisk") and catalog.is_disk("TFcard")
+        assert not catalog.is_disk("line-in")
@@ -8,15 +8,17 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
 import pytest
 
+from custom_components.linkplay.state import MediaMetadata
 from custom_components.linkplay.stream_resolver_mixin import LinkPlayStreamResolverMixin
 
 
 class _FakeDevice(LinkPlayStreamResolverMixin):
     def __init__(self) -> None:
+        self._meta = MediaMetadata()
         self.hass = MagicMock()
         self._name = "fake"
         self._host = "1.2.3.4"
-        self._nometa = False
+        self._meta.nometa = False
 
 
 def _patch_session(session):
@@ -114,7 +116,7 @@ class TestParseM3uPls:
         with _patch_session(session):
             url = await dev.async_parse_m3u_url("http://server/list.m3u")
         assert url == "http://server/list.m3u"
-        assert dev._nometa is True
+        assert dev._meta.nometa is True
 
     @pytest.mark.asyncio
     async def test_pls_returns_first_file(self) -> None:
@@ -139,4 +141,4 @@ class TestParseM3uPls:
         with _patch_session(session):
             url = await dev.async_parse_pls_url("http://server/list.pls")
         assert url == "http://server/list.pls"
-        assert dev._nometa is True
+        assert dev._meta.nometa is True
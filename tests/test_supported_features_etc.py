@@ -11,6 +11,7 @@ import pytest
 from homeassistant.components.media_player import MediaPlayerEntityFeature
 from homeassistant.const import STATE_IDLE, STATE_PLAYING
 
+from custom_components.linkplay.source_catalog import SourceCatalog
 from tests._helpers import make_device
 
 
@@ -23,14 +24,14 @@ def _make_device():
 class TestSupportedFeatures:
     def test_slave_mode_returns_cached(self) -> None:
         dev = _make_device()
-        dev._slave_mode = True
+        dev._group.slave_mode = True
         dev._features = MediaPlayerEntityFeature.PLAY
         assert dev.supported_features == MediaPlayerEntityFeature.PLAY
 
     def test_localfile_idle_falls_through_to_else(self) -> None:
         dev = _make_device()
-        dev._playing_localfile = True
-        dev._state = STATE_IDLE
+        dev._playing.localfile = True
+        dev._transport.state = STATE_IDLE
         feats = dev.supported_features
         # idle/localfile takes the no-seek branch
         assert feats & MediaPlayerEntityFeature.PLAY
@@ -38,30 +39,30 @@ class TestSupportedFeatures:
 
     def test_spotify_playing_includes_seek(self) -> None:
         dev = _make_device()
-        dev._playing_spotify = True
-        dev._state = STATE_PLAYING
+        dev._playing.spotify = True
+        dev._transport.state = STATE_PLAYING
         feats = dev.supported_features
         assert feats & MediaPlayerEntityFeature.SEEK
 
     def test_stream_includes_seek_no_skip(self) -> None:
         dev = _make_device()
-        dev._playing_localfile = False  # default is True in __init__
-        dev._playing_stream = True
+        dev._playing.localfile = False  # default is True in __init__
+        dev._playing.stream = True
         feats = dev.supported_features
         assert feats & MediaPlayerEntityFeature.SEEK
         assert not (feats & MediaPlayerEntityFeature.NEXT_TRACK)
 
     def test_mediabrowser_features(self) -> None:
         dev = _make_device()
-        dev._playing_localfile = False
-        dev._playing_mediabrowser = True
+        dev._playing.localfile = False
+        dev._playing.mediabrowser = True
         feats = dev.supported_features
         assert feats & MediaPlayerEntityFeature.BROWSE_MEDIA
 
     def test_liveinput_lacks_transport_controls(self) -> None:
         dev = _make_device()
-        dev._playing_localfile = False
-        dev._playing_liveinput = True
+        dev._playing.localfile = False
+        dev._playing.liveinput = True
         feats = dev.supported_features
         assert feats & MediaPlayerEntityFeature.SELECT_SOURCE
         assert not (feats & MediaPlayerEntityFeature.PLAY)
@@ -70,42 +71,42 @@ class TestSupportedFeatures:
 class TestIcon:
     def test_bluetooth_icon(self) -> None:
         dev = _make_device()
-        dev._state = STATE_PLAYING
-        dev._source = "Bluetooth"
+        dev._transport.state = STATE_PLAYING
+        dev._transport.source = "Bluetooth"
         from custom_components.linkplay.media_player import ICON_BLUETOOTH
         assert dev.icon == ICON_BLUETOOTH
 
     def test_dlna_icon(self) -> None:
         dev = _make_device()
-        dev._state = STATE_PLAYING
-        dev._source = "DLNA"
+        dev._transport.state = STATE_PLAYING
+        dev._transport.source = "DLNA"
         from custom_components.linkplay.media_player import ICON_PUSHSTREAM
         assert dev.icon == ICON_PUSHSTREAM
 
     def test_playing_icon(self) -> None:
         dev = _make_device()
-        dev._source = "Network"
-        dev._state = STATE_PLAYING
+        dev._transport.source = "Network"
+        dev._transport.state = STATE_PLAYING
         from custom_components.linkplay.media_player import ICON_PLAYING
         assert dev.icon == ICON_PLAYING
 
     def test_muted_icon(self) -> None:
         dev = _make_device()
-        dev._state = STATE_PLAYING
-        dev._muted = True
+        dev._transport.state = STATE_PLAYING
+        dev._transport.muted = True
         from custom_components.linkplay.media_player import ICON_MUTED
         assert dev.icon == ICON_MUTED
 
     def test_multiroom_master_icon(self) -> None:
         dev = _make_device()
-        dev._state = STATE_PLAYING
-        dev._is_master = True
+        dev._transport.state = STATE_PLAYING
+        dev._group.is_master = True
         from custom_components.linkplay.media_player import ICON_MULTIROOM
         assert dev.icon == ICON_MULTIROOM
 
     def test_tts_icon(self) -> None:
         dev = _make_device()
-        dev._playing_tts = True
+        dev._playing.tts = True
         from custom_components.linkplay.media_player import ICON_TTS
         assert dev.icon == ICON_TTS
 
@@ -113,7 +114,7 @@ class TestIcon:
 class TestSourceListEmpty:
     def test_empty_source_list_returns_none(self) -> None:
         dev = _make_device()
-        dev._source_list = {}
+        dev._sources = SourceCatalog({})
         assert dev.source_list is None
 
 
@@ -131,13 +132,13 @@ class TestPlayTrackFailure:
     async def test_slave_delegates_to_master(self) -> None:
         dev = _make_device()
         dev._trackq = ["x"]
-        dev._slave_mode = True
-        dev._master = MagicMock()
-        dev._master.async_play_track = AsyncMock()
+        dev._group.slave_mode = True
+        dev._group.master = MagicMock()
+        dev._group.master.async_play_track = AsyncMock()
         track = MagicMock()
         track.async_render = MagicMock(return_value="x")
         await dev.async_play_track(track)
-        dev._master.async_play_track.assert_awaited_once_with(track)
+        dev._group.master.async_play_track.assert_awaited_once_with(track)
 
 
 class TestTrivialProperties:
@@ -151,23 +152,23 @@ class TestTrivialProperties:
         )
 
         dev = _make_device()
-        dev._shuffle = True
-        dev._repeat = RepeatMode.ALL
-        dev._media_title = "t"
-        dev._media_artist = "a"
-        dev._media_album = "al"
-        dev._media_image_url = "u"
-        dev._media_uri_final = "uri"
+        dev._transport.shuffle = True
+        dev._transport.repeat = RepeatMode.ALL
+        dev._meta.title = "t"
+        dev._meta.artist = "a"
+        dev._meta.album = "al"
+        dev._meta.image_url = "u"
+        dev._meta.uri_final = "uri"
         dev._ssid = "ssid"
         dev._wifi_channel = "6"
-        dev._slave_ip = "1.1.1.1"
+        dev._group.slave_ip = "1.1.1.1"
         dev._trackq = ["a", "b"]
         dev._trackc = "c"
         dev._uuid = "U1"
-        dev._is_master = True
-        dev._slave_mode = True
-        dev._multiroom_group = ["x"]
-        dev._sound_mode = "Jazz"
+        dev._group.is_master = True
+        dev._group.slave_mode = True
+        dev._group.members = ["x"]
+        dev._transport.sound_mode = "Jazz"
 
         assert dev.shuffle is True
         assert dev.repeat == RepeatMode.ALL
@@ -232,8 +233,8 @@ class TestSomaFmDetectionInUpdate:
             "Title": somafm_hex, "Artist": "", "Album": "",
         }
         self._seed(dev, payload)
-        dev._media_title = "Old Track"
-        dev._media_artist = "Old Artist"
+        dev._meta.title = "Old Track"
+        dev._meta.artist = "Old Artist"
         dev._somafm_cached_station = "SomaFM: Drone Zone"
         dev.async_update_from_somafm = AsyncMock(return_value=True)
         await dev.async_update()
@@ -251,14 +252,14 @@ class TestSomaFmDetectionInUpdate:
             "Title": somafm_hex, "Artist": "", "Album": "",
         }
         self._seed(dev, payload)
-        dev._media_title = "Track In Progress"
-        dev._media_artist = "Artist In Progress"
+        dev._meta.title = "Track In Progress"
+        dev._meta.artist = "Artist In Progress"
         dev._somafm_cached_station = "SomaFM: Drone Zone"
         # Throttled fetch returns None (per the integration's @Throttle path)
         dev.async_update_from_somafm = AsyncMock(return_value=None)
         await dev.async_update()
         # Existing artist preserved through throttle
-        assert dev._media_artist == "Artist In Progress"
+        assert dev._meta.artist == "Artist In Progress"
 
     @pytest.mark.asyncio
     async def test_non_somafm_stream_upnp_exception_swallowed(self) -> None:
@@ -270,7 +271,7 @@ class TestSomaFmDetectionInUpdate:
             "Title": "BBC Radio 1", "Artist": "", "Album": "",
         }
         self._seed(dev, payload)
-        dev._media_title = "BBC Radio 1"
+        dev._meta.title = "BBC Radio 1"
         dev._upnp_device = MagicMock()
         dev.async_get_playerstatus_metadata = AsyncMock(return_value=False)
         dev.async_update_via_upnp = AsyncMock(side_effect=Exception("boom"))
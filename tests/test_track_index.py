@@ -0,0 +1,102 @@
+"""Tests for the USB queue parser and track name index."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.linkplay.track_index import (
+    TrackIndex,
+    normalize_title,
+    parse_usb_queue,
+    queue_digest,
+)
+from tests._helpers import make_device
+
+_ROOT = "/media/sda1/"
+
+
+def _queue_xml(paths: list[str]) -> str:
+    tracks = "".join(
+        f"<Track{i}><URL>{_ROOT}{path}</URL><Metadata><URL>nested</URL></Metadata></Track{i}>"
+        for i, path in enumerate(paths, start=1)
+    )
+    return f"<PlayList><ListName>USBDiskQueue</ListName><Tracks>{tracks}</Tracks></PlayList>"
+
+
+class TestParseUsbQueue:
+    def test_only_track_urls_below_root_are_kept(self) -> None:
+        xml = _queue_xml(["Rock/a.mp3", "b.flac"]).replace(
+            "</Tracks>", "<Track9><URL>http://elsewhere/x.mp3</URL></Track9></Tracks>",
+        )
+        assert parse_usb_queue(xml, _ROOT) == ["Rock/a.mp3", "b.flac"]
+
+    def test_large_queue(self) -> None:
+        paths = [f"Artist {i // 100}/Track {i}.mp3" for i in range(10_000)]
+        assert parse_usb_queue(_queue_xml(paths), _ROOT) == paths
+
+    def test_digest_follows_content(self) -> None:
+        assert queue_digest(_queue_xml(["a.mp3"])) == queue_digest(_queue_xml(["a.mp3"]))
+        assert queue_digest(_queue_xml(["a.mp3"])) != queue_digest(_queue_xml(["b.mp3"]))
+
+
+class TestTrackIndex:
+    def test_normalized_keys(self) -> None:
+        assert normalize_title("Björk/Jóga (Live)_2.MP3") == "joga live 2"
+        assert normalize_title("No extension") == "no extension"
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("Joga", 1),              # exact key, accents and case ignored
+            ("hyper", 2),             # prefix
+            ("Bjork/Hyper", 2),       # substring of the path
+            ("hyperbalad", 2),        # fuzzy
+            ("nothing alike", None),
+            ("", None),
+        ],
+    )
+    def test_lookup_order(self, query, expected) -> None:
+        index = TrackIndex(["intro.mp3", "Bjork/Jóga.mp3", "Bjork/Hyperballad.flac"])
+        assert index.find(query) == expected
+
+    def test_exact_key_beats_earlier_substring(self) -> None:
+        index = TrackIndex(["intro.mp3", "track10.mp3", "track1.mp3"])
+        assert index.find("track1") == 2
+        assert index.prefix("track") == [2, 1]
+
+    def test_folder_tree(self) -> None:
+        index = TrackIndex(["b/2.mp3", "a/deep/1.mp3", "top.mp3", "b/3.mp3"])
+        assert index.folder() == (["a", "b"], [2])
+        assert index.folder("a") == (["a/deep"], [])
+        assert index.folder("b") == ([], [0, 3])
+        assert index.folder("missing") is None
+
+
+class TestDeviceQueue:
+    @pytest.mark.asyncio
+    async def test_unchanged_queue_is_not_reparsed(self, monkeypatch) -> None:
+        dev = make_device()
+        dev._upnp_device = MagicMock()
+        xml = _queue_xml(["a.mp3", "b.mp3"])
+        dev._async_upnp_call = AsyncMock(return_value={"QueueContext": xml})
+        parse = MagicMock(side_effect=parse_usb_queue)
+        monkeypatch.setattr("custom_components.linkplay.upnp_mixin.parse_usb_queue", parse)
+
+        await dev.async_tracklist_via_upnp("USB")
+        await dev.async_tracklist_via_upnp("USB")
+        assert parse.call_count == 1
+        assert dev._trackq == ["a.mp3", "b.mp3"]
+        assert dev._track_index.digest == queue_digest(xml)
+
+        dev._async_upnp_call.return_value = {"QueueContext": _queue_xml(["c.mp3"])}
+        await dev.async_tracklist_via_upnp("USB")
+        assert dev._trackq == ["c.mp3"]
+
+    def test_replaced_queue_rebuilds_the_index(self) -> None:
+        dev = make_device()
+        dev._trackq = ["x.mp3", "y.mp3"]
+        assert dev._usb_track_index().find("y") == 1
+        dev._trackq = ["y.mp3"]
+        assert dev._usb_track_index().find("y") == 0
@@ -59,21 +59,23 @@ class TestTuneInMetadataFlow:
 
         await dev.async_update_via_upnp()
 
-        assert dev._media_title == "Carbon Based Lifeforms - World Of Sleepers"
-        assert dev._media_artist == "Carbon Based Lifeforms"
-        assert dev._media_album == "SomaFM"
-        assert dev._media_image_url == "https://cover.example/img.jpg"
+        assert dev._meta.title == "Carbon Based Lifeforms - World Of Sleepers"
+        assert dev._meta.artist == "Carbon Based Lifeforms"
+        assert dev._meta.album == "SomaFM"
+        assert dev._meta.image_url == "https://cover.example/img.jpg"
 
     @pytest.mark.asyncio
     async def test_upnp_skipped_when_no_device(self) -> None:
-        """Without an initialised _upnp_device the method must be a noop."""
+        """When the UPnP device cannot be bound the method must be a noop."""
         dev = _make_device()
         dev._upnp_device = None
-        dev._media_title = "should not change"
+        dev._factory = MagicMock()
+        dev._factory.async_create_device = AsyncMock(side_effect=OSError("offline"))
+        dev._meta.title = "should not change"
 
         await dev.async_update_via_upnp()
 
-        assert dev._media_title == "should not change"
+        assert dev._meta.title == "should not change"
 
     @pytest.mark.asyncio
     async def test_upnp_didl_missing_metadata_is_silent(self) -> None:
@@ -84,8 +86,8 @@ class TestTuneInMetadataFlow:
         await dev.async_update_via_upnp()
 
         # Nothing populated, no exception.
-        assert dev._media_title is None
-        assert dev._media_artist is None
+        assert dev._meta.title is None
+        assert dev._meta.artist is None
 
     @pytest.mark.asyncio
     async def test_playerstatus_metadata_short_circuits_upnp(self) -> None:
@@ -107,8 +109,8 @@ class TestTuneInMetadataFlow:
         got = await dev.async_get_playerstatus_metadata(plr_stat)
 
         assert got is True
-        assert dev._media_title == "Test Track"
-        assert dev._media_artist == "Test Artist!"
+        assert dev._meta.title == "Test Track"
+        assert dev._meta.artist == "Test Artist!"
 
     @pytest.mark.asyncio
     async def test_playerstatus_metadata_returns_false_on_empty(self) -> None:
@@ -119,5 +121,5 @@ class TestTuneInMetadataFlow:
         got = await dev.async_get_playerstatus_metadata(plr_stat)
 
         assert got is False
-        assert dev._media_title is None
-        assert dev._media_artist is None
+        assert dev._meta.title is None
+        assert dev._meta.artist is None
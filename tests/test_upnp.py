@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from custom_components.linkplay.metadata import DidlDecoder, parse_didl_metadata
+from custom_components.linkplay.state import MediaMetadata, PlaybackFlags
+from custom_components.linkplay.track_index import TrackIndex
+from custom_components.linkplay.upnp_factory import UpnpDocumentCache
 from custom_components.linkplay.upnp_mixin import LinkPlayUPnPMixin
 
 
@@ -44,17 +49,32 @@ _QUEUE_XML = """<root>
 
 class _FakeDevice(LinkPlayUPnPMixin):
     def __init__(self) -> None:
+        self._meta = MediaMetadata()
         self.entity_id = "media_player.fake"
-        self._service = None
+        self._host = "1.2.3.4"
+        self._name = "fake"
+        self.hass = None
         self._upnp_device = None
-        self._media_title = None
-        self._media_artist = None
-        self._media_album = None
-        self._media_image_url = None
-        self._media_uri_final = None
+        self._upnp_actions = {}
+        self._upnp_lock = asyncio.Lock()
+        self._upnp_retry_at = 0.0
+        self._upnp_retry_delay = 0
+        self._upnp_retry_unsub = None
+        self._upnp_documents = UpnpDocumentCache(MagicMock())
+        self._device_store = None
+        # Binding fails unless a test provides a device.
+        self._factory = MagicMock()
+        self._factory.async_create_device = AsyncMock(side_effect=OSError("offline"))
+        self._meta.title = None
+        self._meta.artist = None
+        self._meta.album = None
+        self._meta.image_url = None
+        self._meta.uri_final = None
         self._trackc = None
         self._trackq: list[str] = []
-        self._playing_spotify = False
+        self._track_index = TrackIndex()
+        self._didl_decoder = DidlDecoder()
+        self._playing = PlaybackFlags()
 
 
 def _service_with_action(name: str, return_value):
@@ -66,6 +86,52 @@ def _service_with_action(name: str, return_value):
     return service
 
 
+class TestLazyBinding:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_bind_once_and_reuse_action_handles(self) -> None:
+        dev = _FakeDevice()
+        service = _service_with_action("GetMediaInfo", {"CurrentURIMetaData": None})
+        device = MagicMock()
+        device.service = MagicMock(return_value=service)
+        dev._factory.async_create_device = AsyncMock(return_value=device)
+
+        await asyncio.gather(dev.async_update_via_upnp(), dev.async_update_via_upnp())
+        await dev.async_update_via_upnp()
+
+        dev._factory.async_create_device.assert_awaited_once_with(
+            "http://1.2.3.4:49152/description.xml"
+        )
+        assert device.service.call_count == 1
+        assert service.action.return_value.async_call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_bind_backs_off_and_retries_in_background(self) -> None:
+        dev = _FakeDevice()
+        dev.hass = MagicMock()
+        with patch("custom_components.linkplay.upnp_mixin.async_call_later") as call_later:
+            await dev.async_update_via_upnp()
+            await dev.async_update_via_upnp()
+            assert dev._factory.async_create_device.await_count == 1
+            hass, delay, retry = call_later.call_args.args
+            assert delay == 30
+
+            device = MagicMock()
+            device.service = MagicMock(return_value=_service_with_action("GetMediaInfo", {}))
+            dev._factory.async_create_device = AsyncMock(return_value=device)
+            await retry(None)
+
+        assert dev._upnp_device is device
+        assert dev._upnp_retry_delay == 0
+
+    @pytest.mark.asyncio
+    async def test_backoff_doubles_up_to_max(self) -> None:
+        dev = _FakeDevice()
+        for _ in range(8):
+            dev._upnp_retry_at = 0.0
+            await dev._async_upnp_device()
+        assert dev._upnp_retry_delay == 600
+
+
 class TestUpdateViaUpnp:
     @pytest.mark.asyncio
     async def test_no_upnp_device_short_circuits(self) -> None:
@@ -87,11 +153,11 @@ class TestUpdateViaUpnp:
         dev._upnp_device = MagicMock()
         dev._upnp_device.service = MagicMock(return_value=service)
         await dev.async_update_via_upnp()
-        assert dev._media_title == "Carbon Mind"
-        assert dev._media_artist == "Carbon Based Lifeforms"
-        assert dev._media_album == "World Of Sleepers"
-        assert dev._media_image_url == "https://example.com/art.jpg"
-        assert dev._media_uri_final == "http://stream/x-final"
+        assert dev._meta.title == "Carbon Mind"
+        assert dev._meta.artist == "Carbon Based Lifeforms"
+        assert dev._meta.album == "World Of Sleepers"
+        assert dev._meta.image_url == "https://example.com/art.jpg"
+        assert dev._meta.uri_final == "http://stream/x-final"
 
     @pytest.mark.asyncio
     async def test_invalid_url_image_dropped(self) -> None:
@@ -103,14 +169,14 @@ class TestUpdateViaUpnp:
         dev._upnp_device = MagicMock()
         dev._upnp_device.service = MagicMock(return_value=service)
         await dev.async_update_via_upnp()
-        assert dev._media_title == "Track"
-        assert dev._media_image_url is None
+        assert dev._meta.title == "Track"
+        assert dev._meta.image_url is None
 
     @pytest.mark.asyncio
     async def test_malformed_xml_bails_without_clearing_state(self) -> None:
         """ParseError path must not raise and must not crash the poll."""
         dev = _FakeDevice()
-        dev._media_title = "previous"
+        dev._meta.title = "previous"
         service = _service_with_action(
             "GetMediaInfo",
             {"CurrentURI": "x", "TrackSource": "x", "CurrentURIMetaData": _DIDL_MALFORMED},
@@ -118,8 +184,27 @@ class TestUpdateViaUpnp:
         dev._upnp_device = MagicMock()
         dev._upnp_device.service = MagicMock(return_value=service)
         await dev.async_update_via_upnp()
-        # The function returns early; existing _media_title stays put.
-        assert dev._media_title == "previous"
+        # The function returns early; existing _meta.title stays put.
+        assert dev._meta.title == "previous"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_metadata_is_not_reparsed(self) -> None:
+        dev = _FakeDevice()
+        service = _service_with_action(
+            "GetMediaInfo",
+            {"CurrentURI": "x", "TrackSource": "x", "CurrentURIMetaData": _DIDL_OK},
+        )
+        dev._upnp_device = MagicMock()
+        dev._upnp_device.service = MagicMock(return_value=service)
+        with patch(
+            "custom_components.linkplay.metadata.parse_didl_metadata",
+            wraps=parse_didl_metadata,
+        ) as parse:
+            await dev.async_update_via_upnp()
+            dev._meta.title = None
+            await dev.async_update_via_upnp()
+        assert parse.call_count == 1
+        assert dev._meta.title == "Carbon Mind"
 
     @pytest.mark.asyncio
     async def test_action_exception_is_swallowed(self) -> None:
@@ -131,7 +216,7 @@ class TestUpdateViaUpnp:
         dev._upnp_device = MagicMock()
         dev._upnp_device.service = MagicMock(return_value=service)
         await dev.async_update_via_upnp()
-        assert dev._media_title is None  # untouched
+        assert dev._meta.title is None  # untouched
 
 
 class TestTracklistViaUpnp:
@@ -183,7 +268,7 @@ class TestPresetSnapViaUpnp:
 
     def _spotify_device(self) -> _FakeDevice:
         dev = _FakeDevice()
-        dev._playing_spotify = True
+        dev._playing.spotify = True
         dev._upnp_device = MagicMock()
         dev.hass = MagicMock()
         return dev
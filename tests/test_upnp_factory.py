@@ -0,0 +1,107 @@
+"""Tests for the shared UPnP factory and its document cache."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+from async_upnp_client.aiohttp import AiohttpRequester
+from async_upnp_client.client_factory import UpnpFactory
+from async_upnp_client.const import HttpRequest, HttpResponse
+
+from custom_components.linkplay.upnp_factory import (
+    LinkPlayUpnpFactory,
+    UpnpDocumentCache,
+    get_upnp_factory,
+)
+from tests._helpers import make_device
+from tests.simulator import SimulatorFleet
+
+_AV_TRANSPORT = "urn:schemas-upnp-org:service:AVTransport:1"
+_DESCRIPTION_URL = "http://1.2.3.4:49152/description.xml"
+
+
+def _requester(body: str = "<root/>"):
+    requester = MagicMock()
+    requester.async_http_request = AsyncMock(return_value=HttpResponse(200, {}, body))
+    return requester
+
+
+class TestUpnpDocumentCache:
+    @pytest.mark.asyncio
+    async def test_stored_documents_skip_the_network(self) -> None:
+        inner = _requester()
+        cache = UpnpDocumentCache(inner)
+        cache.add({_DESCRIPTION_URL: "<cached/>"})
+        response = await cache.async_http_request(HttpRequest("GET", _DESCRIPTION_URL, {}, None))
+        assert response.body == "<cached/>"
+        inner.async_http_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_fetched_documents_are_kept_and_actions_pass_through(self) -> None:
+        cache = UpnpDocumentCache(_requester("<fresh/>"))
+        await cache.async_http_request(HttpRequest("GET", _DESCRIPTION_URL, {}, None))
+        await cache.async_http_request(HttpRequest("POST", "http://1.2.3.4:49152/ctl", {}, "<s/>"))
+        assert cache.documents == {_DESCRIPTION_URL: "<fresh/>"}
+
+    def test_documents_are_grouped_by_host(self) -> None:
+        cache = UpnpDocumentCache(_requester())
+        other = "http://1.2.3.5:49152/description.xml"
+        cache.add({_DESCRIPTION_URL: "a", other: "b"})
+        assert cache.for_host("1.2.3.4") == {_DESCRIPTION_URL: "a"}
+        cache.forget("1.2.3.4")
+        assert cache.documents == {other: "b"}
+
+
+class TestSharedFactory:
+    def test_devices_share_one_factory(self) -> None:
+        first, second = make_device("a"), make_device("b", host="1.2.3.5")
+        assert first._factory is second._factory is get_upnp_factory()
+        assert first._upnp_documents is get_upnp_factory().requester
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("socket_enabled")
+    async def test_identical_scpds_are_parsed_once(self) -> None:
+        factory = LinkPlayUpnpFactory(UpnpDocumentCache(AiohttpRequester(5)))
+        parse = factory._read_spec_from_reponse
+        with patch.object(factory, "_read_spec_from_reponse", side_effect=parse) as spy:
+            async with SimulatorFleet(3) as fleet:
+                devices = [await factory.async_create_device(sim.description_url) for sim in fleet]
+
+        services = {d.service(_AV_TRANSPORT) for d in devices}
+        assert len(services) == 3
+        # One description per speaker, each SCPD body once for the fleet.
+        assert spy.call_count == 3 + len(factory._scpd_trees)
+
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("socket_enabled")
+    async def test_warm_build_needs_no_speaker(self) -> None:
+        async with SimulatorFleet(1) as fleet:
+            url = fleet[0].description_url
+            cold = UpnpDocumentCache(AiohttpRequester(5))
+            await LinkPlayUpnpFactory(cold).async_create_device(url)
+
+        offline = MagicMock()
+        offline.async_http_request = AsyncMock(side_effect=aiohttp.ClientError)
+        warm = UpnpDocumentCache(offline)
+        warm.add(cold.documents)
+        device = await LinkPlayUpnpFactory(warm).async_create_device(url)
+
+        assert device.has_service(_AV_TRANSPORT)
+        offline.async_http_request.assert_not_awaited()
+
+    def test_missing_internals_disable_sharing(self, monkeypatch) -> None:
+        monkeypatch.delattr(UpnpFactory, "_read_spec_from_reponse")
+        assert LinkPlayUpnpFactory(UpnpDocumentCache(MagicMock()))._share_scpds is False
+
+    @pytest.mark.asyncio
+    async def test_changed_internals_fall_back_to_library_parsing(self) -> None:
+        factory = LinkPlayUpnpFactory(UpnpDocumentCache(MagicMock()))
+        factory._async_get_shared_service_spec = AsyncMock(side_effect=TypeError)
+        library = AsyncMock(return_value="tree")
+        with patch.object(UpnpFactory, "_async_get_service_spec", library):
+            assert await factory._async_get_service_spec("http://x/scpd.xml") == "tree"
+            assert await factory._async_get_service_spec("http://x/scpd.xml") == "tree"
+        assert factory._share_scpds is False
+        factory._async_get_shared_service_spec.assert_awaited_once()
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from custom_components.linkplay.state import GroupState, TransportState
 from custom_components.linkplay.volume_controls_mixin import LinkPlayVolumeControlsMixin
+from custom_components.linkplay.volume_engine import VolumeEngine
 
 
 class _FakeDevice(LinkPlayVolumeControlsMixin):
@@ -20,18 +23,29 @@ class _FakeDevice(LinkPlayVolumeControlsMixin):
         wifidirect: bool = False,
         snapshot: bool = False,
     ) -> None:
+        self._transport = TransportState()
+        self._group = GroupState()
         self.entity_id = "media_player.fake"
-        self._volume = volume
+        self._transport.volume = volume
         self._volume_step = step
-        self._is_master = is_master
-        self._slave_mode = slave_mode
-        self._multiroom_wifidirect = wifidirect
+        self._group.is_master = is_master
+        self._group.slave_mode = slave_mode
+        self._group.wifidirect = wifidirect
         self._snapshot_active = snapshot
-        self._muted = False
-        self._slave_ip = "5.6.7.8"
-        self._master = MagicMock()
-        self._master.call_linkplay_httpapi = AsyncMock(return_value="OK")
+        self._transport.muted = False
+        self._group.slave_ip = "5.6.7.8"
+        self._group.master = MagicMock()
+        self._group.master.call_linkplay_httpapi = AsyncMock(return_value="OK")
         self.call_linkplay_httpapi = AsyncMock(return_value="OK")
+        self._volume_offset = 0
+        self._group_slaves: list = []
+        self._volume_engine = VolumeEngine(
+            lambda volume, action: self._set_volume_on_device(volume, action=action),
+            min_interval=0.01,
+        )
+
+    def _group_slave_entities(self) -> list:
+        return self._group_slaves
 
 
 class TestSetVolume:
@@ -42,7 +56,7 @@ class TestSetVolume:
         Regression for v4.5.5: master previously sent ``slave_vol:N``,
         which only broadcasts to slaves and leaves the master's hardware
         volume unchanged. The next poll would then revert the cached
-        ``_volume`` back to the stale firmware value, and any group-wide
+        ``_transport.volume`` back to the stale firmware value, and any group-wide
         re-sync (e.g. a preset switch) would push that stale master
         volume onto every slave.
         """
@@ -52,21 +66,21 @@ class TestSetVolume:
         cmd = dev.call_linkplay_httpapi.await_args.args[0]
         assert cmd == "setPlayerCmd:vol:30"
         assert "slave_vol" not in cmd
-        assert dev._volume == 30
+        assert dev._transport.volume == 30
 
     @pytest.mark.asyncio
     async def test_standalone_sends_vol(self) -> None:
         dev = _FakeDevice()
         await dev.async_set_volume_level(0.42)
         assert "setPlayerCmd:vol:42" in dev.call_linkplay_httpapi.await_args.args[0]
-        assert dev._volume == 42
+        assert dev._transport.volume == 42
 
     @pytest.mark.asyncio
     async def test_wifidirect_slave_goes_via_master(self) -> None:
         dev = _FakeDevice(slave_mode=True, wifidirect=True)
         await dev.async_set_volume_level(0.20)
-        dev._master.call_linkplay_httpapi.assert_awaited_once()
-        cmd = dev._master.call_linkplay_httpapi.await_args.args[0]
+        dev._group.master.call_linkplay_httpapi.assert_awaited_once()
+        cmd = dev._group.master.call_linkplay_httpapi.await_args.args[0]
         assert cmd == "multiroom:SlaveVolume:5.6.7.8:20"
 
     @pytest.mark.asyncio
@@ -75,27 +89,25 @@ class TestSetVolume:
         clobbering the saved volume."""
         dev = _FakeDevice(slave_mode=True, wifidirect=True, snapshot=True)
         await dev.async_set_volume_level(0.20)
-        dev._master.call_linkplay_httpapi.assert_not_awaited()
+        dev._group.master.call_linkplay_httpapi.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_standalone_snapshot_active_settles_then_sets(self) -> None:
         """A non-wifidirect, non-master device mid snapshot restore waits
-        1s for the input to settle, then sends the vol command."""
-        import custom_components.linkplay.volume_controls_mixin as mod
-
+        for the reported volume to settle, then sends the vol command."""
         dev = _FakeDevice(snapshot=True)  # is_master/slave_mode False
-        with patch.object(mod.asyncio, "sleep", new=AsyncMock()) as slept:
-            await dev.async_set_volume_level(0.40)
-        slept.assert_awaited_once()
+        dev.async_wait_for_status = AsyncMock(return_value={"vol": "20"})
+        await dev.async_set_volume_level(0.40)
+        dev.async_wait_for_status.assert_awaited_once()
         assert dev.call_linkplay_httpapi.await_args.args[0] == "setPlayerCmd:vol:40"
-        assert dev._volume == 40
+        assert dev._transport.volume == 40
 
     @pytest.mark.asyncio
     async def test_non_ok_response_warns_but_keeps_old_volume(self) -> None:
         dev = _FakeDevice()
         dev.call_linkplay_httpapi = AsyncMock(return_value="FAIL")
         await dev.async_set_volume_level(0.99)
-        assert dev._volume == 50  # untouched
+        assert dev._transport.volume == 50  # untouched
 
 
 class TestVolumeUpDown:
@@ -103,7 +115,7 @@ class TestVolumeUpDown:
     async def test_volume_up_clamps_at_100(self) -> None:
         dev = _FakeDevice(volume=98, step=5)
         await dev.async_volume_up()
-        assert dev._volume == 100
+        assert dev._transport.volume == 100
 
     @pytest.mark.asyncio
     async def test_volume_up_noop_at_max_when_not_muted(self) -> None:
@@ -114,7 +126,7 @@ class TestVolumeUpDown:
     @pytest.mark.asyncio
     async def test_volume_up_at_max_runs_when_muted(self) -> None:
         dev = _FakeDevice(volume=100)
-        dev._muted = True
+        dev._transport.muted = True
         await dev.async_volume_up()
         dev.call_linkplay_httpapi.assert_awaited_once()
 
@@ -122,7 +134,7 @@ class TestVolumeUpDown:
     async def test_volume_down_clamps_at_zero(self) -> None:
         dev = _FakeDevice(volume=2, step=10)
         await dev.async_volume_down()
-        assert dev._volume == 0
+        assert dev._transport.volume == 0
 
     @pytest.mark.asyncio
     async def test_volume_down_noop_at_zero(self) -> None:
@@ -130,6 +142,90 @@ class TestVolumeUpDown:
         await dev.async_volume_down()
         dev.call_linkplay_httpapi.assert_not_awaited()
 
+    @pytest.mark.asyncio
+    async def test_held_button_coalesces_into_newest_step(self) -> None:
+        dev = _FakeDevice(volume=50, step=5)
+        release = asyncio.Event()
+
+        async def _slow(cmd, *_args, **_kwargs):
+            await release.wait()
+            return "OK"
+
+        dev.call_linkplay_httpapi = AsyncMock(side_effect=_slow)
+        first = asyncio.create_task(dev.async_volume_up())
+        await asyncio.sleep(0)
+        presses = [asyncio.create_task(dev.async_volume_up()) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, *presses)
+        sent = [call.args[0] for call in dev.call_linkplay_httpapi.await_args_list]
+        # First press goes out at once; the other three fold into one
+        # command that still counts every step.
+        assert sent == ["setPlayerCmd:vol:55", "setPlayerCmd:vol:70"]
+        assert dev._transport.volume == 70
+
+
+class TestFadeVolume:
+    @pytest.mark.asyncio
+    async def test_fade_steps_to_target(self) -> None:
+        dev = _FakeDevice(volume=10)
+        await dev.async_fade_volume(0.14, 0.05)
+        sent = [call.args[0] for call in dev.call_linkplay_httpapi.await_args_list]
+        assert sent == [f"setPlayerCmd:vol:{n}" for n in (11, 12, 13, 14)]
+        assert dev._transport.volume == 14
+
+    @pytest.mark.asyncio
+    async def test_master_fades_slaves_with_offsets(self) -> None:
+        dev = _FakeDevice(volume=40, is_master=True)
+        kitchen = _FakeDevice(volume=40)
+        kitchen._volume_offset = -10
+        dev._group_slaves = [kitchen]
+        await dev.async_fade_volume(0.2, 0.02)
+        assert dev._transport.volume == 20
+        assert kitchen._transport.volume == 10
+
+    @pytest.mark.asyncio
+    async def test_unknown_volume_jumps_to_target(self) -> None:
+        dev = _FakeDevice(volume=None, is_master=True)
+        kitchen = _FakeDevice(volume=None)
+        dev._group_slaves = [kitchen]
+        await dev.async_fade_volume(0.3, 0.02)
+        assert dev.call_linkplay_httpapi.await_count == 1
+        assert (dev._transport.volume, kitchen._transport.volume) == (30, 30)
+
+    @pytest.mark.asyncio
+    async def test_wifidirect_slaves_slow_the_group_fade(self) -> None:
+        dev = _FakeDevice(volume=0, is_master=True)
+        slaves = [_FakeDevice(volume=0, slave_mode=True, wifidirect=True) for _ in range(3)]
+        for slave in slaves:
+            slave._group.master = dev
+        dev._group_slaves = slaves
+        await dev.async_fade_volume(1.0, 0.08)
+        # 4 commands per step reach the master: 0.08 / (0.01 * 4) = 2 steps.
+        assert dev.call_linkplay_httpapi.await_count == 2 * 4
+        assert [s._transport.volume for s in slaves] == [100, 100, 100]
+
+    @pytest.mark.asyncio
+    async def test_slave_set_mid_fade_is_kept(self) -> None:
+        dev = _FakeDevice(volume=0, is_master=True)
+        kitchen = _FakeDevice(volume=0)
+        dev._group_slaves = [kitchen]
+        fade = asyncio.create_task(dev.async_fade_volume(1.0, 0.1))
+        await asyncio.sleep(0.03)
+        await kitchen.async_set_volume_level(0.05)
+        await asyncio.wait_for(fade, 1)
+        assert (dev._transport.volume, kitchen._transport.volume) == (100, 5)
+
+    @pytest.mark.asyncio
+    async def test_set_volume_cancels_running_fade(self) -> None:
+        dev = _FakeDevice(volume=0)
+        dev._volume_engine.min_interval = 0.05
+        fade = asyncio.create_task(dev.async_fade_volume(1.0, 10))
+        await asyncio.sleep(0.01)
+        await dev.async_set_volume_level(0.3)
+        await asyncio.wait_for(fade, 1)
+        assert dev._transport.volume == 30
+
 
 class TestMute:
     @pytest.mark.asyncio
@@ -137,21 +233,21 @@ class TestMute:
         dev = _FakeDevice(is_master=True)
         await dev.async_mute_volume(True)
         assert "slave_mute:1" in dev.call_linkplay_httpapi.await_args.args[0]
-        assert dev._muted is True
+        assert dev._transport.muted is True
 
     @pytest.mark.asyncio
     async def test_unmute_standalone(self) -> None:
         dev = _FakeDevice()
-        dev._muted = True
+        dev._transport.muted = True
         await dev.async_mute_volume(False)
         assert "setPlayerCmd:mute:0" in dev.call_linkplay_httpapi.await_args.args[0]
-        assert dev._muted is False
+        assert dev._transport.muted is False
 
     @pytest.mark.asyncio
     async def test_mute_wifidirect_slave_via_master(self) -> None:
         dev = _FakeDevice(slave_mode=True, wifidirect=True)
         await dev.async_mute_volume(True)
-        cmd = dev._master.call_linkplay_httpapi.await_args.args[0]
+        cmd = dev._group.master.call_linkplay_httpapi.await_args.args[0]
         assert cmd == "multiroom:SlaveVolume:5.6.7.8:1"
 
     @pytest.mark.asyncio
@@ -159,4 +255,4 @@ class TestMute:
         dev = _FakeDevice()
         dev.call_linkplay_httpapi = AsyncMock(return_value="FAIL")
         await dev.async_mute_volume(True)
-        assert dev._muted is False
+        assert dev._transport.muted is False
@@ -0,0 +1,105 @@
+"""Tests for the coalescing volume command engine."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from custom_components.linkplay.volume_engine import VolumeEngine
+
+
+class _Recorder:
+    def __init__(self, delay: float = 0.0) -> None:
+        self.sent: list[tuple[int, str, float]] = []
+        self.delay = delay
+
+    async def __call__(self, volume: int, action: str) -> None:
+        self.sent.append((volume, action, time.monotonic()))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio
+    async def test_single_set_is_sent_immediately(self) -> None:
+        send = _Recorder()
+        engine = VolumeEngine(send, min_interval=10)
+        await asyncio.wait_for(engine.async_set(30, "set volume"), 1)
+        assert [(v, a) for v, a, _ in send.sent] == [(30, "set volume")]
+        assert engine.pending is None
+
+    @pytest.mark.asyncio
+    async def test_burst_sends_first_and_last(self) -> None:
+        send = _Recorder(delay=0.02)
+        engine = VolumeEngine(send, min_interval=0.01)
+        first = asyncio.create_task(engine.async_set(10, "set volume"))
+        await asyncio.sleep(0.005)
+        # 10 is on the wire; later sets wait behind it, newest wins.
+        calls = [asyncio.create_task(engine.async_set(v, "set volume")) for v in (20, 30, 40)]
+        await asyncio.sleep(0)
+        assert engine.pending == 40
+        await asyncio.gather(first, *calls)
+        assert [v for v, _, _ in send.sent] == [10, 40]
+
+    @pytest.mark.asyncio
+    async def test_commands_are_spaced_by_min_interval(self) -> None:
+        send = _Recorder()
+        engine = VolumeEngine(send, min_interval=0.05)
+        await engine.async_set(10, "set volume")
+        await engine.async_set(20, "set volume")
+        assert send.sent[1][2] - send.sent[0][2] >= 0.045
+
+
+class TestFade:
+    @pytest.mark.asyncio
+    async def test_step_count_bounded_by_rate(self) -> None:
+        send = _Recorder()
+        engine = VolumeEngine(send, min_interval=0.01)
+        await engine.async_fade_to(0, 100, 0.05)
+        volumes = [v for v, _, _ in send.sent]
+        assert len(volumes) == 5
+        assert volumes[-1] == 100
+        assert volumes == sorted(volumes)
+        assert {a for _, a, _ in send.sent} == {"fade volume"}
+
+    @pytest.mark.asyncio
+    async def test_fade_to_current_volume_sends_nothing(self) -> None:
+        send = _Recorder()
+        engine = VolumeEngine(send, min_interval=0.01)
+        await engine.async_fade_to(25, 25, 1)
+        assert send.sent == []
+
+    @pytest.mark.asyncio
+    async def test_new_fade_supersedes_old(self) -> None:
+        send = _Recorder()
+        engine = VolumeEngine(send, min_interval=0.02)
+        first = asyncio.create_task(engine.async_fade_to(0, 100, 10))
+        await asyncio.sleep(0.03)
+        await engine.async_fade_to(send.sent[-1][0], 0, 0.04)
+        await asyncio.wait_for(first, 1)
+        assert send.sent[-1][0] == 0
+
+    @pytest.mark.asyncio
+    async def test_followers_step_in_the_same_loop(self) -> None:
+        send, follower = _Recorder(), _Recorder()
+        engine = VolumeEngine(send, min_interval=0.01)
+        followers = [(VolumeEngine(follower), 10, 0)]
+        await engine.async_fade_to(0, 40, 0.04, followers=followers, load=2)
+        assert [v for v, _, _ in send.sent] == [20, 40]
+        assert [v for v, _, _ in follower.sent] == [5, 0]
+
+    @pytest.mark.asyncio
+    async def test_follower_set_leaves_the_group_fade(self) -> None:
+        send, follower = _Recorder(), _Recorder()
+        engine = VolumeEngine(send, min_interval=0.01)
+        slave = VolumeEngine(follower, min_interval=0.01)
+        fade = asyncio.create_task(
+            engine.async_fade_to(0, 100, 0.1, followers=[(slave, 0, 100)]),
+        )
+        await asyncio.sleep(0.03)
+        await slave.async_set(7, "set volume")
+        await asyncio.wait_for(fade, 1)
+        assert follower.sent[-1][:2] == (7, "set volume")
+        assert send.sent[-1][0] == 100